@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query, status
+from pydantic import BaseModel
 
-from app.clients.config import fetch_spec
+from app.clients.config import fetch_spec, get_spec_cache
+from app.clients.spec_cache import BotSpecNotFoundError
 from app.domain.bot_spec import BotSpecEnvelope
 from app.domain.move_request import MoveRequest
 from app.domain.move_response import MoveResponse
@@ -9,16 +11,54 @@ from app.logic.orchestrator import orchestrate_move, get_last_moves
 router = APIRouter()
 
 
+class SpecInvalidationResponse(BaseModel):
+    """Response model for bot spec cache invalidation."""
+    invalidated: int
+    message: str
+
+
 @router.post("/bots/{bot_id}/move", response_model=MoveResponse)
 async def make_move(
     request: MoveRequest, bot_id: str = Path(..., description="Bot identifier"),
 ) -> MoveResponse:
-    return await orchestrate_move(bot_id, request)
+    try:
+        return await orchestrate_move(bot_id, request)
+    except BotSpecNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/bots/{bot_id}/spec", response_model=BotSpecEnvelope)
 async def get_spec(bot_id: str = Path(..., description="Bot identifier")) -> BotSpecEnvelope:
-    return await fetch_spec(bot_id)
+    try:
+        return await fetch_spec(bot_id)
+    except BotSpecNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post("/bots/spec/invalidate", response_model=SpecInvalidationResponse, tags=["admin"])
+async def invalidate_all_specs() -> SpecInvalidationResponse:
+    """Drop every cached bot spec; the next move of each bot fetches it again."""
+    invalidated = get_spec_cache().invalidate()
+    return SpecInvalidationResponse(
+        invalidated=invalidated, message=f"Invalidated {invalidated} cached bot specs"
+    )
+
+
+@router.post("/bots/{bot_id}/spec/invalidate", response_model=SpecInvalidationResponse, tags=["admin"])
+async def invalidate_spec(
+    bot_id: str = Path(..., description="Bot identifier"),
+    version: str | None = Query(
+        default=None, description="Current spec version; a cached spec of this version is kept"
+    ),
+) -> SpecInvalidationResponse:
+    """Drop the cached spec of a bot, e.g. when the config service publishes a new version."""
+    invalidated = get_spec_cache().invalidate(bot_id, version=version)
+    message = (
+        f"Invalidated cached spec for bot {bot_id}"
+        if invalidated
+        else f"No outdated cached spec for bot {bot_id}"
+    )
+    return SpecInvalidationResponse(invalidated=invalidated, message=message)
 
 
 @router.get("/debug/last-moves")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from datetime import datetime, timezone
-import httpx
 from typing import Optional
 
+from app.clients.http_pool import BOT_CONFIG, get_http_client
+from app.clients.spec_cache import BotSpecCache, BotSpecNotFoundError
 from app.core.config import get_settings
 from app.domain.bot_spec import (
     BotSpec,
@@ -41,7 +42,29 @@ DEFAULT_SPEC = BotSpec(
 )
 
 
+_spec_cache: Optional[BotSpecCache] = None
+
+
+def get_spec_cache() -> BotSpecCache:
+    """Get or create the bot spec cache."""
+    global _spec_cache
+    if _spec_cache is None:
+        settings = get_settings()
+        _spec_cache = BotSpecCache(
+            loader=_fetch_remote_spec,
+            ttl=settings.BOT_SPEC_CACHE_TTL_SECONDS,
+            stale_ttl=settings.BOT_SPEC_CACHE_STALE_SECONDS,
+            negative_ttl=settings.BOT_SPEC_CACHE_NEGATIVE_TTL_SECONDS,
+            max_entries=settings.BOT_SPEC_CACHE_MAX_ENTRIES,
+        )
+    return _spec_cache
+
+
 async def fetch_spec(bot_id: str) -> BotSpecEnvelope:
+    """
+    Return the spec of a bot from the spec cache.
+    Raises BotSpecNotFoundError when the config service does not know the bot.
+    """
     settings = get_settings()
     if not settings.BOT_CONFIG_URL:
         return BotSpecEnvelope(
@@ -49,9 +72,15 @@ async def fetch_spec(bot_id: str) -> BotSpecEnvelope:
             version=datetime.now(timezone.utc).replace(microsecond=0).isoformat() + "Z",
             spec=DEFAULT_SPEC,
         )
+    return await get_spec_cache().get(bot_id)
+
 
-    async with httpx.AsyncClient(timeout=settings.HTTP_CLIENT_TIMEOUT_MS / 1000.0) as client:
-        resp = await client.get(f"{settings.BOT_CONFIG_URL.rstrip('/')}/v1/bots/{bot_id}")
-        resp.raise_for_status()
-        data = resp.json()
-        return BotSpecEnvelope(**data)
+async def _fetch_remote_spec(bot_id: str) -> BotSpecEnvelope:
+    settings = get_settings()
+    client = get_http_client(BOT_CONFIG)
+    resp = await client.get(f"{settings.BOT_CONFIG_URL.rstrip('/')}/v1/bots/{bot_id}")
+    if resp.status_code == 404:
+        raise BotSpecNotFoundError(f"Bot {bot_id} not found")
+    resp.raise_for_status()
+    data = resp.json()
+    return BotSpecEnvelope(**data)
@@ -3,9 +3,10 @@ from typing import List, Optional
 import asyncio
 import httpx
 
+from app.clients.http_pool import ENGINE_CLUSTER, get_http_client
 from app.core.config import get_settings
 from app.domain.candidate import Candidate
-from app.domain.move_response import EngineQuery
+from app.domain.engine_query import EngineQuery
 from app.infrastructure.resilience.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 
 # Global circuit breaker for engine calls
@@ -25,7 +26,9 @@ def get_engine_circuit_breaker() -> CircuitBreaker:
     return _engine_circuit_breaker
 
 
-async def evaluate_position(fen: str, side_to_move: str, query: EngineQuery) -> List[Candidate]:
+async def evaluate_position(
+    fen: str, side_to_move: str, query: EngineQuery, remaining_clock_ms: Optional[int] = None
+) -> List[Candidate]:
     settings = get_settings()
     if not settings.ENGINE_CLUSTER_URL:
         # Fallback mock candidates for local dev
@@ -44,20 +47,22 @@ async def evaluate_position(fen: str, side_to_move: str, query: EngineQuery) ->
     circuit_breaker = get_engine_circuit_breaker()
     
     async def _make_request() -> List[Candidate]:
-        async with httpx.AsyncClient(timeout=settings.ENGINE_QUERY_TIMEOUT_SECONDS) as client:
-            resp = await client.post(
-                f"{settings.ENGINE_CLUSTER_URL.rstrip('/')}/v1/evaluate",
-                json={
-                    "fen": fen,
-                    "side_to_move": side_to_move[0],
-                    "max_depth": query.max_depth,
-                    "time_limit_ms": query.time_limit_ms,
-                    "multi_pv": query.multi_pv,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return [Candidate(**c) for c in data.get("candidates", [])]
+        client = get_http_client(ENGINE_CLUSTER)
+        resp = await client.post(
+            f"{settings.ENGINE_CLUSTER_URL.rstrip('/')}/v1/evaluate",
+            json={
+                "fen": fen,
+                "side_to_move": side_to_move[0],
+                "max_depth": query.max_depth,
+                "time_limit_ms": query.time_limit_ms,
+                "multi_pv": query.multi_pv,
+                # Lets the engine cluster serve bots with less time left first
+                "remaining_clock_ms": remaining_clock_ms,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return [Candidate(**c) for c in data.get("candidates", [])]
     
     try:
         return await circuit_breaker.call(_make_request)
@@ -0,0 +1,138 @@
+"""Application-lifetime HTTP clients, one connection pool per upstream service."""
+from __future__ import annotations
+
+import importlib.util
+import logging
+from typing import Dict
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.metrics import (
+    http_client_in_flight_requests,
+    http_client_pool_saturated_total,
+    http_client_pool_timeouts_total,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upstream names, also used as the metrics label
+ENGINE_CLUSTER = "engine_cluster"
+BOT_CONFIG = "bot_config"
+CHESS_KNOWLEDGE = "chess_knowledge"
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body that reports when its connection goes back to the pool."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """
+    Pooled transport exporting pool saturation per upstream.
+
+    A request counts as in flight from the moment it is sent until its
+    response is closed, which is when its connection is free again; a request
+    sent while ``max_connections`` requests are in flight has to wait for a
+    connection and is counted as saturated.
+    """
+
+    def __init__(self, upstream: str, limits: httpx.Limits, http2: bool = False):
+        super().__init__(limits=limits, http2=http2)
+        self.upstream = upstream
+        self.max_connections = limits.max_connections
+        self.in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.max_connections is not None and self.in_flight >= self.max_connections:
+            http_client_pool_saturated_total.labels(upstream=self.upstream).inc()
+        self._enter()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException as e:
+            if isinstance(e, httpx.PoolTimeout):
+                http_client_pool_timeouts_total.labels(upstream=self.upstream).inc()
+            self._exit()
+            raise
+        response.stream = _TrackedStream(response.stream, self._exit)
+        return response
+
+    def _enter(self) -> None:
+        self.in_flight += 1
+        http_client_in_flight_requests.labels(upstream=self.upstream).set(self.in_flight)
+
+    def _exit(self) -> None:
+        self.in_flight -= 1
+        http_client_in_flight_requests.labels(upstream=self.upstream).set(self.in_flight)
+
+
+def _create_client(upstream: str) -> httpx.AsyncClient:
+    settings = get_settings()
+    max_connections, timeout = {
+        ENGINE_CLUSTER: (
+            settings.ENGINE_CLUSTER_MAX_CONNECTIONS,
+            settings.ENGINE_QUERY_TIMEOUT_SECONDS,
+        ),
+        BOT_CONFIG: (settings.BOT_CONFIG_MAX_CONNECTIONS, settings.HTTP_CLIENT_TIMEOUT_MS / 1000.0),
+        CHESS_KNOWLEDGE: (
+            settings.CHESS_KNOWLEDGE_MAX_CONNECTIONS,
+            settings.KNOWLEDGE_QUERY_TIMEOUT_SECONDS,
+        ),
+    }[upstream]
+
+    http2 = settings.HTTP_CLIENT_HTTP2
+    if http2 and not http2_available():
+        logger.warning("HTTP_CLIENT_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    return httpx.AsyncClient(
+        transport=InstrumentedTransport(upstream, limits, http2=http2),
+        timeout=httpx.Timeout(timeout, pool=settings.HTTP_CLIENT_POOL_TIMEOUT_MS / 1000.0),
+    )
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """
+    Return the shared client of an upstream service.
+
+    Clients keep their connections alive across requests and negotiate
+    HTTP/2 (over TLS) where the upstream supports it.
+    """
+    client = _clients.get(upstream)
+    if client is None or client.is_closed:
+        client = _create_client(upstream)
+        _clients[upstream] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients and their pooled connections."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
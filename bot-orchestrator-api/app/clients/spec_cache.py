@@ -0,0 +1,169 @@
+"""In-process cache of bot specs with stale-while-revalidate refresh."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.metrics import bot_spec_cache_requests_total
+from app.domain.bot_spec import BotSpecEnvelope
+
+logger = logging.getLogger(__name__)
+
+SpecLoader = Callable[[str], Awaitable[BotSpecEnvelope]]
+
+
+class BotSpecNotFoundError(Exception):
+    """The config service has no spec for the bot."""
+
+
+@dataclass
+class _Entry:
+    envelope: Optional[BotSpecEnvelope]  # None: bot not found (negative entry)
+    fetched_at: float
+
+
+class BotSpecCache:
+    """
+    Bot specs keyed by bot_id, remembered with their version.
+
+    A spec younger than ``ttl`` is served as is. Up to ``stale_ttl`` seconds
+    later it is still served, while one background request refreshes it.
+    Older specs are fetched in the foreground; concurrent misses for a bot
+    share one request. When the config service fails, the last known spec is
+    served regardless of age, so bots keep playing through an outage. Unknown
+    bots are remembered for ``negative_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        loader: SpecLoader,
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        negative_ttl: float = 30.0,
+        max_entries: int = 10000,
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, _Entry] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._epoch = 0  # Bumped by invalidation; fetches started before it are not stored
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def version(self, bot_id: str) -> Optional[str]:
+        """Cached spec version of a bot, if any."""
+        entry = self._entries.get(bot_id)
+        return entry.envelope.version if entry is not None and entry.envelope is not None else None
+
+    async def get(self, bot_id: str) -> BotSpecEnvelope:
+        """
+        Return the spec of a bot.
+        Raises BotSpecNotFoundError for unknown bots.
+        """
+        entry = self._entries.get(bot_id)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if entry.envelope is None:
+                if age < self.negative_ttl:
+                    bot_spec_cache_requests_total.labels(result="negative").inc()
+                    raise BotSpecNotFoundError(f"Bot {bot_id} not found")
+            elif age < self.ttl:
+                bot_spec_cache_requests_total.labels(result="fresh").inc()
+                return entry.envelope
+            elif age < self.ttl + self.stale_ttl:
+                bot_spec_cache_requests_total.labels(result="stale").inc()
+                self._refresh_in_background(bot_id)
+                return entry.envelope
+
+        try:
+            envelope = await self._load(bot_id)
+        except BotSpecNotFoundError:
+            raise
+        except Exception as e:
+            if entry is not None and entry.envelope is not None:
+                logger.warning(f"Bot spec refresh failed for {bot_id}, serving cached version: {e}")
+                bot_spec_cache_requests_total.labels(result="stale_if_error").inc()
+                return entry.envelope
+            raise
+        bot_spec_cache_requests_total.labels(result="miss").inc()
+        return envelope
+
+    def invalidate(self, bot_id: Optional[str] = None, version: Optional[str] = None) -> int:
+        """
+        Drop cached specs (of one bot, if given); returns the number dropped.
+
+        With a ``version``, a bot's spec is only dropped when the cached
+        version differs, so a config service announcing a new version does
+        not evict bots that already have it.
+        """
+        if bot_id is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            entry = self._entries.get(bot_id)
+            if (
+                version is not None
+                and entry is not None
+                and entry.envelope is not None
+                and entry.envelope.version == version
+            ):
+                return 0
+            dropped = 0 if self._entries.pop(bot_id, None) is None else 1
+            self._inflight.pop(bot_id, None)
+        self._epoch += 1
+        return dropped
+
+    def _refresh_in_background(self, bot_id: str) -> None:
+        if bot_id in self._inflight:
+            return
+        task = self._start_fetch(bot_id)
+        task.add_done_callback(_log_refresh_failure)
+
+    async def _load(self, bot_id: str) -> BotSpecEnvelope:
+        task = self._inflight.get(bot_id) or self._start_fetch(bot_id)
+        # Shielded so that one caller timing out does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _start_fetch(self, bot_id: str) -> asyncio.Task:
+        task = asyncio.ensure_future(self._fetch(bot_id, self._epoch))
+        self._inflight[bot_id] = task
+
+        def _done(_: asyncio.Task) -> None:
+            if self._inflight.get(bot_id) is task:
+                del self._inflight[bot_id]
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _fetch(self, bot_id: str, epoch: int) -> BotSpecEnvelope:
+        try:
+            envelope = await self.loader(bot_id)
+        except BotSpecNotFoundError:
+            self._store(bot_id, None, epoch)
+            raise
+        self._store(bot_id, envelope, epoch)
+        return envelope
+
+    def _store(self, bot_id: str, envelope: Optional[BotSpecEnvelope], epoch: int) -> None:
+        if epoch != self._epoch:
+            return  # Invalidated while the request was running
+        self._entries.pop(bot_id, None)  # Re-insert so the oldest fetch is evicted first
+        while self._entries and len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[bot_id] = _Entry(envelope=envelope, fetched_at=time.monotonic())
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None and not isinstance(error, BotSpecNotFoundError):
+        logger.warning(f"Background bot spec refresh failed: {error}")
@@ -28,6 +28,26 @@ class Settings(BaseSettings):
     KNOWLEDGE_QUERY_TIMEOUT_SECONDS: float = 5.0  # Knowledge query: 5s max
     TOTAL_BOT_MOVE_TIMEOUT_SECONDS: float = 30.0  # Total bot move: 30s max
 
+    # Bot move pipeline
+    BOT_MOVE_CLOCK_FRACTION: float = 0.05  # Share of the bot's remaining clock (plus increment) one move may take
+    BOT_MOVE_MIN_DEADLINE_MS: int = 300  # Floor of the move deadline in time trouble
+    BOT_MOVE_ENGINE_OVERHEAD_MS: int = 100  # Kept out of the engine time limit for the round trip
+    BOT_MOVE_SPECULATIVE_ENGINE: bool = True  # Start the engine alongside book/tablebase probes
+
+    # Bot spec cache
+    BOT_SPEC_CACHE_TTL_SECONDS: float = 300.0  # Served without asking the config service
+    BOT_SPEC_CACHE_STALE_SECONDS: float = 3600.0  # Beyond the TTL: served while refreshed in the background
+    BOT_SPEC_CACHE_NEGATIVE_TTL_SECONDS: float = 30.0  # Unknown bots are remembered this long
+    BOT_SPEC_CACHE_MAX_ENTRIES: int = 10000
+
+    # Pooled HTTP clients (one per upstream, shared by all requests)
+    ENGINE_CLUSTER_MAX_CONNECTIONS: int = 64
+    BOT_CONFIG_MAX_CONNECTIONS: int = 16
+    CHESS_KNOWLEDGE_MAX_CONNECTIONS: int = 32
+    HTTP_CLIENT_POOL_TIMEOUT_MS: int = 1000  # Max wait for a free pooled connection
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_CLIENT_HTTP2: bool = True  # Negotiated over TLS where the upstream supports it (needs h2)
+
     # OpenTelemetry
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None  # e.g., "http://localhost:4317"
     OTEL_SERVICE_NAME: str = "bot-orchestrator-api"
@@ -1,6 +1,6 @@
 """Prometheus metrics for bot-orchestrator-api."""
 
-from prometheus_client import Counter, Histogram, generate_latest
+from prometheus_client import Counter, Gauge, Histogram, generate_latest
 from prometheus_client.openmetrics.exposition import CONTENT_TYPE_LATEST
 
 # HTTP request metrics
@@ -43,6 +43,21 @@ bot_move_timeouts_total = Counter(
     ["bot_id", "timeout_type"],  # timeout_type: "engine", "knowledge", "total"
 )
 
+bot_move_stage_latency_seconds = Histogram(
+    "bot_move_stage_latency_seconds",
+    "Latency of bot move pipeline stages in seconds",
+    # stage: "spec", "book", "tablebase", "engine"
+    # outcome: "ok", "timeout", "error", "cancelled"
+    ["stage", "outcome"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0],
+)
+
+bot_move_speculative_engine_total = Counter(
+    "bot_move_speculative_engine_total",
+    "Engine searches started alongside knowledge probes",
+    ["result"],  # result: "used" (no knowledge answer), "cancelled" (knowledge answered)
+)
+
 # External service call metrics
 external_service_calls_total = Counter(
     "external_service_calls_total",
@@ -57,6 +72,32 @@ external_service_call_duration_seconds = Histogram(
     buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0],
 )
 
+# Bot spec cache metrics
+bot_spec_cache_requests_total = Counter(
+    "bot_spec_cache_requests_total",
+    "Total number of bot spec lookups",
+    ["result"],  # result: "fresh", "stale", "negative", "miss", "stale_if_error"
+)
+
+# HTTP client pool metrics
+http_client_in_flight_requests = Gauge(
+    "http_client_in_flight_requests",
+    "Requests holding a pooled connection to an upstream service",
+    ["upstream"],
+)
+
+http_client_pool_saturated_total = Counter(
+    "http_client_pool_saturated_total",
+    "Total number of upstream requests that had to wait for a free pooled connection",
+    ["upstream"],
+)
+
+http_client_pool_timeouts_total = Counter(
+    "http_client_pool_timeouts_total",
+    "Total number of upstream requests that timed out waiting for a pooled connection",
+    ["upstream"],
+)
+
 # Circuit breaker metrics
 circuit_breaker_state = Histogram(
     "circuit_breaker_state",
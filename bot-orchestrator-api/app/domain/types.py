@@ -3,5 +3,5 @@ from typing import Literal
 
 
 Color = Literal["white", "black"]
-Phase = Literal["opening", "middlegame", "endgame"]
+Phase = Literal["opening", "middlegame", "endgame", "fallback"]
 MistakeType = Literal["none", "inaccuracy", "mistake", "blunder"]
@@ -1,28 +1,34 @@
 from __future__ import annotations
+import logging
 import math
 import random
+import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Awaitable, Deque, Dict, List, Optional, Tuple, TypeVar
 
 from app.clients.config import fetch_spec
 from app.clients.engine import evaluate_position
 from app.clients.knowledge import get_opening_book_move, get_tablebase_move
+from app.core.config import get_settings
+from app.core.metrics import bot_move_speculative_engine_total, bot_move_stage_latency_seconds
 from app.domain.fallback_moves import generate_random_legal_move
 import asyncio
 from app.domain.bot_spec import BotSpecEnvelope
 from app.domain.candidate import Candidate
+from app.domain.chosen_reason import ChosenReason
+from app.domain.debug_info import DebugInfo
+from app.domain.engine_query import EngineQuery
 from app.domain.move_request import MoveRequest
-from app.domain.move_response import (
-    ChosenReason,
-    DebugInfo,
-    EngineQuery,
-    MoveResponse,
-)
+from app.domain.move_response import MoveResponse
 from app.domain.types import MistakeType
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 _LAST_MOVES: Deque[dict] = deque(maxlen=200)
+_FALLBACK_RESERVE_SECONDS = 0.05  # Kept back from the move deadline to answer with a fallback move
 
 
 @dataclass
@@ -100,29 +106,60 @@ def apply_style_weights(candidates: List[Candidate], style: dict, rng: random.Ra
     return chosen, bias_label
 
 
-async def orchestrate_move(bot_id: str, req: MoveRequest) -> MoveResponse:
-    from app.core.config import get_settings
+def bot_clock_ms(req: MoveRequest) -> int:
+    return req.clocks.black_ms if req.bot_color == "black" else req.clocks.white_ms
+
+
+def move_deadline_seconds(req: MoveRequest) -> float:
+    """Time the whole move may take: a share of the bot's remaining clock plus its increment."""
     settings = get_settings()
-    
-    # Overall timeout for bot move (30 seconds)
+    budget_ms = bot_clock_ms(req) * settings.BOT_MOVE_CLOCK_FRACTION + req.clocks.increment_ms
+    budget_ms = max(settings.BOT_MOVE_MIN_DEADLINE_MS, budget_ms)
+    return min(settings.TOTAL_BOT_MOVE_TIMEOUT_SECONDS, budget_ms / 1000.0)
+
+
+async def _run_stage(stage: str, coro: Awaitable[T], timeout: float) -> T:
+    """Await one pipeline stage within ``timeout`` seconds, recording its latency."""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        return await asyncio.wait_for(coro, timeout=max(timeout, 0.0))
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+        raise
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
+    except Exception:
+        outcome = "error"
+        raise
+    finally:
+        bot_move_stage_latency_seconds.labels(stage=stage, outcome=outcome).observe(
+            time.perf_counter() - start
+        )
+
+
+async def orchestrate_move(bot_id: str, req: MoveRequest) -> MoveResponse:
+    budget = move_deadline_seconds(req)
+    deadline = asyncio.get_running_loop().time() + budget
+
+    # Overall deadline for the bot move, derived from its clock
     try:
         return await asyncio.wait_for(
-            _orchestrate_move_internal(bot_id, req),
-            timeout=settings.TOTAL_BOT_MOVE_TIMEOUT_SECONDS,
+            _orchestrate_move_internal(bot_id, req, deadline - _FALLBACK_RESERVE_SECONDS),
+            timeout=budget,
         )
     except asyncio.TimeoutError:
         # Timeout - return fallback move
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Bot move timed out after {settings.TOTAL_BOT_MOVE_TIMEOUT_SECONDS}s, using fallback move")
-        
+        logger.warning(f"Bot move timed out after {budget:.3f}s, using fallback move")
+
         try:
             fallback_move = generate_random_legal_move(req.fen)
             resp = MoveResponse(
                 game_id=req.game_id,
                 bot_id=bot_id,
                 move=fallback_move,
-                thinking_time_ms=int(settings.TOTAL_BOT_MOVE_TIMEOUT_SECONDS * 1000),
+                thinking_time_ms=int(budget * 1000),
                 debug_info=DebugInfo(phase="fallback", mistake_type="none" if req.debug else None),
             )
             _record_move(resp)
@@ -132,83 +169,113 @@ async def orchestrate_move(bot_id: str, req: MoveRequest) -> MoveResponse:
             raise
 
 
-async def _orchestrate_move_internal(bot_id: str, req: MoveRequest) -> MoveResponse:
-    """Internal orchestration logic (wrapped with timeout)."""
-    spec_env = await fetch_spec(bot_id)
+async def _orchestrate_move_internal(bot_id: str, req: MoveRequest, deadline: float) -> MoveResponse:
+    """
+    Internal orchestration logic; every stage finishes by ``deadline`` (event loop time).
+
+    In speculative mode the engine search starts together with the opening
+    book / tablebase probe and is cancelled when the probe answers.
+    """
+    settings = get_settings()
+    loop = asyncio.get_running_loop()
+
+    def time_left(cap: float) -> float:
+        return min(cap, deadline - loop.time())
 
-    # Detect phase and try knowledge sources
+    spec_env = await _run_stage("spec", fetch_spec(bot_id), time_left(settings.TOTAL_BOT_MOVE_TIMEOUT_SECONDS))
+
+    # Detect phase and engine parameters
     phase_decision = detect_phase(req.move_number)
+    remaining_ms = bot_clock_ms(req)
+    engine_query = decide_engine_params(spec_env, remaining_ms, phase_decision.phase)
+    # Leave room for the round trip within the move deadline
+    search_ms = int(time_left(settings.ENGINE_QUERY_TIMEOUT_SECONDS) * 1000) - settings.BOT_MOVE_ENGINE_OVERHEAD_MS
+    engine_query.time_limit_ms = max(10, min(engine_query.time_limit_ms, search_ms))
 
-    # Opening book (with timeout)
-    if phase_decision.use_book and spec_env.spec.opening.use_book_until_ply >= req.move_number * 2:
-        try:
-            book_move = await asyncio.wait_for(
-                get_opening_book_move(req.fen, spec_env.spec.opening.repertoire),
-                timeout=5.0,  # Knowledge query timeout
+    def start_engine() -> asyncio.Task:
+        return asyncio.ensure_future(
+            _run_stage(
+                "engine",
+                evaluate_position(req.fen, req.bot_color, engine_query, remaining_clock_ms=remaining_ms),
+                time_left(settings.ENGINE_QUERY_TIMEOUT_SECONDS),
             )
-            if book_move:
-                resp = MoveResponse(
-                    game_id=req.game_id,
-                    bot_id=bot_id,
-                    move=book_move,
-                    thinking_time_ms=50,
-                    debug_info=DebugInfo(phase="opening", mistake_type="none" if req.debug else None),
-                )
-                _record_move(resp)
-                return resp
-        except (asyncio.TimeoutError, Exception) as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Opening book query failed: {e}, continuing to engine")
+        )
 
-    # Endgame tablebase (with timeout)
-    if phase_decision.use_tablebase and spec_env.spec.endgame.allow_tablebases:
-        try:
-            tb_move = await asyncio.wait_for(
-                get_tablebase_move(req.fen),
-                timeout=5.0,  # Knowledge query timeout
-            )
-            if tb_move and spec_env.spec.endgame.reduce_mistakes_in_simple_endgames:
-                resp = MoveResponse(
-                    game_id=req.game_id,
-                    bot_id=bot_id,
-                    move=tb_move,
-                    thinking_time_ms=40,
-                    debug_info=DebugInfo(phase="endgame", mistake_type="none" if req.debug else None),
+    use_book = phase_decision.use_book and spec_env.spec.opening.use_book_until_ply >= req.move_number * 2
+    use_tablebase = phase_decision.use_tablebase and spec_env.spec.endgame.allow_tablebases
+    engine_task: Optional[asyncio.Task] = None
+    if (use_book or use_tablebase) and settings.BOT_MOVE_SPECULATIVE_ENGINE:
+        engine_task = start_engine()
+
+    try:
+        # Opening book
+        if use_book:
+            try:
+                book_move = await _run_stage(
+                    "book",
+                    get_opening_book_move(req.fen, spec_env.spec.opening.repertoire),
+                    time_left(settings.KNOWLEDGE_QUERY_TIMEOUT_SECONDS),
                 )
-                _record_move(resp)
-                return resp
-        except (asyncio.TimeoutError, Exception) as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Tablebase query failed: {e}, continuing to engine")
+                if book_move:
+                    resp = MoveResponse(
+                        game_id=req.game_id,
+                        bot_id=bot_id,
+                        move=book_move,
+                        thinking_time_ms=50,
+                        debug_info=DebugInfo(phase="opening", mistake_type="none" if req.debug else None),
+                    )
+                    _record_move(resp)
+                    return resp
+            except (asyncio.TimeoutError, Exception) as e:
+                logger.warning(f"Opening book query failed: {e}, continuing to engine")
 
-    # Engine parameters
-    remaining_ms = req.clocks.black_ms if req.bot_color == "black" else req.clocks.white_ms
-    engine_query = decide_engine_params(spec_env, remaining_ms, phase_decision.phase)
+        # Endgame tablebase
+        if use_tablebase:
+            try:
+                tb_move = await _run_stage(
+                    "tablebase",
+                    get_tablebase_move(req.fen),
+                    time_left(settings.KNOWLEDGE_QUERY_TIMEOUT_SECONDS),
+                )
+                if tb_move and spec_env.spec.endgame.reduce_mistakes_in_simple_endgames:
+                    resp = MoveResponse(
+                        game_id=req.game_id,
+                        bot_id=bot_id,
+                        move=tb_move,
+                        thinking_time_ms=40,
+                        debug_info=DebugInfo(phase="endgame", mistake_type="none" if req.debug else None),
+                    )
+                    _record_move(resp)
+                    return resp
+            except (asyncio.TimeoutError, Exception) as e:
+                logger.warning(f"Tablebase query failed: {e}, continuing to engine")
 
-    # Engine evaluation (with timeout)
-    try:
-        candidates = await asyncio.wait_for(
-            evaluate_position(req.fen, req.bot_color, engine_query),
-            timeout=20.0,  # Engine query timeout
-        )
-        candidates = sorted(candidates, key=lambda c: c.eval, reverse=True)
-    except (asyncio.TimeoutError, Exception) as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Engine evaluation failed: {e}, using fallback move")
-        # Generate fallback move
-        fallback_move = generate_random_legal_move(req.fen)
-        resp = MoveResponse(
-            game_id=req.game_id,
-            bot_id=bot_id,
-            move=fallback_move,
-            thinking_time_ms=int(engine_query.time_limit_ms),
-            debug_info=DebugInfo(phase="fallback", mistake_type="none" if req.debug else None),
-        )
-        _record_move(resp)
-        return resp
+        # Engine evaluation (already running in speculative mode)
+        if engine_task is not None:
+            bot_move_speculative_engine_total.labels(result="used").inc()
+        else:
+            engine_task = start_engine()
+        try:
+            candidates = await engine_task
+            candidates = sorted(candidates, key=lambda c: c.eval, reverse=True)
+        except (asyncio.TimeoutError, Exception) as e:
+            logger.warning(f"Engine evaluation failed: {e}, using fallback move")
+            # Generate fallback move
+            fallback_move = generate_random_legal_move(req.fen)
+            resp = MoveResponse(
+                game_id=req.game_id,
+                bot_id=bot_id,
+                move=fallback_move,
+                thinking_time_ms=int(engine_query.time_limit_ms),
+                debug_info=DebugInfo(phase="fallback", mistake_type="none" if req.debug else None),
+            )
+            _record_move(resp)
+            return resp
+    finally:
+        if engine_task is not None and not engine_task.done():
+            # A knowledge source answered: the speculative search is not needed
+            engine_task.cancel()
+            bot_move_speculative_engine_total.labels(result="cancelled").inc()
 
     # Mistake model
     m = spec_env.spec.mistake_model
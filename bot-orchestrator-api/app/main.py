@@ -8,6 +8,7 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.api.routes.health import router as health_router
 from app.api.routes.v1.bots import router as v1_bots_router
+from app.clients.http_pool import close_http_clients
 from app.core.config import get_settings
 from app.core.tracing import (
     instrument_fastapi,
@@ -22,6 +23,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     yield
     # Shutdown
+    await close_http_clients()
 
 
 def create_app() -> FastAPI:
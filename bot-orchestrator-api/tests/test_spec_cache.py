@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.clients import spec_cache
+from app.clients.config import DEFAULT_SPEC
+from app.clients.spec_cache import BotSpecCache, BotSpecNotFoundError
+from app.domain.bot_spec import BotSpecEnvelope
+
+
+class FakeConfigService:
+    def __init__(self):
+        self.calls = 0
+        self.version = "v1"
+        self.down = False
+        self.known = {"bot_blitz_1200"}
+
+    async def __call__(self, bot_id):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.down:
+            raise ConnectionError("config service down")
+        if bot_id not in self.known:
+            raise BotSpecNotFoundError(bot_id)
+        return BotSpecEnvelope(bot_id=bot_id, version=self.version, spec=DEFAULT_SPEC)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(spec_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch_then_hit():
+    service = FakeConfigService()
+    cache = BotSpecCache(service, ttl=60)
+
+    results = await asyncio.gather(*(cache.get("bot_blitz_1200") for _ in range(10)))
+    await cache.get("bot_blitz_1200")
+
+    assert service.calls == 1
+    assert all(result.version == "v1" for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stale_spec_is_served_while_refreshed(clock):
+    service = FakeConfigService()
+    cache = BotSpecCache(service, ttl=60, stale_ttl=600)
+    await cache.get("bot_blitz_1200")
+
+    service.version = "v2"
+    clock[0] += 120
+    assert (await cache.get("bot_blitz_1200")).version == "v1"  # No wait for the refresh
+    await asyncio.sleep(0.05)
+    assert (await cache.get("bot_blitz_1200")).version == "v2"
+    assert service.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_last_known_spec_survives_config_outage(clock):
+    service = FakeConfigService()
+    cache = BotSpecCache(service, ttl=60, stale_ttl=600)
+    await cache.get("bot_blitz_1200")
+
+    service.down = True
+    clock[0] += 3600  # Past the stale window: fetched in the foreground, which fails
+    assert (await cache.get("bot_blitz_1200")).version == "v1"
+
+    with pytest.raises(ConnectionError):
+        await cache.get("bot_unknown_to_cache")
+
+
+@pytest.mark.asyncio
+async def test_unknown_bots_are_negatively_cached(clock):
+    service = FakeConfigService()
+    cache = BotSpecCache(service, negative_ttl=30)
+
+    for _ in range(3):
+        with pytest.raises(BotSpecNotFoundError):
+            await cache.get("bot_missing")
+    assert service.calls == 1
+
+    clock[0] += 31
+    service.known.add("bot_missing")
+    assert (await cache.get("bot_missing")).bot_id == "bot_missing"
+
+
+@pytest.mark.asyncio
+async def test_versioned_invalidation():
+    service = FakeConfigService()
+    cache = BotSpecCache(service, ttl=60)
+    await cache.get("bot_blitz_1200")
+
+    assert cache.invalidate("bot_blitz_1200", version="v1") == 0  # Already current
+    service.version = "v2"
+    assert cache.invalidate("bot_blitz_1200", version="v2") == 1
+    assert (await cache.get("bot_blitz_1200")).version == "v2"
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
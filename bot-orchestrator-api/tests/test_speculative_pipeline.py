@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.clients.config import DEFAULT_SPEC
+from app.domain.bot_spec import BotSpecEnvelope
+from app.domain.candidate import Candidate
+from app.domain.move_request import MoveRequest
+from app.logic import orchestrator
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def _request(white_ms=300000, increment_ms=0, move_number=1):
+    return MoveRequest(
+        game_id="g_1",
+        bot_color="white",
+        fen=START_FEN,
+        move_number=move_number,
+        clocks={"white_ms": white_ms, "black_ms": 300000, "increment_ms": increment_ms},
+    )
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    calls = {"engine_started": 0, "engine_cancelled": 0, "remaining_clock_ms": None}
+    behaviour = {"book_move": None, "book_delay": 0.1, "engine_delay": 0.1}
+
+    async def fetch_spec(bot_id):
+        return BotSpecEnvelope(bot_id=bot_id, version="v1", spec=DEFAULT_SPEC)
+
+    async def get_opening_book_move(fen, repertoire):
+        await asyncio.sleep(behaviour["book_delay"])
+        return behaviour["book_move"]
+
+    async def evaluate_position(fen, side_to_move, query, remaining_clock_ms=None):
+        calls["engine_started"] += 1
+        calls["remaining_clock_ms"] = remaining_clock_ms
+        try:
+            await asyncio.sleep(behaviour["engine_delay"])
+        except asyncio.CancelledError:
+            calls["engine_cancelled"] += 1
+            raise
+        return [Candidate(move="e2e4", eval=0.3, depth=query.max_depth)]
+
+    monkeypatch.setattr(orchestrator, "fetch_spec", fetch_spec)
+    monkeypatch.setattr(orchestrator, "get_opening_book_move", get_opening_book_move)
+    monkeypatch.setattr(orchestrator, "evaluate_position", evaluate_position)
+    return calls, behaviour
+
+
+@pytest.mark.asyncio
+async def test_book_hit_cancels_speculative_engine_search(pipeline):
+    calls, behaviour = pipeline
+    behaviour["book_move"] = "d2d4"
+    behaviour["engine_delay"] = 1.0
+
+    resp = await orchestrator.orchestrate_move("bot_1", _request())
+
+    assert resp.move == "d2d4"
+    assert calls["engine_started"] == 1
+    await asyncio.sleep(0.01)  # Cancellation reaches the request
+    assert calls["engine_cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_book_miss_overlaps_engine_search(pipeline):
+    calls, behaviour = pipeline
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    resp = await orchestrator.orchestrate_move("bot_1", _request())
+
+    assert resp.move == "e2e4"
+    assert loop.time() - start < 0.18  # Book and engine ran concurrently, not back to back
+    assert calls["remaining_clock_ms"] == 300000
+
+
+def test_move_deadline_follows_the_bot_clock():
+    deadline = orchestrator.move_deadline_seconds
+    assert deadline(_request(white_ms=60000)) == pytest.approx(3.0)
+    assert deadline(_request(white_ms=60000, increment_ms=1000)) == pytest.approx(4.0)
+    assert deadline(_request(white_ms=1000)) == pytest.approx(0.3)  # Floor
+    assert deadline(_request(white_ms=3_600_000)) == pytest.approx(30.0)  # Cap
+
+
+@pytest.mark.asyncio
+async def test_clock_deadline_falls_back_to_a_legal_move(pipeline):
+    calls, behaviour = pipeline
+    behaviour["book_delay"] = 5.0
+    behaviour["engine_delay"] = 5.0
+
+    resp = await orchestrator.orchestrate_move("bot_1", _request(white_ms=2000))
+
+    assert resp.debug_info.phase == "fallback"
+    assert resp.thinking_time_ms <= 300
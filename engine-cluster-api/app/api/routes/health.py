@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.core.config import get_settings
+from app.engine.evaluator import get_engine_pool
 
 router = APIRouter()
 
@@ -8,4 +9,8 @@ router = APIRouter()
 @router.get("/health")
 async def health_check() -> dict:
     settings = get_settings()
-    return {"status": "ok", "service": settings.SERVICE_NAME}
+    response = {"status": "ok", "service": settings.SERVICE_NAME}
+    pool = get_engine_pool()
+    if pool is not None:
+        response["engines"] = pool.stats()
+    return response
@@ -1,18 +1,111 @@
-from fastapi import APIRouter
+import asyncio
+from functools import partial
+from typing import AsyncIterator, Literal, Optional
 
+import anyio
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import get_settings
 from app.domain.evaluate_request import EvaluateRequest
 from app.domain.evaluate_response import EvaluateResponse
+from app.engine.batch import evaluate_batch, parse_ndjson_stream, stream_ndjson
+from app.engine.engine_pool import EnginePoolSaturatedError, SearchPriority
 from app.engine.evaluator import evaluate_position
 
 router = APIRouter()
 
 
+class _UploadStreamingResponse(StreamingResponse):
+    """
+    Streaming response sent while the request body is still being read.
+
+    StreamingResponse listens for a client disconnect on ``receive`` as soon
+    as it starts, which would take body chunks away from the handler; this
+    one starts listening only once ``body_read`` is set.
+    """
+
+    def __init__(self, content: AsyncIterator[bytes], body_read: asyncio.Event, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_read = body_read
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async with anyio.create_task_group() as task_group:
+
+            async def wrap(func) -> None:
+                await func()
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(wrap, partial(self.stream_response, send))
+            await self.body_read.wait()
+            await wrap(partial(self.listen_for_disconnect, receive))
+
+        if self.background is not None:
+            await self.background()
+
+
+async def _read_body(request: Request, body_read: asyncio.Event) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in request.stream():
+            yield chunk
+    finally:
+        body_read.set()
+
+
 @router.post("/evaluate", response_model=EvaluateResponse)
 async def evaluate(request: EvaluateRequest) -> EvaluateResponse:
     """Evaluate a chess position and return candidate moves with evaluations."""
-    candidates, time_ms = await evaluate_position(request)
+    try:
+        candidates, time_ms = await evaluate_position(request)
+    except EnginePoolSaturatedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     return EvaluateResponse(
         candidates=candidates,
         fen=request.fen,
         time_ms=time_ms,
     )
+
+
+@router.post(
+    "/evaluate/batch",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def evaluate_batch_ndjson(
+    request: Request,
+    deadline_ms: Optional[int] = Query(
+        None, ge=100, le=3_600_000, description="Deadline for the whole batch"
+    ),
+    priority: Literal["interactive", "background"] = Query(
+        "background", description="Queue priority relative to other engine traffic"
+    ),
+) -> StreamingResponse:
+    """
+    Evaluate many positions in one request.
+
+    The body is NDJSON with one evaluate request (plus an optional ``id``) per
+    line. Lines are evaluated as they arrive, and results are streamed back as
+    NDJSON in completion order, each carrying the ``index`` of its input line.
+    A body with more than ``ENGINE_BATCH_MAX_POSITIONS`` lines gets a
+    ``batch_too_large`` error for the first line over the limit, and the rest
+    is not read.
+    """
+    settings = get_settings()
+    body_read = asyncio.Event()
+    items = parse_ndjson_stream(_read_body(request, body_read), settings.ENGINE_BATCH_MAX_POSITIONS)
+    results = evaluate_batch(
+        items,
+        concurrency=settings.ENGINE_BATCH_CONCURRENCY,
+        priority=(
+            SearchPriority.INTERACTIVE if priority == "interactive" else SearchPriority.BACKGROUND
+        ),
+        deadline=None if deadline_ms is None else deadline_ms / 1000.0,
+    )
+    return _UploadStreamingResponse(
+        stream_ndjson(results), body_read, media_type="application/x-ndjson"
+    )
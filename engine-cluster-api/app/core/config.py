@@ -20,6 +20,28 @@ class Settings(BaseSettings):
     ENGINE_THREADS: int = 1
     ENGINE_HASH_MB: int = 128
 
+    # Engine pool (long-lived engines shared by all requests)
+    ENGINE_POOL_SIZE: int = 0  # 0: one engine per ENGINE_THREADS cores
+    ENGINE_POOL_MAX_WAITERS: int = 64  # Requests queued when all engines are busy
+    ENGINE_POOL_ACQUIRE_TIMEOUT_MS: int = 2000  # Max wait for an idle engine
+    ENGINE_POOL_HEALTH_CHECK_INTERVAL_SECONDS: float = 30.0
+    ENGINE_SEARCH_GRACE_MS: int = 1000  # Beyond the time limit before a search counts as hung
+    ENGINE_NEW_GAME_ON_CHECKOUT: bool = True  # Send ucinewgame (clear hash) on each checkout
+
+    # Scheduling (interactive bot moves vs. background analysis)
+    ENGINE_INTERACTIVE_MAX_ENGINES: int = 0  # Engines interactive requests may hold (0: whole pool)
+    ENGINE_BACKGROUND_MAX_ENGINES: int = 0  # Engines background requests may hold (0: half the pool)
+    ENGINE_PREEMPT_BACKGROUND_AFTER_MS: int = 250  # Stop background searches this old for queued interactive requests (0: never)
+
+    # Batch evaluation
+    ENGINE_BATCH_MAX_POSITIONS: int = 1000
+    ENGINE_BATCH_CONCURRENCY: int = 4  # Positions of one batch searched at once
+
+    # Evaluation cache
+    EVAL_CACHE_MAX_ENTRIES: int = 100000  # In-process tier (0 disables it)
+    EVAL_CACHE_REDIS_URL: Optional[str] = None  # Shared tier (None: in-process only)
+    EVAL_CACHE_REDIS_TTL_SECONDS: int = 86400
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,47 @@
+"""Prometheus metrics for engine-cluster-api."""
+
+from prometheus_client import Counter, Gauge, Histogram, generate_latest
+from prometheus_client.openmetrics.exposition import CONTENT_TYPE_LATEST
+
+# Evaluation cache metrics
+engine_eval_cache_requests_total = Counter(
+    "engine_eval_cache_requests_total",
+    "Total number of evaluation cache lookups",
+    ["result"],  # result: "memory", "redis", "miss"
+)
+
+engine_eval_cache_saved_engine_ms_total = Counter(
+    "engine_eval_cache_saved_engine_ms_total",
+    "Engine milliseconds saved by evaluation cache hits",
+)
+
+engine_eval_cache_entries = Gauge(
+    "engine_eval_cache_entries",
+    "Number of evaluations in the in-process cache tier",
+)
+
+# Search metrics
+engine_searches_total = Counter(
+    "engine_searches_total",
+    "Total number of engine search requests",
+    ["mode"],  # mode: "new" (started a search), "joined" (shared a running search)
+)
+
+# Scheduling metrics
+engine_queue_wait_seconds = Histogram(
+    "engine_queue_wait_seconds",
+    "Time requests waited for an engine",
+    ["priority_class"],  # priority_class: "interactive", "background"
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+engine_preemptions_total = Counter(
+    "engine_preemptions_total",
+    "Total number of searches stopped early to free an engine for higher-priority requests",
+    ["priority_class"],  # Class of the preempted search
+)
+
+
+def get_metrics_response():
+    """Get Prometheus metrics in text format."""
+    return generate_latest(), CONTENT_TYPE_LATEST
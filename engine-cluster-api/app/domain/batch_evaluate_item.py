@@ -0,0 +1,12 @@
+"""Batch evaluation item model."""
+from typing import Optional
+
+from pydantic import Field
+
+from .evaluate_request import EvaluateRequest
+
+
+class BatchEvaluateItem(EvaluateRequest):
+    """One position of a batch evaluation (one NDJSON line)."""
+
+    id: Optional[str] = Field(default=None, description="Caller reference echoed in the result")
@@ -0,0 +1,20 @@
+"""Batch evaluation result model."""
+from __future__ import annotations
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from .candidate import Candidate
+
+
+class BatchEvaluateResult(BaseModel):
+    """Result for one position of a batch evaluation (one NDJSON line)."""
+
+    index: int = Field(..., description="Zero-based line number of the position in the batch")
+    id: Optional[str] = None
+    fen: Optional[str] = None
+    candidates: Optional[List[Candidate]] = None
+    time_ms: Optional[int] = None
+    error: Optional[str] = Field(
+        default=None, description="invalid_request, deadline_exceeded, engine_busy or engine_error"
+    )
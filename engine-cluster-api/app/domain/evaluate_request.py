@@ -1,5 +1,5 @@
 """Engine evaluation request model."""
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -12,3 +12,8 @@ class EvaluateRequest(BaseModel):
     max_depth: int = Field(default=12, ge=1, le=30, description="Maximum search depth")
     time_limit_ms: int = Field(default=1000, ge=10, le=30000, description="Time limit in milliseconds")
     multi_pv: int = Field(default=1, ge=1, le=10, description="Number of principal variations")
+    remaining_clock_ms: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Caller's remaining game clock in milliseconds; earlier deadlines get engines first",
+    )
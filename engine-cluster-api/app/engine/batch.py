@@ -0,0 +1,150 @@
+"""Streaming evaluation of position batches."""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterable, AsyncIterator, Dict, Optional, Union
+
+from pydantic import ValidationError
+
+from app.domain.batch_evaluate_item import BatchEvaluateItem
+from app.domain.batch_evaluate_result import BatchEvaluateResult
+from app.engine.engine_pool import EnginePoolSaturatedError, SearchPriority
+from app.engine.evaluator import evaluate_position
+
+
+def _parse_line(line: bytes) -> Union[BatchEvaluateItem, str]:
+    try:
+        return BatchEvaluateItem.model_validate_json(line)
+    except ValidationError as e:
+        return f"invalid_request: {e.errors()[0]['msg']}"
+
+
+async def parse_ndjson_stream(
+    chunks: AsyncIterable[bytes], max_items: int
+) -> AsyncIterator[Union[BatchEvaluateItem, str]]:
+    """
+    Parse an NDJSON body as it arrives, one position per non-empty line.
+
+    Invalid lines are yielded as their error message. Reading stops after an
+    error for the line past ``max_items``.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        buffer = b""
+        async for chunk in chunks:
+            *complete, buffer = (buffer + chunk).split(b"\n")
+            for line in complete:
+                yield line
+        yield buffer
+
+    count = 0
+    async for line in lines():
+        if not line.strip():
+            continue
+        if count == max_items:
+            yield f"batch_too_large: more than {max_items} positions"
+            return
+        count += 1
+        yield _parse_line(line)
+
+
+async def evaluate_batch(
+    items: AsyncIterable[Union[BatchEvaluateItem, str]],
+    concurrency: int,
+    priority: SearchPriority = SearchPriority.BACKGROUND,
+    deadline: Optional[float] = None,
+) -> AsyncIterator[BatchEvaluateResult]:
+    """
+    Evaluate a batch, yielding results in completion order.
+
+    Positions are started as they are read from ``items``, so searching
+    overlaps the upload. At most ``concurrency`` positions are searched (or
+    queued for an engine) at once, with ``priority`` relative to other
+    traffic. Positions not done by ``deadline`` (seconds from now) are
+    reported as ``deadline_exceeded``. Closing the iterator cancels the
+    remaining work.
+    """
+    loop = asyncio.get_running_loop()
+    expires_at = None if deadline is None else loop.time() + deadline
+    semaphore = asyncio.Semaphore(concurrency)
+    # Results, then None once every item is read (or the error reading them)
+    results: asyncio.Queue[Union[BatchEvaluateResult, Exception, None]] = asyncio.Queue()
+
+    async def run(index: int, item: BatchEvaluateItem) -> None:
+        async with semaphore:
+            acquire_timeout = None if expires_at is None else max(expires_at - loop.time(), 0.001)
+            try:
+                candidates, time_ms = await evaluate_position(
+                    item, priority=priority, acquire_timeout=acquire_timeout
+                )
+            except EnginePoolSaturatedError:
+                result = BatchEvaluateResult(
+                    index=index, id=item.id, fen=item.fen, error="engine_busy"
+                )
+            except Exception:
+                result = BatchEvaluateResult(
+                    index=index, id=item.id, fen=item.fen, error="engine_error"
+                )
+            else:
+                result = BatchEvaluateResult(
+                    index=index, id=item.id, fen=item.fen, candidates=candidates, time_ms=time_ms
+                )
+        results.put_nowait(result)
+
+    unfinished: Dict[int, BatchEvaluateItem] = {}
+    tasks: Dict[int, asyncio.Task] = {}
+
+    async def read() -> None:
+        index = 0
+        try:
+            async for item in items:
+                if isinstance(item, str):
+                    results.put_nowait(BatchEvaluateResult(index=index, error=item))
+                else:
+                    unfinished[index] = item
+                    tasks[index] = asyncio.create_task(run(index, item))
+                index += 1
+        except Exception as e:
+            results.put_nowait(e)
+        else:
+            results.put_nowait(None)
+
+    reader = asyncio.create_task(read())
+    read_all = False
+    try:
+        while not read_all or unfinished:
+            timeout = None if expires_at is None else expires_at - loop.time()
+            try:
+                result = await asyncio.wait_for(results.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if isinstance(result, Exception):
+                raise result
+            if result is None:
+                read_all = True
+                continue
+            unfinished.pop(result.index, None)
+            yield result
+        while not results.empty():  # Finished right at the deadline
+            result = results.get_nowait()
+            if isinstance(result, BatchEvaluateResult):
+                unfinished.pop(result.index, None)
+                yield result
+        for index in sorted(unfinished):
+            item = unfinished[index]
+            yield BatchEvaluateResult(
+                index=index, id=item.id, fen=item.fen, error="deadline_exceeded"
+            )
+    finally:
+        reader.cancel()
+        for task in tasks.values():
+            task.cancel()
+
+
+async def stream_ndjson(results: AsyncIterator[BatchEvaluateResult]) -> AsyncIterator[bytes]:
+    """Encode results as NDJSON lines."""
+    async for result in results:
+        yield (
+            json.dumps(result.model_dump(exclude_none=True), separators=(",", ":")) + "\n"
+        ).encode()
@@ -0,0 +1,480 @@
+"""Pool of long-lived, pre-warmed UCI engine processes."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import chess
+import chess.engine
+
+from app.core.metrics import engine_preemptions_total, engine_queue_wait_seconds
+
+logger = logging.getLogger(__name__)
+
+EngineFactory = Callable[[], Awaitable[chess.engine.Protocol]]
+
+
+class EnginePoolSaturatedError(Exception):
+    """All engines are busy and the request could not be queued (or waited too long)."""
+
+
+class SearchPriority(IntEnum):
+    """Scheduling class of a request; queued requests get a free engine lowest class first."""
+
+    INTERACTIVE = 0  # Bot moves and other latency-sensitive requests
+    BACKGROUND = 1  # Batch analysis
+
+
+async def spawn_uci_engine(
+    path: str, options: Mapping[str, Union[str, int, bool]]
+) -> chess.engine.Protocol:
+    """Start a UCI engine, configure it and wait until it is ready to search."""
+    _, engine = await chess.engine.popen_uci(path)
+    try:
+        await engine.configure(options)
+        await engine.ping()  # Hash is allocated before the first search
+    except BaseException:
+        await _quit(engine)
+        raise
+    return engine
+
+
+async def _quit(engine: chess.engine.Protocol, timeout: float = 2.0) -> None:
+    try:
+        await asyncio.wait_for(engine.quit(), timeout)
+    except Exception:
+        pass  # Already gone or hung; the process is reaped with its transport
+
+
+@dataclass
+class _QueuedRequest:
+    priority: SearchPriority
+    deadline: float  # Event loop time by which the caller needs its result
+    seq: int
+    future: asyncio.Future
+    owner: Optional[object] = None
+
+    def key(self) -> Tuple[int, float, int]:
+        return self.priority, self.deadline, self.seq
+
+
+@dataclass
+class _Lease:
+    priority: SearchPriority
+    started: float
+    on_preempt: Optional[Callable[[], None]] = None
+    preempted: bool = False
+    owner: Optional[object] = None
+
+
+class EnginePool:
+    """
+    Fixed-size pool of warm engine processes shared by all requests.
+
+    Engines are spawned and configured once, so a search pays neither the
+    process spawn nor the UCI handshake and ``Hash`` allocation. Requests
+    check an idle engine out and return it afterwards; when every engine is
+    busy, up to ``max_waiters`` requests wait (for at most
+    ``acquire_timeout`` seconds) and further requests are rejected with
+    ``EnginePoolSaturatedError``.
+
+    A freed engine goes to the waiter with the best ``SearchPriority`` and,
+    within a priority, the earliest deadline. ``quotas`` caps the engines a
+    priority class may hold at once, so background work cannot occupy the
+    engines interactive requests need. When ``preempt_after`` is set, a
+    queued request makes the pool preempt the longest-running lower-priority
+    checkout that has run at least that long and registered ``on_preempt``.
+    A checkout identified by an ``owner`` can be moved to a better class or
+    an earlier deadline with ``escalate`` while it waits or runs.
+
+    Each checkout starts a new game (``ucinewgame``) unless
+    ``new_game_on_checkout`` is off, in which case engines keep their hash
+    table across requests. Engines that crash, fail a search or stop
+    answering the periodic ``isready`` health check are replaced.
+    """
+
+    def __init__(
+        self,
+        factory: EngineFactory,
+        size: int,
+        max_waiters: int = 64,
+        acquire_timeout: float = 2.0,
+        health_check_interval: float = 30.0,
+        ping_timeout: float = 2.0,
+        new_game_on_checkout: bool = True,
+        quotas: Optional[Mapping[SearchPriority, int]] = None,
+        preempt_after: Optional[float] = None,
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_waiters = max_waiters
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self.ping_timeout = ping_timeout
+        self.new_game_on_checkout = new_game_on_checkout
+        self.quotas: Dict[SearchPriority, int] = dict(quotas or {})
+        self.preempt_after = preempt_after
+        self._idle: Deque[chess.engine.Protocol] = deque()
+        self._engines: Set[chess.engine.Protocol] = set()
+        self._leases: Dict[chess.engine.Protocol, _Lease] = {}
+        self._waiters: List[_QueuedRequest] = []
+        self._waiter_seq = itertools.count()
+        self._preempt_timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._health_task: asyncio.Task | None = None
+        self._closed = False
+
+    def stats(self) -> dict:
+        """Current pool occupancy."""
+        return {
+            "size": self.size,
+            "alive": len(self._engines),
+            "idle": len(self._idle),
+            "waiting": self.waiting(),
+            "classes": {
+                priority.name.lower(): {
+                    "in_use": self.in_use(priority),
+                    "waiting": self.waiting(priority),
+                    "quota": self.quotas.get(priority, self.size),
+                }
+                for priority in SearchPriority
+            },
+        }
+
+    def waiting(self, priority: Optional[SearchPriority] = None) -> int:
+        """Number of queued requests (of one priority, if given)."""
+        return sum(
+            1
+            for waiter in self._waiters
+            if not waiter.future.done() and (priority is None or waiter.priority == priority)
+        )
+
+    def in_use(self, priority: SearchPriority) -> int:
+        """Number of engines checked out by one priority class."""
+        return sum(1 for lease in self._leases.values() if lease.priority == priority)
+
+    async def start(self) -> None:
+        """Spawn all engines concurrently and start the health checks."""
+        results = await asyncio.gather(
+            *(self.factory() for _ in range(self.size)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to start engine: {result}")
+                self._spawn_in_background()
+            else:
+                self._engines.add(result)
+                self._idle.append(result)
+        if self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def analyse(
+        self,
+        board: chess.Board,
+        limit: chess.engine.Limit,
+        multipv: int = 1,
+        timeout: float | None = None,
+    ) -> List[chess.engine.InfoDict]:
+        """
+        Search a position on a pooled engine.
+
+        Args:
+            board: Position to search
+            limit: Search limit
+            multipv: Number of principal variations
+            timeout: Seconds after which the engine is considered hung
+
+        Returns:
+            One info dict per principal variation, best first
+        """
+        async with self.checkout() as engine:
+            game = object() if self.new_game_on_checkout else None
+            return await asyncio.wait_for(
+                engine.analyse(board, limit, multipv=multipv, game=game), timeout
+            )
+
+    @asynccontextmanager
+    async def checkout(
+        self,
+        priority: SearchPriority = SearchPriority.INTERACTIVE,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        on_preempt: Optional[Callable[[], None]] = None,
+        owner: Optional[object] = None,
+    ) -> AsyncIterator[chess.engine.Protocol]:
+        """
+        Borrow an idle engine for the duration of the block.
+
+        Args:
+            priority: Queue priority class while all engines are busy
+            timeout: Max seconds to wait for an engine (defaults to ``acquire_timeout``)
+            deadline: Event loop time by which the caller needs its result,
+                for earliest-deadline-first order within the class (defaults
+                to the end of the wait)
+            on_preempt: Called (once) when a higher-priority request needs the
+                engine; the holder should stop its search and return it
+            owner: Identifies the checkout to ``escalate``
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        if deadline is None:
+            deadline = asyncio.get_running_loop().time() + timeout
+        engine = await self._acquire(priority, timeout, deadline, owner)
+        self._leases[engine].on_preempt = on_preempt
+        ok = False
+        try:
+            yield engine
+            ok = True
+        finally:
+            self._release(engine, ok)
+
+    def escalate(
+        self, owner: object, priority: SearchPriority, deadline: Optional[float] = None
+    ) -> bool:
+        """
+        Move an owner's checkout to a better class and/or an earlier deadline.
+
+        A queued request is reordered (and may now preempt lower-priority
+        checkouts); a running one counts against its new class and is no
+        longer preempted for requests of that class.
+
+        Returns:
+            False when the checkout is already being preempted
+        """
+        for waiter in self._waiters:
+            if waiter.owner is owner and not waiter.future.done():
+                waiter.priority = min(waiter.priority, priority)
+                if deadline is not None:
+                    waiter.deadline = min(waiter.deadline, deadline)
+                break
+        else:
+            lease = next((lease for lease in self._leases.values() if lease.owner is owner), None)
+            if lease is None:
+                return True  # Not checked out (yet or anymore)
+            if lease.preempted:
+                return False
+            lease.priority = min(lease.priority, priority)
+        self._dispatch()  # A new class may have quota left, or free the old one
+        self._maybe_preempt()
+        return True
+
+    def _has_quota(self, priority: SearchPriority) -> bool:
+        return self.in_use(priority) < self.quotas.get(priority, self.size)
+
+    async def _acquire(
+        self,
+        priority: SearchPriority,
+        timeout: float,
+        deadline: float,
+        owner: Optional[object] = None,
+    ) -> chess.engine.Protocol:
+        loop = asyncio.get_running_loop()
+        enqueued = loop.time()
+        while True:
+            if self._closed:
+                raise RuntimeError("Engine pool is closed")
+            # Idle engines only remain while no queued request may take them
+            if self._idle and self._has_quota(priority):
+                engine = self._idle.popleft()
+                self._leases[engine] = _Lease(priority, loop.time(), owner=owner)
+            else:
+                if self.waiting() >= self.max_waiters:
+                    raise EnginePoolSaturatedError("All engines are busy")
+                waiter = _QueuedRequest(
+                    priority, deadline, next(self._waiter_seq), loop.create_future(), owner
+                )
+                self._waiters.append(waiter)
+                self._maybe_preempt()
+                try:
+                    engine = await asyncio.wait_for(
+                        waiter.future, max(enqueued + timeout - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    raise EnginePoolSaturatedError("Timed out waiting for an engine") from None
+                except asyncio.CancelledError:
+                    if waiter.future.done() and not waiter.future.cancelled():
+                        # Handed over just as we were cancelled
+                        self._leases.pop(waiter.future.result(), None)
+                        self._put_idle(waiter.future.result())
+                    raise
+                finally:
+                    self._prune_waiters()
+            if _is_alive(engine):
+                engine_queue_wait_seconds.labels(priority_class=priority.name.lower()).observe(
+                    loop.time() - enqueued
+                )
+                return engine
+            self._leases.pop(engine, None)
+            self._replace(engine)
+            self._dispatch()
+
+    def _prune_waiters(self) -> None:
+        self._waiters = [waiter for waiter in self._waiters if not waiter.future.done()]
+
+    def _next_waiter(self) -> Optional[_QueuedRequest]:
+        """The queued request to serve next: best class with quota left, then earliest deadline."""
+        eligible = [
+            waiter
+            for waiter in self._waiters
+            if not waiter.future.done() and self._has_quota(waiter.priority)
+        ]
+        return min(eligible, key=_QueuedRequest.key, default=None)
+
+    def _put_idle(self, engine: chess.engine.Protocol) -> None:
+        """Hand an engine to the best queued request, or park it."""
+        self._idle.append(engine)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._idle:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            engine = self._idle.popleft()
+            now = asyncio.get_running_loop().time()
+            self._leases[engine] = _Lease(waiter.priority, now, owner=waiter.owner)
+            waiter.future.set_result(engine)
+
+    def _maybe_preempt(self) -> None:
+        """Preempt lower-priority checkouts that hold engines queued requests need."""
+        if self.preempt_after is None or self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        if self._preempt_timer is not None:
+            self._preempt_timer.cancel()
+            self._preempt_timer = None
+
+        queued = sorted(
+            (w for w in self._waiters if not w.future.done() and self._has_quota(w.priority)),
+            key=_QueuedRequest.key,
+        )
+        # Engines already being given back will serve the first requests
+        pending = sum(1 for lease in self._leases.values() if lease.preempted)
+        for waiter in queued[pending:]:
+            candidates = [
+                lease
+                for lease in self._leases.values()
+                if lease.priority > waiter.priority
+                and lease.on_preempt is not None
+                and not lease.preempted
+            ]
+            if not candidates:
+                return
+            now = loop.time()
+            oldest = min(candidates, key=lambda lease: lease.started)
+            if now - oldest.started < self.preempt_after:
+                # Check again once the longest-running search becomes preemptible
+                self._preempt_timer = loop.call_later(
+                    oldest.started + self.preempt_after - now, self._maybe_preempt
+                )
+                return
+            oldest.preempted = True
+            engine_preemptions_total.labels(priority_class=oldest.priority.name.lower()).inc()
+            oldest.on_preempt()
+
+    def _release(self, engine: chess.engine.Protocol, ok: bool) -> None:
+        self._leases.pop(engine, None)
+        if self._closed:
+            return  # close() has quit every engine
+        if ok and _is_alive(engine):
+            self._put_idle(engine)
+        else:
+            # A failed or cancelled search may leave the engine mid-search
+            self._track(self._recheck(engine))
+            self._dispatch()  # The freed quota may admit an idle engine's waiter
+
+    async def _recheck(self, engine: chess.engine.Protocol) -> None:
+        if await self._responds(engine) and not self._closed:
+            self._put_idle(engine)
+        else:
+            self._replace(engine)
+
+    async def _responds(self, engine: chess.engine.Protocol) -> bool:
+        if not _is_alive(engine):
+            return False
+        try:
+            await asyncio.wait_for(engine.ping(), self.ping_timeout)
+            return True
+        except Exception:
+            return False
+
+    def _replace(self, engine: chess.engine.Protocol) -> None:
+        """Retire an engine and spawn its replacement in the background."""
+        if engine in self._engines:
+            self._engines.discard(engine)
+            logger.warning("Replacing unhealthy engine")
+            self._track(_quit(engine))
+            self._spawn_in_background()
+
+    def _spawn_in_background(self) -> None:
+        self._track(self._spawn_with_retry())
+
+    async def _spawn_with_retry(self) -> None:
+        delay = 0.5
+        while not self._closed:
+            try:
+                engine = await self.factory()
+            except Exception as e:
+                logger.error(f"Failed to start engine, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+            if self._closed:
+                await _quit(engine)
+                return
+            self._engines.add(engine)
+            self._put_idle(engine)
+            return
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            idle = list(self._idle)
+            self._idle.clear()
+            results = await asyncio.gather(*(self._responds(engine) for engine in idle))
+            for engine, healthy in zip(idle, results):
+                if healthy:
+                    self._put_idle(engine)
+                else:
+                    self._replace(engine)
+
+    def _track(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Stop health checks and quit all engines."""
+        self._closed = True
+        if self._preempt_timer is not None:
+            self._preempt_timer.cancel()
+        if self._health_task is not None:
+            self._health_task.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._health_task is not None:
+            await asyncio.gather(self._health_task, return_exceptions=True)
+        await asyncio.gather(*(_quit(engine) for engine in self._engines))
+        self._engines.clear()
+
+
+def _is_alive(engine: chess.engine.Protocol) -> bool:
+    return not engine.returncode.done()
@@ -0,0 +1,190 @@
+"""Two-tier cache of engine evaluations keyed by Zobrist hash."""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import chess
+import chess.polyglot
+
+from app.core.metrics import (
+    engine_eval_cache_entries,
+    engine_eval_cache_requests_total,
+    engine_eval_cache_saved_engine_ms_total,
+)
+from app.domain.candidate import Candidate
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[int, int]  # (Zobrist hash, multi_pv)
+
+
+@dataclass
+class CachedEvaluation:
+    """A stored search result."""
+
+    candidates: List[Candidate]
+    depth: int  # Depth reached by every candidate
+    time_ms: int  # Engine time the search took
+
+
+def cache_key(board: chess.Board, multi_pv: int) -> CacheKey:
+    """Key of a position: the Zobrist hash covers pieces, side to move, castling and en passant."""
+    return chess.polyglot.zobrist_hash(board), multi_pv
+
+
+class DepthWeightedLRU:
+    """
+    In-process tier with GreedyDual eviction weighted by search depth.
+
+    Every access gives an entry the priority ``age + depth``; when full, the
+    entry with the lowest priority is evicted and its priority becomes the new
+    ``age``. Deep results therefore survive longer than shallow ones, while
+    entries nobody reads still age out like in a plain LRU.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: Dict[CacheKey, CachedEvaluation] = {}
+        self._priority: Dict[CacheKey, float] = {}
+        self._heap: List[Tuple[float, int, CacheKey]] = []  # Lazily invalidated
+        self._age = 0.0
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[CachedEvaluation]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._touch(key, entry)
+        return entry
+
+    def put(self, key: CacheKey, entry: CachedEvaluation) -> None:
+        if self.max_entries <= 0:
+            return
+        if key not in self._entries:
+            while len(self._entries) >= self.max_entries:
+                self._evict()
+        self._entries[key] = entry
+        self._touch(key, entry)
+
+    def _touch(self, key: CacheKey, entry: CachedEvaluation) -> None:
+        priority = self._age + entry.depth
+        self._priority[key] = priority
+        self._counter += 1
+        heapq.heappush(self._heap, (priority, self._counter, key))
+        if len(self._heap) > 4 * len(self._entries) + 64:
+            self._compact()
+
+    def _evict(self) -> None:
+        while self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            if self._priority.get(key) == priority:
+                del self._entries[key]
+                del self._priority[key]
+                self._age = priority
+                return
+
+    def _compact(self) -> None:
+        self._heap = [
+            (priority, counter, key)
+            for priority, counter, key in self._heap
+            if self._priority.get(key) == priority
+        ]
+        heapq.heapify(self._heap)
+
+
+class EvaluationCache:
+    """
+    Evaluation cache with an in-process tier in front of Redis.
+
+    A stored result answers a request for the same position and ``multi_pv``
+    when it was searched at least as deep as the requested ``max_depth``.
+    Redis results are promoted into the process tier; a new result only
+    replaces an entry that was not searched deeper. Redis errors degrade to
+    the process tier alone.
+    """
+
+    def __init__(self, max_entries: int, redis_client=None, redis_ttl_seconds: int = 86400):
+        self.memory = DepthWeightedLRU(max_entries)
+        self.redis_client = redis_client
+        self.redis_ttl_seconds = redis_ttl_seconds
+
+    @staticmethod
+    def _redis_key(key: CacheKey) -> str:
+        zobrist, multi_pv = key
+        return f"engine:eval:{zobrist:016x}:{multi_pv}"
+
+    async def get(
+        self, board: chess.Board, multi_pv: int, min_depth: int
+    ) -> Optional[CachedEvaluation]:
+        """
+        Look up a result searched to at least ``min_depth``.
+        Returns None on a miss.
+        """
+        key = cache_key(board, multi_pv)
+        entry = self.memory.get(key)
+        tier = "memory"
+        if (entry is None or entry.depth < min_depth) and self.redis_client is not None:
+            remote = await self._redis_get(key)
+            if remote is not None and (entry is None or remote.depth > entry.depth):
+                self.memory.put(key, remote)
+                entry = remote
+                tier = "redis"
+                engine_eval_cache_entries.set(len(self.memory))
+
+        if entry is None or entry.depth < min_depth:
+            engine_eval_cache_requests_total.labels(result="miss").inc()
+            return None
+        engine_eval_cache_requests_total.labels(result=tier).inc()
+        engine_eval_cache_saved_engine_ms_total.inc(entry.time_ms)
+        return entry
+
+    async def put(self, board: chess.Board, multi_pv: int, entry: CachedEvaluation) -> None:
+        """Store a result unless a deeper one is already cached."""
+        key = cache_key(board, multi_pv)
+        current = self.memory.get(key)
+        if current is not None and current.depth > entry.depth:
+            return
+        self.memory.put(key, entry)
+        engine_eval_cache_entries.set(len(self.memory))
+        if self.redis_client is not None:
+            await self._redis_set(key, entry)
+
+    async def _redis_get(self, key: CacheKey) -> Optional[CachedEvaluation]:
+        try:
+            data = await self.redis_client.get(self._redis_key(key))
+            if data is None:
+                return None
+            payload = json.loads(data)
+            return CachedEvaluation(
+                candidates=[Candidate(**candidate) for candidate in payload["candidates"]],
+                depth=payload["depth"],
+                time_ms=payload["time_ms"],
+            )
+        except Exception as e:
+            logger.warning(f"Evaluation cache read failed: {e}")
+            return None
+
+    async def _redis_set(self, key: CacheKey, entry: CachedEvaluation) -> None:
+        payload = {
+            "candidates": [candidate.model_dump() for candidate in entry.candidates],
+            "depth": entry.depth,
+            "time_ms": entry.time_ms,
+        }
+        try:
+            await self.redis_client.set(
+                self._redis_key(key),
+                json.dumps(payload, separators=(",", ":")),
+                ex=self.redis_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Evaluation cache write failed: {e}")
+
+    async def close(self) -> None:
+        if self.redis_client is not None:
+            await self.redis_client.close()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import asyncio
+import os
 import shutil
 import time
+from functools import partial
 from typing import List, Optional
 import chess
 import chess.engine
@@ -9,71 +11,190 @@ import chess.engine
 from app.core.config import get_settings
 from app.domain.evaluate_request import EvaluateRequest
 from app.domain.evaluate_response import Candidate
+from app.engine.engine_pool import (
+    EnginePool,
+    EnginePoolSaturatedError,
+    SearchPriority,
+    spawn_uci_engine,
+)
+from app.engine.evaluation_cache import CachedEvaluation, EvaluationCache
+from app.engine.search_coalescer import SearchCoalescer
 
 
-async def evaluate_position(request: EvaluateRequest) -> tuple[List[Candidate], int]:
+_pool: Optional[EnginePool] = None
+_pool_lock = asyncio.Lock()
+_cache: Optional[EvaluationCache] = None
+_coalescer: Optional[SearchCoalescer] = None
+
+
+def get_engine_pool() -> Optional[EnginePool]:
+    """Return the running engine pool, if any."""
+    return _pool
+
+
+async def start_engine_pool() -> Optional[EnginePool]:
+    """
+    Start the shared engine pool (once).
+    Returns None when no Stockfish binary is available.
+    """
+    global _pool
+    async with _pool_lock:
+        if _pool is not None:
+            return _pool
+
+        settings = get_settings()
+        stockfish_path = settings.STOCKFISH_PATH or shutil.which("stockfish")
+        if not stockfish_path:
+            return None
+
+        options = {"Threads": settings.ENGINE_THREADS, "Hash": settings.ENGINE_HASH_MB}
+        size = settings.ENGINE_POOL_SIZE or max(1, (os.cpu_count() or 1) // settings.ENGINE_THREADS)
+        pool = EnginePool(
+            factory=partial(spawn_uci_engine, stockfish_path, options),
+            size=size,
+            max_waiters=settings.ENGINE_POOL_MAX_WAITERS,
+            acquire_timeout=settings.ENGINE_POOL_ACQUIRE_TIMEOUT_MS / 1000.0,
+            health_check_interval=settings.ENGINE_POOL_HEALTH_CHECK_INTERVAL_SECONDS,
+            new_game_on_checkout=settings.ENGINE_NEW_GAME_ON_CHECKOUT,
+            quotas={
+                SearchPriority.INTERACTIVE: settings.ENGINE_INTERACTIVE_MAX_ENGINES or size,
+                SearchPriority.BACKGROUND: settings.ENGINE_BACKGROUND_MAX_ENGINES or max(1, size // 2),
+            },
+            preempt_after=settings.ENGINE_PREEMPT_BACKGROUND_AFTER_MS / 1000.0
+            if settings.ENGINE_PREEMPT_BACKGROUND_AFTER_MS > 0
+            else None,
+        )
+        await pool.start()
+        _pool = pool
+        return _pool
+
+
+async def close_engine_pool() -> None:
+    """Quit all pooled engines and close the evaluation cache."""
+    global _pool, _cache
+    async with _pool_lock:
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+        if _cache is not None:
+            await _cache.close()
+            _cache = None
+
+
+def get_search_coalescer(pool: EnginePool) -> SearchCoalescer:
+    """Return the search coalescer of the engine pool."""
+    global _coalescer
+    if _coalescer is None or _coalescer.pool is not pool:
+        _coalescer = SearchCoalescer(pool, grace=get_settings().ENGINE_SEARCH_GRACE_MS / 1000.0)
+    return _coalescer
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """Return the shared evaluation cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        redis_client = None
+        if settings.EVAL_CACHE_REDIS_URL:
+            import redis.asyncio as redis
+
+            redis_client = redis.from_url(settings.EVAL_CACHE_REDIS_URL)
+        _cache = EvaluationCache(
+            max_entries=settings.EVAL_CACHE_MAX_ENTRIES,
+            redis_client=redis_client,
+            redis_ttl_seconds=settings.EVAL_CACHE_REDIS_TTL_SECONDS,
+        )
+    return _cache
+
+
+async def evaluate_position(
+    request: EvaluateRequest,
+    priority: SearchPriority = SearchPriority.INTERACTIVE,
+    acquire_timeout: Optional[float] = None,
+) -> tuple[List[Candidate], int]:
     """
     Evaluate a chess position using Stockfish (or mock if unavailable).
     Returns (candidates, time_ms).
-    """
-    settings = get_settings()
-    stockfish_path = settings.STOCKFISH_PATH or shutil.which("stockfish")
 
-    if not stockfish_path:
+    ``priority`` and ``acquire_timeout`` control queueing for an engine
+    (defaults: interactive, the pool's acquire timeout). Within a priority,
+    requests whose caller has the least ``remaining_clock_ms`` left get an
+    engine first.
+
+    Results searched at least to ``max_depth`` are served from the
+    evaluation cache; concurrent requests for the same position share one
+    search. Raises EnginePoolSaturatedError when every engine is
+    busy and the wait queue is full.
+    """
+    pool = await start_engine_pool()
+    if pool is None:
         # Mock fallback for development
         return await _mock_evaluation(request)
 
     start = time.time()
     board = chess.Board(request.fen)
+    cache = get_evaluation_cache()
+    cached = await cache.get(board, request.multi_pv, min_depth=request.max_depth)
+    if cached is not None:
+        return cached.candidates, int((time.time() - start) * 1000)
 
     try:
-        transport, engine = await chess.engine.popen_uci(stockfish_path)
-        await engine.configure({"Threads": settings.ENGINE_THREADS, "Hash": settings.ENGINE_HASH_MB})
-
-        limit = chess.engine.Limit(
-            time=request.time_limit_ms / 1000.0,
+        # Concurrent requests for this position share one search
+        infos = await get_search_coalescer(pool).search(
+            board,
+            request.multi_pv,
             depth=request.max_depth,
+            time_limit=request.time_limit_ms / 1000.0,
+            priority=priority,
+            acquire_timeout=acquire_timeout,
+            deadline=None
+            if request.remaining_clock_ms is None
+            else asyncio.get_running_loop().time() + request.remaining_clock_ms / 1000.0,
         )
+    except EnginePoolSaturatedError:
+        raise
+    except Exception:
+        # Fallback on any engine error
+        return await _mock_evaluation(request)
 
-        analysis = await engine.analysis(board, limit, multipv=request.multi_pv)
-
-        candidates = []
-        async for info in analysis:
-            if "multipv" in info and "score" in info and "pv" in info:
-                pv_index = info["multipv"]
-                score = info["score"]
-                pv = info["pv"]
-                depth = info.get("depth", request.max_depth)
-
-                # Convert score to float (centipawns -> pawns)
-                if score.is_mate():
-                    eval_value = 100.0 if score.relative.mate() > 0 else -100.0
-                else:
-                    eval_value = score.relative.score() / 100.0
-
-                move_uci = str(pv[0]) if pv else "0000"
-                pv_uci = [str(m) for m in pv[:8]]  # Limit PV length
-
-                candidates.append(
-                    Candidate(
-                        move=move_uci,
-                        eval=round(eval_value, 2),
-                        depth=depth,
-                        pv=pv_uci,
-                    )
-                )
-
-                if len(candidates) >= request.multi_pv:
-                    break
-
-        await engine.quit()
+    candidates = []
+    for info in infos:
+        if "score" not in info or "pv" not in info:
+            continue
+        score = info["score"]
+        pv = info["pv"]
+        depth = info.get("depth", request.max_depth)
+
+        # Convert score to float (centipawns -> pawns)
+        if score.is_mate():
+            eval_value = 100.0 if score.relative.mate() > 0 else -100.0
+        else:
+            eval_value = score.relative.score() / 100.0
+
+        move_uci = str(pv[0]) if pv else "0000"
+        pv_uci = [str(m) for m in pv[:8]]  # Limit PV length
 
-        elapsed_ms = int((time.time() - start) * 1000)
-        return candidates, elapsed_ms
+        candidates.append(
+            Candidate(
+                move=move_uci,
+                eval=round(eval_value, 2),
+                depth=depth,
+                pv=pv_uci,
+            )
+        )
 
-    except Exception as e:
-        # Fallback on any engine error
-        return await _mock_evaluation(request)
+    elapsed_ms = int((time.time() - start) * 1000)
+    if candidates:
+        await cache.put(
+            board,
+            request.multi_pv,
+            CachedEvaluation(
+                candidates=candidates,
+                depth=min(candidate.depth for candidate in candidates),
+                time_ms=elapsed_ms,
+            ),
+        )
+    return candidates, elapsed_ms
 
 
 async def _mock_evaluation(request: EvaluateRequest) -> tuple[List[Candidate], int]:
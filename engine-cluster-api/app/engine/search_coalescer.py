@@ -0,0 +1,261 @@
+"""Single-flight coalescing of concurrent searches of the same position."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import chess
+import chess.engine
+
+from app.core.metrics import engine_searches_total
+from app.engine.engine_pool import EnginePool, SearchPriority
+from app.engine.evaluation_cache import CacheKey, cache_key
+
+
+@dataclass
+class _Waiter:
+    depth: int
+    time_limit: float
+    future: asyncio.Future
+    deadline: Optional[float] = None  # Event loop time, set once the search runs
+
+
+class _Flight:
+    """One running search and the requests waiting on it."""
+
+    def __init__(
+        self,
+        board: chess.Board,
+        multi_pv: int,
+        priority: SearchPriority,
+        acquire_timeout: Optional[float],
+        deadline: Optional[float],
+    ):
+        self.board = board
+        self.multi_pv = multi_pv
+        self.priority = priority
+        self.acquire_timeout = acquire_timeout
+        self.deadline = deadline
+        self.lines = min(multi_pv, board.legal_moves.count())
+        self.waiters: List[_Waiter] = []
+        self.changed = asyncio.Event()
+        self.completed: Optional[List[chess.engine.InfoDict]] = None  # Last finished iteration
+        self.completed_depth = 0
+        self.partial: Optional[List[chess.engine.InfoDict]] = None  # Latest lines, any depth
+        self.started = False
+        self.preempted = False
+
+    def add(self, waiter: _Waiter, now: float) -> None:
+        if self.started:
+            waiter.deadline = now + waiter.time_limit
+        self.waiters.append(waiter)
+        self.changed.set()
+        # Wake the search when the caller goes away, so an unwanted search stops
+        waiter.future.add_done_callback(lambda _: self.changed.set())
+
+    def start(self, now: float) -> None:
+        """Start the clocks of requests that waited for an engine."""
+        self.started = True
+        for waiter in self.waiters:
+            waiter.deadline = now + waiter.time_limit
+
+    def escalate(self, priority: SearchPriority, deadline: Optional[float]) -> bool:
+        """Take on a joining request's priority and deadline if they are more urgent."""
+        escalated = False
+        if priority < self.priority:
+            self.priority = priority
+            escalated = True
+        if deadline is not None and (self.deadline is None or deadline < self.deadline):
+            self.deadline = deadline
+            escalated = True
+        return escalated
+
+    def preempt(self) -> None:
+        """Stop at the next opportunity and answer everyone with the latest lines."""
+        self.preempted = True
+        self.changed.set()
+
+    def update(self, info: chess.engine.InfoDict, multipv: List[chess.engine.InfoDict]) -> None:
+        current = [dict(line) for line in multipv[: self.lines] if "pv" in line]
+        if current:
+            self.partial = current
+        # Engines print all lines of an iteration in order, so the last line closes it
+        if (
+            self.lines
+            and info.get("multipv", 1) == self.lines
+            and "depth" in info
+            and len(current) == self.lines
+        ):
+            self.completed = current
+            self.completed_depth = info["depth"]
+
+    def best(self) -> Optional[List[chess.engine.InfoDict]]:
+        return self.completed if self.completed is not None else self.partial
+
+    def resolve(self, now: float) -> None:
+        """Answer waiters whose depth is reached or whose time is up."""
+        remaining = []
+        for waiter in self.waiters:
+            if waiter.future.done():
+                continue  # Caller went away
+            if self.completed is not None and self.completed_depth >= waiter.depth:
+                waiter.future.set_result(self.completed)
+            elif waiter.deadline <= now and self.best() is not None:
+                waiter.future.set_result(self.best())
+            else:
+                remaining.append(waiter)
+        self.waiters = remaining
+
+    def next_deadline(self) -> float:
+        return min(waiter.deadline for waiter in self.waiters)
+
+
+class SearchCoalescer:
+    """
+    Shares one engine search between concurrent requests for a position.
+
+    Requests for the same position and ``multi_pv`` join the running search
+    instead of checking out another engine. The search runs open-ended and
+    each request is answered as soon as the search reaches its depth, or with
+    the latest lines when its time limit expires, so a request asking for more
+    depth or time simply extends the shared search. The search stops once no
+    request is waiting on it, or early (answering with the latest lines) when
+    the pool preempts it for a higher-priority request.
+
+    A search runs with the most urgent priority and deadline of its requests:
+    a request joining a less urgent search escalates its checkout in the
+    pool, so e.g. a bot move never waits under the background quota or gets
+    preempted. Requests never join a search that is being preempted.
+    """
+
+    def __init__(self, pool: EnginePool, grace: float = 1.0):
+        """
+        Args:
+            pool: Engine pool to run searches on
+            grace: Seconds past every deadline without any result before the
+                engine is considered hung
+        """
+        self.pool = pool
+        self.grace = grace
+        self._flights: Dict[CacheKey, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def search(
+        self,
+        board: chess.Board,
+        multi_pv: int,
+        depth: int,
+        time_limit: float,
+        priority: SearchPriority = SearchPriority.INTERACTIVE,
+        acquire_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> List[chess.engine.InfoDict]:
+        """
+        Search a position, sharing a running search when there is one.
+
+        Args:
+            board: Position to search
+            multi_pv: Number of principal variations
+            depth: Depth at which the caller is satisfied
+            time_limit: Seconds of search after which the caller takes the latest lines
+            priority: Queue priority of the search; raises a joined search's priority
+            acquire_timeout: Max seconds a new search waits for an engine
+            deadline: Event loop time by which the caller needs its result,
+                ordering the search among queued requests of its priority
+
+        Returns:
+            One info dict per principal variation, best first
+        """
+        loop = asyncio.get_running_loop()
+        key = cache_key(board, multi_pv)
+        waiter = _Waiter(depth=depth, time_limit=time_limit, future=loop.create_future())
+
+        flight = self._flights.get(key)
+        if flight is not None and flight.preempted:
+            # It is about to stop with shallow lines; search again instead
+            self._retire(key, flight)
+            flight = None
+        if flight is None:
+            flight = _Flight(board.copy(), multi_pv, priority, acquire_timeout, deadline)
+            flight.add(waiter, loop.time())
+            self._flights[key] = flight
+            asyncio.create_task(self._run(key, flight))
+            engine_searches_total.labels(mode="new").inc()
+        else:
+            flight.add(waiter, loop.time())
+            if flight.escalate(priority, deadline):
+                self.pool.escalate(flight, flight.priority, flight.deadline)
+            engine_searches_total.labels(mode="joined").inc()
+
+        return await waiter.future
+
+    def _retire(self, key: CacheKey, flight: _Flight) -> None:
+        """Stop routing requests to a flight (later requests start a new search)."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def _run(self, key: CacheKey, flight: _Flight) -> None:
+        error: Optional[BaseException] = None
+        try:
+            await self._search(key, flight)
+        except Exception as e:
+            error = e
+        finally:
+            self._retire(key, flight)
+            for waiter in flight.waiters:
+                if waiter.future.done():
+                    continue
+                if error is not None:
+                    waiter.future.set_exception(error)
+                else:
+                    waiter.future.set_result(flight.best() or [])
+
+    async def _search(self, key: CacheKey, flight: _Flight) -> None:
+        loop = asyncio.get_running_loop()
+        async with self.pool.checkout(
+            flight.priority,
+            flight.acquire_timeout,
+            flight.deadline,
+            on_preempt=flight.preempt,
+            owner=flight,
+        ) as engine:
+            game = object() if self.pool.new_game_on_checkout else None
+            analysis = await engine.analysis(flight.board, multipv=flight.multi_pv, game=game)
+            flight.start(loop.time())  # Time limits count from the start of the search
+            next_info = asyncio.ensure_future(analysis.get())
+            try:
+                while True:
+                    flight.resolve(loop.time())
+                    if not flight.waiters or (flight.preempted and flight.best() is not None):
+                        self._retire(key, flight)
+                        return
+
+                    timeout = flight.next_deadline() - loop.time()
+                    overdue = timeout <= 0  # Due waiters have no lines yet
+                    flight.changed.clear()
+                    changed = asyncio.ensure_future(flight.changed.wait())
+                    done, _ = await asyncio.wait(
+                        {next_info, changed},
+                        timeout=self.grace if overdue else timeout,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    changed.cancel()
+                    if not done and overdue:
+                        raise asyncio.TimeoutError("Engine produced no search result in time")
+                    if next_info not in done:
+                        continue
+
+                    try:
+                        info = next_info.result()
+                    except chess.engine.AnalysisComplete:
+                        self._retire(key, flight)
+                        return  # Engine finished on its own (e.g. no legal moves)
+                    flight.update(info, analysis.multipv)
+                    next_info = asyncio.ensure_future(analysis.get())
+            finally:
+                next_info.cancel()
+                analysis.stop()
+                await asyncio.wait_for(analysis.wait(), self.grace)
@@ -9,13 +9,16 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from app.api.routes.health import router as health_router
 from app.api.routes.v1.engine import router as v1_engine_router
 from app.core.config import get_settings
+from app.engine.evaluator import close_engine_pool, start_engine_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    # Startup
+    # Startup: spawn and warm the engines before taking traffic
+    await start_engine_pool()
     yield
     # Shutdown
+    await close_engine_pool()
 
 
 def create_app() -> FastAPI:
@@ -47,6 +50,16 @@ def create_app() -> FastAPI:
     app.include_router(health_router)
     app.include_router(v1_engine_router, prefix=settings.API_V1_STR)
 
+    # Metrics endpoint
+    @app.get("/metrics")
+    async def metrics():
+        """Prometheus metrics endpoint."""
+        from fastapi import Response
+        from app.core.metrics import get_metrics_response
+
+        metrics_data, content_type = get_metrics_response()
+        return Response(content=metrics_data, media_type=content_type)
+
     return app
 
 
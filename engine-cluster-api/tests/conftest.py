@@ -0,0 +1,111 @@
+import asyncio
+
+import chess
+import chess.engine
+import pytest
+
+from app.engine.engine_pool import EnginePool
+
+
+class FakeAnalysis:
+    """Open-ended analysis printing one iteration every ``step`` seconds."""
+
+    def __init__(self, board, multipv, step):
+        self.multipv = [{}]
+        self._queue = asyncio.Queue()
+        self._finished = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._iterate(list(board.legal_moves)[:multipv], step))
+
+    async def _iterate(self, moves, step):
+        if not moves:
+            self.stop()
+            return
+        depth = 0
+        while True:
+            await asyncio.sleep(step)
+            depth += 1
+            for i, move in enumerate(moves):
+                info = {
+                    "multipv": i + 1,
+                    "depth": depth,
+                    "score": chess.engine.PovScore(chess.engine.Cp(35 - 10 * i), chess.WHITE),
+                    "pv": [move],
+                }
+                self.multipv.extend({} for _ in range(i + 1 - len(self.multipv)))
+                self.multipv[i].update(info)
+                self._queue.put_nowait(info)
+
+    def stop(self):
+        if not self._finished.done():
+            self._task.cancel()
+            self._queue.put_nowait({})
+            self._finished.set_result(None)
+
+    async def get(self):
+        info = await self._queue.get()
+        if not info:
+            raise chess.engine.AnalysisComplete()
+        return info
+
+    async def wait(self):
+        return await self._finished
+
+
+class FakeEngine:
+    """Stands in for a UCI engine process."""
+
+    def __init__(self):
+        self.returncode = asyncio.get_running_loop().create_future()
+        self.games = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.responsive = True
+        self.step = 0.001  # Seconds per search iteration
+
+    async def analyse(self, board, limit, multipv=None, game=None):
+        self.games.append(game)
+        await self.release.wait()
+        return [
+            {
+                "score": chess.engine.PovScore(chess.engine.Cp(35 - 10 * i), chess.WHITE),
+                "pv": [move],
+                "depth": 9,
+            }
+            for i, move in enumerate(list(board.legal_moves)[:multipv])
+        ]
+
+    async def analysis(self, board, limit=None, multipv=None, game=None):
+        self.games.append(game)
+        await self.release.wait()
+        return FakeAnalysis(board, multipv or 1, self.step)
+
+    async def ping(self):
+        if not self.responsive:
+            await asyncio.sleep(60)
+
+    async def quit(self):
+        if not self.returncode.done():
+            self.returncode.set_result(0)
+
+
+class FakeFactory:
+    def __init__(self):
+        self.engines = []
+
+    async def __call__(self):
+        engine = FakeEngine()
+        self.engines.append(engine)
+        return engine
+
+
+@pytest.fixture
+def make_pool():
+    """Start an engine pool of fake engines; returns (pool, factory)."""
+
+    async def _make_pool(size=1, **kwargs):
+        factory = FakeFactory()
+        pool = EnginePool(factory, size=size, health_check_interval=0, ping_timeout=0.05, **kwargs)
+        await pool.start()
+        return pool, factory
+
+    return _make_pool
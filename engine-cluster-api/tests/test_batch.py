@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.engine import evaluator
+from app.engine.batch import evaluate_batch, parse_ndjson_stream
+from app.engine.evaluation_cache import EvaluationCache
+from app.main import app
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+E4_FEN = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+
+
+def _ndjson(*lines) -> bytes:
+    return "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines).encode()
+
+
+async def _chunks(body: bytes, size: int = 7):
+    """Deliver a body in small chunks that split lines, as an upload would."""
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.fixture
+async def fake_engines(make_pool, monkeypatch):
+    pool, factory = await make_pool(size=2)
+    monkeypatch.setattr(evaluator, "_pool", pool)
+    monkeypatch.setattr(evaluator, "_cache", EvaluationCache(max_entries=10))
+    yield factory
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_yields_every_position(fake_engines):
+    items = parse_ndjson_stream(
+        _chunks(
+            _ndjson(
+                {"id": "a", "fen": START_FEN, "side_to_move": "w", "max_depth": 3},
+                "",
+                {"fen": E4_FEN, "side_to_move": "b", "max_depth": 3, "multi_pv": 2},
+                {"fen": START_FEN},
+            )
+        ),
+        max_items=10,
+    )
+
+    results = [result async for result in evaluate_batch(items, concurrency=2)]
+
+    by_index = {result.index: result for result in results}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[0].id == "a" and by_index[0].candidates
+    assert len(by_index[1].candidates) == 2
+    assert by_index[2].error.startswith("invalid_request")
+
+
+@pytest.mark.asyncio
+async def test_batch_deadline_reports_unfinished_positions(fake_engines):
+    for engine in fake_engines.engines:
+        engine.step = 0.05
+    items = parse_ndjson_stream(
+        _chunks(
+            _ndjson(
+                *(
+                    {
+                        "fen": fen,
+                        "side_to_move": fen.split()[1],
+                        "max_depth": 30,
+                        "time_limit_ms": 5000,
+                    }
+                    for fen in (START_FEN, E4_FEN)
+                )
+            )
+        ),
+        max_items=10,
+    )
+
+    results = [result async for result in evaluate_batch(items, concurrency=2, deadline=0.1)]
+
+    assert sorted(result.index for result in results) == [0, 1]
+    assert {result.error for result in results} == {"deadline_exceeded"}
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint_streams_ndjson():
+    body = _ndjson(
+        {"fen": START_FEN, "side_to_move": "w", "time_limit_ms": 10},
+        {"fen": E4_FEN, "side_to_move": "b", "time_limit_ms": 10},
+    )
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        resp = await ac.post("/v1/evaluate/batch", content=body)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1]
+    assert all(line["candidates"] for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_batch_starts_positions_before_the_body_ends(fake_engines):
+    first_done = asyncio.Event()
+
+    async def upload():
+        yield _ndjson({"fen": START_FEN, "side_to_move": "w", "max_depth": 3}) + b"\n"
+        await asyncio.wait_for(first_done.wait(), 1)
+        yield _ndjson({"fen": E4_FEN, "side_to_move": "b", "max_depth": 3})
+
+    results = []
+    async for result in evaluate_batch(parse_ndjson_stream(upload(), max_items=10), concurrency=2):
+        results.append(result)
+        first_done.set()
+
+    assert [result.index for result in results] == [0, 1]
+    assert all(result.candidates for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_over_the_limit_stops_reading(fake_engines):
+    body = _ndjson(*({"fen": START_FEN, "side_to_move": "w", "max_depth": 3} for _ in range(4)))
+
+    results = [
+        result
+        async for result in evaluate_batch(
+            parse_ndjson_stream(_chunks(body), max_items=2), concurrency=2
+        )
+    ]
+
+    by_index = {result.index: result for result in results}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[2].error.startswith("batch_too_large")
@@ -0,0 +1,176 @@
+import asyncio
+
+import chess
+import chess.engine
+import pytest
+
+from app.domain.evaluate_request import EvaluateRequest
+from app.engine import evaluator
+from app.engine.engine_pool import EnginePoolSaturatedError, SearchPriority
+from app.engine.evaluation_cache import EvaluationCache
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+@pytest.mark.asyncio
+async def test_engines_are_reused_with_new_game_per_checkout(make_pool):
+    pool, factory = await make_pool(size=2)
+    limit = chess.engine.Limit(time=0.1)
+
+    for _ in range(5):
+        await pool.analyse(chess.Board(), limit)
+
+    assert len(factory.engines) == 2
+    games = [game for engine in factory.engines for game in engine.games]
+    assert len(games) == 5
+    assert len({id(game) for game in games}) == 5  # ucinewgame on every checkout
+    await pool.close()
+    assert all(engine.returncode.done() for engine in factory.engines)
+
+
+@pytest.mark.asyncio
+async def test_admission_control_when_all_engines_are_busy(make_pool):
+    pool, factory = await make_pool(size=1, max_waiters=1, acquire_timeout=1.0)
+    engine = factory.engines[0]
+    engine.release.clear()
+    limit = chess.engine.Limit(time=0.1)
+
+    busy = asyncio.create_task(pool.analyse(chess.Board(), limit))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(pool.analyse(chess.Board(), limit))
+    await asyncio.sleep(0)
+    assert pool.stats()["waiting"] == 1
+
+    with pytest.raises(EnginePoolSaturatedError):
+        await pool.analyse(chess.Board(), limit)
+
+    engine.release.set()
+    await asyncio.gather(busy, queued)
+    assert len(engine.games) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_engine_times_out(make_pool):
+    pool, factory = await make_pool(size=1, acquire_timeout=0.05)
+    factory.engines[0].release.clear()
+
+    busy = asyncio.create_task(pool.analyse(chess.Board(), chess.engine.Limit(time=0.1)))
+    await asyncio.sleep(0)
+    with pytest.raises(EnginePoolSaturatedError):
+        await pool.analyse(chess.Board(), chess.engine.Limit(time=0.1))
+
+    busy.cancel()
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_crashed_and_hung_engines_are_replaced(make_pool):
+    pool, factory = await make_pool(size=1)
+    limit = chess.engine.Limit(time=0.1)
+
+    factory.engines[0].returncode.set_result(-9)  # Crashed while idle
+    await pool.analyse(chess.Board(), limit)
+    assert len(factory.engines) == 2
+    assert factory.engines[1].games
+
+    hung = factory.engines[1]
+    hung.release.clear()
+    hung.responsive = False
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.analyse(chess.Board(), limit, timeout=0.05)
+    await asyncio.sleep(0.1)  # Failed isready check -> replacement
+
+    await pool.analyse(chess.Board(), limit)
+    assert len(factory.engines) == 3
+    assert hung not in pool._engines
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_position_uses_pool_and_cache(make_pool, monkeypatch):
+    pool, factory = await make_pool(size=1)
+    monkeypatch.setattr(evaluator, "_pool", pool)
+    monkeypatch.setattr(evaluator, "_cache", EvaluationCache(max_entries=10))
+
+    request = EvaluateRequest(
+        fen=START_FEN, side_to_move="w", max_depth=9, time_limit_ms=100, multi_pv=3
+    )
+    candidates, _ = await evaluator.evaluate_position(request)
+
+    assert [c.eval for c in candidates] == [0.35, 0.25, 0.15]
+    assert all(c.depth == 9 and c.pv == [c.move] for c in candidates)
+
+    # Same position and depth: served from the cache, deeper: searched again
+    assert (await evaluator.evaluate_position(request))[0] == candidates
+    assert len(factory.engines[0].games) == 1
+    await evaluator.evaluate_position(request.model_copy(update={"max_depth": 12}))
+    assert len(factory.engines[0].games) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_are_served_before_background(make_pool):
+    pool, factory = await make_pool(size=1)
+    order = []
+
+    async def search(name, priority):
+        async with pool.checkout(priority=priority):
+            order.append(name)
+
+    async with pool.checkout():
+        background = asyncio.create_task(search("background", SearchPriority.BACKGROUND))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(search("interactive", SearchPriority.INTERACTIVE))
+        await asyncio.sleep(0)
+        assert pool.waiting(SearchPriority.BACKGROUND) == 1
+
+    await asyncio.gather(background, interactive)
+    assert order == ["interactive", "background"]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_earliest_deadline_first_within_a_class(make_pool):
+    pool, factory = await make_pool(size=1)
+    loop = asyncio.get_running_loop()
+    order = []
+
+    async def search(name, remaining_clock):
+        async with pool.checkout(deadline=loop.time() + remaining_clock):
+            order.append(name)
+
+    async with pool.checkout():
+        classical = asyncio.create_task(search("classical", 600.0))
+        await asyncio.sleep(0)
+        bullet = asyncio.create_task(search("bullet", 5.0))
+        await asyncio.sleep(0)
+
+    await asyncio.gather(classical, bullet)
+    assert order == ["bullet", "classical"]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_background_quota_keeps_engines_for_interactive(make_pool):
+    pool, factory = await make_pool(size=2, quotas={SearchPriority.BACKGROUND: 1})
+    release = asyncio.Event()
+
+    async def search(priority):
+        async with pool.checkout(priority=priority):
+            await release.wait()
+
+    first = asyncio.create_task(search(SearchPriority.BACKGROUND))
+    second = asyncio.create_task(search(SearchPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    assert pool.in_use(SearchPriority.BACKGROUND) == 1
+    assert pool.waiting(SearchPriority.BACKGROUND) == 1  # Over quota despite an idle engine
+
+    async with pool.checkout(priority=SearchPriority.INTERACTIVE, timeout=0.01):
+        pass  # Served immediately by the reserved engine
+
+    release.set()
+    await asyncio.gather(first, second)
+    stats = pool.stats()["classes"]["background"]
+    assert stats == {"in_use": 0, "waiting": 0, "quota": 1}
+    await pool.close()
@@ -0,0 +1,105 @@
+import chess
+import pytest
+
+from app.domain.candidate import Candidate
+from app.engine.evaluation_cache import (
+    CachedEvaluation,
+    DepthWeightedLRU,
+    EvaluationCache,
+    cache_key,
+)
+
+
+def _entry(depth: int, move: str = "e2e4", time_ms: int = 300) -> CachedEvaluation:
+    return CachedEvaluation(
+        candidates=[Candidate(move=move, eval=0.3, depth=depth, pv=[move])],
+        depth=depth,
+        time_ms=time_ms,
+    )
+
+
+class FakeRedis:
+    def __init__(self, fail: bool = False):
+        self.data = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+
+def test_key_ignores_move_counters_but_not_side_to_move():
+    board = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
+    same = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 3 9")
+    other_side = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 1")
+
+    assert cache_key(board, 1) == cache_key(same, 1)
+    assert cache_key(board, 1) != cache_key(other_side, 1)
+    assert cache_key(board, 1) != cache_key(board, 3)
+
+
+def test_eviction_prefers_shallow_entries():
+    lru = DepthWeightedLRU(max_entries=2)
+    lru.put((1, 1), _entry(depth=20))
+    lru.put((2, 1), _entry(depth=4))
+    lru.put((3, 1), _entry(depth=10))
+
+    assert lru.get((2, 1)) is None
+    assert lru.get((1, 1)) is not None
+    assert lru.get((3, 1)) is not None
+
+
+def test_unused_deep_entries_age_out():
+    lru = DepthWeightedLRU(max_entries=2)
+    lru.put((0, 1), _entry(depth=12))
+    for zobrist in range(1, 10):
+        lru.put((zobrist, 1), _entry(depth=8))
+        lru.get((zobrist, 1))
+
+    assert lru.get((0, 1)) is None
+    assert len(lru) == 2
+
+
+@pytest.mark.asyncio
+async def test_serves_only_results_searched_deep_enough():
+    cache = EvaluationCache(max_entries=10)
+    board = chess.Board()
+
+    await cache.put(board, 1, _entry(depth=12))
+
+    assert (await cache.get(board, 1, min_depth=10)).depth == 12
+    assert await cache.get(board, 1, min_depth=14) is None
+    assert await cache.get(board, 2, min_depth=1) is None
+
+    await cache.put(board, 1, _entry(depth=8, move="d2d4"))  # Shallower: ignored
+    assert (await cache.get(board, 1, min_depth=1)).candidates[0].move == "e2e4"
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_and_promoted():
+    redis_client = FakeRedis()
+    board = chess.Board()
+    await EvaluationCache(max_entries=10, redis_client=redis_client).put(board, 1, _entry(depth=15))
+
+    other_process = EvaluationCache(max_entries=10, redis_client=redis_client)
+    hit = await other_process.get(board, 1, min_depth=15)
+
+    assert hit.candidates[0].move == "e2e4"
+    assert other_process.memory.get(cache_key(board, 1)) is not None
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_memory():
+    cache = EvaluationCache(max_entries=10, redis_client=FakeRedis(fail=True))
+    board = chess.Board()
+
+    await cache.put(board, 1, _entry(depth=10))
+
+    assert (await cache.get(board, 1, min_depth=10)).depth == 10
+    assert await cache.get(board, 1, min_depth=11) is None
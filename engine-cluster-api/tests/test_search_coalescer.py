@@ -0,0 +1,150 @@
+import asyncio
+
+import chess
+import pytest
+
+from app.engine.engine_pool import SearchPriority
+from app.engine.search_coalescer import SearchCoalescer
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_engine(make_pool):
+    pool, factory = await make_pool(size=2)
+    coalescer = SearchCoalescer(pool)
+
+    results = await asyncio.gather(
+        *(coalescer.search(chess.Board(), 2, depth=5, time_limit=1.0) for _ in range(5))
+    )
+
+    assert sum(len(engine.games) for engine in factory.engines) == 1
+    assert all(result == results[0] for result in results)
+    assert [info["depth"] for info in results[0]] == [5, 5]
+    assert len(coalescer) == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_deeper_request_extends_the_running_search(make_pool):
+    pool, factory = await make_pool(size=1)
+    factory.engines[0].step = 0.01
+    coalescer = SearchCoalescer(pool)
+
+    shallow = asyncio.create_task(coalescer.search(chess.Board(), 1, depth=2, time_limit=1.0))
+    await asyncio.sleep(0.005)
+    deep = await coalescer.search(chess.Board(), 1, depth=6, time_limit=1.0)
+
+    assert (await shallow)[0]["depth"] == 2
+    assert deep[0]["depth"] == 6
+    assert len(factory.engines[0].games) == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_time_limit_returns_latest_lines(make_pool):
+    pool, factory = await make_pool(size=1)
+    factory.engines[0].step = 0.03
+    coalescer = SearchCoalescer(pool)
+
+    result = await coalescer.search(chess.Board(), 1, depth=30, time_limit=0.1)
+
+    assert 1 <= result[0]["depth"] < 30
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_different_positions_search_separately(make_pool):
+    pool, factory = await make_pool(size=2)
+    coalescer = SearchCoalescer(pool)
+    board = chess.Board()
+    board.push_uci("e2e4")
+
+    first, second = await asyncio.gather(
+        coalescer.search(chess.Board(), 1, depth=3, time_limit=1.0),
+        coalescer.search(board, 1, depth=3, time_limit=1.0),
+    )
+
+    assert sum(len(engine.games) for engine in factory.engines) == 2
+    assert first[0]["pv"] != second[0]["pv"]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_long_background_search_is_preempted_for_interactive(make_pool):
+    pool, factory = await make_pool(size=1, preempt_after=0.05)
+    factory.engines[0].step = 0.01
+    coalescer = SearchCoalescer(pool)
+    board = chess.Board()
+    board.push_uci("e2e4")
+
+    background = asyncio.create_task(
+        coalescer.search(
+            chess.Board(), 1, depth=30, time_limit=10.0, priority=SearchPriority.BACKGROUND
+        )
+    )
+    await asyncio.sleep(0.02)
+    interactive = await coalescer.search(board, 1, depth=2, time_limit=1.0)
+
+    assert interactive[0]["depth"] == 2
+    preempted = await background
+    assert 1 <= preempted[0]["depth"] < 30  # Latest lines at the time of the stop
+    assert pool.in_use(SearchPriority.BACKGROUND) == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_interactive_request_escalates_a_queued_background_search(make_pool):
+    pool, factory = await make_pool(size=2, quotas={SearchPriority.BACKGROUND: 1})
+    for engine in factory.engines:
+        engine.step = 0.01
+    coalescer = SearchCoalescer(pool)
+    board = chess.Board()
+    board.push_uci("e2e4")
+
+    running = asyncio.create_task(
+        coalescer.search(board, 1, depth=10, time_limit=1.0, priority=SearchPriority.BACKGROUND)
+    )
+    await asyncio.sleep(0.005)
+    queued = asyncio.create_task(
+        coalescer.search(
+            chess.Board(),
+            1,
+            depth=2,
+            time_limit=1.0,
+            priority=SearchPriority.BACKGROUND,
+            acquire_timeout=0.05,
+        )
+    )
+    await asyncio.sleep(0.005)
+    assert pool.waiting(SearchPriority.BACKGROUND) == 1
+
+    # Joining moves the search to the interactive class, which has an engine free
+    interactive = await coalescer.search(chess.Board(), 1, depth=2, time_limit=1.0)
+
+    assert interactive[0]["depth"] == 2
+    assert await queued == interactive
+    await running
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_search_with_interactive_waiter_is_not_preempted(make_pool):
+    pool, factory = await make_pool(size=1, preempt_after=0.02)
+    factory.engines[0].step = 0.01
+    coalescer = SearchCoalescer(pool)
+    board = chess.Board()
+    board.push_uci("e2e4")
+
+    background = asyncio.create_task(
+        coalescer.search(
+            chess.Board(), 1, depth=30, time_limit=0.2, priority=SearchPriority.BACKGROUND
+        )
+    )
+    await asyncio.sleep(0.005)
+    joined = asyncio.create_task(coalescer.search(chess.Board(), 1, depth=8, time_limit=1.0))
+    await asyncio.sleep(0.005)
+    other = await coalescer.search(board, 1, depth=2, time_limit=1.0)
+
+    assert (await joined)[0]["depth"] == 8  # Not cut short by the other interactive request
+    assert other[0]["depth"] == 2
+    await background
+    await pool.close()
@@ -53,19 +53,168 @@ def get_websocket_manager():
     return _websocket_manager_instance
 
 
+# Singleton game cache instance (shared Redis client)
+_game_cache_instance = None
+
+
+def get_game_cache():
+    """Get Redis game cache instance (singleton)."""
+    global _game_cache_instance
+    if _game_cache_instance is None:
+        from app.infrastructure.cache.game_cache import GameCache
+        _game_cache_instance = GameCache()
+    return _game_cache_instance
+
+
+# Singleton game state engine (resident in-progress games for this process)
+_game_state_engine_instance = None
+
+
+def get_game_state_engine():
+    """Get in-memory game state engine instance (singleton)."""
+    global _game_state_engine_instance
+    if _game_state_engine_instance is None:
+        from app.core.config import get_settings
+        from app.domain.services.game_state_engine import GameStateEngine
+        _game_state_engine_instance = GameStateEngine(
+            max_resident_games=get_settings().GAME_STATE_MAX_RESIDENT_GAMES,
+        )
+    return _game_state_engine_instance
+
+
+# Singleton shard lease manager (which games this pod owns)
+_shard_lease_manager_instance = None
+
+
+def get_shard_lease_manager():
+    """Get shard lease manager instance (singleton)."""
+    global _shard_lease_manager_instance
+    if _shard_lease_manager_instance is None:
+        import socket
+        from app.core.config import get_settings
+        from app.infrastructure.sharding.shard_lease_manager import ShardLeaseManager
+        from app.infrastructure.sharding.shard_router import ShardRouter
+
+        settings = get_settings()
+        hostname = socket.gethostname()
+        _shard_lease_manager_instance = ShardLeaseManager(
+            ShardRouter(),
+            pod_id=settings.POD_ID or hostname,
+            pod_address=settings.POD_ADDRESS or f"http://{hostname}:{settings.PORT}",
+            lease_ttl_seconds=settings.SHARD_LEASE_TTL_SECONDS,
+            renew_interval_seconds=settings.SHARD_RENEW_INTERVAL_SECONDS,
+        )
+    return _shard_lease_manager_instance
+
+
+# Singleton clock engine (running clocks and flag-fall deadlines for this process)
+_clock_engine_instance = None
+
+
+def get_clock_engine():
+    """Get clock engine instance (singleton)."""
+    global _clock_engine_instance
+    if _clock_engine_instance is None:
+        from app.core.config import get_settings
+        from app.domain.services.clock_engine import ClockEngine
+        _clock_engine_instance = ClockEngine(
+            tick_ms=get_settings().CLOCK_TICK_MS,
+            on_flag=handle_flag_fall,
+        )
+    return _clock_engine_instance
+
+
+# Singleton bot orchestrator client (pooled keep-alive connections)
+_bot_orchestrator_client_instance = None
+
+
+def get_bot_orchestrator_client():
+    """Get bot orchestrator client instance (singleton)."""
+    global _bot_orchestrator_client_instance
+    if _bot_orchestrator_client_instance is None:
+        from app.infrastructure.clients.bot_orchestrator import BotOrchestratorClient
+        _bot_orchestrator_client_instance = BotOrchestratorClient()
+    return _bot_orchestrator_client_instance
+
+
+# Singleton bot move scheduler (background bot moves for this process)
+_bot_move_scheduler_instance = None
+
+
+def get_bot_move_scheduler():
+    """Get bot move scheduler instance (singleton)."""
+    global _bot_move_scheduler_instance
+    if _bot_move_scheduler_instance is None:
+        from app.core.config import get_settings
+        from app.domain.services.bot_move_scheduler import BotMoveScheduler
+
+        settings = get_settings()
+        _bot_move_scheduler_instance = BotMoveScheduler(
+            on_bot_move=play_scheduled_bot_move,
+            workers=settings.BOT_MOVE_WORKERS,
+            per_bot_concurrency=settings.BOT_MOVE_PER_BOT_CONCURRENCY,
+            max_pending=settings.BOT_MOVE_MAX_PENDING,
+        )
+    return _bot_move_scheduler_instance
+
+
+async def _background_game_service(session: AsyncSession):
+    """Build a game service outside any request (background tasks)."""
+    return await get_game_service(
+        db=session,
+        event_publisher=get_event_publisher(),
+        websocket_manager=get_websocket_manager(),
+        state_engine=get_game_state_engine(),
+        game_cache=get_game_cache(),
+        clock_engine=get_clock_engine(),
+        shard_lease_manager=get_shard_lease_manager(),
+        bot_orchestrator_client=get_bot_orchestrator_client(),
+        bot_move_scheduler=get_bot_move_scheduler(),
+    )
+
+
+async def play_scheduled_bot_move(game_id: UUID) -> None:
+    """Play a bot move from the bot move scheduler (outside any request)."""
+    from app.infrastructure.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        game_service = await _background_game_service(session)
+        await game_service.play_bot_move(game_id)
+
+
+async def handle_flag_fall(game_id: UUID) -> None:
+    """End a game on time from the clock engine (outside any request)."""
+    from app.infrastructure.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        game_service = await _background_game_service(session)
+        await game_service.handle_flag_fall(game_id)
+
+
 async def get_game_service(
     db: AsyncSession = Depends(get_db_session),
     event_publisher = Depends(get_event_publisher),
     websocket_manager = Depends(get_websocket_manager),
+    state_engine = Depends(get_game_state_engine),
+    game_cache = Depends(get_game_cache),
+    clock_engine = Depends(get_clock_engine),
+    shard_lease_manager = Depends(get_shard_lease_manager),
+    bot_orchestrator_client = Depends(get_bot_orchestrator_client),
+    bot_move_scheduler = Depends(get_bot_move_scheduler),
 ):
     """Get game service with dependencies."""
     from app.domain.repositories.game_repository import GameRepositoryInterface
     from app.domain.services.game_service import GameService
     from app.domain.services.rating_decision_engine import RatingDecisionEngine, RulesConfig
+    from app.core.config import get_settings
+    from app.infrastructure.cache.cached_game_repository import CachedGameRepository
     from app.infrastructure.database.repository import GameRepository
+    from app.infrastructure.snapshots.snapshot_service import SnapshotService
     import os
 
     repository: GameRepositoryInterface = GameRepository(db)
+    if get_settings().GAME_CACHE_ENABLED:
+        repository = CachedGameRepository(repository, game_cache)
 
     # Configure decision engine from environment (with sensible defaults)
     max_gap = int(os.getenv("RATED_MAX_RATING_DIFFERENCE", "500"))
@@ -82,6 +231,12 @@ async def get_game_service(
     return GameService(
         repository,
         decision_engine,
+        bot_orchestrator_client=bot_orchestrator_client,
         event_publisher=event_publisher,
         websocket_manager=websocket_manager,
+        state_engine=state_engine,
+        clock_engine=clock_engine,
+        owns_game=shard_lease_manager.owns_game,
+        snapshot_service=SnapshotService(db),
+        bot_move_scheduler=bot_move_scheduler,
     )
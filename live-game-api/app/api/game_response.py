@@ -17,6 +17,7 @@ class GameResponse(BaseModel):
     """Game response model."""
 
     id: UUID
+    version: int = 0  # Bumped on every change; also sent as the ETag
     status: GameStatus
     rated: bool
     decision_reason: Optional[DecisionReason]
@@ -31,6 +32,7 @@ class GameResponse(BaseModel):
 
     side_to_move: str
     fen: str
+    since_ply: Optional[int] = None  # Set when ``moves`` only holds moves after this ply
     moves: List[MoveResponse] = Field(default_factory=list)
 
     result: Optional[GameResult]
@@ -0,0 +1,115 @@
+"""Shard routing middleware: send game requests to the pod owning the game."""
+
+import logging
+import re
+from typing import Callable, Optional
+from uuid import UUID
+
+import httpx
+from fastapi import Request, Response, status
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, RedirectResponse
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+FORWARDED_HEADER = "x-shard-forwarded"
+
+# Hop-by-hop headers and headers describing the original encoding
+_SKIPPED_RESPONSE_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+}
+
+
+class ShardRoutingMiddleware(BaseHTTPMiddleware):
+    """Forwards (or redirects) per-game requests to the owning pod.
+
+    Only ``/games/{game_id}...`` HTTP routes are routed; game creation and
+    WebSockets are served by any pod (broadcasts reach every pod through
+    pub/sub). Requests are handled locally when this pod owns the game, the
+    shard has no owner yet, or the request was already forwarded once. If
+    the owner cannot be reached the client gets a 503 and retries; the lease
+    expires and the shard moves if the owner is gone.
+    """
+
+    def __init__(self, app: Callable, get_lease_manager: Callable, mode: Optional[str] = None):
+        """Initialize shard routing middleware.
+
+        Args:
+            app: ASGI application
+            get_lease_manager: Returns the process-wide ShardLeaseManager
+            mode: "forward" (proxy to the owner) or "redirect" (307 to the owner)
+        """
+        super().__init__(app)
+        self.settings = get_settings()
+        self.get_lease_manager = get_lease_manager
+        self.mode = mode or self.settings.SHARD_ROUTING_MODE
+        self.game_path = re.compile(
+            rf"^{re.escape(self.settings.API_V1_STR)}/games/"
+            r"(?P<game_id>[0-9a-fA-F-]{36})(?:/|$)"
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.settings.SHARD_FORWARD_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            )
+        return self._client
+
+    def _owner_address(self, request: Request) -> Optional[str]:
+        if request.headers.get(FORWARDED_HEADER):
+            return None
+        match = self.game_path.match(request.url.path)
+        if match is None:
+            return None
+        try:
+            game_id = UUID(match.group("game_id"))
+        except ValueError:
+            return None
+        return self.get_lease_manager().owner_address(game_id)
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Route a request to the owning pod, or handle it here."""
+        owner_address = self._owner_address(request)
+        if owner_address is None:
+            return await call_next(request)
+
+        target = f"{owner_address.rstrip('/')}{request.url.path}"
+        if request.url.query:
+            target = f"{target}?{request.url.query}"
+
+        if self.mode == "redirect":
+            return RedirectResponse(target, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+        headers = {key: value for key, value in request.headers.items() if key.lower() != "host"}
+        headers[FORWARDED_HEADER] = "1"
+        try:
+            upstream = await self._get_client().request(
+                request.method, target, headers=headers, content=await request.body()
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"Forwarding to shard owner {owner_address} failed: {e}")
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "error": "SHARD_OWNER_UNAVAILABLE",
+                    "message": "The server owning this game is unavailable, please retry",
+                },
+            )
+
+        return Response(
+            content=upstream.content,
+            status_code=upstream.status_code,
+            headers={
+                key: value
+                for key, value in upstream.headers.items()
+                if key.lower() not in _SKIPPED_RESPONSE_HEADERS
+            },
+        )
@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
 from app.api.dependencies import get_current_user, get_game_service
 from app.api.models import (
@@ -16,17 +16,79 @@ from app.api.models import (
 from app.api.bot_game_request import CreateBotGameRequest
 from app.core.exceptions import (
     ApplicationException,
-    GameNotFoundError,
     GameStateError,
     InvalidMoveError,
     NotPlayersTurnError,
 )
-from app.domain.models.game import TimeControl
+from app.domain.models.game import Game, TimeControl
 from app.domain.services.game_service import GameService
 
 router = APIRouter()
 
 
+def _game_etag(version: int) -> str:
+    """ETag of a game version."""
+    return f'W/"{version}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def _to_game_response(game: Game, since_ply: Optional[int] = None) -> GameResponse:
+    """Build the API representation of a game.
+
+    Args:
+        game: Game aggregate
+        since_ply: Only include moves after this ply (None for all moves)
+    """
+    moves = game.moves if since_ply is None else [m for m in game.moves if m.ply > since_ply]
+    return GameResponse(
+        id=game.id,
+        version=game.version,
+        status=game.status,
+        rated=game.rated,
+        decision_reason=game.decision_reason,
+        variant_code=game.variant_code,
+        white_account_id=game.white_account_id,
+        black_account_id=game.black_account_id,
+        bot_id=game.bot_id,
+        bot_color=game.bot_color,
+        white_remaining_ms=game.white_clock_ms,
+        black_remaining_ms=game.black_clock_ms,
+        side_to_move=game.side_to_move,
+        fen=game.fen,
+        since_ply=since_ply,
+        moves=[
+            {
+                "ply": m.ply,
+                "move_number": m.move_number,
+                "color": m.color,
+                "from_square": m.from_square,
+                "to_square": m.to_square,
+                "promotion": m.promotion,
+                "san": m.san,
+                "played_at": m.played_at,
+                "elapsed_ms": m.elapsed_ms,
+            }
+            for m in moves
+        ],
+        result=game.result,
+        end_reason=game.end_reason,
+        created_at=game.created_at,
+        started_at=game.started_at,
+        ended_at=game.ended_at,
+    )
+
+
 @router.post("/games", response_model=GameSummaryResponse, status_code=status.HTTP_201_CREATED)
 async def create_game(
     request: CreateGameRequest,
@@ -136,40 +198,7 @@ async def request_takeback(
     """
     try:
         game = await game_service.request_takeback(game_id=game_id, player_id=current_user)
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        return _to_game_response(game)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -187,40 +216,7 @@ async def set_position(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Missing 'fen' in request body")
     try:
         game = await game_service.set_position(game_id=game_id, player_id=current_user, fen=fen)
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        return _to_game_response(game)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -240,90 +236,42 @@ async def update_rated_status(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Missing 'rated' in request body")
     try:
         game = await game_service.update_rated_status(game_id=game_id, player_id=current_user, rated=bool(body["rated"]))
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        return _to_game_response(game)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
 
-@router.get("/games/{game_id}", response_model=GameResponse)
+@router.get(
+    "/games/{game_id}",
+    response_model=GameResponse,
+    responses={304: {"description": "Game unchanged since the version in If-None-Match"}},
+)
 async def get_game(
     game_id: UUID,
+    response: Response,
+    since_ply: Optional[int] = Query(
+        None, ge=0, description="Only return moves played after this ply"
+    ),
+    if_none_match: Optional[str] = Header(None),
     current_user: UUID = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service),
 ):
-    """Get current state of a game."""
+    """Get current state of a game.
+
+    Polling clients should send the last ETag in ``If-None-Match`` (answered
+    with 304 from the game's version alone, without loading moves) and the
+    last ply they have in ``since_ply`` (only newer moves are returned).
+    """
     try:
-        game = await game_service.repository.get_by_id(game_id)
-        if not game:
-            raise GameNotFoundError(str(game_id))
+        if if_none_match:
+            etag = _game_etag(await game_service.get_game_version(game_id))
+            if _etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        game = await game_service.get_game(game_id)
+
+        response.headers["ETag"] = _game_etag(game.version)
+        return _to_game_response(game, since_ply)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -343,40 +291,7 @@ async def join_game(
             color_preference=request.color_preference,
         )
 
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        return _to_game_response(game)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -385,6 +300,10 @@ async def join_game(
 async def play_move(
     game_id: UUID,
     request: PlayMoveRequest,
+    response: Response,
+    since_ply: Optional[int] = Query(
+        None, ge=0, description="Only return moves played after this ply"
+    ),
     current_user: UUID = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service),
 ):
@@ -398,40 +317,8 @@ async def play_move(
             promotion=request.promotion,
         )
 
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        response.headers["ETag"] = _game_etag(game.version)
+        return _to_game_response(game, since_ply)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -446,39 +333,6 @@ async def resign(
     try:
         game = await game_service.resign(game_id=game_id, player_id=current_user)
 
-        return GameResponse(
-            id=game.id,
-            status=game.status,
-            rated=game.rated,
-            decision_reason=game.decision_reason,
-            variant_code=game.variant_code,
-            white_account_id=game.white_account_id,
-            black_account_id=game.black_account_id,
-            bot_id=game.bot_id,
-            bot_color=game.bot_color,
-            white_remaining_ms=game.white_clock_ms,
-            black_remaining_ms=game.black_clock_ms,
-            side_to_move=game.side_to_move,
-            fen=game.fen,
-            moves=[
-                {
-                    "ply": m.ply,
-                    "move_number": m.move_number,
-                    "color": m.color,
-                    "from_square": m.from_square,
-                    "to_square": m.to_square,
-                    "promotion": m.promotion,
-                    "san": m.san,
-                    "played_at": m.played_at,
-                    "elapsed_ms": m.elapsed_ms,
-                }
-                for m in game.moves
-            ],
-            result=game.result,
-            end_reason=game.end_reason,
-            created_at=game.created_at,
-            started_at=game.started_at,
-            ended_at=game.ended_at,
-        )
+        return _to_game_response(game)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
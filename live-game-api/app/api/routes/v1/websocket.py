@@ -8,6 +8,8 @@ from uuid import UUID, uuid4
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status
 
+from app.api.dependencies import get_websocket_manager
+from app.core.config import get_settings
 from app.core.security import extract_user_id_from_token
 from app.infrastructure.websocket.connection_manager import WebSocketConnectionManager
 
@@ -15,16 +17,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Singleton connection manager
-_connection_manager: Optional[WebSocketConnectionManager] = None
-
-
 def get_connection_manager() -> WebSocketConnectionManager:
-    """Get WebSocket connection manager instance."""
-    global _connection_manager
-    if _connection_manager is None:
-        _connection_manager = WebSocketConnectionManager()
-    return _connection_manager
+    """Get WebSocket connection manager instance.
+
+    Shares the singleton used by GameService so broadcasts and local
+    subscriptions go through the same Redis client and fan-out.
+    """
+    return get_websocket_manager()
 
 
 async def authenticate_websocket(websocket: WebSocket, token: Optional[str] = None) -> UUID:
@@ -91,27 +90,29 @@ async def websocket_game_updates(
 
     # Accept connection
     await websocket.accept()
+
+    # All writes go through a bounded queue drained by its own task
+    send_queue = connection_manager.create_send_queue(connection_id, websocket)
+    heartbeat_interval = get_settings().WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS
     
     try:
         # Register connection
-        await connection_manager.connect(connection_id, game_id)
+        await connection_manager.connect(connection_id, game_id, send_queue)
         logger.info(f"WebSocket connected: {connection_id} for game {game_id}, user {user_id}")
 
         # Send connection confirmation
-        await websocket.send_json({
+        send_queue.offer(json.dumps({
             "type": "connected",
             "connection_id": connection_id,
             "game_id": str(game_id),
-        })
+        }))
 
         # Heartbeat/ping loop (keep connection alive)
         async def send_heartbeat():
-            while True:
-                await asyncio.sleep(30)  # Send ping every 30 seconds
-                try:
-                    await websocket.send_json({"type": "ping"})
-                except Exception:
-                    break
+            ping = json.dumps({"type": "ping"})
+            while not send_queue.closed:
+                await asyncio.sleep(heartbeat_interval)
+                send_queue.offer(ping)
 
         heartbeat_task = asyncio.create_task(send_heartbeat())
 
@@ -131,12 +132,11 @@ async def websocket_game_updates(
                     elif message_type == "subscribe":
                         # Subscribe to additional games (future: multi-game support)
                         target_game_id = UUID(message.get("game_id"))
-                        await connection_manager.connect(connection_id, target_game_id)
+                        await connection_manager.connect(connection_id, target_game_id, send_queue)
                     elif message_type == "unsubscribe":
                         # Unsubscribe from games (future: multi-game support)
                         target_game_id = UUID(message.get("game_id"))
-                        # Note: Full unsubscribe would require tracking per-game subscriptions
-                        pass
+                        await connection_manager.unsubscribe(connection_id, target_game_id)
                     else:
                         logger.warning(f"Unknown message type: {message_type}")
                 except json.JSONDecodeError:
@@ -149,10 +149,12 @@ async def websocket_game_updates(
         finally:
             heartbeat_task.cancel()
             await connection_manager.disconnect(connection_id)
+            await send_queue.close()
 
     except Exception as e:
         logger.error(f"WebSocket error: {e}", exc_info=True)
         await connection_manager.disconnect(connection_id)
+        await send_queue.close()
         try:
             await websocket.close()
         except Exception:
@@ -50,15 +50,43 @@ class Settings(BaseSettings):
     REDIS_DECODE_RESPONSES: bool = True
 
     # Sharding Configuration
-    SHARD_ENABLED: bool = False  # Enable sharding when ready
-    SHARD_COUNT: int = 8  # Number of shards
+    SHARD_ENABLED: bool = True  # Lease shards so each game has one owning pod (state and clock)
+    SHARD_COUNT: int = 64  # Number of virtual shards (leased by pods, keep well above pod count)
+    SHARD_LEASE_TTL_SECONDS: float = 10.0  # Shard lease / pod membership lifetime
+    SHARD_RENEW_INTERVAL_SECONDS: float = 3.0  # Lease refresh cadence
+    SHARD_ROUTING_MODE: str = "forward"  # "forward" (proxy) or "redirect" (307) to the owner
+    SHARD_FORWARD_TIMEOUT_SECONDS: float = 10.0  # Timeout for forwarded requests
+    # Single pod only: with SHARD_ENABLED off, hold every game's state and clock anyway
+    RESIDENT_GAMES_WITHOUT_SHARDING: bool = False
+    POD_ID: Optional[str] = None  # Defaults to the hostname
+    POD_ADDRESS: Optional[str] = None  # Base URL of this pod; defaults to http://<hostname>:<PORT>
+    GAME_CACHE_ENABLED: bool = True  # Serve in-progress games from Redis
     GAME_CACHE_TTL_SECONDS: int = 3600  # 1 hour TTL for active games in Redis
     SNAPSHOT_INTERVAL_MOVES: int = 10  # Snapshot every N moves
     SNAPSHOT_INTERVAL_SECONDS: int = 300  # Or every 5 minutes
 
+    # In-memory game state engine
+    GAME_STATE_MAX_RESIDENT_GAMES: int = 50000  # LRU bound on resident in-progress games
+
+    # Server-side clocks
+    CLOCK_TICK_MS: int = 100  # Flag-fall timer resolution
+
+    # Bot moves
+    BOT_MOVE_WORKERS: int = 32  # Concurrent bot move requests per process
+    BOT_MOVE_PER_BOT_CONCURRENCY: int = 8  # Concurrent requests per bot
+    BOT_MOVE_MAX_PENDING: int = 10000  # Games waiting for a bot move
+    BOT_MOVE_TIMEOUT_SECONDS: float = 30.0  # Bot orchestrator request timeout
+    BOT_ORCHESTRATOR_MAX_CONNECTIONS: int = 64  # Pooled keep-alive connections
+    BOT_ORCHESTRATOR_POOL_TIMEOUT_MS: int = 1000  # Max wait for a free pooled connection
+    BOT_ORCHESTRATOR_HTTP2: bool = True  # Negotiated over TLS where supported (needs h2)
+
     # WebSocket Configuration
     WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS: int = 30  # Ping interval
     WEBSOCKET_RESUME_TOKEN_TTL_SECONDS: int = 3600  # 1 hour TTL for resume tokens
+    WEBSOCKET_SEND_QUEUE_SIZE: int = 64  # Max outbound frames buffered per connection
+    WEBSOCKET_SEND_QUEUE_HIGH_WATER: int = 48  # Depth above which a client counts as slow
+    WEBSOCKET_SLOW_CONSUMER_GRACE_SECONDS: float = 5.0  # Time over high water before eviction
+    WEBSOCKET_SUBSCRIBER_RECONCILE_SECONDS: int = 30  # Redis subscriber reconciliation interval
 
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
@@ -94,6 +94,18 @@ class NotPlayersTurnError(ApplicationException):
         )
 
 
+class MoveConflictError(ApplicationException):
+    """Move conflicts with a concurrent change to the game."""
+
+    def __init__(self, game_id: str):
+        super().__init__(
+            message=f"Game {game_id} was modified concurrently, please retry",
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="MOVE_CONFLICT",
+            details={"game_id": game_id},
+        )
+
+
 class TakebackNotAllowedError(ApplicationException):
     """Takeback not allowed in rated games."""
 
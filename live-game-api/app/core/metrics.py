@@ -51,6 +51,64 @@ live_game_websocket_reconnects_total = Counter(
     "Total number of WebSocket reconnections",
 )
 
+live_game_websocket_send_queue_depth = Histogram(
+    "live_game_websocket_send_queue_depth",
+    "Outbound queue depth of a WebSocket connection when a frame is enqueued",
+    buckets=[0, 1, 2, 4, 8, 16, 32, 48, 64],
+)
+
+live_game_websocket_frames_dropped_total = Counter(
+    "live_game_websocket_frames_dropped_total",
+    "Outbound WebSocket frames dropped before being sent",
+    ["reason"],  # reason: "coalesced", "overflow", "closed"
+)
+
+live_game_websocket_slow_consumer_evictions_total = Counter(
+    "live_game_websocket_slow_consumer_evictions_total",
+    "WebSocket connections closed for staying over the send queue high-water mark",
+)
+
+# Bot move pipeline metrics
+live_game_bot_move_queue_delay_seconds = Histogram(
+    "live_game_bot_move_queue_delay_seconds",
+    "Time a bot move waits in the scheduler before a worker requests it",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+live_game_bot_move_think_seconds = Histogram(
+    "live_game_bot_move_think_seconds",
+    "Bot move request duration (orchestrator round trip including think time)",
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+live_game_bot_move_queue_depth = Gauge(
+    "live_game_bot_move_queue_depth",
+    "Games with a queued or running bot move",
+)
+
+live_game_bot_moves_total = Counter(
+    "live_game_bot_moves_total",
+    "Total number of scheduled bot moves by outcome",
+    ["outcome"],  # outcome: "played", "failed", "cancelled", "rejected"
+)
+
+# Game cache metrics
+live_game_cache_hits_total = Counter(
+    "live_game_cache_hits_total",
+    "Total number of game cache hits",
+)
+
+live_game_cache_misses_total = Counter(
+    "live_game_cache_misses_total",
+    "Total number of game cache misses",
+)
+
+live_game_cache_errors_total = Counter(
+    "live_game_cache_errors_total",
+    "Total number of game cache errors",
+    ["operation"],  # operation: "get", "set", "delete"
+)
+
 # Database metrics
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
@@ -73,6 +131,25 @@ external_service_call_duration_seconds = Histogram(
     buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
 )
 
+# HTTP client pool metrics
+http_client_in_flight_requests = Gauge(
+    "http_client_in_flight_requests",
+    "Requests holding a pooled connection to an upstream service",
+    ["upstream"],
+)
+
+http_client_pool_saturated_total = Counter(
+    "http_client_pool_saturated_total",
+    "Total number of upstream requests that had to wait for a free pooled connection",
+    ["upstream"],
+)
+
+http_client_pool_timeouts_total = Counter(
+    "http_client_pool_timeouts_total",
+    "Total number of upstream requests that timed out waiting for a pooled connection",
+    ["upstream"],
+)
+
 # Kafka event publishing metrics
 kafka_events_published_total = Counter(
     "kafka_events_published_total",
@@ -49,6 +49,9 @@ class Game(BaseEntity):
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
 
+    # Incremented on every persisted change (drives ETags and "unchanged" answers)
+    version: int = 0
+
     def is_waiting_for_opponent(self) -> bool:
         """Check if game is waiting for opponent."""
         return self.status == GameStatus.WAITING_FOR_OPPONENT
@@ -133,15 +136,27 @@ class Game(BaseEntity):
         self.started_at = datetime.now(timezone.utc)
         self.white_clock_ms = self.time_control.initial_seconds * 1000
         self.black_clock_ms = self.time_control.initial_seconds * 1000
-        self.side_to_move = "w"
+        self.side_to_move = self.fen.split()[1]  # Custom positions may start with black
         
         # If bot is assigned and it's bot's turn, game can start immediately
         # (bot move will be triggered by service layer)
 
+    def get_clock_ms(self, color: str) -> int:
+        """Get remaining clock time of a side in milliseconds."""
+        return self.white_clock_ms if color == "w" else self.black_clock_ms
+
+    def set_clock_ms(self, color: str, clock_ms: int) -> None:
+        """Set remaining clock time of a side in milliseconds."""
+        if color == "w":
+            self.white_clock_ms = clock_ms
+        else:
+            self.black_clock_ms = clock_ms
+
     def add_move(self, move: Move) -> None:
         """Add a move to the game and update clocks."""
         self.moves.append(move)
         self.updated_at = datetime.now(timezone.utc)
+        self.version += 1
 
     def end_game(
         self, result: GameResult, reason: EndReason, ended_at: Optional[datetime] = None
@@ -18,6 +18,8 @@ class Move(BaseModel):
     fen_after: str
     played_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     elapsed_ms: int = Field(..., ge=0)
+    # Zobrist hash of the position after the move (repetition detection only)
+    position_hash: Optional[int] = Field(None, exclude=True)
 
     class Config:
         from_attributes = True
@@ -1,10 +1,10 @@
 """Game repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from app.domain.models.game import Game, GameStatus
+from app.domain.models.game import Game, GameStatus, Move
 
 
 class GameRepositoryInterface(ABC):
@@ -20,9 +20,24 @@ class GameRepositoryInterface(ABC):
         """Get game by ID."""
         pass
 
+    @abstractmethod
+    async def get_version(self, game_id: UUID) -> Optional[int]:
+        """Get a game's version without loading the game."""
+        pass
+
     @abstractmethod
     async def update(self, game: Game) -> Game:
-        """Update a game."""
+        """Update a game (bumping its version)."""
+        pass
+
+    @abstractmethod
+    async def append_move(
+        self, game_id: UUID, move: Move, game_columns: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Persist one new move and the game columns it changed.
+
+        Returns the game columns as stored, without re-reading the game.
+        """
         pass
 
     @abstractmethod
@@ -0,0 +1,186 @@
+"""Background scheduler for bot moves."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+from uuid import UUID
+
+from app.core.metrics import (
+    live_game_bot_move_queue_delay_seconds,
+    live_game_bot_move_queue_depth,
+    live_game_bot_moves_total,
+)
+
+logger = logging.getLogger(__name__)
+
+BotMoveHandler = Callable[[UUID], Awaitable[None]]
+
+
+@dataclass
+class BotMoveJob:
+    """A pending request for a bot to move in one game."""
+
+    game_id: UUID
+    bot_id: str
+    ply: int  # Plies played when the job was scheduled
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class BotMoveScheduler:
+    """Plays bot moves in the background with a bounded worker pool.
+
+    Human moves only enqueue a job, so their response does not wait for the
+    bot's think time. Workers hand jobs to ``on_bot_move`` (which asks the
+    bot orchestrator, applies the move and broadcasts it) with at most
+    ``per_bot_concurrency`` jobs in flight per bot; jobs for a saturated bot
+    wait aside without occupying a worker. There is at most one job per game:
+    scheduling again replaces a queued job, and ``cancel`` drops a queued job
+    or cancels a running one (e.g. on resign or takeback).
+    """
+
+    def __init__(
+        self,
+        on_bot_move: Optional[BotMoveHandler] = None,
+        workers: int = 32,
+        per_bot_concurrency: int = 8,
+        max_pending: int = 10000,
+    ):
+        """Initialize bot move scheduler.
+
+        Args:
+            on_bot_move: Coroutine playing the bot move of a game
+            workers: Number of concurrent bot move requests
+            per_bot_concurrency: Max concurrent requests for one bot
+            max_pending: Max games waiting for a bot move
+        """
+        self.on_bot_move = on_bot_move
+        self.workers = workers
+        self.per_bot_concurrency = per_bot_concurrency
+        self.max_pending = max_pending
+        self._ready: "asyncio.Queue[BotMoveJob]" = asyncio.Queue()
+        self._pending: Dict[UUID, BotMoveJob] = {}  # Queued or running job per game
+        self._running: Dict[UUID, asyncio.Task] = {}
+        self._in_flight: Dict[str, int] = {}  # bot_id -> running jobs
+        self._deferred: Dict[str, Deque[BotMoveJob]] = {}  # bot_id -> jobs over its limit
+        self._worker_tasks: List[asyncio.Task] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def is_pending(self, game_id: UUID) -> bool:
+        """Whether a bot move is queued or running for a game."""
+        return game_id in self._pending
+
+    def schedule(self, game_id: UUID, bot_id: str, ply: int) -> bool:
+        """Queue a bot move for a game.
+
+        Args:
+            game_id: Game UUID
+            bot_id: Bot to move
+            ply: Plies played so far (identifies the position to answer)
+
+        Returns:
+            True if queued, False if the scheduler is full
+        """
+        current = self._pending.get(game_id)
+        if current is not None and current.ply == ply:
+            return True  # Already queued or thinking about this position
+        self.cancel(game_id)
+        if len(self._pending) >= self.max_pending:
+            live_game_bot_moves_total.labels(outcome="rejected").inc()
+            logger.warning(f"Bot move queue full, not scheduling game {game_id}")
+            return False
+
+        job = BotMoveJob(game_id=game_id, bot_id=bot_id, ply=ply)
+        self._pending[game_id] = job
+        self._ready.put_nowait(job)
+        live_game_bot_move_queue_depth.set(len(self._pending))
+        return True
+
+    def cancel(self, game_id: UUID) -> bool:
+        """Drop a queued bot move or cancel a running one.
+
+        Returns:
+            True if a job was cancelled
+        """
+        job = self._pending.pop(game_id, None)
+        if job is None:
+            return False
+        # Queued jobs are skipped by the workers once they are no longer pending
+        task = self._running.get(game_id)
+        if task is not None:
+            task.cancel()
+        live_game_bot_moves_total.labels(outcome="cancelled").inc()
+        live_game_bot_move_queue_depth.set(len(self._pending))
+        return True
+
+    def start(self) -> None:
+        """Start the worker pool."""
+        self._worker_tasks = [task for task in self._worker_tasks if not task.done()]
+        while len(self._worker_tasks) < self.workers:
+            self._worker_tasks.append(asyncio.create_task(self._work()))
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._ready.get()
+            if self._pending.get(job.game_id) is not job:
+                continue  # Cancelled or replaced while queued
+            if self._in_flight.get(job.bot_id, 0) >= self.per_bot_concurrency:
+                self._deferred.setdefault(job.bot_id, deque()).append(job)
+                continue
+            await self._run_job(job)
+
+    async def _run_job(self, job: BotMoveJob) -> None:
+        live_game_bot_move_queue_delay_seconds.observe(time.monotonic() - job.enqueued_at)
+        self._in_flight[job.bot_id] = self._in_flight.get(job.bot_id, 0) + 1
+        task = asyncio.create_task(self.on_bot_move(job.game_id))
+        self._running[job.game_id] = task
+        try:
+            await task
+            outcome = "played"
+        except asyncio.CancelledError:
+            if self._pending.get(job.game_id) is job:
+                raise  # The worker itself is being cancelled
+            outcome = None  # Cancelled through cancel(), which counted it
+        except Exception as e:
+            logger.error(f"Failed to play bot move for game {job.game_id}: {e}")
+            outcome = "failed"
+        finally:
+            if self._running.get(job.game_id) is task:
+                del self._running[job.game_id]
+            if self._pending.get(job.game_id) is job:
+                del self._pending[job.game_id]
+            live_game_bot_move_queue_depth.set(len(self._pending))
+            self._release(job.bot_id)
+        if outcome is not None:
+            live_game_bot_moves_total.labels(outcome=outcome).inc()
+
+    def _release(self, bot_id: str) -> None:
+        """Free a bot's slot and hand its next deferred job to the workers."""
+        self._in_flight[bot_id] -= 1
+        if not self._in_flight[bot_id]:
+            del self._in_flight[bot_id]
+        deferred = self._deferred.get(bot_id)
+        while deferred:
+            job = deferred.popleft()
+            if self._pending.get(job.game_id) is job:
+                self._ready.put_nowait(job)
+                break
+        if deferred is not None and not deferred:
+            del self._deferred[bot_id]
+
+    async def close(self) -> None:
+        """Stop the workers and cancel running bot moves."""
+        for task in self._worker_tasks:
+            task.cancel()
+        for task in list(self._running.values()):
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, *self._running.values(), return_exceptions=True)
+        self._worker_tasks = []
+        self._running.clear()
+        self._pending.clear()
+        self._deferred.clear()
+        self._in_flight.clear()
@@ -0,0 +1,200 @@
+"""Server-side chess clocks with flag-fall detection."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+from app.domain.models.game import Game
+from app.domain.services.timer_wheel import TimerWheel
+
+logger = logging.getLogger(__name__)
+
+FlagHandler = Callable[[UUID], Awaitable[None]]
+
+
+@dataclass
+class RunningClock:
+    """Clock of the side to move in one game."""
+
+    color: str
+    started_at: float  # time.monotonic() when the turn started
+    remaining_ms: int  # Time left for the side to move when the turn started
+
+
+class ClockEngine:
+    """Runs the clock of the side to move for every resident game.
+
+    Elapsed time is measured with ``time.monotonic()`` from the start of the
+    turn, so it is unaffected by wall-clock adjustments. Each running clock
+    has a flag-fall deadline in a ``TimerWheel``; a background task advances
+    the wheel every tick and hands expired games to the flag handler, so
+    games end on time without polling the database.
+    """
+
+    def __init__(self, tick_ms: int = 100, on_flag: Optional[FlagHandler] = None):
+        """Initialize clock engine.
+
+        Args:
+            tick_ms: Timer resolution in milliseconds
+            on_flag: Coroutine called with the game ID when a flag falls
+        """
+        self.tick_ms = tick_ms
+        self.on_flag = on_flag
+        self._clocks: Dict[UUID, RunningClock] = {}
+        self._wheel = TimerWheel(start_tick=self._to_tick(time.monotonic()))
+        self._runner_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._clocks)
+
+    def _to_tick(self, monotonic_seconds: float) -> int:
+        return int(monotonic_seconds * 1000) // self.tick_ms
+
+    def start_turn(
+        self,
+        game_id: UUID,
+        color: str,
+        remaining_ms: int,
+        already_elapsed_ms: int = 0,
+        now: Optional[float] = None,
+    ) -> None:
+        """Start (or restart) the clock of the side to move.
+
+        Args:
+            game_id: Game UUID
+            color: Side to move ('w' or 'b')
+            remaining_ms: Time left for that side
+            already_elapsed_ms: Time already spent on this turn (e.g. before a
+                process restart)
+            now: Monotonic time in seconds (defaults to ``time.monotonic()``)
+        """
+        now = time.monotonic() if now is None else now
+        started_at = now - already_elapsed_ms / 1000
+        clock = RunningClock(color=color, started_at=started_at, remaining_ms=remaining_ms)
+        self._clocks[game_id] = clock
+        self._schedule(game_id, clock)
+
+    def _schedule(self, game_id: UUID, clock: RunningClock) -> None:
+        deadline_ms = int(clock.started_at * 1000) + clock.remaining_ms
+        self._wheel.schedule(game_id, -(-deadline_ms // self.tick_ms))  # Round up
+
+    def start_turn_for(self, game: Game, last_activity: Optional[datetime] = None) -> None:
+        """Start the clock of ``game.side_to_move`` from the persisted game.
+
+        Time since the last move (or game start) is charged using wall-clock
+        timestamps, so clocks keep running across reloads and restarts.
+
+        Args:
+            game: In-progress game
+            last_activity: When the current turn started, if ``game.moves``
+                does not hold the last move (defaults to the last move or the
+                game start)
+        """
+        if not game.is_in_progress():
+            self.stop(game.id)
+            return
+
+        self.start_turn(
+            game.id,
+            game.side_to_move,
+            game.get_clock_ms(game.side_to_move),
+            already_elapsed_ms=self.turn_elapsed_ms(game, last_activity),
+        )
+
+    @staticmethod
+    def turn_elapsed_ms(game: Game, last_activity: Optional[datetime] = None) -> int:
+        """Time spent on the current turn according to the persisted game.
+
+        Used where no clock runs for the game (e.g. on a pod that does not own
+        it); measured with wall-clock timestamps.
+
+        Args:
+            game: In-progress game
+            last_activity: When the current turn started (defaults to the
+                last move or the game start)
+        """
+        if last_activity is None:
+            last_activity = game.moves[-1].played_at if game.moves else game.started_at
+        if last_activity is None:
+            return 0
+        if last_activity.tzinfo is None:
+            last_activity = last_activity.replace(tzinfo=timezone.utc)
+        elapsed = datetime.now(timezone.utc) - last_activity
+        return max(0, round(elapsed.total_seconds() * 1000))
+
+    def game_ids(self) -> List[UUID]:
+        """IDs of all games with a running clock."""
+        return list(self._clocks)
+
+    def is_running(self, game_id: UUID) -> bool:
+        """Whether a clock is running for the game."""
+        return game_id in self._clocks
+
+    def elapsed_ms(self, game_id: UUID, now: Optional[float] = None) -> int:
+        """Time spent on the current turn, or 0 if no clock is running."""
+        clock = self._clocks.get(game_id)
+        if clock is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        # Round, don't truncate: float error would turn 0.4 s into 399 ms
+        return max(0, round((now - clock.started_at) * 1000))
+
+    def has_flagged(self, game_id: UUID, now: Optional[float] = None) -> bool:
+        """Whether the side to move has run out of time."""
+        clock = self._clocks.get(game_id)
+        if clock is None:
+            return False
+        return self.elapsed_ms(game_id, now) >= clock.remaining_ms
+
+    def rearm(self, game_id: UUID) -> None:
+        """Re-schedule the flag-fall deadline of a running clock."""
+        clock = self._clocks.get(game_id)
+        if clock is not None:
+            self._schedule(game_id, clock)
+
+    def stop(self, game_id: UUID) -> None:
+        """Stop a game's clock and cancel its flag-fall deadline."""
+        self._clocks.pop(game_id, None)
+        self._wheel.cancel(game_id)
+
+    def expire(self, now: Optional[float] = None) -> List[UUID]:
+        """Advance the timer wheel and return games whose flag has fallen.
+
+        Expired clocks stay registered until the handler stops them, so a
+        move racing the flag still sees the elapsed time.
+        """
+        now = time.monotonic() if now is None else now
+        return self._wheel.advance(self._to_tick(now))
+
+    def start(self) -> None:
+        """Start the background task that fires flag-fall deadlines."""
+        if self._runner_task is None or self._runner_task.done():
+            self._runner_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        interval = self.tick_ms / 1000
+        while True:
+            await asyncio.sleep(interval)
+            expired = self.expire()
+            if not expired or self.on_flag is None:
+                continue
+            results = await asyncio.gather(
+                *(self.on_flag(game_id) for game_id in expired), return_exceptions=True
+            )
+            for game_id, result in zip(expired, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to handle flag fall for game {game_id}: {result}")
+
+    async def close(self) -> None:
+        """Stop the background task."""
+        if self._runner_task is not None:
+            self._runner_task.cancel()
+            try:
+                await self._runner_task
+            except asyncio.CancelledError:
+                pass
+            self._runner_task = None
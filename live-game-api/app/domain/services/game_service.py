@@ -1,14 +1,16 @@
 """Game domain service."""
 
 import asyncio
+import logging
 import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Callable, List, Optional
 from uuid import UUID
 
 import chess
 
 from app.core.metrics import (
+    live_game_bot_move_think_seconds,
     live_game_move_latency_seconds,
     live_game_moves_total,
 )
@@ -36,8 +38,18 @@ from app.domain.models.game import (
     TimeControl,
 )
 from app.domain.repositories.game_repository import GameRepositoryInterface
+from app.domain.services.bot_move_scheduler import BotMoveScheduler
+from app.domain.services.clock_engine import ClockEngine
+from app.domain.services.game_state_engine import (
+    AppliedMove,
+    GameStateEngine,
+    LiveGameState,
+)
 from app.domain.services.rating_decision_engine import RatingDecisionEngine, RulesConfig
 from app.infrastructure.clients.bot_orchestrator import BotOrchestratorClient
+from app.infrastructure.snapshots.snapshot_service import SnapshotService
+
+logger = logging.getLogger(__name__)
 
 
 class GameService:
@@ -50,12 +62,25 @@ class GameService:
         bot_orchestrator_client: Optional[BotOrchestratorClient] = None,
         event_publisher = None,
         websocket_manager = None,
+        state_engine: Optional[GameStateEngine] = None,
+        clock_engine: Optional[ClockEngine] = None,
+        owns_game: Optional[Callable[[UUID], bool]] = None,
+        snapshot_service: Optional[SnapshotService] = None,
+        bot_move_scheduler: Optional[BotMoveScheduler] = None,
     ):
         self.repository = repository
         self.rating_decision_engine = rating_decision_engine or RatingDecisionEngine()
         self.bot_orchestrator_client = bot_orchestrator_client or BotOrchestratorClient()
         self.event_publisher = event_publisher
         self.websocket_manager = websocket_manager
+        # Engines define __len__, so an empty shared engine is falsy: test for None
+        self.state_engine = state_engine if state_engine is not None else GameStateEngine()
+        self.clock_engine = clock_engine if clock_engine is not None else ClockEngine()
+        # Whether this process owns a game's shard (always true without sharding)
+        self.owns_game = owns_game or (lambda game_id: True)
+        self.snapshot_service = snapshot_service
+        # Plays bot moves in the background (inline when not configured)
+        self.bot_move_scheduler = bot_move_scheduler
         self.events: List = []  # Keep for backward compatibility
 
     async def create_challenge(
@@ -108,6 +133,8 @@ class GameService:
             starting_fen=starting_fen,
             is_odds_game=is_odds_game,
         )
+        if starting_fen:
+            game.fen = starting_fen
 
         # Assign creator's color based on preference
         # If no opponent, we still need to assign creator's side
@@ -224,6 +251,9 @@ class GameService:
         # Save game
         saved_game = await self.repository.create(game)
         
+        # Keep the started game resident for the move hot path
+        self._keep_resident(saved_game)
+        
         # Emit events
         game_created_event = GameCreatedEvent(
             aggregate_id=saved_game.id,
@@ -244,15 +274,9 @@ class GameService:
         self.events.append(game_started_event)
         # Note: GameStartedEvent is not in scope for Kafka publishing (only GameCreated, MovePlayed, GameEnded)
         
-        # If bot goes first, play bot move immediately
+        # If bot goes first, request its move right away
         if saved_game.is_bot_turn() and saved_game.is_in_progress():
-            try:
-                saved_game = await self.play_bot_move(saved_game.id)
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to play initial bot move: {e}", exc_info=True)
-                # Continue with the game even if bot move fails
+            saved_game = await self._request_bot_move(saved_game)
         
         return saved_game
 
@@ -280,6 +304,9 @@ class GameService:
         # Save updated game
         saved_game = await self.repository.update(game)
 
+        # Keep the started game resident for the move hot path
+        self._keep_resident(saved_game)
+
         # Emit events
         game_started_event = GameStartedEvent(
             aggregate_id=saved_game.id,
@@ -292,17 +319,73 @@ class GameService:
 
         return saved_game
 
-    async def play_move(
-        self,
-        game_id: UUID,
-        player_id: UUID,
-        from_square: str,
-        to_square: str,
-        promotion: Optional[str] = None,
-    ) -> Game:
-        """Play a move in an active game."""
-        start_time = time.time()
+    async def get_game(self, game_id: UUID) -> Game:
+        """Get the current state of a game.
+
+        Resident in-progress games are served from memory; everything else
+        goes through the repository (and its cache, when configured).
+        """
+        state = self.state_engine.get(game_id)
+        if state is not None and state.has_full_history:
+            return state.snapshot()
+
+        game = await self.repository.get_by_id(game_id)
+        if not game:
+            raise GameNotFoundError(str(game_id))
+        return game
 
+    async def get_game_version(self, game_id: UUID) -> int:
+        """Get the current version of a game without loading its moves.
+
+        Resident games answer from memory; others with a single-column read.
+
+        Raises:
+            GameNotFoundError: If the game does not exist
+        """
+        state = self.state_engine.get(game_id)
+        if state is not None:
+            return state.game.version
+
+        version = await self.repository.get_version(game_id)
+        if version is None:
+            raise GameNotFoundError(str(game_id))
+        return version
+
+    def _keep_resident(self, game: Game) -> None:
+        """Make a started game resident and run its clock, if this process owns it."""
+        if not self.owns_game(game.id):
+            return
+        self.state_engine.put(game.model_copy(deep=True))
+        self.clock_engine.start_turn_for(game)
+
+    async def _load_live_state(self, game_id: UUID) -> LiveGameState:
+        """Get the resident state of an in-progress game, loading it on a miss.
+
+        Also makes sure the game's clock is running (e.g. after a restart).
+        On a process that does not own the game, a transient state is built
+        from the database instead: nothing is kept resident and no clock is
+        started, so only the owner holds the game's state and clock.
+        """
+        if not self.owns_game(game_id):
+            game = await self._get_in_progress_game(game_id)
+            return self.state_engine.build_state(game)
+
+        state = self.state_engine.get(game_id)
+        if state is not None and not state.has_full_history:
+            state = await self._complete_history(state)
+        if state is not None:
+            if not self.clock_engine.is_running(game_id):
+                self.clock_engine.start_turn_for(state.game)
+            return state
+
+        game = await self._get_in_progress_game(game_id)
+        state = self.state_engine.put(game)
+        if not self.clock_engine.is_running(game_id):
+            self.clock_engine.start_turn_for(game)
+        return state
+
+    async def _get_in_progress_game(self, game_id: UUID) -> Game:
+        """Read a game from the repository, which must be in progress."""
         game = await self.repository.get_by_id(game_id)
         if not game:
             raise GameNotFoundError(str(game_id))
@@ -311,99 +394,122 @@ class GameService:
             raise GameStateError(
                 f"Game is not in progress (status: {game.status})", str(game_id)
             )
+        return game
 
-        # Verify it's this player's turn
-        player_color = game.get_player_by_id(player_id)
-        if not player_color:
-            raise GameStateError("You are not a player in this game", str(game_id))
+    def _turn_elapsed_ms(self, game: Game) -> int:
+        """Time spent on the current turn: from the game's clock if it runs here."""
+        if self.clock_engine.is_running(game.id):
+            return self.clock_engine.elapsed_ms(game.id)
+        return ClockEngine.turn_elapsed_ms(game)
 
-        if game.side_to_move != player_color:
-            raise NotPlayersTurnError(str(game_id))
+    def _has_flagged(self, game: Game) -> bool:
+        """Whether the side to move has run out of time."""
+        if self.clock_engine.is_running(game.id):
+            return self.clock_engine.has_flagged(game.id)
+        return ClockEngine.turn_elapsed_ms(game) >= game.get_clock_ms(game.side_to_move)
 
-        # Validate move using chess engine
-        board = chess.Board(game.fen)
-        
+    async def _complete_history(self, state: LiveGameState) -> Optional[LiveGameState]:
+        """Fill in the move list of a state recovered from a snapshot.
+
+        Recovery only replays the moves after the snapshot; the earlier moves
+        are read on first use so responses carry the full move list.
+
+        Returns:
+            The completed state, or None if it no longer matches the database
+            (it is evicted and reloaded through the regular path)
+        """
+        game = await self.repository.get_by_id(state.game.id)
+        if game is None or len(game.moves) != state.ply:
+            self.state_engine.evict(state.game.id)
+            return None
+        state.game.moves = game.moves
+        state.ply_offset = 0
+        return state
+
+    async def _persist_applied_move(
+        self, state: LiveGameState, applied: AppliedMove
+    ) -> Game:
+        """Persist the delta of an applied move and return a snapshot of the game."""
+        game_id = state.game.id
         try:
-            # Parse squares
-            from_sq = chess.parse_square(from_square)
-            to_sq = chess.parse_square(to_square)
-            
-            # Parse promotion piece
-            promotion_piece = None
-            if promotion:
-                promotion_map = {
-                    "q": chess.QUEEN,
-                    "r": chess.ROOK,
-                    "b": chess.BISHOP,
-                    "n": chess.KNIGHT,
-                }
-                promotion_piece = promotion_map.get(promotion.lower())
-            
-            # Create move
-            chess_move = chess.Move(from_sq, to_sq, promotion=promotion_piece)
-            
-            # Validate move is legal
-            if chess_move not in board.legal_moves:
-                raise InvalidMoveError(
-                    f"Illegal move: {from_square} to {to_square}", str(game_id)
+            await self.repository.append_move(game_id, applied.move, applied.game_columns)
+        except Exception:
+            # Resident state is ahead of the database; reload it on next access
+            self.state_engine.evict(game_id)
+            raise
+
+        saved_game = state.snapshot()
+        if saved_game.is_ended():
+            self.state_engine.evict(game_id)
+            self.clock_engine.stop(game_id)
+        elif self.owns_game(game_id):
+            # Start the opponent's clock
+            self.clock_engine.start_turn(
+                game_id,
+                saved_game.side_to_move,
+                saved_game.get_clock_ms(saved_game.side_to_move),
+            )
+            await self._maybe_snapshot(state)
+        return saved_game
+
+    async def _maybe_snapshot(self, state: LiveGameState) -> None:
+        """Snapshot a resident game when its interval is due.
+
+        Snapshots only speed up recovery, so failures are logged and never
+        fail the move that triggered them.
+        """
+        if self.snapshot_service is None or not self.snapshot_service.should_snapshot(state):
+            return
+        try:
+            await self.snapshot_service.create_snapshot(state)
+        except Exception as e:
+            logger.warning(f"Failed to snapshot game {state.game.id}: {e}")
+
+    async def play_move(
+        self,
+        game_id: UUID,
+        player_id: UUID,
+        from_square: str,
+        to_square: str,
+        promotion: Optional[str] = None,
+    ) -> Game:
+        """Play a move in an active game."""
+        start_time = time.time()
+
+        async with self.state_engine.lock_for(game_id):
+            state = await self._load_live_state(game_id)
+            game = state.game
+
+            # Verify it's this player's turn
+            player_color = game.get_player_by_id(player_id)
+            if not player_color:
+                raise GameStateError("You are not a player in this game", str(game_id))
+
+            if game.side_to_move != player_color:
+                raise NotPlayersTurnError(str(game_id))
+
+            # A move arriving after the flag fell loses on time instead
+            flagged = self._has_flagged(state.game)
+            if not flagged:
+                # Validate and apply move against the resident board
+                applied = self.state_engine.apply_move(
+                    state,
+                    color=player_color,
+                    from_square=from_square,
+                    to_square=to_square,
+                    promotion=promotion,
+                    elapsed_ms=self._turn_elapsed_ms(state.game),
                 )
-            
-            # Apply move to board
-            san = board.san(chess_move)
-            board.push(chess_move)
-            fen_after = board.fen()
-            
-        except ValueError as e:
-            raise InvalidMoveError(f"Invalid move format: {str(e)}", str(game_id))
-
-        # Calculate elapsed time (simplified for MVP)
-        elapsed_ms = 0  # TODO: Calculate from actual clock
-
-        # Create move object
-        ply = len(game.moves) + 1
-        move_number = (ply + 1) // 2
-
-        move = Move(
-            ply=ply,
-            move_number=move_number,
-            color=player_color,
-            from_square=from_square,
-            to_square=to_square,
-            promotion=promotion,
-            san=san,
-            fen_after=fen_after,
-            played_at=datetime.now(timezone.utc),
-            elapsed_ms=elapsed_ms,
-        )
 
-        # Add move to game
-        game.add_move(move)
-
-        # Update game state
-        game.fen = fen_after
-        game.side_to_move = "b" if game.side_to_move == "w" else "w"
-
-        # Check for game end conditions
-        move_result = "valid"
-        if board.is_checkmate():
-            result = GameResult.WHITE_WIN if player_color == "w" else GameResult.BLACK_WIN
-            game.end_game(result, EndReason.CHECKMATE)
-            move_result = "checkmate"
-        elif board.is_stalemate():
-            game.end_game(GameResult.DRAW, EndReason.STALEMATE)
-            move_result = "stalemate"
-        elif board.is_insufficient_material():
-            game.end_game(GameResult.DRAW, EndReason.INSUFFICIENT_MATERIAL)
-            move_result = "draw"
-        elif board.is_fifty_moves():
-            game.end_game(GameResult.DRAW, EndReason.FIFTY_MOVE_RULE)
-            move_result = "draw"
-        elif board.is_repetition():
-            game.end_game(GameResult.DRAW, EndReason.THREEFOLD_REPETITION)
-            move_result = "draw"
+                # Persist only the new move and the changed game columns
+                saved_game = await self._persist_applied_move(state, applied)
 
-        # Save updated game
-        saved_game = await self.repository.update(game)
+        if flagged:
+            await self.handle_flag_fall(game_id)
+            raise GameAlreadyEndedError(str(game_id), EndReason.TIMEOUT.value)
+
+        move = applied.move
+        move_result = applied.move_result
 
         # Record metrics
         latency = time.time() - start_time
@@ -474,19 +580,37 @@ class GameService:
                     logger = logging.getLogger(__name__)
                     logger.error(f"Failed to broadcast game ended to WebSocket: {e}", exc_info=True)
         
-        # If this is a bot game and it's now the bot's turn, play bot move
+        # If this is a bot game and it's now the bot's turn, request its move
         if saved_game.is_bot_game() and saved_game.is_bot_turn() and saved_game.is_in_progress():
-            try:
-                saved_game = await self.play_bot_move(game_id)
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to play bot move after human move: {e}", exc_info=True)
-                # Continue with the game even if bot move fails
-                # The frontend can poll for bot moves if needed
+            saved_game = await self._request_bot_move(saved_game)
 
         return saved_game
 
+    async def _request_bot_move(self, game: Game) -> Game:
+        """Have the bot answer the current position.
+
+        With a scheduler the move is played in the background and pushed over
+        the WebSocket, and ``game`` is returned unchanged. Without one the
+        move is played inline.
+
+        Returns:
+            The game, including the bot move if it was played inline
+        """
+        if self.bot_move_scheduler is not None:
+            self.bot_move_scheduler.schedule(game.id, game.bot_id, len(game.moves))
+            return game
+        try:
+            return await self.play_bot_move(game.id)
+        except Exception as e:
+            # Continue with the game even if bot move fails
+            logger.error(f"Failed to play bot move: {e}", exc_info=True)
+            return game
+
+    def _cancel_bot_move(self, game_id: UUID) -> None:
+        """Drop a pending bot move that no longer answers the current position."""
+        if self.bot_move_scheduler is not None:
+            self.bot_move_scheduler.cancel(game_id)
+
     async def play_bot_move(self, game_id: UUID) -> Game:
         """Play a bot move in a bot game.
         
@@ -500,12 +624,12 @@ class GameService:
             GameNotFoundError: If game not found
             GameStateError: If game is not a bot game or not bot's turn
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        game = await self.repository.get_by_id(game_id)
-        if not game:
-            raise GameNotFoundError(str(game_id))
+        # Load under the lock so a concurrent move's state is never replaced,
+        # and read the position the bot answers as one consistent copy
+        async with self.state_engine.lock_for(game_id):
+            state = await self._load_live_state(game_id)
+            game = state.snapshot()
+            plies_before = state.ply
         
         if not game.is_bot_game():
             raise GameStateError("Game is not a bot game", str(game_id))
@@ -513,14 +637,12 @@ class GameService:
         if not game.is_bot_turn():
             raise GameStateError("It is not the bot's turn", str(game_id))
         
-        if not game.is_in_progress():
-            raise GameStateError(f"Game is not in progress (status: {game.status})", str(game_id))
-        
         try:
             # Calculate move number
-            move_number = len(game.moves) // 2 + 1
+            move_number = plies_before // 2 + 1
             
-            # Get bot move from orchestrator
+            # Get bot move from orchestrator (without holding the game lock)
+            think_started = time.monotonic()
             bot_response = await self.bot_orchestrator_client.get_bot_move(
                 bot_id=game.bot_id,
                 game_id=str(game.id),
@@ -533,6 +655,7 @@ class GameService:
                 metadata={},
                 debug=False,
             )
+            live_game_bot_move_think_seconds.observe(time.monotonic() - think_started)
             
             # Parse bot move (format: "e2e4" or "e2e4q" for promotion)
             bot_move_str = bot_response.move
@@ -542,184 +665,228 @@ class GameService:
             from_square = bot_move_str[0:2]
             to_square = bot_move_str[2:4]
             promotion = bot_move_str[4:5] if len(bot_move_str) > 4 else None
-            
-            # Apply bot move using existing play_move logic
-            # We need to use a special player_id for the bot
-            # For now, we'll use the bot_id as a string and handle it specially
-            # Actually, we should call the internal move logic directly
-            
-            # Validate move using chess engine
-            board = chess.Board(game.fen)
-            
-            try:
-                # Parse squares
-                from_sq = chess.parse_square(from_square)
-                to_sq = chess.parse_square(to_square)
-                
-                # Parse promotion piece
-                promotion_piece = None
-                if promotion:
-                    promotion_map = {
-                        "q": chess.QUEEN,
-                        "r": chess.ROOK,
-                        "b": chess.BISHOP,
-                        "n": chess.KNIGHT,
-                    }
-                    promotion_piece = promotion_map.get(promotion.lower())
-                
-                # Create move
-                chess_move = chess.Move(from_sq, to_sq, promotion=promotion_piece)
-                
-                # Validate move is legal
-                if chess_move not in board.legal_moves:
-                    raise InvalidMoveError(
-                        f"Illegal bot move: {from_square} to {to_square}", str(game_id)
-                    )
-                
-                # Apply move to board
-                san = board.san(chess_move)
-                board.push(chess_move)
-                fen_after = board.fen()
-                
-            except ValueError as e:
-                raise InvalidMoveError(f"Invalid bot move format: {str(e)}", str(game_id))
-            
-            # Calculate elapsed time
-            elapsed_ms = bot_response.thinking_time_ms
-            
-            # Create move object
-            ply = len(game.moves) + 1
-            move_number = (ply + 1) // 2
-            
-            move = Move(
-                ply=ply,
-                move_number=move_number,
-                color=game.bot_color,
-                from_square=from_square,
-                to_square=to_square,
-                promotion=promotion,
-                san=san,
-                fen_after=fen_after,
-                played_at=datetime.now(timezone.utc),
-                elapsed_ms=elapsed_ms,
+
+            # Applying is shielded: a cancellation (resign, takeback) after the
+            # bot answered must not interrupt persisting and broadcasting
+            return await asyncio.shield(
+                self._apply_bot_move(game_id, plies_before, from_square, to_square, promotion)
             )
             
-            # Add move to game
-            game.add_move(move)
-            
-            # Update game state
-            game.fen = fen_after
-            game.side_to_move = "b" if game.side_to_move == "w" else "w"
-            
-            # Check for game end conditions
-            if board.is_checkmate():
-                result = GameResult.WHITE_WIN if game.bot_color == "b" else GameResult.BLACK_WIN
-                game.end_game(result, EndReason.CHECKMATE)
-            elif board.is_stalemate():
-                game.end_game(GameResult.DRAW, EndReason.STALEMATE)
-            elif board.is_insufficient_material():
-                game.end_game(GameResult.DRAW, EndReason.INSUFFICIENT_MATERIAL)
-            elif board.is_fifty_moves():
-                game.end_game(GameResult.DRAW, EndReason.FIFTY_MOVE_RULE)
-            elif board.is_repetition():
-                game.end_game(GameResult.DRAW, EndReason.THREEFOLD_REPETITION)
-            
-            # Save updated game
-            saved_game = await self.repository.update(game)
-            
-            # Emit event
-            move_played_event = MovePlayedEvent(
-                aggregate_id=saved_game.id, move=move, fen=saved_game.fen
+        except Exception as e:
+            logger.error(f"Failed to play bot move: {e}", exc_info=True)
+            # Don't fail the game, just log the error
+            # In production, you might want to retry or use a fallback move
+            raise GameStateError(f"Failed to get bot move: {str(e)}", str(game_id))
+
+    async def _apply_bot_move(
+        self,
+        game_id: UUID,
+        plies_before: int,
+        from_square: str,
+        to_square: str,
+        promotion: Optional[str],
+    ) -> Game:
+        """Apply, persist and broadcast a bot move chosen for ``plies_before``."""
+        async with self.state_engine.lock_for(game_id):
+            state = await self._load_live_state(game_id)
+            if state.ply != plies_before or not state.game.is_bot_turn():
+                raise GameStateError("Game changed while bot was thinking", str(game_id))
+
+            flagged = self._has_flagged(state.game)
+            if not flagged:
+                # Validate and apply move against the resident board
+                applied = self.state_engine.apply_move(
+                    state,
+                    color=state.game.bot_color,
+                    from_square=from_square,
+                    to_square=to_square,
+                    promotion=promotion,
+                    elapsed_ms=self._turn_elapsed_ms(state.game),
+                )
+
+                # Persist only the new move and the changed game columns
+                saved_game = await self._persist_applied_move(state, applied)
+
+        if flagged:
+            await self.handle_flag_fall(game_id)
+            raise GameAlreadyEndedError(str(game_id), EndReason.TIMEOUT.value)
+
+        move = applied.move
+
+        # Emit event
+        move_played_event = MovePlayedEvent(
+            aggregate_id=saved_game.id, move=move, fen=saved_game.fen
+        )
+        self.events.append(move_played_event)
+        if self.event_publisher:
+            self.event_publisher.publish_move_played(move_played_event)
+
+        # Broadcast to WebSocket subscribers
+        if self.websocket_manager:
+            try:
+                await self.websocket_manager.broadcast_to_game(
+                    saved_game.id,
+                    {
+                        "type": "move_played",
+                        "game_id": str(saved_game.id),
+                        "move": {
+                            "ply": move.ply,
+                            "from_square": move.from_square,
+                            "to_square": move.to_square,
+                            "san": move.san,
+                            "fen_after": move.fen_after,
+                        },
+                        "fen": saved_game.fen,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Failed to broadcast bot move to WebSocket: {e}", exc_info=True)
+
+        # If game ended, emit game ended event
+        if saved_game.is_ended():
+            game_ended_event = GameEndedEvent(
+                aggregate_id=saved_game.id,
+                white_account_id=saved_game.white_account_id,
+                black_account_id=saved_game.black_account_id,
+                result=saved_game.result,
+                end_reason=saved_game.end_reason,
+                time_control=saved_game.time_control,
+                rated=saved_game.rated,
             )
-            self.events.append(move_played_event)
+            self.events.append(game_ended_event)
             if self.event_publisher:
-                self.event_publisher.publish_move_played(move_played_event)
-            
-            # Broadcast to WebSocket subscribers
+                self.event_publisher.publish_game_ended(game_ended_event)
+
+            # Broadcast game ended to WebSocket subscribers
             if self.websocket_manager:
                 try:
                     await self.websocket_manager.broadcast_to_game(
                         saved_game.id,
                         {
-                            "type": "move_played",
+                            "type": "game_ended",
                             "game_id": str(saved_game.id),
-                            "move": {
-                                "ply": move.ply,
-                                "from_square": move.from_square,
-                                "to_square": move.to_square,
-                                "san": move.san,
-                                "fen_after": move.fen_after,
-                            },
-                            "fen": saved_game.fen,
+                            "result": saved_game.result.value if saved_game.result else None,
+                            "end_reason": saved_game.end_reason.value if saved_game.end_reason else None,
                         },
                     )
                 except Exception as e:
-                    logger.error(f"Failed to broadcast bot move to WebSocket: {e}", exc_info=True)
-            
-            # If game ended, emit game ended event
-            if saved_game.is_ended():
-                game_ended_event = GameEndedEvent(
-                    aggregate_id=saved_game.id,
-                    white_account_id=saved_game.white_account_id,
-                    black_account_id=saved_game.black_account_id,
-                    result=saved_game.result,
-                    end_reason=saved_game.end_reason,
-                    time_control=saved_game.time_control,
-                    rated=saved_game.rated,
+                    logger.error(f"Failed to broadcast game ended to WebSocket: {e}", exc_info=True)
+
+        return saved_game
+
+    async def handle_flag_fall(self, game_id: UUID) -> Optional[Game]:
+        """End a game on time if the side to move has run out of time.
+
+        Called by the clock engine when a flag-fall deadline expires, and by
+        the move path when a move arrives too late. The flag is re-checked
+        under the game lock, so a move that beat the deadline wins the race.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Ended game, or None if the game did not end on time
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
+        async with self.state_engine.lock_for(game_id):
+            owner = self.owns_game(game_id)
+            if not owner:
+                # Clock left behind after the shard moved to another process;
+                # the flag is then checked against the persisted game
+                self.clock_engine.stop(game_id)
+
+            game = await self.repository.get_by_id(game_id)
+            if not game or not game.is_in_progress():
+                self.clock_engine.stop(game_id)
+                return None
+
+            if owner and not self.clock_engine.is_running(game_id):
+                self.clock_engine.start_turn_for(game)
+            if not self._has_flagged(game):
+                self.clock_engine.rearm(game_id)
+                return None
+
+            # Flagging loses unless the opponent cannot possibly mate
+            flagged_color = game.side_to_move
+            opponent = chess.BLACK if flagged_color == "w" else chess.WHITE
+            if chess.Board(game.fen).has_insufficient_material(opponent):
+                result = GameResult.DRAW
+            elif flagged_color == "w":
+                result = GameResult.BLACK_WIN
+            else:
+                result = GameResult.WHITE_WIN
+
+            game.set_clock_ms(flagged_color, 0)
+            game.end_game(result, EndReason.TIMEOUT)
+
+            saved_game = await self.repository.update(game)
+            self.state_engine.evict(game_id)
+            self.clock_engine.stop(game_id)
+            self._cancel_bot_move(game_id)
+
+        logger.info(f"Game {game_id} ended on time ({flagged_color} flagged)")
+
+        game_ended_event = GameEndedEvent(
+            aggregate_id=saved_game.id,
+            white_account_id=saved_game.white_account_id,
+            black_account_id=saved_game.black_account_id,
+            result=result,
+            end_reason=EndReason.TIMEOUT,
+            time_control=saved_game.time_control,
+            rated=saved_game.rated,
+        )
+        self.events.append(game_ended_event)
+        if self.event_publisher:
+            self.event_publisher.publish_game_ended(game_ended_event)
+
+        if self.websocket_manager:
+            try:
+                await self.websocket_manager.broadcast_to_game(
+                    saved_game.id,
+                    {
+                        "type": "game_ended",
+                        "game_id": str(saved_game.id),
+                        "result": result.value,
+                        "end_reason": EndReason.TIMEOUT.value,
+                    },
                 )
-                self.events.append(game_ended_event)
-                if self.event_publisher:
-                    self.event_publisher.publish_game_ended(game_ended_event)
-                
-                # Broadcast game ended to WebSocket subscribers
-                if self.websocket_manager:
-                    try:
-                        await self.websocket_manager.broadcast_to_game(
-                            saved_game.id,
-                            {
-                                "type": "game_ended",
-                                "game_id": str(saved_game.id),
-                                "result": saved_game.result.value if saved_game.result else None,
-                                "end_reason": saved_game.end_reason.value if saved_game.end_reason else None,
-                            },
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to broadcast game ended to WebSocket: {e}", exc_info=True)
-            
-            return saved_game
-            
-        except Exception as e:
-            logger.error(f"Failed to play bot move: {e}", exc_info=True)
-            # Don't fail the game, just log the error
-            # In production, you might want to retry or use a fallback move
-            raise GameStateError(f"Failed to get bot move: {str(e)}", str(game_id))
+            except Exception as e:
+                logger.error(f"Failed to broadcast time forfeit to WebSocket: {e}", exc_info=True)
+
+        return saved_game
 
     async def resign(self, game_id: UUID, player_id: UUID) -> Game:
         """Player resigns from the game."""
 
-        game = await self.repository.get_by_id(game_id)
-        if not game:
-            raise GameNotFoundError(str(game_id))
+        async with self.state_engine.lock_for(game_id):
+            game = await self.repository.get_by_id(game_id)
+            if not game:
+                raise GameNotFoundError(str(game_id))
 
-        if game.is_ended():
-            raise GameAlreadyEndedError(str(game_id), str(game.end_reason))
+            if game.is_ended():
+                raise GameAlreadyEndedError(str(game_id), str(game.end_reason))
 
-        # Verify player is in game
-        player_color = game.get_player_by_id(player_id)
-        if not player_color:
-            raise GameStateError("You are not a player in this game", str(game_id))
+            # Verify player is in game
+            player_color = game.get_player_by_id(player_id)
+            if not player_color:
+                raise GameStateError("You are not a player in this game", str(game_id))
 
-        # Determine winner
-        if player_color == "w":
-            result = GameResult.BLACK_WIN
-        else:
-            result = GameResult.WHITE_WIN
+            # Determine winner
+            if player_color == "w":
+                result = GameResult.BLACK_WIN
+            else:
+                result = GameResult.WHITE_WIN
 
-        # End game
-        game.end_game(result, EndReason.RESIGNATION)
+            # End game
+            game.end_game(result, EndReason.RESIGNATION)
 
-        # Save updated game
-        saved_game = await self.repository.update(game)
+            # Save updated game
+            saved_game = await self.repository.update(game)
+            self.state_engine.evict(game_id)
+            self.clock_engine.stop(game_id)
+            self._cancel_bot_move(game_id)
 
         # Emit event
         game_ended_event = GameEndedEvent(
@@ -772,38 +939,58 @@ class GameService:
             TakebackNotAllowedError: If game is rated
             GameStateError: If no moves to take back
         """
-        game = await self.repository.get_by_id(game_id)
-        if not game:
-            raise GameNotFoundError(str(game_id))
+        async with self.state_engine.lock_for(game_id):
+            game = await self.repository.get_by_id(game_id)
+            if not game:
+                raise GameNotFoundError(str(game_id))
 
-        if game.is_ended():
-            raise GameAlreadyEndedError(str(game_id), str(game.end_reason))
+            if game.is_ended():
+                raise GameAlreadyEndedError(str(game_id), str(game.end_reason))
 
-        if not game.is_player_in_game(player_id):
-            raise GameStateError("You are not a player in this game", str(game_id))
-        
-        if game.rated:
-            raise TakebackNotAllowedError(str(game_id))
+            if not game.is_player_in_game(player_id):
+                raise GameStateError("You are not a player in this game", str(game_id))
+            
+            if game.rated:
+                raise TakebackNotAllowedError(str(game_id))
 
-        if len(game.moves) == 0:
-            raise GameStateError("No moves to take back", str(game_id))
+            if len(game.moves) == 0:
+                raise GameStateError("No moves to take back", str(game_id))
 
-        last_move = game.moves.pop()
+            last_move = game.moves.pop()
 
-        if len(game.moves) > 0:
-            previous_move = game.moves[-1]
-            game.fen = previous_move.fen_after
-        else:
-            if game.starting_fen:
-                game.fen = game.starting_fen
+            if len(game.moves) > 0:
+                previous_move = game.moves[-1]
+                game.fen = previous_move.fen_after
             else:
-                game.fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+                if game.starting_fen:
+                    game.fen = game.starting_fen
+                else:
+                    game.fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
 
-        # Toggle side to move
-        game.side_to_move = "b" if game.side_to_move == "w" else "w"
+            # Toggle side to move
+            game.side_to_move = "b" if game.side_to_move == "w" else "w"
 
-        # Save updated game
-        saved_game = await self.repository.update(game)
+            # Save updated game
+            saved_game = await self.repository.update(game)
+
+            # Resident state still holds the undone position; it is rebuilt
+            # from the stored position hashes on next access
+            self.state_engine.evict(game_id)
+            # A pending bot move would answer the position taken back
+            self._cancel_bot_move(game_id)
+            if self.snapshot_service is not None:
+                try:
+                    await self.snapshot_service.delete_snapshot(game_id)
+                except Exception as e:
+                    logger.warning(f"Failed to drop snapshot of game {game_id}: {e}")
+
+            # The side to move again starts a fresh turn
+            if self.owns_game(game_id):
+                self.clock_engine.start_turn(
+                    game_id,
+                    saved_game.side_to_move,
+                    saved_game.get_clock_ms(saved_game.side_to_move),
+                )
 
         return saved_game
 
@@ -857,6 +1044,7 @@ class GameService:
         # Update game
         game.starting_fen = fen
         game.fen = fen
+        game.side_to_move = fen.split()[1]
 
         # Save updated game
         saved_game = await self.repository.update(game)
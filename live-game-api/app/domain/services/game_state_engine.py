@@ -0,0 +1,406 @@
+"""In-memory state engine for in-progress games."""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import chess
+import chess.polyglot
+
+from app.core.exceptions import InvalidMoveError
+from app.domain.models.game import EndReason, Game, GameResult, Move
+
+logger = logging.getLogger(__name__)
+
+STANDARD_START_FEN = chess.STARTING_FEN
+
+PROMOTION_PIECES = {
+    "q": chess.QUEEN,
+    "r": chess.ROOK,
+    "b": chess.BISHOP,
+    "n": chess.KNIGHT,
+}
+
+
+@dataclass
+class LiveGameState:
+    """Resident state of an in-progress game.
+
+    Holds the ``Game`` aggregate together with the current ``chess.Board``,
+    so applying a move never needs to rebuild the position from FEN or
+    reload the move list. Repetition is tracked with the Zobrist hashes of
+    the positions since the last irreversible move (plus a count per hash)
+    rather than the board's move stack, so repetition checks are O(1) and a
+    board built from FEN detects repetitions exactly like a replayed one.
+
+    A state restored from a snapshot may only hold the moves played after
+    the snapshot; ``ply_offset`` counts the moves that are not loaded.
+    """
+
+    game: Game
+    board: chess.Board
+    position_hashes: List[int] = field(default_factory=list)
+    ply_offset: int = 0
+    snapshot_ply: int = 0  # Ply of the latest persisted snapshot
+    # time.monotonic() of the latest persisted snapshot (or of becoming resident)
+    snapshot_at: float = field(default_factory=time.monotonic)
+    _position_counts: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for position_hash in self.position_hashes:
+            self._position_counts[position_hash] = self._position_counts.get(position_hash, 0) + 1
+
+    @property
+    def ply(self) -> int:
+        """Number of moves played in the game."""
+        return self.ply_offset + len(self.game.moves)
+
+    @property
+    def has_full_history(self) -> bool:
+        """Whether ``game.moves`` holds every move of the game."""
+        return self.ply_offset == 0
+
+    def record_position(self) -> int:
+        """Record the board's current position for repetition detection.
+
+        Returns:
+            Zobrist hash of the position
+        """
+        position_hash = chess.polyglot.zobrist_hash(self.board)
+        if self.board.halfmove_clock == 0:
+            # Positions before a capture or pawn move can never recur
+            self.position_hashes = []
+            self._position_counts = {}
+        self.position_hashes.append(position_hash)
+        self._position_counts[position_hash] = self._position_counts.get(position_hash, 0) + 1
+        return position_hash
+
+    def repetition_count(self) -> int:
+        """How many times the current position has occurred."""
+        if not self.position_hashes:
+            return 0
+        return self._position_counts[self.position_hashes[-1]]
+
+    def can_claim_draw(self) -> bool:
+        """Whether the side to move may claim a draw (threefold or fifty moves)."""
+        return self.repetition_count() >= 3 or self.board.halfmove_clock >= 100
+
+    def snapshot(self) -> Game:
+        """Return a copy of the aggregate that later moves will not mutate."""
+        return self.game.model_copy(update={"moves": list(self.game.moves)})
+
+
+@dataclass
+class AppliedMove:
+    """Result of applying a move to a live game."""
+
+    move: Move
+    move_result: str  # "valid", "checkmate", "stalemate", "draw"
+    game_columns: Dict[str, Any] = field(default_factory=dict)
+
+
+class GameStateEngine:
+    """Keeps in-progress games resident and applies moves against them.
+
+    One instance is shared by every request in the process. Games are loaded
+    once (board set up from the stored FEN, repetition history from the
+    position hashes stored with the moves) and then updated in place, so each
+    subsequent move costs O(1) regardless of game length. Only the
+    delta produced by ``apply_move`` needs to be persisted.
+    """
+
+    def __init__(self, max_resident_games: int = 50000):
+        """Initialize state engine.
+
+        Args:
+            max_resident_games: Upper bound on resident games (LRU eviction)
+        """
+        self.max_resident_games = max_resident_games
+        self._states: "OrderedDict[UUID, LiveGameState]" = OrderedDict()
+        self._locks: "weakref.WeakValueDictionary[UUID, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def lock_for(self, game_id: UUID) -> asyncio.Lock:
+        """Get the per-game lock serializing mutations within this process."""
+        lock = self._locks.get(game_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[game_id] = lock
+        return lock
+
+    def get(self, game_id: UUID) -> Optional[LiveGameState]:
+        """Get resident state for a game, if any."""
+        state = self._states.get(game_id)
+        if state is not None:
+            self._states.move_to_end(game_id)
+        return state
+
+    def put(self, game: Game) -> Optional[LiveGameState]:
+        """Make a game resident. Only in-progress games are kept.
+
+        Args:
+            game: Game aggregate (ownership passes to the engine)
+
+        Returns:
+            Resident state, or None if the game is not in progress
+        """
+        if not game.is_in_progress():
+            self.evict(game.id)
+            return None
+
+        return self.adopt(self.build_state(game))
+
+    def adopt(self, state: LiveGameState) -> LiveGameState:
+        """Make an already built state resident (e.g. restored from a snapshot)."""
+        game_id = state.game.id
+        self._states[game_id] = state
+        self._states.move_to_end(game_id)
+        while len(self._states) > self.max_resident_games:
+            evicted_id, _ = self._states.popitem(last=False)
+            logger.debug(f"Evicted game {evicted_id} from state engine (capacity)")
+        return state
+
+    @staticmethod
+    def build_state(game: Game) -> LiveGameState:
+        """Build state for a game whose ``moves`` hold its full move list."""
+        board, position_hashes = GameStateEngine._build_board(game)
+        return LiveGameState(game=game, board=board, position_hashes=position_hashes)
+
+    @staticmethod
+    def restore(
+        game: Game,
+        board: chess.Board,
+        position_hashes: List[int],
+        snapshot_ply: int,
+        moves_after_snapshot: List[Move],
+    ) -> Optional[LiveGameState]:
+        """Build resident state from a snapshot plus the moves played after it.
+
+        Args:
+            game: Game row (its ``moves`` are replaced by the replayed tail)
+            board: Board at the snapshot
+            position_hashes: Repetition hashes at the snapshot
+            snapshot_ply: Ply the snapshot was taken at
+            moves_after_snapshot: Moves with ply > snapshot_ply, in order
+
+        Returns:
+            Restored state, or None if the replay does not reach the game's FEN
+        """
+        state = LiveGameState(
+            game=game,
+            board=board,
+            position_hashes=list(position_hashes),
+            ply_offset=snapshot_ply,
+            snapshot_ply=snapshot_ply,
+        )
+        game.moves = []
+        try:
+            for move in moves_after_snapshot:
+                board.push(GameStateEngine._to_chess_move(move))
+                state.record_position()
+                game.moves.append(move)
+        except (ValueError, AssertionError) as e:
+            logger.warning(f"Could not replay moves after snapshot for game {game.id}: {e}")
+            return None
+
+        if board.fen() != game.fen:
+            logger.warning(f"Snapshot replay for game {game.id} differs from stored FEN")
+            return None
+        return state
+
+    def game_ids(self) -> List[UUID]:
+        """IDs of all resident games."""
+        return list(self._states)
+
+    def evict(self, game_id: UUID) -> None:
+        """Drop resident state for a game (e.g. after it ends or a write fails)."""
+        self._states.pop(game_id, None)
+
+    def apply_move(
+        self,
+        state: LiveGameState,
+        color: str,
+        from_square: str,
+        to_square: str,
+        promotion: Optional[str] = None,
+        elapsed_ms: int = 0,
+    ) -> AppliedMove:
+        """Validate and apply a move to a resident game.
+
+        The state is only mutated once the move has been validated, so a
+        rejected move leaves the resident game untouched. The mover's clock
+        is charged ``elapsed_ms`` and credited the time control increment.
+
+        Args:
+            state: Resident game state
+            color: Color of the side making the move ('w' or 'b')
+            from_square: Origin square (e.g. "e2")
+            to_square: Destination square (e.g. "e4")
+            promotion: Optional promotion piece (q, r, b, n)
+            elapsed_ms: Time spent on the move (measured by the clock engine)
+
+        Returns:
+            Applied move with the changed game columns to persist
+
+        Raises:
+            InvalidMoveError: If the move is malformed or illegal
+        """
+        game = state.game
+        board = state.board
+        game_id = str(game.id)
+
+        try:
+            from_sq = chess.parse_square(from_square)
+            to_sq = chess.parse_square(to_square)
+            promotion_piece = PROMOTION_PIECES.get(promotion.lower()) if promotion else None
+            chess_move = chess.Move(from_sq, to_sq, promotion=promotion_piece)
+        except ValueError as e:
+            raise InvalidMoveError(f"Invalid move format: {str(e)}", game_id)
+
+        if not board.is_legal(chess_move):
+            raise InvalidMoveError(f"Illegal move: {from_square} to {to_square}", game_id)
+
+        san = board.san(chess_move)
+        board.push(chess_move)
+        position_hash = state.record_position()
+        fen_after = board.fen()
+
+        ply = state.ply + 1
+        move = Move(
+            ply=ply,
+            move_number=(ply + 1) // 2,
+            color=color,
+            from_square=from_square,
+            to_square=to_square,
+            promotion=promotion,
+            san=san,
+            fen_after=fen_after,
+            played_at=datetime.now(timezone.utc),
+            elapsed_ms=elapsed_ms,
+            position_hash=position_hash,
+        )
+
+        game.add_move(move)
+        game.set_clock_ms(
+            color,
+            max(0, game.get_clock_ms(color) - elapsed_ms)
+            + game.time_control.increment_seconds * 1000,
+        )
+        game.fen = fen_after
+        game.side_to_move = "b" if color == "w" else "w"
+
+        move_result = self._check_game_end(state, color)
+
+        return AppliedMove(
+            move=move,
+            move_result=move_result,
+            game_columns=self.game_columns(game),
+        )
+
+    @staticmethod
+    def game_columns(game: Game) -> Dict[str, Any]:
+        """Columns of the game row that change when a move is played."""
+        return {
+            "white_clock_ms": game.white_clock_ms,
+            "black_clock_ms": game.black_clock_ms,
+            "side_to_move": game.side_to_move,
+            "fen": game.fen,
+            "status": game.status,
+            "result": game.result,
+            "end_reason": game.end_reason,
+            "ended_at": game.ended_at,
+            "updated_at": game.updated_at,
+            "version": game.version,
+        }
+
+    @staticmethod
+    def _check_game_end(state: LiveGameState, mover_color: str) -> str:
+        """End the game if the position after the move is terminal."""
+        game, board = state.game, state.board
+        if board.is_checkmate():
+            result = GameResult.WHITE_WIN if mover_color == "w" else GameResult.BLACK_WIN
+            game.end_game(result, EndReason.CHECKMATE)
+            return "checkmate"
+        if board.is_stalemate():
+            game.end_game(GameResult.DRAW, EndReason.STALEMATE)
+            return "stalemate"
+        if board.is_insufficient_material():
+            game.end_game(GameResult.DRAW, EndReason.INSUFFICIENT_MATERIAL)
+            return "draw"
+        if state.can_claim_draw():
+            # Draws are applied automatically as soon as they can be claimed
+            if state.repetition_count() >= 3:
+                game.end_game(GameResult.DRAW, EndReason.THREEFOLD_REPETITION)
+            else:
+                game.end_game(GameResult.DRAW, EndReason.FIFTY_MOVE_RULE)
+            return "draw"
+        return "valid"
+
+    @staticmethod
+    def _to_chess_move(move: Move) -> chess.Move:
+        promotion_piece = PROMOTION_PIECES.get(move.promotion) if move.promotion else None
+        return chess.Move(
+            chess.parse_square(move.from_square),
+            chess.parse_square(move.to_square),
+            promotion=promotion_piece,
+        )
+
+    @staticmethod
+    def _build_board(game: Game) -> "tuple[chess.Board, List[int]]":
+        """Set up the board and repetition hashes of a game.
+
+        The board comes from the stored FEN and the repetition window from
+        the position hashes stored with the moves, so loading a game does not
+        replay its move list. Moves written before hashes were stored are
+        replayed instead.
+        """
+        board = chess.Board(game.fen)
+        # Only positions since the last capture or pawn move can recur
+        window = board.halfmove_clock + 1
+        recent_moves = game.moves[-window:]
+        hashes = [move.position_hash for move in recent_moves]
+        if None in hashes:
+            return GameStateEngine._replay_board(game)
+        if len(hashes) < window:
+            start_board = chess.Board(game.starting_fen or STANDARD_START_FEN)
+            hashes.insert(0, chess.polyglot.zobrist_hash(start_board))
+
+        if hashes[-1] != chess.polyglot.zobrist_hash(board):
+            logger.warning(f"Stored position hashes for game {game.id} differ from its FEN")
+            return GameStateEngine._replay_board(game)
+        return board, hashes
+
+    @staticmethod
+    def _replay_board(game: Game) -> "tuple[chess.Board, List[int]]":
+        """Rebuild the board and repetition hashes by replaying the move list.
+
+        Falls back to the stored FEN (without history) if the move list cannot
+        be replayed, e.g. for rows written before starting_fen was persisted.
+        """
+        board = chess.Board(game.starting_fen or STANDARD_START_FEN)
+        replay = LiveGameState(game=game, board=board)
+        replay.record_position()
+        try:
+            for move in game.moves:
+                board.push(GameStateEngine._to_chess_move(move))
+                replay.record_position()
+        except (ValueError, AssertionError) as e:
+            logger.warning(f"Could not replay moves for game {game.id}, using FEN: {e}")
+            board = chess.Board(game.fen)
+            return board, [chess.polyglot.zobrist_hash(board)]
+
+        if board.fen() != game.fen:
+            logger.warning(f"Replayed position for game {game.id} differs from stored FEN")
+            board = chess.Board(game.fen)
+            return board, [chess.polyglot.zobrist_hash(board)]
+        return board, replay.position_hashes
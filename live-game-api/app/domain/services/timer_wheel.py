@@ -0,0 +1,118 @@
+"""Hierarchical timer wheel for large numbers of cancellable deadlines."""
+
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+
+class TimerWheel:
+    """Hierarchical hashed timer wheel.
+
+    Deadlines are expressed in integer ticks. Level 0 has one slot per tick;
+    each higher level has one slot per full revolution of the level below
+    and is cascaded down when that level wraps. Scheduling and cancelling
+    are O(1) dictionary operations, and advancing one tick touches a single
+    level-0 slot plus an occasional cascade, independent of how many timers
+    are pending.
+    """
+
+    def __init__(self, level_bits: Sequence[int] = (8, 6, 6, 6), start_tick: int = 0):
+        """Initialize timer wheel.
+
+        Args:
+            level_bits: Slot count (as a power of two) of each level
+            start_tick: Tick the wheel starts at
+        """
+        self._shifts: List[int] = []
+        self._masks: List[int] = []
+        shift = 0
+        for bits in level_bits:
+            self._shifts.append(shift)
+            self._masks.append((1 << bits) - 1)
+            shift += bits
+        self._span = 1 << shift  # Furthest deadline that can be placed exactly
+        self._levels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(1 << bits)] for bits in level_bits
+        ]
+        self._index: Dict[Hashable, Tuple[int, int]] = {}  # key -> (level, slot)
+        self._tick = start_tick
+
+    @property
+    def current_tick(self) -> int:
+        """Last tick that has been processed."""
+        return self._tick
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def schedule(self, key: Hashable, deadline_tick: int) -> None:
+        """Schedule (or reschedule) a timer.
+
+        Args:
+            key: Timer identity; an existing timer with this key is replaced
+            deadline_tick: Tick at which the timer fires; past deadlines fire
+                on the next tick
+        """
+        self.cancel(key)
+        self._place(key, max(deadline_tick, self._tick + 1))
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel a timer.
+
+        Returns:
+            True if a pending timer was removed
+        """
+        position = self._index.pop(key, None)
+        if position is None:
+            return False
+        level, slot = position
+        del self._levels[level][slot][key]
+        return True
+
+    def advance(self, to_tick: int) -> List[Hashable]:
+        """Process every tick up to and including ``to_tick``.
+
+        Returns:
+            Keys of the timers that fired, in deadline order
+        """
+        fired: List[Hashable] = []
+        while self._tick < to_tick:
+            self._tick += 1
+            self._cascade()
+            slot_index = self._tick & self._masks[0]
+            slot = self._levels[0][slot_index]
+            if slot:
+                self._levels[0][slot_index] = {}
+                for key in slot:
+                    del self._index[key]
+                fired.extend(slot)
+        return fired
+
+    def _place(self, key: Hashable, deadline_tick: int) -> None:
+        delta = deadline_tick - self._tick
+        placement = deadline_tick
+        if delta >= self._span:
+            # Park in the top level; it is re-placed when that slot cascades
+            placement = self._tick + self._span - 1
+            delta = self._span - 1
+
+        level = 0
+        while delta >= (1 << (self._shifts[level] + self._masks[level].bit_length())):
+            level += 1
+        slot = (placement >> self._shifts[level]) & self._masks[level]
+        self._levels[level][slot][key] = deadline_tick
+        self._index[key] = (level, slot)
+
+    def _cascade(self) -> None:
+        """Move timers of higher levels down when the levels below wrap."""
+        for level in range(1, len(self._levels)):
+            if self._tick & ((1 << self._shifts[level]) - 1):
+                break
+            slot_index = (self._tick >> self._shifts[level]) & self._masks[level]
+            slot = self._levels[level][slot_index]
+            if not slot:
+                continue
+            self._levels[level][slot_index] = {}
+            for key, deadline_tick in slot.items():
+                self._place(key, deadline_tick)
@@ -0,0 +1,98 @@
+"""Read-through/write-through cache in front of the game repository."""
+
+import logging
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from app.domain.models.game import Game, GameStatus, Move
+from app.domain.repositories.game_repository import GameRepositoryInterface
+from app.infrastructure.cache.game_cache import GameCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedGameRepository(GameRepositoryInterface):
+    """Serves in-progress games from Redis and keeps the cache coherent.
+
+    Reads of in-progress games go to the cache first and fall back to the
+    wrapped repository on a miss. Full writes (create/update) refresh the
+    cached copy; move appends only have the delta, so they invalidate it.
+    Writes raise the cache's version floor, so a miss that read the game
+    before a write cannot cache the older version after it.
+    Finished and not-yet-started games are never cached. Query methods pass
+    straight through to the wrapped repository.
+    """
+
+    def __init__(self, repository: GameRepositoryInterface, cache: GameCache):
+        """Initialize cached repository.
+
+        Args:
+            repository: Underlying (database) repository
+            cache: Redis game cache
+        """
+        self.repository = repository
+        self.cache = cache
+
+    async def _write_through(self, game: Game) -> None:
+        """Cache an in-progress game, or drop any cached copy otherwise."""
+        if game.is_in_progress():
+            await self.cache.set(game)
+        else:
+            await self.cache.delete(game.id)
+
+    async def create(self, game: Game) -> Game:
+        """Create a new game."""
+        saved_game = await self.repository.create(game)
+        await self._write_through(saved_game)
+        return saved_game
+
+    async def get_by_id(self, game_id: UUID) -> Optional[Game]:
+        """Get game by ID, serving in-progress games from the cache."""
+        game = await self.cache.get(game_id)
+        if game is not None:
+            return game
+
+        game = await self.repository.get_by_id(game_id)
+        if game is not None and game.is_in_progress():
+            await self.cache.set(game)
+        return game
+
+    async def get_version(self, game_id: UUID) -> Optional[int]:
+        """Get a game's version from the wrapped repository (no moves are read)."""
+        return await self.repository.get_version(game_id)
+
+    async def update(self, game: Game) -> Game:
+        """Update a game and refresh its cached copy."""
+        # Invalidate first so a failed write cannot leave a stale entry behind
+        await self.cache.invalidate(game.id, game.version + 1)
+        saved_game = await self.repository.update(game)
+        await self._write_through(saved_game)
+        return saved_game
+
+    async def append_move(
+        self, game_id: UUID, move: Move, game_columns: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Append a move and invalidate the cached game."""
+        try:
+            stored = await self.repository.append_move(game_id, move, game_columns)
+        except Exception:
+            await self.cache.delete(game_id)
+            raise
+        await self.cache.invalidate(game_id, game_columns["version"])
+        return stored
+
+    async def find_by_creator(self, creator_id: UUID) -> List[Game]:
+        """Find games created by a user."""
+        return await self.repository.find_by_creator(creator_id)
+
+    async def find_by_player(self, player_id: UUID) -> List[Game]:
+        """Find games where player is participant."""
+        return await self.repository.find_by_player(player_id)
+
+    async def find_active_games(self) -> List[Game]:
+        """Find all active games."""
+        return await self.repository.find_active_games()
+
+    async def find_by_status(self, status: GameStatus) -> List[Game]:
+        """Find games by status."""
+        return await self.repository.find_by_status(status)
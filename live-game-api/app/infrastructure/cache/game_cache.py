@@ -1,6 +1,5 @@
 """Redis cache for active game state."""
 
-import json
 import logging
 from typing import Optional
 from uuid import UUID
@@ -8,13 +7,46 @@ from uuid import UUID
 import redis.asyncio as redis
 
 from app.core.config import get_settings
+from app.core.metrics import (
+    live_game_cache_errors_total,
+    live_game_cache_hits_total,
+    live_game_cache_misses_total,
+)
 from app.domain.models.game import Game
+from app.infrastructure.cache.game_codec import GameCodecError, decode_game, encode_game
 
 logger = logging.getLogger(__name__)
 
+# Cache a game unless a newer version was written or invalidated meanwhile.
+# KEYS: game key, version key; ARGV: version, data, TTL in seconds.
+SET_IF_NEWER_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[2]) or '-1')
+if tonumber(ARGV[1]) < current then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# Drop the cached game and refuse later fills older than ARGV[1].
+# KEYS: game key, version key; ARGV: minimum version, TTL in seconds.
+INVALIDATE_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[2]) or '-1')
+if tonumber(ARGV[1]) > current then
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+end
+return redis.call('DEL', KEYS[1])
+"""
+
 
 class GameCache:
-    """Redis-based cache for active game state."""
+    """Redis-based cache for active game state.
+
+    Each cached game has a version key next to it. Writes only go through
+    for a version at least as new as the stored one, and invalidation raises
+    it, so a read that overlapped a write cannot put the older game back.
+    """
 
     def __init__(self, redis_client: Optional[redis.Redis] = None):
         """Initialize game cache.
@@ -25,6 +57,8 @@ class GameCache:
         self.redis_client = redis_client
         self.settings = get_settings()
         self.ttl_seconds = self.settings.GAME_CACHE_TTL_SECONDS
+        self._set_script = None
+        self._invalidate_script = None
 
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client."""
@@ -33,6 +67,9 @@ class GameCache:
                 self.settings.REDIS_URL,
                 decode_responses=self.settings.REDIS_DECODE_RESPONSES,
             )
+        if self._set_script is None:
+            self._set_script = self.redis_client.register_script(SET_IF_NEWER_SCRIPT)
+            self._invalidate_script = self.redis_client.register_script(INVALIDATE_SCRIPT)
         return self.redis_client
 
     def _get_cache_key(self, game_id: UUID) -> str:
@@ -42,9 +79,14 @@ class GameCache:
             game_id: Game UUID
 
         Returns:
-            Cache key string
+            Cache key string (hash-tagged, so it shares a cluster slot with
+            the version key)
         """
-        return f"game:{game_id}"
+        return f"game:{{{game_id}}}"
+
+    def _get_version_key(self, game_id: UUID) -> str:
+        """Get the key holding the newest version of a game seen by the cache."""
+        return f"game:{{{game_id}}}:version"
 
     async def get(self, game_id: UUID) -> Optional[Game]:
         """Get game from cache.
@@ -61,46 +103,51 @@ class GameCache:
             cached_data = await client.get(cache_key)
             
             if cached_data is None:
+                live_game_cache_misses_total.inc()
                 return None
 
-            # Deserialize game from JSON
-            game_dict = json.loads(cached_data)
-            # Convert dict to Game domain object using Pydantic
-            from app.domain.models.game import Game
             try:
-                game = Game.model_validate(game_dict)
-                logger.debug(f"Cache hit for game {game_id}")
-                return game
-            except Exception as e:
+                game = decode_game(cached_data)
+            except GameCodecError as e:
                 logger.warning(f"Failed to deserialize cached game {game_id}: {e}")
+                live_game_cache_misses_total.inc()
                 # Delete corrupted cache entry
                 await self.delete(game_id)
                 return None
+
+            live_game_cache_hits_total.inc()
+            logger.debug(f"Cache hit for game {game_id}")
+            return game
             
         except Exception as e:
+            live_game_cache_errors_total.labels(operation="get").inc()
             logger.error(f"Error getting game from cache: {e}", exc_info=True)
             return None
 
     async def set(self, game: Game, ttl: Optional[int] = None) -> None:
-        """Cache game state.
+        """Cache game state, unless a newer version is already known.
 
         Args:
             game: Game domain object
             ttl: Optional TTL in seconds (defaults to config value)
         """
         try:
-            client = await self._get_client()
-            cache_key = self._get_cache_key(game.id)
+            await self._get_client()
             ttl = ttl or self.ttl_seconds
 
-            # Serialize game to JSON using Pydantic
-            game_dict = game.model_dump(mode="json")
-            cached_data = json.dumps(game_dict)
-            
-            await client.setex(cache_key, ttl, cached_data)
-            logger.debug(f"Cached game {game.id} with TTL {ttl}s")
+            cached_data = encode_game(game)
+
+            stored = await self._set_script(
+                keys=[self._get_cache_key(game.id), self._get_version_key(game.id)],
+                args=[game.version, cached_data, ttl],
+            )
+            if stored:
+                logger.debug(f"Cached game {game.id} with TTL {ttl}s")
+            else:
+                logger.debug(f"Skipped caching stale version {game.version} of game {game.id}")
             
         except Exception as e:
+            live_game_cache_errors_total.labels(operation="set").inc()
             logger.error(f"Error caching game: {e}", exc_info=True)
             # Don't raise - caching failures shouldn't break operations
 
@@ -116,8 +163,27 @@ class GameCache:
             await client.delete(cache_key)
             logger.debug(f"Removed game {game_id} from cache")
         except Exception as e:
+            live_game_cache_errors_total.labels(operation="delete").inc()
             logger.error(f"Error deleting game from cache: {e}", exc_info=True)
 
+    async def invalidate(self, game_id: UUID, min_version: int) -> None:
+        """Remove game from cache and refuse later writes older than ``min_version``.
+
+        Args:
+            game_id: Game UUID
+            min_version: Version written to the database (or about to be)
+        """
+        try:
+            await self._get_client()
+            await self._invalidate_script(
+                keys=[self._get_cache_key(game_id), self._get_version_key(game_id)],
+                args=[min_version, self.ttl_seconds],
+            )
+            logger.debug(f"Invalidated game {game_id} below version {min_version}")
+        except Exception as e:
+            live_game_cache_errors_total.labels(operation="delete").inc()
+            logger.error(f"Error invalidating cached game: {e}", exc_info=True)
+
     async def close(self) -> None:
         """Close Redis connection."""
         if self.redis_client:
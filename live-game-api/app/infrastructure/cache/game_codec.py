@@ -0,0 +1,200 @@
+"""Compact serialization of games for the Redis cache.
+
+Games are encoded as positional JSON arrays instead of
+``model_dump(mode="json")`` dictionaries: field names are not repeated for
+every move, timestamps are epoch microseconds, and decoding uses
+``model_construct`` so cached data (which was validated when written) is not
+re-validated on every read.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+from uuid import UUID
+
+from app.domain.models.game import Game, Move, TimeControl
+
+CODEC_VERSION = 3
+
+
+class GameCodecError(ValueError):
+    """Raised when cached data cannot be decoded."""
+
+
+def _value(value: Any) -> Any:
+    """Unwrap enums (use_enum_values may or may not have applied)."""
+    return getattr(value, "value", value)
+
+
+def _uuid(value: Optional[UUID]) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _parse_uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value is not None else None
+
+
+def _ts(value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+def _parse_ts(value: Optional[int]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value / 1_000_000, tz=timezone.utc)
+
+
+def _encode_move(move: Move) -> List[Any]:
+    return [
+        move.ply,
+        move.color,
+        move.from_square,
+        move.to_square,
+        move.promotion,
+        move.san,
+        move.fen_after,
+        _ts(move.played_at),
+        move.elapsed_ms,
+        move.position_hash,
+    ]
+
+
+def _decode_move(data: List[Any]) -> Move:
+    (
+        ply,
+        color,
+        from_square,
+        to_square,
+        promotion,
+        san,
+        fen_after,
+        played_at,
+        elapsed_ms,
+        position_hash,
+    ) = data
+    return Move.model_construct(
+        ply=ply,
+        move_number=(ply + 1) // 2,
+        color=color,
+        from_square=from_square,
+        to_square=to_square,
+        promotion=promotion,
+        san=san,
+        fen_after=fen_after,
+        played_at=_parse_ts(played_at),
+        elapsed_ms=elapsed_ms,
+        position_hash=position_hash,
+    )
+
+
+def encode_game(game: Game) -> str:
+    """Encode a game into its compact cache representation."""
+    payload = [
+        CODEC_VERSION,
+        str(game.id),
+        str(game.creator_account_id),
+        _uuid(game.white_account_id),
+        _uuid(game.black_account_id),
+        game.bot_id,
+        game.bot_color,
+        _value(game.status),
+        game.rated,
+        _value(game.decision_reason),
+        game.variant_code,
+        game.starting_fen,
+        game.is_odds_game,
+        game.time_control.initial_seconds,
+        game.time_control.increment_seconds,
+        game.white_clock_ms,
+        game.black_clock_ms,
+        game.side_to_move,
+        game.fen,
+        [_encode_move(move) for move in game.moves],
+        _value(game.result),
+        _value(game.end_reason),
+        _ts(game.created_at),
+        _ts(game.updated_at),
+        _ts(game.started_at),
+        _ts(game.ended_at),
+        game.version,
+    ]
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def decode_game(data: str) -> Game:
+    """Decode a game from its compact cache representation.
+
+    Raises:
+        GameCodecError: If the data is malformed or from another codec version
+    """
+    try:
+        payload = json.loads(data)
+        if payload[0] != CODEC_VERSION:
+            raise GameCodecError(f"Unsupported codec version: {payload[0]}")
+        (
+            _,
+            game_id,
+            creator_account_id,
+            white_account_id,
+            black_account_id,
+            bot_id,
+            bot_color,
+            status,
+            rated,
+            decision_reason,
+            variant_code,
+            starting_fen,
+            is_odds_game,
+            initial_seconds,
+            increment_seconds,
+            white_clock_ms,
+            black_clock_ms,
+            side_to_move,
+            fen,
+            moves,
+            result,
+            end_reason,
+            created_at,
+            updated_at,
+            started_at,
+            ended_at,
+            version,
+        ) = payload
+        return Game.model_construct(
+            id=UUID(game_id),
+            creator_account_id=UUID(creator_account_id),
+            white_account_id=_parse_uuid(white_account_id),
+            black_account_id=_parse_uuid(black_account_id),
+            bot_id=bot_id,
+            bot_color=bot_color,
+            status=status,
+            rated=rated,
+            decision_reason=decision_reason,
+            variant_code=variant_code,
+            starting_fen=starting_fen,
+            is_odds_game=is_odds_game,
+            time_control=TimeControl.model_construct(
+                initial_seconds=initial_seconds,
+                increment_seconds=increment_seconds,
+            ),
+            white_clock_ms=white_clock_ms,
+            black_clock_ms=black_clock_ms,
+            side_to_move=side_to_move,
+            fen=fen,
+            moves=[_decode_move(move) for move in moves],
+            result=result,
+            end_reason=end_reason,
+            created_at=_parse_ts(created_at),
+            updated_at=_parse_ts(updated_at),
+            started_at=_parse_ts(started_at),
+            ended_at=_parse_ts(ended_at),
+            version=version,
+        )
+    except GameCodecError:
+        raise
+    except (TypeError, ValueError, IndexError, KeyError) as e:
+        raise GameCodecError(f"Malformed cached game: {e}") from e
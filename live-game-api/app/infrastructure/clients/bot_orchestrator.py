@@ -1,10 +1,15 @@
 """Bot orchestrator API client."""
+import logging
 import os
 from typing import Optional
 import httpx
 from pydantic import BaseModel
 
+from app.core.config import get_settings
 from app.core.exceptions import ApplicationException
+from app.infrastructure.clients.pooled_transport import InstrumentedTransport, http2_available
+
+logger = logging.getLogger(__name__)
 
 
 class BotMoveError(ApplicationException):
@@ -47,13 +52,55 @@ class MoveResponse(BaseModel):
 
 
 class BotOrchestratorClient:
-    """HTTP client for bot-orchestrator-api."""
+    """HTTP client for bot-orchestrator-api.
+
+    Requests share one ``httpx.AsyncClient`` so bot moves reuse keep-alive
+    connections instead of opening a connection per move. HTTP/2 is
+    negotiated where the orchestrator supports it, and pool saturation is
+    exported as ``http_client_*`` metrics.
+    """
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ):
+        settings = get_settings()
         self.base_url = base_url or os.getenv(
             "BOT_ORCHESTRATOR_API_URL", "http://localhost:8006"
         )
-        self.timeout = 30.0  # 30 seconds timeout for bot moves
+        self.timeout = timeout or settings.BOT_MOVE_TIMEOUT_SECONDS
+        self.max_connections = max_connections or settings.BOT_ORCHESTRATOR_MAX_CONNECTIONS
+        self.pool_timeout = settings.BOT_ORCHESTRATOR_POOL_TIMEOUT_MS / 1000.0
+        self.http2 = settings.BOT_ORCHESTRATOR_HTTP2 if http2 is None else http2
+        if self.http2 and not http2_available():
+            logger.warning("HTTP/2 requested for bot orchestrator but h2 is not installed; using HTTP/1.1")
+            self.http2 = False
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, pool=self.pool_timeout),
+                transport=InstrumentedTransport(
+                    "bot_orchestrator",
+                    httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    http2=self.http2,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def get_bot_move(
         self,
@@ -89,7 +136,7 @@ class BotOrchestratorClient:
             BotMoveError: If the API call fails
             BotNotConfiguredError: If bot_id is invalid
         """
-        url = f"{self.base_url}/v1/bots/{bot_id}/move"
+        url = f"/v1/bots/{bot_id}/move"
         
         request_data = {
             "game_id": str(game_id),
@@ -106,25 +153,23 @@ class BotOrchestratorClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url,
-                    json=request_data,
+            response = await self._get_client().post(url, json=request_data)
+
+            if response.status_code == 404:
+                raise BotNotConfiguredError(
+                    f"Bot {bot_id} not found or not configured"
+                )
+
+            if response.status_code != 200:
+                raise BotMoveError(
+                    f"Bot orchestrator API error: {response.status_code} {response.text}"
                 )
-                
-                if response.status_code == 404:
-                    raise BotNotConfiguredError(
-                        f"Bot {bot_id} not found or not configured"
-                    )
-                
-                if response.status_code != 200:
-                    raise BotMoveError(
-                        f"Bot orchestrator API error: {response.status_code} {response.text}"
-                    )
-                
-                data = response.json()
-                return MoveResponse(**data)
-                
+
+            data = response.json()
+            return MoveResponse(**data)
+
+        except ApplicationException:
+            raise
         except httpx.TimeoutException:
             raise BotMoveError("Bot move request timed out")
         except httpx.RequestError as e:
@@ -0,0 +1,73 @@
+"""httpx transport for the bot orchestrator connection pool.
+
+Exports the same ``http_client_*`` series as bot-orchestrator-api's
+``app/clients/http_pool.py``, labelled ``upstream="bot_orchestrator"`` here,
+so one dashboard covers both services' outbound pools.
+"""
+import importlib.util
+from typing import Callable
+
+import httpx
+
+from app.core.metrics import (
+    http_client_in_flight_requests,
+    http_client_pool_saturated_total,
+    http_client_pool_timeouts_total,
+)
+
+
+def http2_available() -> bool:
+    """Whether ``h2`` is installed; httpx cannot speak HTTP/2 without it."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Wraps a response body and calls ``release`` once it is closed."""
+
+    def __init__(self, body: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._body = body
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._body:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._body.aclose()
+        finally:
+            self._release()
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """Keep-alive transport that counts requests holding a pooled connection.
+
+    The count goes up when a request is handed to the pool and down when its
+    response is closed. Bot moves arriving while it is at ``max_connections``
+    queue behind the pool; they are counted as saturated, and those that give
+    up after the pool timeout as pool timeouts.
+    """
+
+    def __init__(self, upstream: str, limits: httpx.Limits, http2: bool = False):
+        super().__init__(limits=limits, http2=http2)
+        self.upstream = upstream
+        self.max_connections = limits.max_connections
+        self.in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.max_connections is not None and self.in_flight >= self.max_connections:
+            http_client_pool_saturated_total.labels(upstream=self.upstream).inc()
+        self._set_in_flight(1)
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException as e:
+            if isinstance(e, httpx.PoolTimeout):
+                http_client_pool_timeouts_total.labels(upstream=self.upstream).inc()
+            self._set_in_flight(-1)
+            raise
+        response.stream = _ReleasingStream(response.stream, lambda: self._set_in_flight(-1))
+        return response
+
+    def _set_in_flight(self, delta: int) -> None:
+        self.in_flight += delta
+        http_client_in_flight_requests.labels(upstream=self.upstream).set(self.in_flight)
@@ -1,7 +1,17 @@
 """Game move ORM model."""
+from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database import Base
@@ -9,10 +19,25 @@ from app.infrastructure.database.game_orm import GUID
 from app.domain.models.move import Move
 
 
+def _to_signed64(value: Optional[int]) -> Optional[int]:
+    """Store unsigned 64-bit Zobrist hashes in a signed BIGINT column."""
+    if value is None:
+        return None
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned64(value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return None
+    return value + (1 << 64) if value < 0 else value
+
+
 class GameMoveORM(Base):
     """Game move ORM model."""
 
     __tablename__ = "game_moves"
+    # One row per ply: a duplicate append fails instead of forking the game
+    __table_args__ = (UniqueConstraint("game_id", "ply", name="uq_game_moves_game_id_ply"),)
 
     id = Column(GUID(), primary_key=True)
     game_id = Column(
@@ -31,6 +56,7 @@ class GameMoveORM(Base):
 
     played_at = Column(DateTime, nullable=False)
     elapsed_ms = Column(Integer, nullable=False)
+    position_hash = Column(BigInteger, nullable=True)  # Zobrist hash after the move
 
     game = relationship("GameORM", back_populates="moves")
 
@@ -47,23 +73,30 @@ class GameMoveORM(Base):
             fen_after=self.fen_after,
             played_at=self.played_at,
             elapsed_ms=self.elapsed_ms,
+            position_hash=_to_unsigned64(self.position_hash),
         )
 
+    @staticmethod
+    def values_from_domain(move: Move, game_id: UUID) -> dict:
+        """Convert domain model to a column/value mapping for a move row."""
+        import uuid
+        return {
+            "id": uuid.uuid4(),
+            "game_id": game_id,
+            "ply": move.ply,
+            "move_number": move.move_number,
+            "color": move.color,
+            "from_square": move.from_square,
+            "to_square": move.to_square,
+            "promotion": move.promotion,
+            "san": move.san,
+            "fen_after": move.fen_after,
+            "played_at": move.played_at,
+            "elapsed_ms": move.elapsed_ms,
+            "position_hash": _to_signed64(move.position_hash),
+        }
+
     @staticmethod
     def from_domain(move: Move, game_id: UUID) -> "GameMoveORM":
         """Convert domain model to ORM model."""
-        import uuid
-        return GameMoveORM(
-            id=uuid.uuid4(),
-            game_id=game_id,
-            ply=move.ply,
-            move_number=move.move_number,
-            color=move.color,
-            from_square=move.from_square,
-            to_square=move.to_square,
-            promotion=move.promotion,
-            san=move.san,
-            fen_after=move.fen_after,
-            played_at=move.played_at,
-            elapsed_ms=move.elapsed_ms,
-        )
+        return GameMoveORM(**GameMoveORM.values_from_domain(move, game_id))
@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database import Base
+from app.domain.models.decision_reason import DecisionReason
 from app.domain.models.end_reason import EndReason
 from app.domain.models.game_model import Game
 from app.domain.models.game_result import GameResult
@@ -60,8 +61,13 @@ class GameORM(Base):
 
     status = Column(String(32), nullable=False, default=GameStatus.WAITING_FOR_OPPONENT)
     rated = Column(Boolean, nullable=False, default=True)
+    decision_reason = Column(String(32), nullable=True)
     variant_code = Column(String(32), nullable=False, default="standard")
 
+    # Custom game settings
+    starting_fen = Column(Text, nullable=True)
+    is_odds_game = Column(Boolean, nullable=False, default=False)
+
     time_initial_ms = Column(Integer, nullable=False)
     time_increment_ms = Column(Integer, nullable=False, default=0)
 
@@ -82,6 +88,7 @@ class GameORM(Base):
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
 
     moves = relationship("GameMoveORM", back_populates="game", cascade="all, delete-orphan")
 
@@ -94,7 +101,10 @@ class GameORM(Base):
             black_account_id=self.black_account_id,
             status=GameStatus(self.status),
             rated=self.rated,
+            decision_reason=DecisionReason(self.decision_reason) if self.decision_reason else None,
             variant_code=self.variant_code,
+            starting_fen=self.starting_fen,
+            is_odds_game=bool(self.is_odds_game),
             time_control=TimeControl(
                 initial_seconds=self.time_initial_ms // 1000,
                 increment_seconds=self.time_increment_ms // 1000,
@@ -110,6 +120,7 @@ class GameORM(Base):
             started_at=self.started_at,
             ended_at=self.ended_at,
             updated_at=self.updated_at,
+            version=self.version or 0,
         )
         # Add bot fields if present
         if self.bot_id:
@@ -134,6 +145,14 @@ class GameORM(Base):
         if game.end_reason:
             end_reason_value = game.end_reason.value if isinstance(game.end_reason, EndReason) else game.end_reason
         
+        decision_reason_value = None
+        if game.decision_reason:
+            decision_reason_value = (
+                game.decision_reason.value
+                if isinstance(game.decision_reason, DecisionReason)
+                else game.decision_reason
+            )
+
         # Convert moves
         from app.infrastructure.database.game_move_orm import GameMoveORM
         move_orms = [GameMoveORM.from_domain(move, game.id) for move in game.moves]
@@ -147,7 +166,10 @@ class GameORM(Base):
             bot_color=game.bot_color,
             status=status_value,
             rated=game.rated,
+            decision_reason=decision_reason_value,
             variant_code=game.variant_code,
+            starting_fen=game.starting_fen,
+            is_odds_game=game.is_odds_game,
             time_initial_ms=game.time_control.initial_seconds * 1000,
             time_increment_ms=game.time_control.increment_seconds * 1000,
             white_clock_ms=game.white_clock_ms,
@@ -160,6 +182,7 @@ class GameORM(Base):
             started_at=game.started_at,
             ended_at=game.ended_at,
             updated_at=game.updated_at,
+            version=game.version,
         )
         game_orm.moves = move_orms
         return game_orm
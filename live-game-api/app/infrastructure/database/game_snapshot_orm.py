@@ -0,0 +1,16 @@
+"""Game snapshot ORM model."""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary
+
+from app.infrastructure.database import Base
+from app.infrastructure.database.game_orm import GUID
+
+
+class GameSnapshotORM(Base):
+    """Latest binary snapshot of a live game (one row per game)."""
+
+    __tablename__ = "game_snapshots"
+
+    game_id = Column(GUID(), ForeignKey("games.id"), primary_key=True)
+    ply = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, nullable=False)
@@ -1,5 +1,6 @@
 """Database ORM models re-exports for backward compatibility."""
 from .game_move_orm import GameMoveORM
 from .game_orm import GameORM
+from .game_snapshot_orm import GameSnapshotORM
 
-__all__ = ["GameORM", "GameMoveORM"]
+__all__ = ["GameORM", "GameMoveORM", "GameSnapshotORM"]
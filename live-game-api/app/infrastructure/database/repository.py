@@ -1,14 +1,17 @@
 """SQLAlchemy game repository implementation."""
 
-from typing import List, Optional
+from enum import Enum
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.models.game import Game, GameStatus
+from app.core.exceptions import MoveConflictError
+from app.domain.models.game import Game, GameStatus, Move
 from app.domain.repositories.game_repository import GameRepositoryInterface
-from app.infrastructure.database.models import GameORM
+from app.infrastructure.database.models import GameMoveORM, GameORM
 
 
 class GameRepository(GameRepositoryInterface):
@@ -36,15 +39,139 @@ class GameRepository(GameRepositoryInterface):
         orm_obj = result.scalar_one_or_none()
         return orm_obj.to_domain() if orm_obj else None
 
+    async def get_version(self, game_id: UUID) -> Optional[int]:
+        """Get a game's version (a primary-key lookup of one column)."""
+        stmt = select(GameORM.version).where(GameORM.id == game_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
     async def update(self, game: Game) -> Game:
-        """Update a game."""
+        """Update a game.
+
+        Writes the game row and reconciles its moves by ply: moves are
+        append-only apart from takebacks, so plies beyond the game are
+        deleted and plies not yet stored are inserted. The row UPDATE only
+        matches the version the game was loaded at, and runs first in the
+        same transaction, so a stale writer changes neither the row nor the
+        moves a newer writer stored.
+
+        Raises:
+            MoveConflictError: If the game was modified since it was loaded
+        """
+        expected_version = game.version
+        game.version += 1
         orm_obj = GameORM.from_domain(game)
-        await self.session.merge(orm_obj)
+        columns = {
+            attr.key: getattr(orm_obj, attr.key)
+            for attr in inspect(GameORM).column_attrs
+            if attr.key != "id"
+        }
+        result = await self.session.execute(
+            update(GameORM)
+            .where(GameORM.id == game.id, GameORM.version == expected_version)
+            .values(**columns)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            await self.session.rollback()
+            game.version = expected_version
+            raise MoveConflictError(str(game.id))
+
+        await self.session.execute(
+            delete(GameMoveORM).where(
+                GameMoveORM.game_id == game.id, GameMoveORM.ply > len(game.moves)
+            )
+        )
+        stored_plies = set(
+            (
+                await self.session.execute(
+                    select(GameMoveORM.ply).where(GameMoveORM.game_id == game.id)
+                )
+            ).scalars()
+        )
+        new_moves = [
+            GameMoveORM.values_from_domain(move, game.id)
+            for move in game.moves
+            if move.ply not in stored_plies
+        ]
+        if new_moves:
+            await self.session.execute(insert(GameMoveORM), new_moves)
         await self.session.commit()
 
         # Fetch fresh instance to ensure consistency
         return await self.get_by_id(game.id)
 
+    async def append_move(
+        self, game_id: UUID, move: Move, game_columns: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Insert a single move row and update the game row in one batch.
+
+        Unlike ``update``, this never touches the game's existing moves, so the
+        write cost is flat regardless of game length. On PostgreSQL the INSERT
+        runs as a data-modifying CTE of the UPDATE, making the whole write one
+        statement; other dialects issue both statements in the same
+        transaction. The UPDATE only matches while the game is in progress and
+        still at the version the writer applied the move to (one below the
+        version in ``game_columns``), which rejects stale writers without a
+        prior SELECT; the unique (game_id, ply) constraint rejects duplicate
+        plies.
+
+        Args:
+            game_id: Game UUID
+            move: Move to append
+            game_columns: Changed game columns (column name -> value),
+                including the version after the move
+
+        Returns:
+            Game columns as stored after the update (read via RETURNING)
+
+        Raises:
+            MoveConflictError: If the game no longer accepts this move
+        """
+        values = {
+            column: value.value if isinstance(value, Enum) else value
+            for column, value in game_columns.items()
+        }
+        move_values = GameMoveORM.values_from_domain(move, game_id)
+        returning = [getattr(GameORM, column) for column in values]
+        expected_version = values["version"] - 1
+
+        try:
+            if self.session.bind.dialect.name == "postgresql":
+                inserted_move = (
+                    insert(GameMoveORM)
+                    .values(**move_values)
+                    .returning(GameMoveORM.game_id)
+                    .cte("inserted_move")
+                )
+                target = GameORM.id == select(inserted_move.c.game_id).scalar_subquery()
+            else:
+                await self.session.execute(insert(GameMoveORM).values(**move_values))
+                target = GameORM.id == game_id
+
+            stmt = (
+                update(GameORM)
+                .where(
+                    target,
+                    GameORM.status == GameStatus.IN_PROGRESS.value,
+                    GameORM.version == expected_version,
+                    GameORM.side_to_move == move.color,
+                )
+                .values(**values)
+                .returning(*returning)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            row = result.mappings().one_or_none()
+        except IntegrityError:
+            # Another writer already stored this ply
+            row = None
+        if row is None:
+            await self.session.rollback()
+            raise MoveConflictError(str(game_id))
+
+        await self.session.commit()
+        return dict(row)
+
     async def find_by_creator(self, creator_id: UUID) -> List[Game]:
         """Find games created by a user."""
         stmt = select(GameORM).where(GameORM.creator_account_id == creator_id)
@@ -0,0 +1,228 @@
+"""Redis-leased shard ownership for live-game pods."""
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set, Union
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import get_settings
+from app.infrastructure.sharding.shard_router import ShardRouter
+
+logger = logging.getLogger(__name__)
+
+ShardCallback = Callable[[Set[int]], Union[None, Awaitable[None]]]
+
+# Take a free lease or extend our own; never steal another pod's lease
+CLAIM_LEASE_SCRIPT = """
+local owner = redis.call('GET', KEYS[1])
+if not owner then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return 1
+elseif owner == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ShardLeaseManager:
+    """Claims this pod's shards with Redis leases and tracks shard owners.
+
+    Every refresh the pod heartbeats into a membership set, computes the
+    shards it should own from the live members (rendezvous hashing), claims
+    or renews those leases and releases the ones it should give up. A shard
+    only changes hands once the previous owner released it or its lease
+    expired, so in-memory game state has a single owner at a time.
+    """
+
+    MEMBERS_KEY = "shard:members"  # zset: pod_id -> membership expiry (ms)
+    ADDRESSES_KEY = "shard:addresses"  # hash: pod_id -> base URL
+
+    def __init__(
+        self,
+        router: ShardRouter,
+        pod_id: str,
+        pod_address: str,
+        redis_client: Optional[redis.Redis] = None,
+        lease_ttl_seconds: float = 10.0,
+        renew_interval_seconds: float = 3.0,
+        on_acquired: Optional[ShardCallback] = None,
+        on_released: Optional[ShardCallback] = None,
+    ):
+        """Initialize shard lease manager.
+
+        Args:
+            router: Shard router (game -> shard, shard -> pod)
+            pod_id: Unique ID of this pod
+            pod_address: Base URL other pods use to reach this pod
+            redis_client: Optional Redis client (will create if not provided)
+            lease_ttl_seconds: Lease and membership lifetime
+            renew_interval_seconds: Refresh cadence (well below the TTL)
+            on_acquired: Called with shards newly owned by this pod
+            on_released: Called with shards this pod no longer owns
+        """
+        self.router = router
+        self.pod_id = pod_id
+        self.pod_address = pod_address
+        self.redis_client = redis_client
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.renew_interval_seconds = renew_interval_seconds
+        self.on_acquired = on_acquired
+        self.on_released = on_released
+        self.settings = get_settings()
+        self.owned_shards: Set[int] = set()
+        self._owner_addresses: Dict[int, str] = {}  # shard -> address of another pod
+        self._claim_script = None
+        self._release_script = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _get_redis_client(self) -> redis.Redis:
+        """Get or create Redis client."""
+        if self.redis_client is None:
+            self.redis_client = await redis.from_url(
+                self.settings.REDIS_URL,
+                decode_responses=self.settings.REDIS_DECODE_RESPONSES,
+            )
+        if self._claim_script is None:
+            self._claim_script = self.redis_client.register_script(CLAIM_LEASE_SCRIPT)
+            self._release_script = self.redis_client.register_script(RELEASE_LEASE_SCRIPT)
+        return self.redis_client
+
+    @staticmethod
+    def _lease_key(shard: int) -> str:
+        return f"shard:lease:{shard}"
+
+    def owns_game(self, game_id: UUID) -> bool:
+        """Whether this pod should hold the game's state and clock.
+
+        With sharding (the default) a pod owns the games of the shards it
+        holds leases for; a lone pod leases every shard. Without sharding no
+        pod owns games (each would run its own copy and clock), unless a
+        single pod is configured to own them all.
+        """
+        if not self.router.enabled:
+            return self.settings.RESIDENT_GAMES_WITHOUT_SHARDING
+        return self.router.get_shard_for_game(game_id) in self.owned_shards
+
+    def owner_address(self, game_id: UUID) -> Optional[str]:
+        """Address of the pod owning a game, or None to handle it locally.
+
+        None is returned when sharding is disabled, this pod owns the game,
+        or the shard currently has no owner.
+        """
+        if not self.router.enabled:
+            return None
+        return self._owner_addresses.get(self.router.get_shard_for_game(game_id))
+
+    async def refresh(self) -> None:
+        """Heartbeat, claim/renew/release leases and refresh the owner map."""
+        redis_client = await self._get_redis_client()
+        now_ms = int(time.time() * 1000)
+        ttl_ms = int(self.lease_ttl_seconds * 1000)
+
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zadd(self.MEMBERS_KEY, {self.pod_id: now_ms + ttl_ms})
+            pipe.hset(self.ADDRESSES_KEY, self.pod_id, self.pod_address)
+            pipe.zremrangebyscore(self.MEMBERS_KEY, 0, now_ms)
+            pipe.zrange(self.MEMBERS_KEY, 0, -1)
+            members = (await pipe.execute())[-1]
+
+        assignment = self.router.assign_shards(members)
+        desired = sorted(shard for shard, pod in assignment.items() if pod == self.pod_id)
+        to_release = sorted(self.owned_shards.difference(desired))
+
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for shard in desired:
+                await self._claim_script(
+                    keys=[self._lease_key(shard)], args=[self.pod_id, ttl_ms], client=pipe
+                )
+            for shard in to_release:
+                await self._release_script(
+                    keys=[self._lease_key(shard)], args=[self.pod_id], client=pipe
+                )
+            pipe.mget([self._lease_key(shard) for shard in range(self.router.shard_count)])
+            pipe.hgetall(self.ADDRESSES_KEY)
+            results = await pipe.execute()
+
+        claimed = {shard for shard, ok in zip(desired, results) if ok}
+        lease_owners, addresses = results[-2], results[-1]
+        self._owner_addresses = {
+            shard: addresses[owner]
+            for shard, owner in enumerate(lease_owners)
+            if owner and owner != self.pod_id and owner in addresses
+        }
+
+        acquired = claimed - self.owned_shards
+        released = self.owned_shards - claimed
+        self.owned_shards = claimed
+        if released:
+            logger.info(f"Pod {self.pod_id} released shards {sorted(released)}")
+            await self._notify(self.on_released, released)
+        if acquired:
+            logger.info(f"Pod {self.pod_id} acquired shards {sorted(acquired)}")
+            await self._notify(self.on_acquired, acquired)
+
+    @staticmethod
+    async def _notify(callback: Optional[ShardCallback], shards: Set[int]) -> None:
+        if callback is None:
+            return
+        try:
+            result = callback(shards)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Shard ownership callback failed: {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Start the background refresh loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Shard lease refresh failed: {e}", exc_info=True)
+            await asyncio.sleep(self.renew_interval_seconds)
+
+    async def close(self) -> None:
+        """Stop refreshing and hand back leases so other pods take over quickly."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+        if self.redis_client is None:
+            return
+        try:
+            redis_client = await self._get_redis_client()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for shard in self.owned_shards:
+                    await self._release_script(
+                        keys=[self._lease_key(shard)], args=[self.pod_id], client=pipe
+                    )
+                pipe.zrem(self.MEMBERS_KEY, self.pod_id)
+                pipe.hdel(self.ADDRESSES_KEY, self.pod_id)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to release shard leases: {e}", exc_info=True)
+        self.owned_shards = set()
+        await self.redis_client.close()
@@ -2,7 +2,7 @@
 
 import hashlib
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 
 from app.core.config import get_settings
@@ -10,18 +10,44 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash (Python's ``hash`` is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def jump_consistent_hash(key: int, buckets: int) -> int:
+    """Map a 64-bit key to a bucket with Lamping & Veach jump consistent hashing.
+
+    Growing from N to M buckets only moves about (M - N) / M of the keys,
+    and it needs no ring state.
+    """
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
 class ShardRouter:
-    """Routes game requests to appropriate shard using consistent hashing."""
+    """Routes games to shards and shards to pods.
 
-    def __init__(self, shard_count: Optional[int] = None):
+    Games map to a fixed set of virtual shards with jump consistent hashing.
+    Shards map to live pods with rendezvous (highest random weight) hashing,
+    so adding or removing a pod only moves the shards that pod gains or
+    loses: scaling from 8 to 12 pods moves about a third of the shards.
+    """
+
+    def __init__(self, shard_count: Optional[int] = None, enabled: Optional[bool] = None):
         """Initialize shard router.
 
         Args:
             shard_count: Number of shards (defaults to config value)
+            enabled: Whether sharding is enabled (defaults to config value)
         """
         settings = get_settings()
         self.shard_count = shard_count or settings.SHARD_COUNT
-        self.enabled = settings.SHARD_ENABLED
+        self.enabled = settings.SHARD_ENABLED if enabled is None else enabled
 
     def get_shard_for_game(self, game_id: UUID) -> int:
         """Get shard number for a game using consistent hashing.
@@ -35,14 +61,36 @@ class ShardRouter:
         if not self.enabled:
             return 0  # Single shard mode
 
-        # Use consistent hashing (MD5 hash of game_id, modulo shard_count)
-        game_id_str = str(game_id)
-        hash_value = int(hashlib.md5(game_id_str.encode()).hexdigest(), 16)
-        shard = hash_value % self.shard_count
-        
+        shard = jump_consistent_hash(_hash64(str(game_id)), self.shard_count)
         logger.debug(f"Game {game_id} routed to shard {shard}")
         return shard
 
+    def get_pod_for_shard(self, shard: int, pods: Iterable[str]) -> Optional[str]:
+        """Pick the pod that should own a shard (rendezvous hashing).
+
+        Args:
+            shard: Shard number
+            pods: IDs of the live pods
+
+        Returns:
+            Pod ID, or None if there are no pods
+        """
+        return max(pods, key=lambda pod: _hash64(f"{shard}:{pod}"), default=None)
+
+    def assign_shards(self, pods: Iterable[str]) -> Dict[int, str]:
+        """Compute the desired owner of every shard.
+
+        Args:
+            pods: IDs of the live pods
+
+        Returns:
+            Mapping of shard number to pod ID
+        """
+        pods = list(pods)
+        if not pods:
+            return {}
+        return {shard: self.get_pod_for_shard(shard, pods) for shard in range(self.shard_count)}
+
     def should_handle_shard(self, game_id: UUID, current_shard: int) -> bool:
         """Check if current instance should handle this game.
 
@@ -0,0 +1,119 @@
+"""Compact binary encoding of live game snapshots.
+
+A snapshot holds what is needed to resume a game without replaying its
+move list: the board (one nibble per square plus side to move, castling
+rights, en passant square and move counters) and the Zobrist hashes of the
+positions since the last irreversible move. Clocks are not part of it: the
+game row's clock columns are written with every move, so they are always at
+least as fresh. A typical middlegame snapshot is well under 100 bytes.
+
+Layout (big-endian)::
+
+    header   magic "GS", version, ply
+    board    32 bytes of square nibbles, turn, castling bitboard, ep square,
+             halfmove clock, fullmove number
+    hashes   count, then one unsigned 64-bit Zobrist hash per position
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import List
+
+import chess
+
+MAGIC = b"GS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct(">2sBI")
+_BOARD_TAIL = struct.Struct(">BQbHH")
+_HASH_COUNT = struct.Struct(">H")
+
+# Nibble codes: 0 empty, 1-6 white pawn..king, 9-14 black pawn..king
+_BLACK = 8
+
+
+class SnapshotCodecError(ValueError):
+    """Raised when snapshot data cannot be decoded."""
+
+
+@dataclass
+class GameSnapshot:
+    """Point-in-time state of a live game."""
+
+    ply: int
+    board: chess.Board
+    position_hashes: List[int] = field(default_factory=list)
+
+
+def _encode_squares(board: chess.Board) -> bytes:
+    nibbles = [0] * 64
+    for square, piece in board.piece_map().items():
+        nibbles[square] = piece.piece_type | (0 if piece.color == chess.WHITE else _BLACK)
+    return bytes((nibbles[i] << 4) | nibbles[i + 1] for i in range(0, 64, 2))
+
+
+def _decode_squares(data: bytes) -> dict:
+    pieces = {}
+    for index, byte in enumerate(data):
+        for square, code in ((index * 2, byte >> 4), (index * 2 + 1, byte & 0x0F)):
+            if code:
+                color = chess.BLACK if code & _BLACK else chess.WHITE
+                pieces[square] = chess.Piece(code & 0x07, color)
+    return pieces
+
+
+def encode_snapshot(snapshot: GameSnapshot) -> bytes:
+    """Encode a snapshot into its binary representation."""
+    board = snapshot.board
+    hashes = snapshot.position_hashes
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, SNAPSHOT_VERSION, snapshot.ply),
+            _encode_squares(board),
+            _BOARD_TAIL.pack(
+                0 if board.turn == chess.WHITE else 1,
+                board.castling_rights,
+                board.ep_square if board.ep_square is not None else -1,
+                board.halfmove_clock,
+                board.fullmove_number,
+            ),
+            _HASH_COUNT.pack(len(hashes)),
+            struct.pack(f">{len(hashes)}Q", *hashes),
+        ]
+    )
+
+
+def decode_snapshot(data: bytes) -> GameSnapshot:
+    """Decode a snapshot from its binary representation.
+
+    Raises:
+        SnapshotCodecError: If the data is malformed or from another version
+    """
+    try:
+        magic, version, ply = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != SNAPSHOT_VERSION:
+            raise SnapshotCodecError(f"Unsupported snapshot format: {magic!r} v{version}")
+        offset = _HEADER.size
+
+        board = chess.Board(None)
+        board.set_piece_map(_decode_squares(data[offset : offset + 32]))
+        offset += 32
+
+        tail = _BOARD_TAIL.unpack_from(data, offset)
+        turn, castling_rights, ep_square, halfmove_clock, fullmove_number = tail
+        offset += _BOARD_TAIL.size
+        board.turn = chess.WHITE if turn == 0 else chess.BLACK
+        board.castling_rights = castling_rights
+        board.ep_square = ep_square if ep_square >= 0 else None
+        board.halfmove_clock = halfmove_clock
+        board.fullmove_number = fullmove_number
+
+        (count,) = _HASH_COUNT.unpack_from(data, offset)
+        offset += _HASH_COUNT.size
+        position_hashes = list(struct.unpack_from(f">{count}Q", data, offset))
+    except SnapshotCodecError:
+        raise
+    except (struct.error, ValueError) as e:
+        raise SnapshotCodecError(f"Malformed snapshot: {e}") from e
+
+    return GameSnapshot(ply=ply, board=board, position_hashes=position_hashes)
@@ -1,21 +1,39 @@
 """Snapshot service for periodic game state persistence."""
 
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from app.core.config import get_settings
-from app.domain.models.game import Game
-from app.infrastructure.database.models import GameORM
+from app.domain.models.game import GameStatus, Move
+from app.domain.services.game_state_engine import GameStateEngine, LiveGameState
+from app.infrastructure.database.models import GameMoveORM, GameORM, GameSnapshotORM
+from app.infrastructure.snapshots.snapshot_codec import (
+    GameSnapshot,
+    SnapshotCodecError,
+    decode_snapshot,
+    encode_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class SnapshotService:
-    """Service for creating and managing game state snapshots."""
+    """Service for creating and managing game state snapshots.
+
+    Live games are snapshotted every ``SNAPSHOT_INTERVAL_MOVES`` moves or
+    ``SNAPSHOT_INTERVAL_SECONDS`` seconds (whichever comes first) into a
+    single compact binary row per game. Recovery loads the game rows, their
+    snapshots and only the moves played after each snapshot, so resuming a
+    game never replays or reads its full move list.
+    """
 
     def __init__(self, db_session: AsyncSession):
         """Initialize snapshot service.
@@ -28,74 +46,180 @@ class SnapshotService:
         self.snapshot_interval_moves = self.settings.SNAPSHOT_INTERVAL_MOVES
         self.snapshot_interval_seconds = self.settings.SNAPSHOT_INTERVAL_SECONDS
 
-    async def should_snapshot(self, game: Game) -> bool:
-        """Check if game should be snapshotted.
+    def should_snapshot(self, state: LiveGameState, now: Optional[float] = None) -> bool:
+        """Check if a resident game should be snapshotted.
 
         Args:
-            game: Game to check
+            state: Resident game state
+            now: Monotonic time in seconds (defaults to ``time.monotonic()``)
 
         Returns:
             True if snapshot should be created
         """
-        # Snapshot if:
-        # 1. Game has reached move interval (every N moves)
-        # 2. Game hasn't been updated recently (every N seconds for active games)
-        # 3. Game has ended (always snapshot ended games)
-        
-        if game.is_ended():
-            return True
-            
-        move_count = len(game.moves)
-        if move_count > 0 and move_count % self.snapshot_interval_moves == 0:
+        if state.game.is_ended():
+            return False  # Ended games are never recovered
+
+        moves_since = state.ply - state.snapshot_ply
+        if moves_since <= 0:
+            return False
+        if moves_since >= self.snapshot_interval_moves:
             return True
-            
-        # Check time-based snapshot
-        if game.updated_at:
-            time_since_update = (datetime.now(timezone.utc) - game.updated_at).total_seconds()
-            if time_since_update >= self.snapshot_interval_seconds:
-                return True
-                
-        return False
-
-    async def create_snapshot(self, game: Game) -> None:
-        """Create snapshot of game state.
+
+        now = time.monotonic() if now is None else now
+        return now - state.snapshot_at >= self.snapshot_interval_seconds
+
+    async def create_snapshot(self, state: LiveGameState) -> None:
+        """Write (replace) the snapshot of a resident game.
 
         Args:
-            game: Game to snapshot
+            state: Resident game state
         """
-        try:
-            # Use existing repository update mechanism (which persists to DB)
-            # Snapshots are effectively the current DB state
-            # This service coordinates when snapshots should be created
-            
-            # For now, we rely on the repository to persist game state
-            # In the future, we might want to add snapshot metadata tracking
-            # or S3 archival for completed games
-            
-            logger.debug(f"Snapshot created for game {game.id} (moves: {len(game.moves)})")
-        except Exception as e:
-            logger.error(f"Failed to create snapshot for game {game.id}: {e}", exc_info=True)
-
-    async def load_from_snapshot(self, game_id: UUID) -> Optional[Game]:
-        """Load game from snapshot (from database).
+        game = state.game
+        taken_at = datetime.now(timezone.utc)
+        snapshot = GameSnapshot(
+            ply=state.ply, board=state.board, position_hashes=state.position_hashes
+        )
+        values = {
+            "game_id": game.id,
+            "ply": snapshot.ply,
+            "data": encode_snapshot(snapshot),
+            "created_at": taken_at,
+        }
+
+        dialect = self.db_session.bind.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(GameSnapshotORM).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GameSnapshotORM.game_id],
+            set_={"ply": stmt.excluded.ply, "data": stmt.excluded.data, "created_at": stmt.excluded.created_at},
+        )
+        await self.db_session.execute(stmt)
+        await self.db_session.commit()
+
+        state.snapshot_ply = snapshot.ply
+        state.snapshot_at = time.monotonic()
+        logger.debug(f"Snapshot created for game {game.id} (ply {snapshot.ply})")
+
+    async def load_snapshot(self, game_id: UUID) -> Optional[GameSnapshot]:
+        """Load the latest snapshot of a game.
 
         Args:
             game_id: Game UUID
 
         Returns:
-            Game domain object or None if not found
+            Decoded snapshot, or None if there is none (or it is unreadable)
         """
-        try:
-            from sqlalchemy import select
-            from sqlalchemy.orm import selectinload
-            
-            stmt = select(GameORM).where(GameORM.id == game_id).options(selectinload(GameORM.moves))
-            result = await self.db_session.execute(stmt)
-            orm_obj = result.scalar_one_or_none()
-            
-            if orm_obj:
-                return orm_obj.to_domain()
+        stmt = select(GameSnapshotORM.data).where(GameSnapshotORM.game_id == game_id)
+        data = (await self.db_session.execute(stmt)).scalar_one_or_none()
+        if data is None:
             return None
-        except Exception as e:
-            logger.error(f"Failed to load snapshot for game {game_id}: {e}", exc_info=True)
+        try:
+            return decode_snapshot(data)
+        except SnapshotCodecError as e:
+            logger.warning(f"Ignoring unreadable snapshot for game {game_id}: {e}")
             return None
+
+    async def delete_snapshot(self, game_id: UUID) -> None:
+        """Drop a game's snapshot, e.g. after a takeback made it stale.
+
+        Args:
+            game_id: Game UUID
+        """
+        await self.db_session.execute(
+            delete(GameSnapshotORM).where(GameSnapshotORM.game_id == game_id)
+        )
+        await self.db_session.commit()
+
+    async def load_from_snapshot(self, game_id: UUID) -> Optional[LiveGameState]:
+        """Rebuild the resident state of one in-progress game.
+
+        Args:
+            game_id: Game UUID
+
+        Returns:
+            Restored state, or None if the game is not in progress or cannot
+            be restored from its snapshot
+        """
+        states = await self._recover(GameORM.id == game_id)
+        return states[0] if states else None
+
+    async def recover_active_games(
+        self, owns_game: Optional[Callable[[UUID], bool]] = None
+    ) -> List[LiveGameState]:
+        """Rebuild the resident state of every in-progress game.
+
+        Uses three queries in total (game rows, snapshots, moves after the
+        snapshots) regardless of the number of games.
+
+        Args:
+            owns_game: Optional predicate restricting which games to recover
+
+        Returns:
+            Restored states (games whose snapshot replay fails are skipped and
+            load through the regular path on first access)
+        """
+        return await self._recover(
+            GameORM.status == GameStatus.IN_PROGRESS.value, owns_game=owns_game
+        )
+
+    async def _recover(
+        self, condition, owns_game: Optional[Callable[[UUID], bool]] = None
+    ) -> List[LiveGameState]:
+        stmt = (
+            select(GameORM)
+            .where(condition, GameORM.status == GameStatus.IN_PROGRESS.value)
+            .options(noload(GameORM.moves))
+        )
+        games = [
+            orm_obj.to_domain()
+            for orm_obj in (await self.db_session.execute(stmt)).scalars().all()
+            if owns_game is None or owns_game(orm_obj.id)
+        ]
+        if not games:
+            return []
+        game_ids = [game.id for game in games]
+
+        snapshots: Dict[UUID, GameSnapshot] = {}
+        stmt = select(GameSnapshotORM.game_id, GameSnapshotORM.data).where(
+            GameSnapshotORM.game_id.in_(game_ids)
+        )
+        for game_id, data in (await self.db_session.execute(stmt)).all():
+            try:
+                snapshots[game_id] = decode_snapshot(data)
+            except SnapshotCodecError as e:
+                logger.warning(f"Ignoring unreadable snapshot for game {game_id}: {e}")
+
+        # Moves after each game's snapshot (all moves for games without one)
+        stmt = (
+            select(GameMoveORM)
+            .outerjoin(GameSnapshotORM, GameSnapshotORM.game_id == GameMoveORM.game_id)
+            .where(
+                GameMoveORM.game_id.in_(game_ids),
+                GameMoveORM.ply > func.coalesce(GameSnapshotORM.ply, 0),
+            )
+            .order_by(GameMoveORM.game_id, GameMoveORM.ply)
+        )
+        tails: Dict[UUID, List[Move]] = defaultdict(list)
+        for move_orm in (await self.db_session.execute(stmt)).scalars().all():
+            tails[move_orm.game_id].append(move_orm.to_domain())
+
+        states = []
+        for game in games:
+            snapshot = snapshots.get(game.id)
+            if snapshot is None:
+                game.moves = tails.get(game.id, [])
+                states.append(GameStateEngine.build_state(game))
+                continue
+            state = GameStateEngine.restore(
+                game,
+                snapshot.board,
+                snapshot.position_hashes,
+                snapshot.ply,
+                tails.get(game.id, []),
+            )
+            if state is not None:
+                states.append(state)
+        return states
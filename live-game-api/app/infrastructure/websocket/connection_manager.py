@@ -3,17 +3,20 @@
 import asyncio
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, Set, Optional
+import time
+from typing import Dict, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
 import redis.asyncio as redis
+from fastapi import WebSocket
 
 from app.core.config import get_settings
 from app.core.metrics import (
     live_game_websocket_connections,
     live_game_websocket_reconnects_total,
 )
+from app.infrastructure.websocket.fanout import GameChannelFanout
+from app.infrastructure.websocket.send_queue import ConnectionSendQueue
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,8 @@ logger = logging.getLogger(__name__)
 class WebSocketConnectionManager:
     """Manages WebSocket connections and game subscriptions."""
 
+    CONNECTION_TTL_SECONDS = 3600  # Refreshed by reconcile() while connected
+
     def __init__(self, redis_client: Optional[redis.Redis] = None):
         """Initialize connection manager.
 
@@ -32,6 +37,11 @@ class WebSocketConnectionManager:
         # In-memory connection tracking (per-instance)
         self.active_connections: Dict[str, Set] = {}  # game_id -> set of connection IDs
         self.connection_games: Dict[str, Set] = {}  # connection_id -> set of game_ids
+        # game_id -> (fetched_at, subscriber IDs from Redis), dropped on reconcile
+        self._remote_subscribers: Dict[str, Tuple[float, Set[str]]] = {}
+        self._reconcile_task: Optional[asyncio.Task] = None
+        # Delivers pub/sub messages to the sockets held by this instance
+        self.fanout = GameChannelFanout(self._get_redis_client, channel_prefix="pubsub:game:")
 
     async def _get_redis_client(self) -> redis.Redis:
         """Get or create Redis client."""
@@ -54,82 +64,116 @@ class WebSocketConnectionManager:
         """Get Redis pub/sub channel for game updates."""
         return f"pubsub:game:{game_id}"
 
-    async def connect(self, connection_id: str, game_id: UUID) -> None:
+    def create_send_queue(self, connection_id: str, websocket: WebSocket) -> ConnectionSendQueue:
+        """Create and start the bounded outbound queue for an accepted socket.
+
+        Args:
+            connection_id: Unique connection identifier
+            websocket: Accepted socket
+
+        Returns:
+            Started send queue; all writes to the socket should go through it
+        """
+        send_queue = ConnectionSendQueue(
+            websocket,
+            connection_id,
+            max_size=self.settings.WEBSOCKET_SEND_QUEUE_SIZE,
+            high_water=self.settings.WEBSOCKET_SEND_QUEUE_HIGH_WATER,
+            slow_consumer_grace_seconds=self.settings.WEBSOCKET_SLOW_CONSUMER_GRACE_SECONDS,
+        )
+        send_queue.start()
+        return send_queue
+
+    async def connect(
+        self,
+        connection_id: str,
+        game_id: UUID,
+        send_queue: Optional[ConnectionSendQueue] = None,
+    ) -> None:
         """Register a connection for a game.
 
+        Redis bookkeeping (game subscriber set, connection's game set and its
+        TTL) is written in a single pipelined round-trip.
+
         Args:
             connection_id: Unique connection identifier
             game_id: Game UUID to subscribe to
+            send_queue: Queue to deliver game broadcasts to (local connections)
         """
         game_id_str = str(game_id)
-        
+
+        if send_queue is not None:
+            try:
+                await self.fanout.add(game_id_str, connection_id, send_queue)
+            except Exception as e:
+                logger.error(f"Failed to subscribe to game channel: {e}", exc_info=True)
+
         # Track in memory
-        if game_id_str not in self.active_connections:
-            self.active_connections[game_id_str] = set()
-        self.active_connections[game_id_str].add(connection_id)
-        
+        self.active_connections.setdefault(game_id_str, set()).add(connection_id)
         if connection_id not in self.connection_games:
             self.connection_games[connection_id] = set()
+            live_game_websocket_connections.inc()
         self.connection_games[connection_id].add(game_id_str)
+        self._ensure_reconciler()
 
         # Track in Redis (for cross-instance awareness)
         try:
             redis_client = await self._get_redis_client()
-            await redis_client.sadd(self._get_game_subscribers_key(game_id), connection_id)
-            await redis_client.setex(
-                self._get_connection_key(connection_id),
-                3600,  # TTL 1 hour
-                json.dumps({
-                    "connected_at": datetime.now(timezone.utc).isoformat(),
-                    "games": [game_id_str],
-                })
-            )
-            
-            # Update metrics
-            total_connections = sum(len(conns) for conns in self.active_connections.values())
-            live_game_websocket_connections.set(total_connections)
+            connection_key = self._get_connection_key(connection_id)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.sadd(self._get_game_subscribers_key(game_id), connection_id)
+                pipe.sadd(connection_key, game_id_str)
+                pipe.expire(connection_key, self.CONNECTION_TTL_SECONDS)
+                await pipe.execute()
         except Exception as e:
             logger.error(f"Failed to track connection in Redis: {e}", exc_info=True)
 
     async def disconnect(self, connection_id: str) -> None:
         """Unregister a connection.
 
+        The games of a connection are known locally, so its Redis entries are
+        removed in a single pipelined round-trip without reading them first.
+
         Args:
             connection_id: Connection identifier
         """
-        # Remove from memory tracking
-        if connection_id in self.connection_games:
-            game_ids = self.connection_games[connection_id].copy()
-            for game_id_str in game_ids:
-                if game_id_str in self.active_connections:
-                    self.active_connections[game_id_str].discard(connection_id)
-                    if not self.active_connections[game_id_str]:
-                        del self.active_connections[game_id_str]
-            del self.connection_games[connection_id]
-
-        # Remove from Redis
+        game_ids = self.connection_games.pop(connection_id, None)
+        if game_ids is None:
+            return
+        live_game_websocket_connections.dec()
+
+        for game_id_str in game_ids:
+            try:
+                await self.fanout.remove(game_id_str, connection_id)
+            except Exception as e:
+                logger.error(f"Failed to unsubscribe from game channel: {e}", exc_info=True)
+            self._discard_local(game_id_str, connection_id)
+
         try:
             redis_client = await self._get_redis_client()
-            connection_key = self._get_connection_key(connection_id)
-            connection_data = await redis_client.get(connection_key)
-            
-            if connection_data:
-                data = json.loads(connection_data)
-                for game_id_str in data.get("games", []):
-                    game_id = UUID(game_id_str)
-                    await redis_client.srem(self._get_game_subscribers_key(game_id), connection_id)
-            
-            await redis_client.delete(connection_key)
-            
-            # Update metrics
-            total_connections = sum(len(conns) for conns in self.active_connections.values())
-            live_game_websocket_connections.set(total_connections)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for game_id_str in game_ids:
+                    pipe.srem(self._get_game_subscribers_key(game_id_str), connection_id)
+                pipe.delete(self._get_connection_key(connection_id))
+                await pipe.execute()
         except Exception as e:
             logger.error(f"Failed to remove connection from Redis: {e}", exc_info=True)
 
+    def _discard_local(self, game_id_str: str, connection_id: str) -> None:
+        """Remove a connection from the in-memory subscriber index of a game."""
+        connections = self.active_connections.get(game_id_str)
+        if connections is not None:
+            connections.discard(connection_id)
+            if not connections:
+                del self.active_connections[game_id_str]
+
     async def get_subscribers(self, game_id: UUID) -> Set[str]:
         """Get all connection IDs subscribed to a game.
 
+        Local connections come from memory. Connections held by other
+        instances come from a per-game snapshot of the Redis subscriber set
+        that is refreshed at most once per reconcile interval.
+
         Args:
             game_id: Game UUID
 
@@ -138,20 +182,67 @@ class WebSocketConnectionManager:
         """
         game_id_str = str(game_id)
         subscribers = self.active_connections.get(game_id_str, set()).copy()
-        
-        # Also get from Redis (for cross-instance)
-        try:
-            redis_client = await self._get_redis_client()
-            redis_subscribers = await redis_client.smembers(self._get_game_subscribers_key(game_id))
-            subscribers.update(redis_subscribers)
-        except Exception as e:
-            logger.error(f"Failed to get subscribers from Redis: {e}", exc_info=True)
-        
+
+        now = time.monotonic()
+        cached = self._remote_subscribers.get(game_id_str)
+        if cached is None or now - cached[0] > self.settings.WEBSOCKET_SUBSCRIBER_RECONCILE_SECONDS:
+            try:
+                redis_client = await self._get_redis_client()
+                members = await redis_client.smembers(self._get_game_subscribers_key(game_id))
+                cached = (now, set(members))
+                self._remote_subscribers[game_id_str] = cached
+            except Exception as e:
+                logger.error(f"Failed to get subscribers from Redis: {e}", exc_info=True)
+        if cached is not None:
+            subscribers.update(cached[1])
+
         return subscribers
 
+    def _ensure_reconciler(self) -> None:
+        if self._reconcile_task is None or self._reconcile_task.done():
+            self._reconcile_task = asyncio.create_task(self._run_reconciler())
+
+    async def _run_reconciler(self) -> None:
+        """Periodically reconcile Redis with local state."""
+        while True:
+            await asyncio.sleep(self.settings.WEBSOCKET_SUBSCRIBER_RECONCILE_SECONDS)
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to reconcile WebSocket subscriptions: {e}", exc_info=True)
+
+    async def reconcile(self) -> None:
+        """Re-assert local connections in Redis and drop stale remote snapshots.
+
+        Restores entries lost to a Redis failover or expiry and refreshes
+        connection TTLs, so long-lived connections do not disappear after
+        CONNECTION_TTL_SECONDS. All writes go out in one pipeline.
+        """
+        self._remote_subscribers.clear()
+        if not self.connection_games:
+            return
+
+        redis_client = await self._get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for connection_id, game_ids in self.connection_games.items():
+                if not game_ids:
+                    continue
+                connection_key = self._get_connection_key(connection_id)
+                pipe.sadd(connection_key, *game_ids)
+                pipe.expire(connection_key, self.CONNECTION_TTL_SECONDS)
+                for game_id_str in game_ids:
+                    pipe.sadd(self._get_game_subscribers_key(game_id_str), connection_id)
+            await pipe.execute()
+        live_game_websocket_connections.set(len(self.connection_games))
+
     async def broadcast_to_game(self, game_id: UUID, message: dict) -> None:
         """Broadcast message to all subscribers of a game.
 
+        The message is serialized once and published to the game's channel;
+        every instance with local subscribers forwards it to its sockets.
+
         Args:
             game_id: Game UUID
             message: Message dictionary to broadcast
@@ -164,7 +255,38 @@ class WebSocketConnectionManager:
         except Exception as e:
             logger.error(f"Failed to publish to Redis pub/sub: {e}", exc_info=True)
 
+    async def unsubscribe(self, connection_id: str, game_id: UUID) -> None:
+        """Stop delivering a game's updates to a connection.
+
+        Args:
+            connection_id: Connection identifier
+            game_id: Game UUID to unsubscribe from
+        """
+        game_id_str = str(game_id)
+        await self.fanout.remove(game_id_str, connection_id)
+
+        self._discard_local(game_id_str, connection_id)
+        if connection_id in self.connection_games:
+            self.connection_games[connection_id].discard(game_id_str)
+
+        try:
+            redis_client = await self._get_redis_client()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.srem(self._get_game_subscribers_key(game_id), connection_id)
+                pipe.srem(self._get_connection_key(connection_id), game_id_str)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to remove subscription from Redis: {e}", exc_info=True)
+
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Stop reconciliation, close pub/sub fan-out and Redis connection."""
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
+        await self.fanout.close()
         if self.redis_client:
             await self.redis_client.close()
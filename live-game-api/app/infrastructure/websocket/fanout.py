@@ -0,0 +1,151 @@
+"""Per-process Redis pub/sub fan-out to local WebSocket connections."""
+
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as redis
+
+from app.infrastructure.websocket.send_queue import ConnectionSendQueue
+
+logger = logging.getLogger(__name__)
+
+
+class GameChannelFanout:
+    """Delivers game channel messages to the sockets connected to this process.
+
+    The process holds a single pub/sub connection and subscribes to a game's
+    channel only while at least one local socket watches that game, so a game
+    costs one Redis subscription per pod no matter how many spectators it has.
+    A single reader task receives each message once and hands the already
+    serialized payload to the send queue of every local socket for the game,
+    so a slow socket never delays delivery to the others.
+    """
+
+    def __init__(
+        self,
+        get_redis_client: Callable[[], Awaitable[redis.Redis]],
+        channel_prefix: str = "pubsub:game:",
+        poll_timeout_seconds: float = 1.0,
+    ):
+        """Initialize fan-out.
+
+        Args:
+            get_redis_client: Coroutine returning the shared Redis client
+            channel_prefix: Prefix of per-game channels (followed by the game ID)
+            poll_timeout_seconds: How long the reader waits for a message per poll
+        """
+        self._get_redis_client = get_redis_client
+        self.channel_prefix = channel_prefix
+        self.poll_timeout_seconds = poll_timeout_seconds
+        # game_id -> conn_id -> queue
+        self.local_sockets: Dict[str, Dict[str, ConnectionSendQueue]] = {}
+        self._pubsub: Optional[redis.client.PubSub] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    def _channel(self, game_id: str) -> str:
+        return f"{self.channel_prefix}{game_id}"
+
+    async def _get_pubsub(self) -> "redis.client.PubSub":
+        if self._pubsub is None:
+            client = await self._get_redis_client()
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._run())
+        return self._pubsub
+
+    async def add(self, game_id: str, connection_id: str, send_queue: ConnectionSendQueue) -> None:
+        """Register a local socket for a game, subscribing on the first one."""
+        sockets = self.local_sockets.setdefault(game_id, {})
+        first = not sockets
+        sockets[connection_id] = send_queue
+        if first:
+            pubsub = await self._get_pubsub()
+            await pubsub.subscribe(self._channel(game_id))
+            self._subscribed.set()
+
+    async def remove(self, game_id: str, connection_id: str) -> None:
+        """Unregister a local socket, unsubscribing when the game has none left."""
+        sockets = self.local_sockets.get(game_id)
+        if sockets is None or sockets.pop(connection_id, None) is None:
+            return
+        if not sockets:
+            del self.local_sockets[game_id]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(self._channel(game_id))
+
+    def local_connection_count(self, game_id: str) -> int:
+        """Number of sockets on this process watching a game."""
+        return len(self.local_sockets.get(game_id, ()))
+
+    async def deliver(self, game_id: str, data: str, message_type: Optional[str] = None) -> None:
+        """Queue an already serialized message for every local socket of a game.
+
+        Args:
+            game_id: Game the message belongs to
+            data: Serialized message
+            message_type: Message type; ``move_played`` frames supersede each other
+        """
+        sockets = self.local_sockets.get(game_id)
+        if not sockets:
+            return
+        coalesce_key = f"{game_id}:move_played" if message_type == "move_played" else None
+        closed = [
+            connection_id
+            for connection_id, send_queue in sockets.items()
+            if not send_queue.offer(data, coalesce_key) and send_queue.closed
+        ]
+        for connection_id in closed:
+            logger.info(f"Dropping closed socket {connection_id} from game {game_id}")
+            await self.remove(game_id, connection_id)
+
+    async def _run(self) -> None:
+        """Reader loop: receive channel messages and fan them out."""
+        prefix_length = len(self.channel_prefix)
+        while True:
+            try:
+                if self._pubsub is None or not self._pubsub.subscribed:
+                    self._subscribed.clear()
+                    await self._subscribed.wait()
+                    continue
+
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_timeout_seconds
+                )
+                if message is None or message.get("type") != "message":
+                    continue
+
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                await self.deliver(channel[prefix_length:], data, self._message_type(data))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket fan-out reader error: {e}", exc_info=True)
+                await asyncio.sleep(self.poll_timeout_seconds)
+
+    @staticmethod
+    def _message_type(data: str) -> Optional[str]:
+        try:
+            return json.loads(data).get("type")
+        except (ValueError, AttributeError):
+            return None
+
+    async def close(self) -> None:
+        """Stop the reader task and close the pub/sub connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
@@ -0,0 +1,180 @@
+"""Bounded outbound queue for a single WebSocket connection."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from fastapi import WebSocket, status
+
+from app.core.metrics import (
+    live_game_websocket_frames_dropped_total,
+    live_game_websocket_send_queue_depth,
+    live_game_websocket_slow_consumer_evictions_total,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionSendQueue:
+    """Buffers outbound frames for one socket and writes them from a task.
+
+    Producers call ``offer``, which never awaits the socket, so broadcasting
+    to a game costs the same whether its spectators read quickly or not.
+    When the queue is full, a frame carrying a coalesce key replaces the
+    queued frame with the same key (e.g. an older ``move_played`` of the
+    same game, where only the latest position matters); other frames are
+    dropped. A client that stays above the high-water mark for longer than
+    the grace period is closed so it stops holding memory.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        connection_id: str,
+        max_size: int = 64,
+        high_water: int = 48,
+        slow_consumer_grace_seconds: float = 5.0,
+    ):
+        """Initialize send queue.
+
+        Args:
+            websocket: Accepted socket to write to
+            connection_id: Connection identifier (for logging)
+            max_size: Maximum number of buffered frames
+            high_water: Depth above which the client counts as slow
+            slow_consumer_grace_seconds: Time allowed above high water before eviction
+        """
+        self.websocket = websocket
+        self.connection_id = connection_id
+        self.max_size = max_size
+        self.high_water = high_water
+        self.slow_consumer_grace_seconds = slow_consumer_grace_seconds
+        self._frames: Deque[List[Optional[str]]] = deque()  # [coalesce_key, data]
+        self._ready = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._close_task: Optional[asyncio.Task] = None
+        self._over_high_water_since: Optional[float] = None
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._frames)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the queue stopped accepting frames."""
+        return self._closed
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._run())
+
+    def offer(self, data: str, coalesce_key: Optional[str] = None) -> bool:
+        """Enqueue a serialized frame without waiting for the socket.
+
+        Args:
+            data: Serialized frame
+            coalesce_key: Frames with the same key supersede each other when full
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        if self._closed:
+            live_game_websocket_frames_dropped_total.labels(reason="closed").inc()
+            return False
+
+        if len(self._frames) >= self.max_size:
+            if not self._coalesce(data, coalesce_key):
+                live_game_websocket_frames_dropped_total.labels(reason="overflow").inc()
+                self._check_slow_consumer()
+                return False
+        else:
+            self._frames.append([coalesce_key, data])
+
+        live_game_websocket_send_queue_depth.observe(len(self._frames))
+        self._ready.set()
+        self._check_slow_consumer()
+        return not self._closed
+
+    def _coalesce(self, data: str, coalesce_key: Optional[str]) -> bool:
+        """Replace a queued frame superseded by ``data``; move it to the tail."""
+        if coalesce_key is None:
+            return False
+        for index, (key, _) in enumerate(self._frames):
+            if key == coalesce_key:
+                del self._frames[index]
+                self._frames.append([coalesce_key, data])
+                live_game_websocket_frames_dropped_total.labels(reason="coalesced").inc()
+                return True
+        return False
+
+    def _check_slow_consumer(self) -> None:
+        """Track time over the high-water mark and evict persistent laggards."""
+        if len(self._frames) <= self.high_water:
+            self._over_high_water_since = None
+            return
+
+        now = time.monotonic()
+        if self._over_high_water_since is None:
+            self._over_high_water_since = now
+        elif now - self._over_high_water_since > self.slow_consumer_grace_seconds:
+            logger.warning(
+                f"Evicting slow WebSocket consumer {self.connection_id} "
+                f"(queue depth {len(self._frames)})"
+            )
+            live_game_websocket_slow_consumer_evictions_total.inc()
+            # Closed now, so offers made before the close task runs cannot evict again
+            self._mark_closed()
+            self._close_task = asyncio.create_task(self.close(code=status.WS_1013_TRY_AGAIN_LATER))
+
+    async def _run(self) -> None:
+        """Writer loop: send queued frames in order."""
+        while True:
+            if not self._frames:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            _, data = self._frames.popleft()
+            if len(self._frames) <= self.high_water:
+                self._over_high_water_since = None
+            try:
+                await self.websocket.send_text(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.info(f"Send to {self.connection_id} failed, closing queue: {e}")
+                self._mark_closed()
+                return
+
+    def _mark_closed(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._frames:
+            live_game_websocket_frames_dropped_total.labels(reason="closed").inc(len(self._frames))
+            self._frames.clear()
+
+    async def close(self, code: Optional[int] = None) -> None:
+        """Stop the writer and drop pending frames.
+
+        Args:
+            code: If set, also close the socket with this close code
+        """
+        self._mark_closed()
+        writer_task = self._writer_task
+        if writer_task is not None and writer_task is not asyncio.current_task():
+            writer_task.cancel()
+            try:
+                await writer_task
+            except asyncio.CancelledError:
+                pass
+        if code is not None:
+            try:
+                await self.websocket.close(code=code)
+            except Exception:
+                pass
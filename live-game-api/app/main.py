@@ -21,6 +21,65 @@ from app.core.tracing import (
 from app.infrastructure.database import database_manager
 from app.api.middleware.rate_limit import RateLimitMiddleware
 from app.api.middleware.metrics import MetricsMiddleware
+from app.api.middleware.shard_routing import ShardRoutingMiddleware
+
+
+async def recover_live_games(
+    state_engine, clock_engine, owns_game=None, bot_move_scheduler=None
+) -> None:
+    """Make in-progress games left by a previous owner resident and start their clocks.
+
+    Each game is restored from its latest snapshot plus the moves played
+    after it. Bot games waiting for the bot get their bot move rescheduled.
+
+    Args:
+        state_engine: Process game state engine
+        clock_engine: Process clock engine
+        owns_game: Optional predicate restricting which games to recover
+        bot_move_scheduler: Optional scheduler for pending bot moves
+    """
+    from app.infrastructure.database import AsyncSessionLocal
+    from app.infrastructure.snapshots.snapshot_service import SnapshotService
+
+    async with AsyncSessionLocal() as session:
+        states = await SnapshotService(session).recover_active_games(owns_game)
+
+    for state in states:
+        state_engine.adopt(state)
+        game = state.game
+        # Without the move tail, the last move time is the row's updated_at
+        last_activity = game.updated_at if state.ply_offset and not game.moves else None
+        clock_engine.start_turn_for(game, last_activity=last_activity)
+        if bot_move_scheduler is not None and game.is_bot_turn():
+            bot_move_scheduler.schedule(game.id, game.bot_id, state.ply)
+
+
+def setup_shard_ownership(
+    lease_manager, state_engine, clock_engine, bot_move_scheduler=None
+) -> None:
+    """Keep resident games and clocks limited to the shards this pod owns."""
+    router = lease_manager.router
+
+    def drop_shards(shards) -> None:
+        for game_id in set(state_engine.game_ids()) | set(clock_engine.game_ids()):
+            if router.get_shard_for_game(game_id) in shards:
+                state_engine.evict(game_id)
+                clock_engine.stop(game_id)
+                if bot_move_scheduler is not None:
+                    bot_move_scheduler.cancel(game_id)
+
+    async def take_over_shards(shards) -> None:
+        # Drop anything left from an earlier ownership period, then recover
+        drop_shards(shards)
+        await recover_live_games(
+            state_engine,
+            clock_engine,
+            lambda game_id: router.get_shard_for_game(game_id) in shards,
+            bot_move_scheduler,
+        )
+
+    lease_manager.on_released = drop_shards
+    lease_manager.on_acquired = take_over_shards
 
 
 @asynccontextmanager
@@ -29,9 +88,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     await database_manager.connect()
 
+    from app.api import dependencies
+
+    settings = get_settings()
+    state_engine = dependencies.get_game_state_engine()
+    clock_engine = dependencies.get_clock_engine()
+    lease_manager = dependencies.get_shard_lease_manager()
+    bot_move_scheduler = dependencies.get_bot_move_scheduler()
+    bot_move_scheduler.start()
+    if settings.SHARD_ENABLED:
+        setup_shard_ownership(lease_manager, state_engine, clock_engine, bot_move_scheduler)
+        lease_manager.start()
+    elif settings.RESIDENT_GAMES_WITHOUT_SHARDING:
+        await recover_live_games(state_engine, clock_engine, bot_move_scheduler=bot_move_scheduler)
+    clock_engine.start()
+
     yield
 
     # Shutdown
+    await bot_move_scheduler.close()
+    await dependencies.get_bot_orchestrator_client().close()
+    await clock_engine.close()
+    if settings.SHARD_ENABLED:
+        await lease_manager.close()
+    if dependencies._websocket_manager_instance is not None:
+        await dependencies._websocket_manager_instance.close()
     await database_manager.disconnect()
 
 
@@ -68,6 +149,12 @@ def create_app() -> FastAPI:
     if settings.RATE_LIMIT_ENABLED:
         app.add_middleware(RateLimitMiddleware)
 
+    # Route per-game requests to the pod owning the game's shard
+    if settings.SHARD_ENABLED:
+        from app.api.dependencies import get_shard_lease_manager
+
+        app.add_middleware(ShardRoutingMiddleware, get_lease_manager=get_shard_lease_manager)
+
     # Initialize observability
     setup_tracing()
     instrument_fastapi(app)
@@ -0,0 +1,38 @@
+"""Add game_snapshots table and (game_id, ply) index on game_moves.
+
+Revision ID: 004_game_snapshots
+Revises: 003_add_bot_support
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "004_game_snapshots"
+down_revision = "003_add_bot_support"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create game_snapshots and index moves by ply for tail replay."""
+    op.create_table(
+        "game_snapshots",
+        sa.Column("game_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("ply", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"]),
+        sa.PrimaryKeyConstraint("game_id"),
+    )
+
+    # Recovery reads only the moves after a snapshot
+    op.create_index("idx_game_moves_game_id_ply", "game_moves", ["game_id", "ply"])
+
+
+def downgrade() -> None:
+    """Drop game_snapshots and the (game_id, ply) index."""
+    op.drop_index("idx_game_moves_game_id_ply", table_name="game_moves")
+    op.drop_table("game_snapshots")
@@ -0,0 +1,25 @@
+"""Store the Zobrist hash of the position after each move.
+
+Revision ID: 005_move_position_hashes
+Revises: 004_game_snapshots
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005_move_position_hashes"
+down_revision = "004_game_snapshots"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add game_moves.position_hash (NULL for moves played before this revision)."""
+    op.add_column("game_moves", sa.Column("position_hash", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop game_moves.position_hash."""
+    op.drop_column("game_moves", "position_hash")
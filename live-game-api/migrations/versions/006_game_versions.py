@@ -0,0 +1,28 @@
+"""Add a version counter to games.
+
+Revision ID: 006_game_versions
+Revises: 005_move_position_hashes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006_game_versions"
+down_revision = "005_move_position_hashes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add games.version (bumped on every persisted change)."""
+    op.add_column(
+        "games",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Drop games.version."""
+    op.drop_column("games", "version")
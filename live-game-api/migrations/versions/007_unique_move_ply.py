@@ -0,0 +1,26 @@
+"""Make (game_id, ply) unique on game_moves.
+
+Revision ID: 007_unique_move_ply
+Revises: 006_game_versions
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "007_unique_move_ply"
+down_revision = "006_game_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the (game_id, ply) index with a unique constraint."""
+    op.drop_index("idx_game_moves_game_id_ply", table_name="game_moves")
+    op.create_unique_constraint("uq_game_moves_game_id_ply", "game_moves", ["game_id", "ply"])
+
+
+def downgrade() -> None:
+    """Restore the non-unique (game_id, ply) index."""
+    op.drop_constraint("uq_game_moves_game_id_ply", "game_moves", type_="unique")
+    op.create_index("idx_game_moves_game_id_ply", "game_moves", ["game_id", "ply"])
@@ -0,0 +1,153 @@
+"""Integration tests for the SQLAlchemy game repository."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import MoveConflictError
+from app.domain.models.game import EndReason, Game, GameResult, GameStatus, TimeControl
+from app.domain.services.game_state_engine import GameStateEngine
+from app.infrastructure.database.repository import GameRepository
+
+
+async def _create_started_game(repository: GameRepository) -> Game:
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(initial_seconds=300, increment_seconds=0),
+        white_clock_ms=300000,
+        black_clock_ms=300000,
+    )
+    game.white_account_id = creator_id
+    game.black_account_id = uuid4()
+    game.start_game()
+    return await repository.create(game)
+
+
+@pytest.mark.asyncio
+async def test_append_move_persists_move_and_columns(db_session):
+    """append_move inserts one move row and updates the game columns."""
+    repository = GameRepository(db_session)
+    engine = GameStateEngine()
+    state = engine.put(await _create_started_game(repository))
+
+    for color, from_sq, to_sq in [("w", "e2", "e4"), ("b", "e7", "e5")]:
+        applied = engine.apply_move(state, color=color, from_square=from_sq, to_square=to_sq)
+        stored = await repository.append_move(state.game.id, applied.move, applied.game_columns)
+        assert stored["fen"] == state.game.fen
+        assert stored["side_to_move"] == state.game.side_to_move
+
+    reloaded = await repository.get_by_id(state.game.id)
+    assert [m.san for m in reloaded.moves] == ["e4", "e5"]
+    assert reloaded.fen == state.game.fen
+    assert reloaded.status == GameStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_append_move_rejects_stale_writer(db_session):
+    """A move for the side not to move is rejected without being stored."""
+    repository = GameRepository(db_session)
+    engine = GameStateEngine()
+    game = await _create_started_game(repository)
+    state = engine.put(game)
+    stale = GameStateEngine().put(game.model_copy(deep=True))
+
+    applied = engine.apply_move(state, color="w", from_square="d2", to_square="d4")
+    await repository.append_move(game.id, applied.move, applied.game_columns)
+
+    duplicate = GameStateEngine().apply_move(stale, color="w", from_square="c2", to_square="c4")
+    with pytest.raises(MoveConflictError):
+        await repository.append_move(game.id, duplicate.move, duplicate.game_columns)
+
+    reloaded = await repository.get_by_id(game.id)
+    assert [m.san for m in reloaded.moves] == ["d4"]
+
+
+@pytest.mark.asyncio
+async def test_append_move_rejects_writer_two_plies_behind(db_session):
+    """A writer whose side is to move again, two plies later, is still rejected."""
+    repository = GameRepository(db_session)
+    engine = GameStateEngine()
+    game = await _create_started_game(repository)
+    state = engine.put(game)
+    stale = GameStateEngine().put(game.model_copy(deep=True))
+
+    for color, from_sq, to_sq in [("w", "e2", "e4"), ("b", "e7", "e5")]:
+        applied = engine.apply_move(state, color=color, from_square=from_sq, to_square=to_sq)
+        await repository.append_move(game.id, applied.move, applied.game_columns)
+
+    behind = GameStateEngine().apply_move(stale, color="w", from_square="d2", to_square="d4")
+    with pytest.raises(MoveConflictError):
+        await repository.append_move(game.id, behind.move, behind.game_columns)
+
+    reloaded = await repository.get_by_id(game.id)
+    assert [m.san for m in reloaded.moves] == ["e4", "e5"]
+    assert reloaded.version == 2
+
+
+@pytest.mark.asyncio
+async def test_update_reconciles_moves_by_ply(db_session):
+    """update keeps stored moves, drops taken-back plies and adds new ones."""
+    repository = GameRepository(db_session)
+    engine = GameStateEngine()
+    state = engine.put(await _create_started_game(repository))
+
+    for color, from_sq, to_sq in [("w", "e2", "e4"), ("b", "e7", "e5")]:
+        applied = engine.apply_move(state, color=color, from_square=from_sq, to_square=to_sq)
+        await repository.append_move(state.game.id, applied.move, applied.game_columns)
+
+    game = await repository.get_by_id(state.game.id)
+    game.moves.pop()
+    game.fen = game.moves[-1].fen_after
+    game.side_to_move = "b"
+    saved = await repository.update(game)
+    assert [m.san for m in saved.moves] == ["e4"]
+
+    replayed = GameStateEngine().put(saved.model_copy(deep=True))
+    applied = GameStateEngine().apply_move(replayed, color="b", from_square="c7", to_square="c5")
+    saved.moves.append(applied.move)
+    saved = await repository.update(saved)
+    assert [m.san for m in saved.moves] == ["e4", "c5"]
+
+
+@pytest.mark.asyncio
+async def test_update_rejects_stale_game_and_keeps_newer_moves(db_session):
+    """A resign written from a game loaded before a move neither ends it nor drops the move."""
+    repository = GameRepository(db_session)
+    engine = GameStateEngine()
+    state = engine.put(await _create_started_game(repository))
+    stale = await repository.get_by_id(state.game.id)
+
+    applied = engine.apply_move(state, color="w", from_square="e2", to_square="e4")
+    await repository.append_move(state.game.id, applied.move, applied.game_columns)
+
+    stale.end_game(GameResult.BLACK_WIN, EndReason.RESIGNATION)
+    with pytest.raises(MoveConflictError):
+        await repository.update(stale)
+
+    reloaded = await repository.get_by_id(state.game.id)
+    assert [m.san for m in reloaded.moves] == ["e4"]
+    assert reloaded.status == GameStatus.IN_PROGRESS
+    assert reloaded.version == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_takeback_does_not_delete_newer_move(db_session):
+    """The version guard runs before the ply reconcile, so a stale takeback deletes nothing."""
+    repository = GameRepository(db_session)
+    engine = GameStateEngine()
+    state = engine.put(await _create_started_game(repository))
+    applied = engine.apply_move(state, color="w", from_square="e2", to_square="e4")
+    await repository.append_move(state.game.id, applied.move, applied.game_columns)
+    stale = await repository.get_by_id(state.game.id)
+
+    applied = engine.apply_move(state, color="b", from_square="e7", to_square="e5")
+    await repository.append_move(state.game.id, applied.move, applied.game_columns)
+
+    stale.moves.pop()
+    stale.side_to_move = "w"
+    with pytest.raises(MoveConflictError):
+        await repository.update(stale)
+
+    reloaded = await repository.get_by_id(state.game.id)
+    assert [m.san for m in reloaded.moves] == ["e4", "e5"]
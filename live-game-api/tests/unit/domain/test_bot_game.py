@@ -1,8 +1,11 @@
 """Unit tests for bot game functionality."""
+import asyncio
+
 import pytest
 from uuid import UUID, uuid4
 from unittest.mock import AsyncMock, MagicMock
 
+from app.core.exceptions import GameStateError
 from app.domain.models.game import Game, GameStatus, TimeControl
 from app.domain.models.decision_reason import DecisionReason
 from app.domain.services.game_service import GameService
@@ -105,7 +108,7 @@ async def test_play_bot_move(game_service, mock_repository, mock_bot_client):
     game.white_account_id = creator_id
     
     mock_repository.get_by_id = AsyncMock(return_value=game)
-    mock_repository.update = AsyncMock(return_value=game)
+    mock_repository.append_move = AsyncMock(return_value=None)
     
     # Mock bot move response
     bot_response = MoveResponse(
@@ -121,7 +124,7 @@ async def test_play_bot_move(game_service, mock_repository, mock_bot_client):
     
     # Verify bot move was called
     assert mock_bot_client.get_bot_move.called
-    assert mock_repository.update.called
+    assert mock_repository.append_move.called
 
 
 @pytest.mark.asyncio
@@ -148,3 +151,73 @@ async def test_play_bot_move_not_bot_turn(game_service, mock_repository):
     with pytest.raises(Exception):  # GameStateError
         await game_service.play_bot_move(game_id)
 
+
+
+@pytest.mark.asyncio
+async def test_human_move_schedules_bot_move_in_background(mock_repository, mock_bot_client):
+    """With a scheduler, the human move returns before the bot is asked to move."""
+    from app.domain.services.bot_move_scheduler import BotMoveScheduler
+
+    human_id = uuid4()
+    game = Game(
+        creator_account_id=human_id,
+        time_control=TimeControl(initial_seconds=300, increment_seconds=0),
+        white_clock_ms=300000,
+        black_clock_ms=300000,
+        bot_id="bot-medium-1200",
+        bot_color="b",
+        rated=False,
+    )
+    game.white_account_id = human_id
+    game.start_game()
+    mock_repository.get_by_id = AsyncMock(return_value=game)
+    scheduler = BotMoveScheduler(on_bot_move=AsyncMock())
+    service = GameService(
+        mock_repository,
+        bot_orchestrator_client=mock_bot_client,
+        bot_move_scheduler=scheduler,
+    )
+
+    result = await service.play_move(game.id, human_id, "e2", "e4")
+
+    assert len(result.moves) == 1
+    assert result.side_to_move == "b"
+    assert scheduler.is_pending(game.id)
+    mock_bot_client.get_bot_move.assert_not_awaited()
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_bot_move_load_does_not_replace_state_of_concurrent_move(
+    game_service, mock_repository, mock_bot_client
+):
+    """A bot move loading the game on a miss waits for the lock of a running move."""
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(initial_seconds=300, increment_seconds=0),
+        white_clock_ms=300000,
+        black_clock_ms=300000,
+        bot_id="bot-medium-1200",
+        bot_color="b",
+    )
+    game.white_account_id = creator_id
+    game.start_game()
+    first_read = asyncio.Event()
+
+    async def get_by_id(game_id):
+        if not first_read.is_set():
+            first_read.set()
+            await asyncio.sleep(0.05)  # The bot's read is slow
+        return game.model_copy(deep=True)
+
+    mock_repository.get_by_id = AsyncMock(side_effect=get_by_id)
+    game_service.bot_move_scheduler = MagicMock()
+    bot_task = asyncio.create_task(game_service.play_bot_move(game.id))
+    await first_read.wait()
+    await game_service.play_move(game.id, creator_id, "e2", "e4")
+
+    with pytest.raises(GameStateError):
+        await bot_task  # Still the human's turn when the bot read the game
+    assert game_service.state_engine.get(game.id).ply == 1
+    game_service.bot_move_scheduler.schedule.assert_called_once_with(game.id, game.bot_id, 1)
@@ -0,0 +1,122 @@
+"""Unit tests for the background bot move scheduler."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.domain.services.bot_move_scheduler import BotMoveScheduler
+
+
+class BlockingBot:
+    """Bot move handler that thinks until released."""
+
+    def __init__(self):
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, game_id):
+        self.started.append(game_id)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(game_id)
+            raise
+        self.finished.append(game_id)
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest_asyncio.fixture
+async def bot():
+    return BlockingBot()
+
+
+@pytest_asyncio.fixture
+async def scheduler(bot):
+    scheduler = BotMoveScheduler(on_bot_move=bot, workers=4, per_bot_concurrency=1)
+    scheduler.start()
+    yield scheduler
+    await scheduler.close()
+
+
+class TestBotMoveScheduler:
+    """Test bot move scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_returns_before_the_bot_moves(self, scheduler, bot):
+        """Scheduling only queues the job; a worker plays it in the background."""
+        game_id = uuid4()
+
+        assert scheduler.schedule(game_id, "bot-a", ply=1)
+        assert bot.started == []
+
+        await _settle()
+        assert bot.started == [game_id]
+        bot.release.set()
+        await _settle()
+        assert bot.finished == [game_id]
+        assert not scheduler.is_pending(game_id)
+
+    @pytest.mark.asyncio
+    async def test_per_bot_concurrency_limit(self, scheduler, bot):
+        """A saturated bot waits without blocking other bots."""
+        first, second, other = uuid4(), uuid4(), uuid4()
+        scheduler.schedule(first, "bot-a", ply=1)
+        scheduler.schedule(second, "bot-a", ply=1)
+        scheduler.schedule(other, "bot-b", ply=1)
+
+        await _settle()
+        assert bot.started == [first, other]
+
+        bot.release.set()
+        await _settle()
+        assert bot.started == [first, other, second]
+        assert set(bot.finished) == {first, second, other}
+        assert len(scheduler) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_queued_jobs(self, scheduler, bot):
+        """Cancelling stops a thinking bot and drops a queued job."""
+        running, queued = uuid4(), uuid4()
+        scheduler.schedule(running, "bot-a", ply=1)
+        scheduler.schedule(queued, "bot-a", ply=1)
+        await _settle()
+
+        assert scheduler.cancel(running)
+        assert scheduler.cancel(queued)
+        assert not scheduler.cancel(queued)
+        await _settle()
+
+        assert bot.cancelled == [running]
+        assert queued not in bot.started
+        assert len(scheduler) == 0
+
+    @pytest.mark.asyncio
+    async def test_one_job_per_game(self, scheduler, bot):
+        """Re-scheduling the same position is a no-op; a new position replaces it."""
+        game_id = uuid4()
+        scheduler.schedule(game_id, "bot-a", ply=1)
+        scheduler.schedule(game_id, "bot-a", ply=1)
+        await _settle()
+        assert bot.started == [game_id]
+
+        scheduler.schedule(game_id, "bot-a", ply=3)
+        await _settle()
+        assert bot.cancelled == [game_id]
+        assert bot.started == [game_id, game_id]
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_full(self, bot):
+        """Scheduling fails once max_pending games are waiting."""
+        scheduler = BotMoveScheduler(on_bot_move=bot, max_pending=1)
+
+        assert scheduler.schedule(uuid4(), "bot-a", ply=1)
+        assert not scheduler.schedule(uuid4(), "bot-a", ply=1)
+        await scheduler.close()
@@ -0,0 +1,224 @@
+"""Unit tests for server-side clocks and the timer wheel."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+
+from app.domain.models.game import EndReason, Game, GameResult, TimeControl
+from app.domain.services.clock_engine import ClockEngine
+from app.domain.services.game_service import GameService
+from app.domain.services.game_state_engine import GameStateEngine
+from app.domain.services.timer_wheel import TimerWheel
+from app.infrastructure.sharding.shard_lease_manager import ShardLeaseManager
+from app.infrastructure.sharding.shard_router import ShardRouter
+
+
+def _in_progress_game(initial_seconds: int = 60, increment_seconds: int = 0) -> Game:
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(
+            initial_seconds=initial_seconds, increment_seconds=increment_seconds
+        ),
+        white_clock_ms=initial_seconds * 1000,
+        black_clock_ms=initial_seconds * 1000,
+    )
+    game.white_account_id = creator_id
+    game.black_account_id = uuid4()
+    game.start_game()
+    return game
+
+
+class TestTimerWheel:
+    """Test hierarchical timer wheel scheduling."""
+
+    def test_fires_at_deadline_across_levels(self):
+        """Timers beyond the first level cascade down and fire on time."""
+        wheel = TimerWheel(level_bits=(4, 4, 4))
+        for deadline in (3, 16, 17, 300, 4000):
+            wheel.schedule(deadline, deadline)
+
+        fired = {tick: wheel.advance(tick) for tick in range(1, 4001)}
+
+        assert {tick: keys for tick, keys in fired.items() if keys} == {
+            3: [3],
+            16: [16],
+            17: [17],
+            300: [300],
+            4000: [4000],
+        }
+        assert len(wheel) == 0
+
+    def test_cancel_and_reschedule(self):
+        wheel = TimerWheel()
+        wheel.schedule("a", 10)
+        wheel.schedule("b", 10)
+        assert wheel.cancel("a")
+        wheel.schedule("b", 20)
+
+        assert wheel.advance(15) == []
+        assert wheel.advance(20) == ["b"]
+        assert not wheel.cancel("a")
+
+    def test_past_deadline_fires_on_next_tick(self):
+        wheel = TimerWheel(start_tick=100)
+        wheel.schedule("late", 50)
+
+        assert wheel.advance(101) == ["late"]
+
+
+class TestClockEngine:
+    """Test clock accounting and flag-fall detection."""
+
+    def test_elapsed_and_flag_use_monotonic_time(self):
+        clocks = ClockEngine(tick_ms=100)
+        game_id = uuid4()
+        start = float(int(time.monotonic()) + 1)
+        clocks.start_turn(game_id, "w", remaining_ms=1000, now=start)
+
+        assert clocks.elapsed_ms(game_id, now=start + 0.4) == 400
+        assert not clocks.has_flagged(game_id, now=start + 0.9)
+        assert clocks.expire(now=start + 0.9) == []
+        assert clocks.has_flagged(game_id, now=start + 1.0)
+        assert clocks.expire(now=start + 1.0) == [game_id]
+
+    def test_stop_cancels_deadline(self):
+        clocks = ClockEngine(tick_ms=100)
+        game_id = uuid4()
+        now = time.monotonic()
+        clocks.start_turn(game_id, "w", remaining_ms=500, now=now)
+        clocks.stop(game_id)
+
+        assert clocks.expire(now=now + 10) == []
+        assert len(clocks) == 0
+
+    def test_apply_move_charges_elapsed_time_and_increment(self):
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game(initial_seconds=60, increment_seconds=2))
+
+        applied = engine.apply_move(
+            state, color="w", from_square="e2", to_square="e4", elapsed_ms=5000
+        )
+
+        assert state.game.white_clock_ms == 60000 - 5000 + 2000
+        assert applied.game_columns["white_clock_ms"] == 57000
+        assert state.game.black_clock_ms == 60000
+
+
+@pytest.mark.asyncio
+async def test_flag_fall_ends_game_on_time():
+    """An expired clock ends the game with a win for the opponent."""
+    game = _in_progress_game(initial_seconds=1)
+    repository = AsyncMock()
+    repository.get_by_id = AsyncMock(return_value=game)
+    repository.update = AsyncMock(side_effect=lambda g: g)
+    clocks = ClockEngine(tick_ms=100)
+    clocks.start_turn(game.id, "w", remaining_ms=1000, already_elapsed_ms=1500)
+    service = GameService(repository, bot_orchestrator_client=AsyncMock(), clock_engine=clocks)
+
+    ended = await service.handle_flag_fall(game.id)
+
+    assert ended.result == GameResult.BLACK_WIN
+    assert ended.end_reason == EndReason.TIMEOUT
+    assert ended.white_clock_ms == 0
+    assert not clocks.is_running(game.id)
+
+
+@pytest.mark.asyncio
+async def test_flag_fall_is_ignored_when_time_remains():
+    game = _in_progress_game(initial_seconds=60)
+    repository = AsyncMock()
+    repository.get_by_id = AsyncMock(return_value=game)
+    clocks = ClockEngine(tick_ms=100)
+    clocks.start_turn(game.id, "w", remaining_ms=60000)
+    service = GameService(repository, bot_orchestrator_client=AsyncMock(), clock_engine=clocks)
+
+    assert await service.handle_flag_fall(game.id) is None
+    repository.update.assert_not_called()
+    assert clocks.is_running(game.id)
+
+
+@pytest.mark.asyncio
+async def test_non_owner_plays_moves_without_resident_state_or_clock():
+    """A process that does not own the game keeps no state and runs no clock."""
+    game = _in_progress_game(initial_seconds=60)
+    repository = AsyncMock()
+    repository.get_by_id = AsyncMock(side_effect=lambda game_id: game.model_copy(deep=True))
+    clocks = ClockEngine(tick_ms=100)
+    service = GameService(
+        repository,
+        bot_orchestrator_client=AsyncMock(),
+        clock_engine=clocks,
+        owns_game=lambda game_id: False,
+    )
+
+    saved = await service.play_move(game.id, game.white_account_id, "e2", "e4")
+
+    assert [move.san for move in saved.moves] == ["e4"]
+    repository.append_move.assert_awaited_once()
+    assert service.state_engine.get(game.id) is None
+    assert not clocks.is_running(game.id)
+
+
+@pytest.mark.asyncio
+async def test_non_owner_detects_flag_from_persisted_game():
+    """Without a local clock, the flag is measured from the last activity."""
+    game = _in_progress_game(initial_seconds=1)
+    game.started_at = game.started_at.replace(year=game.started_at.year - 1)
+    repository = AsyncMock()
+    repository.get_by_id = AsyncMock(return_value=game)
+    repository.update = AsyncMock(side_effect=lambda g: g)
+    service = GameService(
+        repository, bot_orchestrator_client=AsyncMock(), owns_game=lambda game_id: False
+    )
+
+    ended = await service.handle_flag_fall(game.id)
+
+    assert ended.result == GameResult.BLACK_WIN
+    assert ended.end_reason == EndReason.TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_abandoned_game_times_out_with_default_settings():
+    """With the default shard leases the pod owns the game and its flag timer fires."""
+    lease_manager = ShardLeaseManager(
+        ShardRouter(),
+        pod_id="pod-0",
+        pod_address="http://pod-0",
+        redis_client=aioredis.FakeRedis(decode_responses=True),
+    )
+    await lease_manager.refresh()
+    game = _in_progress_game(initial_seconds=60)
+    game.black_clock_ms = 200
+    stored = {"game": game}
+    repository = AsyncMock()
+    repository.get_by_id = AsyncMock(
+        side_effect=lambda game_id: stored["game"].model_copy(deep=True)
+    )
+    repository.update = AsyncMock(side_effect=lambda g: g)
+    clocks = ClockEngine(tick_ms=20)
+    service = GameService(
+        repository,
+        bot_orchestrator_client=AsyncMock(),
+        clock_engine=clocks,
+        owns_game=lease_manager.owns_game,
+    )
+    clocks.on_flag = service.handle_flag_fall
+    clocks.start()
+    try:
+        stored["game"] = await service.play_move(game.id, game.white_account_id, "e2", "e4")
+        # Black never moves again
+        for _ in range(50):
+            await asyncio.sleep(0.02)
+            if repository.update.await_count:
+                break
+    finally:
+        await clocks.close()
+
+    ended = repository.update.await_args.args[0]
+    assert ended.result == GameResult.WHITE_WIN
+    assert ended.end_reason == EndReason.TIMEOUT
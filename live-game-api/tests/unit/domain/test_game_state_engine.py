@@ -0,0 +1,201 @@
+"""Unit tests for the in-memory game state engine."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import InvalidMoveError
+from app.domain.models.game import EndReason, Game, GameStatus, TimeControl
+from app.domain.services.game_service import GameService
+from app.domain.services.game_state_engine import GameStateEngine
+
+KNIGHT_SHUFFLE = [("g1", "f3"), ("g8", "f6"), ("f3", "g1"), ("f6", "g8")] * 2
+
+
+def _in_progress_game() -> Game:
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(initial_seconds=180, increment_seconds=2),
+        white_clock_ms=180000,
+        black_clock_ms=180000,
+    )
+    game.white_account_id = creator_id
+    game.black_account_id = uuid4()
+    game.start_game()
+    return game
+
+
+def _play(engine: GameStateEngine, state, moves) -> None:
+    for from_square, to_square in moves:
+        engine.apply_move(
+            state, color=state.game.side_to_move, from_square=from_square, to_square=to_square
+        )
+
+
+class TestGameStateEngine:
+    """Test resident game state handling."""
+
+    def test_put_only_keeps_in_progress_games(self):
+        """Waiting games are not made resident."""
+        engine = GameStateEngine()
+        game = _in_progress_game()
+        game.status = GameStatus.WAITING_FOR_OPPONENT
+
+        assert engine.put(game) is None
+        assert engine.get(game.id) is None
+
+    def test_apply_move_updates_state_and_returns_delta(self):
+        """Applying a move mutates the resident game and reports changed columns."""
+        engine = GameStateEngine()
+        game = _in_progress_game()
+        state = engine.put(game)
+
+        applied = engine.apply_move(state, color="w", from_square="e2", to_square="e4")
+
+        assert applied.move.ply == 1
+        assert applied.move.san == "e4"
+        assert applied.move_result == "valid"
+        assert state.game.side_to_move == "b"
+        assert len(state.board.move_stack) == 1
+        assert applied.game_columns["fen"] == state.board.fen()
+        assert applied.game_columns["side_to_move"] == "b"
+
+    def test_illegal_move_leaves_state_untouched(self):
+        """A rejected move does not mutate the resident game."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        fen_before = state.game.fen
+
+        with pytest.raises(InvalidMoveError):
+            engine.apply_move(state, color="w", from_square="e2", to_square="e5")
+
+        assert state.game.fen == fen_before
+        assert state.game.moves == []
+        assert state.board.move_stack == []
+
+    def test_board_is_rebuilt_from_stored_hashes(self, monkeypatch):
+        """Loading a game uses the FEN and stored position hashes, not a replay."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        _play(engine, state, KNIGHT_SHUFFLE[:3])
+
+        monkeypatch.setattr(
+            GameStateEngine, "_replay_board", staticmethod(lambda game: pytest.fail("replayed"))
+        )
+        reloaded = GameStateEngine().put(state.snapshot())
+
+        assert reloaded.board.fen() == state.game.fen
+        assert reloaded.position_hashes == state.position_hashes
+
+    def test_threefold_repetition_survives_reload(self):
+        """Repetitions counted before a reload still count after it."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        _play(engine, state, KNIGHT_SHUFFLE[:7])
+        assert state.repetition_count() == 2  # Knights out, for the second time
+
+        reloaded = GameStateEngine().put(state.snapshot())
+        applied = engine.apply_move(reloaded, color="b", from_square="f6", to_square="g8")
+
+        assert applied.move_result == "draw"
+        assert reloaded.game.end_reason == EndReason.THREEFOLD_REPETITION
+
+    def test_takeback_removes_position_from_history(self):
+        """A game reloaded after a takeback no longer counts the undone position."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        _play(engine, state, KNIGHT_SHUFFLE[:4])
+        assert state.repetition_count() == 2  # Start position again
+
+        game = state.snapshot()
+        game.moves.pop()
+        game.fen = game.moves[-1].fen_after
+        game.side_to_move = "b"
+        reloaded = GameStateEngine().put(game)
+
+        assert reloaded.repetition_count() == 1
+        engine.apply_move(reloaded, color="b", from_square="f6", to_square="g8")
+        assert reloaded.repetition_count() == 2
+
+    def test_custom_starting_position_counts_as_first_occurrence(self):
+        """Repetitions of a custom starting position (black to move) are detected."""
+        fen = "4k3/8/8/8/8/8/8/R3K3 b - - 0 1"
+        game = _in_progress_game()
+        game.starting_fen = game.fen = fen
+        game.start_game()
+        engine = GameStateEngine()
+        state = engine.put(game)
+        moves = [("e8", "d7"), ("e1", "d1"), ("d7", "e8"), ("d1", "e1")] * 2
+        _play(engine, state, moves[:7])
+
+        reloaded = GameStateEngine().put(state.snapshot())
+        applied = engine.apply_move(reloaded, color="w", from_square="d1", to_square="e1")
+
+        assert reloaded.game.moves[0].color == "b"
+        assert applied.move_result == "draw"
+        assert reloaded.game.end_reason == EndReason.THREEFOLD_REPETITION
+
+    def test_moves_without_hashes_are_replayed(self):
+        """Games stored before position hashes existed are rebuilt by replay."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        _play(engine, state, KNIGHT_SHUFFLE[:3])
+        game = state.snapshot()
+        game.moves = [move.model_copy(update={"position_hash": None}) for move in game.moves]
+
+        reloaded = GameStateEngine().put(game)
+
+        assert reloaded.position_hashes == state.position_hashes
+
+    def test_checkmate_ends_game(self):
+        """Fool's mate ends the game with a black win."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        moves = [("w", "f2", "f3"), ("b", "e7", "e5"), ("w", "g2", "g4"), ("b", "d8", "h4")]
+        for color, from_sq, to_sq in moves:
+            applied = engine.apply_move(state, color=color, from_square=from_sq, to_square=to_sq)
+
+        assert applied.move_result == "checkmate"
+        assert state.game.is_ended()
+        assert applied.game_columns["status"] == GameStatus.ENDED
+
+    def test_snapshot_is_isolated_from_later_moves(self):
+        """Snapshots returned to callers do not see subsequent moves."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        snapshot = state.snapshot()
+
+        engine.apply_move(state, color="w", from_square="d2", to_square="d4")
+
+        assert snapshot.moves == []
+        assert len(state.game.moves) == 1
+
+    def test_capacity_evicts_least_recently_used(self):
+        """Resident games are bounded with LRU eviction."""
+        engine = GameStateEngine(max_resident_games=2)
+        first, second, third = (_in_progress_game() for _ in range(3))
+        engine.put(first)
+        engine.put(second)
+        engine.get(first.id)
+        engine.put(third)
+
+        assert engine.get(first.id) is not None
+        assert engine.get(second.id) is None
+        assert len(engine) == 2
+
+
+@pytest.mark.asyncio
+async def test_service_keeps_games_in_the_shared_engine():
+    """An empty process-wide engine is used, not replaced by a per-service one."""
+    engine = GameStateEngine()
+    game = _in_progress_game()
+    repository = AsyncMock()
+    repository.get_by_id = AsyncMock(side_effect=lambda game_id: game.model_copy(deep=True))
+    service = GameService(repository, bot_orchestrator_client=AsyncMock(), state_engine=engine)
+
+    await service.play_move(game.id, game.white_account_id, "e2", "e4")
+
+    assert service.state_engine is engine
+    assert engine.get(game.id).ply == 1
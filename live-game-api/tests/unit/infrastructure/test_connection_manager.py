@@ -0,0 +1,111 @@
+"""Unit tests for WebSocket connection bookkeeping."""
+
+from typing import Dict, List, Set, Tuple
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.core.metrics import live_game_websocket_connections
+from app.infrastructure.websocket.connection_manager import WebSocketConnectionManager
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis"):
+        self.client = client
+        self.commands: List[Tuple] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+    def sadd(self, key: str, *members: str) -> None:
+        self.commands.append(("sadd", key, members))
+
+    def srem(self, key: str, *members: str) -> None:
+        self.commands.append(("srem", key, members))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.commands.append(("expire", key, seconds))
+
+    def delete(self, key: str) -> None:
+        self.commands.append(("delete", key))
+
+    async def execute(self) -> list:
+        self.client.round_trips += 1
+        for command in self.commands:
+            name, key = command[0], command[1]
+            if name == "sadd":
+                self.client.sets.setdefault(key, set()).update(command[2])
+            elif name == "srem":
+                self.client.sets.get(key, set()).difference_update(command[2])
+            elif name == "delete":
+                self.client.sets.pop(key, None)
+        return []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.sets: Dict[str, Set[str]] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def smembers(self, key: str) -> Set[str]:
+        self.round_trips += 1
+        return set(self.sets.get(key, set()))
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = WebSocketConnectionManager(redis_client=FakeRedis())
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_and_disconnect_are_one_round_trip_each(manager):
+    game_id = uuid4()
+    gauge_before = live_game_websocket_connections._value.get()
+
+    await manager.connect("c1", game_id)
+    assert manager.redis_client.round_trips == 1
+    assert manager.redis_client.sets[f"ws:game:{game_id}:subscribers"] == {"c1"}
+    assert live_game_websocket_connections._value.get() == gauge_before + 1
+
+    await manager.disconnect("c1")
+    assert manager.redis_client.round_trips == 2
+    assert manager.redis_client.sets[f"ws:game:{game_id}:subscribers"] == set()
+    assert "ws:conn:c1" not in manager.redis_client.sets
+    assert live_game_websocket_connections._value.get() == gauge_before
+
+
+@pytest.mark.asyncio
+async def test_subscriber_lookups_are_served_from_local_snapshot(manager):
+    game_id = uuid4()
+    manager.redis_client.sets[f"ws:game:{game_id}:subscribers"] = {"remote"}
+    await manager.connect("local", game_id)
+    round_trips = manager.redis_client.round_trips
+
+    for _ in range(5):
+        assert await manager.get_subscribers(game_id) == {"local", "remote"}
+
+    assert manager.redis_client.round_trips == round_trips + 1
+
+
+@pytest.mark.asyncio
+async def test_reconcile_restores_lost_entries(manager):
+    game_id = uuid4()
+    await manager.connect("c1", game_id)
+    manager.redis_client.sets.clear()
+
+    await manager.reconcile()
+
+    assert manager.redis_client.sets[f"ws:game:{game_id}:subscribers"] == {"c1"}
+    assert manager.redis_client.sets["ws:conn:c1"] == {str(game_id)}
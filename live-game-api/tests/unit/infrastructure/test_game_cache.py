@@ -0,0 +1,142 @@
+"""Unit tests for game cache serialization and the cached repository."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+
+from app.domain.models.game import Game, GameStatus, TimeControl
+from app.domain.services.game_state_engine import GameStateEngine
+from app.infrastructure.cache.cached_game_repository import CachedGameRepository
+from app.infrastructure.cache.game_cache import GameCache
+from app.infrastructure.cache.game_codec import GameCodecError, decode_game, encode_game
+
+
+def _game_with_moves() -> Game:
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(initial_seconds=300, increment_seconds=3),
+        white_clock_ms=300000,
+        black_clock_ms=300000,
+    )
+    game.white_account_id = creator_id
+    game.black_account_id = uuid4()
+    game.start_game()
+    engine = GameStateEngine()
+    state = engine.put(game)
+    for color, from_sq, to_sq in [("w", "e2", "e4"), ("b", "c7", "c5"), ("w", "g1", "f3")]:
+        engine.apply_move(state, color=color, from_square=from_sq, to_square=to_sq)
+    return state.game
+
+
+class TestGameCodec:
+    """Test compact game serialization."""
+
+    def test_round_trip(self):
+        """Decoding an encoded game yields an equal game."""
+        game = _game_with_moves()
+
+        decoded = decode_game(encode_game(game))
+
+        assert decoded.model_dump() == game.model_dump()
+        assert decoded.is_in_progress()
+
+    def test_smaller_than_model_dump(self):
+        """The compact form is smaller than the pydantic JSON dump."""
+        game = _game_with_moves()
+
+        assert len(encode_game(game)) < len(game.model_dump_json())
+
+    def test_rejects_legacy_payload(self):
+        """Entries written in the old dict format are reported as malformed."""
+        game = _game_with_moves()
+
+        with pytest.raises(GameCodecError):
+            decode_game(game.model_dump_json())
+
+
+class TestCachedGameRepository:
+    """Test read-through/write-through behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_repository(self):
+        game = _game_with_moves()
+        repository = AsyncMock()
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=game)
+
+        result = await CachedGameRepository(repository, cache).get_by_id(game.id)
+
+        assert result is game
+        repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_reads_through(self):
+        game = _game_with_moves()
+        repository = AsyncMock()
+        repository.get_by_id = AsyncMock(return_value=game)
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
+
+        result = await CachedGameRepository(repository, cache).get_by_id(game.id)
+
+        assert result is game
+        cache.set.assert_awaited_once_with(game)
+
+    @pytest.mark.asyncio
+    async def test_append_move_invalidates(self):
+        game = _game_with_moves()
+        repository = AsyncMock()
+        cache = AsyncMock()
+
+        await CachedGameRepository(repository, cache).append_move(
+            game.id, game.moves[-1], {"version": game.version}
+        )
+
+        cache.invalidate.assert_awaited_once_with(game.id, game.version)
+
+    @pytest.mark.asyncio
+    async def test_ended_game_is_not_cached(self):
+        game = _game_with_moves()
+        game.status = GameStatus.ENDED
+        repository = AsyncMock()
+        repository.update = AsyncMock(return_value=game)
+        cache = AsyncMock()
+
+        await CachedGameRepository(repository, cache).update(game)
+
+        cache.set.assert_not_called()
+        cache.delete.assert_awaited_with(game.id)
+
+
+class TestGameCacheVersions:
+    """Test that the cache never goes back to an older game version."""
+
+    @pytest.mark.asyncio
+    async def test_fill_older_than_invalidation_is_refused(self):
+        """A read that started before a move cannot cache the pre-move game."""
+        cache = GameCache(aioredis.FakeRedis())
+        game = _game_with_moves()
+        stale = game.model_copy(deep=True)
+
+        # A move is persisted while a reader still holds the previous version
+        await cache.invalidate(game.id, game.version + 1)
+        await cache.set(stale)
+        assert await cache.get(game.id) is None
+
+        game.version += 1
+        await cache.set(game)
+        assert (await cache.get(game.id)).version == game.version
+
+    @pytest.mark.asyncio
+    async def test_older_version_does_not_overwrite_newer(self):
+        cache = GameCache(aioredis.FakeRedis())
+        game = _game_with_moves()
+        newer = game.model_copy(update={"version": game.version + 2})
+
+        await cache.set(newer)
+        await cache.set(game)
+
+        assert (await cache.get(game.id)).version == newer.version
@@ -0,0 +1,97 @@
+"""Unit tests for game versions, ETags and ply cursors."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.api.routes.v1.games import _etag_matches, _game_etag, _to_game_response
+from app.domain.models.game import Game, TimeControl
+from app.domain.services.game_service import GameService
+from app.domain.services.game_state_engine import GameStateEngine
+from app.infrastructure.database.repository import GameRepository
+
+
+def _in_progress_game() -> Game:
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(initial_seconds=180, increment_seconds=2),
+        white_clock_ms=180000,
+        black_clock_ms=180000,
+    )
+    game.white_account_id = creator_id
+    game.black_account_id = uuid4()
+    game.start_game()
+    return game
+
+
+class TestGameVersions:
+    """Test that every persisted change bumps the game's version."""
+
+    @pytest.mark.asyncio
+    async def test_moves_and_updates_bump_the_version(self, db_session):
+        """append_move and update both advance the stored version."""
+        repository = GameRepository(db_session)
+        game = await repository.create(_in_progress_game())
+        engine = GameStateEngine()
+        state = engine.put(game.model_copy(deep=True))
+        assert await repository.get_version(game.id) == 0
+
+        for from_square, to_square in [("e2", "e4"), ("e7", "e5")]:
+            applied = engine.apply_move(
+                state, color=state.game.side_to_move, from_square=from_square, to_square=to_square
+            )
+            await repository.append_move(game.id, applied.move, applied.game_columns)
+        assert state.game.version == 2
+        assert await repository.get_version(game.id) == 2
+
+        saved = await repository.update(state.game)
+        assert saved.version == state.game.version == 3
+        assert await repository.get_version(game.id) == 3
+        assert await repository.get_version(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_resident_game_version_skips_the_repository(self):
+        """The version of a resident game is answered from memory."""
+        repository = AsyncMock()
+        service = GameService(repository, bot_orchestrator_client=AsyncMock())
+        state = service.state_engine.put(_in_progress_game())
+        service.state_engine.apply_move(state, color="w", from_square="d2", to_square="d4")
+
+        assert await service.get_game_version(state.game.id) == 1
+        repository.get_version.assert_not_called()
+
+
+class TestGameResponseCursor:
+    """Test ETag matching and since_ply slicing of game responses."""
+
+    def test_etag_matching(self):
+        """If-None-Match uses weak comparison and accepts lists and '*'."""
+        etag = _game_etag(7)
+
+        assert _etag_matches('W/"7"', etag)
+        assert _etag_matches('"7"', etag)
+        assert _etag_matches('W/"6", W/"7"', etag)
+        assert _etag_matches("*", etag)
+        assert not _etag_matches('W/"6"', etag)
+        assert not _etag_matches(None, etag)
+
+    def test_since_ply_returns_only_newer_moves(self):
+        """Only moves after the cursor are included."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        for from_square, to_square in [("e2", "e4"), ("e7", "e5"), ("g1", "f3")]:
+            engine.apply_move(
+                state, color=state.game.side_to_move, from_square=from_square, to_square=to_square
+            )
+
+        full = _to_game_response(state.game)
+        delta = _to_game_response(state.game, since_ply=2)
+
+        assert [move.ply for move in full.moves] == [1, 2, 3]
+        assert full.since_ply is None
+        assert [move.ply for move in delta.moves] == [3]
+        assert delta.since_ply == 2
+        assert delta.version == full.version == 3
+        assert _to_game_response(state.game, since_ply=3).moves == []
@@ -0,0 +1,57 @@
+"""Unit tests for the pooled HTTP transport."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.metrics import http_client_pool_saturated_total
+from app.infrastructure.clients.bot_orchestrator import BotOrchestratorClient
+from app.infrastructure.clients.pooled_transport import InstrumentedTransport
+
+
+async def _serve_slowly(reader, writer):
+    try:
+        while True:
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(0.02)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except asyncio.IncompleteReadError:
+        writer.close()
+
+
+class TestInstrumentedTransport:
+    """Test connection reuse and saturation accounting."""
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_the_pool_wait_and_are_counted(self):
+        server = await asyncio.start_server(_serve_slowly, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = InstrumentedTransport(
+            "test_upstream", httpx.Limits(max_connections=2, max_keepalive_connections=2)
+        )
+        saturated = http_client_pool_saturated_total.labels(upstream="test_upstream")
+        before = saturated._value.get()
+
+        async with httpx.AsyncClient(
+            transport=transport, base_url=f"http://127.0.0.1:{port}"
+        ) as client:
+            responses = await asyncio.gather(*(client.get("/") for _ in range(5)))
+
+        server.close()
+        await server.wait_closed()
+        assert [response.text for response in responses] == ["ok"] * 5
+        assert saturated._value.get() - before == 3
+        assert transport.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_bot_orchestrator_client_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.infrastructure.clients.bot_orchestrator.http2_available", lambda: False
+        )
+        client = BotOrchestratorClient(base_url="http://bot-orchestrator", http2=True)
+
+        assert client.http2 is False
+        assert isinstance(client._get_client()._transport, InstrumentedTransport)
+        await client.close()
@@ -0,0 +1,81 @@
+"""Unit tests for shard routing."""
+
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+
+from app.infrastructure.sharding.shard_lease_manager import ShardLeaseManager
+from app.infrastructure.sharding.shard_router import ShardRouter, jump_consistent_hash
+
+
+def test_game_to_shard_is_stable_and_in_range():
+    router = ShardRouter(shard_count=64, enabled=True)
+    game_id = uuid4()
+
+    shard = router.get_shard_for_game(game_id)
+
+    assert 0 <= shard < 64
+    assert router.get_shard_for_game(game_id) == shard
+
+
+def test_disabled_router_uses_single_shard():
+    router = ShardRouter(shard_count=64, enabled=False)
+
+    assert router.get_shard_for_game(uuid4()) == 0
+
+
+def test_growing_shard_count_moves_only_the_new_share():
+    """Going from 8 to 12 shards moves about a third of the games."""
+    keys = range(0, 20000 * 7919, 7919)
+    moved = sum(jump_consistent_hash(k, 8) != jump_consistent_hash(k, 12) for k in keys)
+
+    assert 0.28 < moved / 20000 < 0.39
+
+
+def test_scaling_pods_from_8_to_12_moves_about_a_third_of_shards():
+    router = ShardRouter(shard_count=1024, enabled=True)
+    before = router.assign_shards([f"pod-{i}" for i in range(8)])
+    after = router.assign_shards([f"pod-{i}" for i in range(12)])
+
+    moved = [shard for shard in before if before[shard] != after[shard]]
+
+    assert 0.28 < len(moved) / 1024 < 0.39
+    # Shards only move to the new pods, never between existing ones
+    assert all(after[shard] in {f"pod-{i}" for i in range(8, 12)} for shard in moved)
+
+
+def test_without_sharding_no_pod_owns_games_unless_configured():
+    manager = ShardLeaseManager(
+        ShardRouter(shard_count=64, enabled=False), pod_id="pod-0", pod_address="http://pod-0"
+    )
+    assert not manager.owns_game(uuid4())
+
+    manager.settings = manager.settings.model_copy(update={"RESIDENT_GAMES_WITHOUT_SHARDING": True})
+    assert manager.owns_game(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_default_settings_give_every_game_one_owning_pod():
+    """Shard leases are on by default: a lone pod owns all games, two pods split them."""
+    redis_client = aioredis.FakeRedis(decode_responses=True)
+    pods = [
+        ShardLeaseManager(
+            ShardRouter(),
+            pod_id=f"pod-{i}",
+            pod_address=f"http://pod-{i}",
+            redis_client=redis_client,
+        )
+        for i in range(2)
+    ]
+    game_ids = [uuid4() for _ in range(50)]
+
+    await pods[0].refresh()
+    assert all(pods[0].owns_game(game_id) for game_id in game_ids)
+
+    await pods[1].refresh()  # Joins; waits for pod-0 to hand its shards over
+    await pods[0].refresh()
+    await pods[1].refresh()
+    owners = [[pod.owns_game(game_id) for pod in pods] for game_id in game_ids]
+    assert all(sum(owned) == 1 for owned in owners)
+    assert any(owned[1] for owned in owners)
@@ -0,0 +1,174 @@
+"""Unit tests for game snapshots and snapshot-based recovery."""
+
+from uuid import uuid4
+
+import chess
+import pytest
+
+from app.domain.models.game import Game, TimeControl
+from app.domain.services.game_state_engine import GameStateEngine
+from app.infrastructure.database.repository import GameRepository
+from app.infrastructure.snapshots.snapshot_codec import (
+    GameSnapshot,
+    SnapshotCodecError,
+    decode_snapshot,
+    encode_snapshot,
+)
+from app.infrastructure.snapshots.snapshot_service import SnapshotService
+
+# Knights out and back (repeating the start position), then an en passant chance
+MOVES = [(move[:2], move[2:]) for move in "g1f3 g8f6 f3g1 f6g8 e2e4 d7d5 e4e5 f7f5".split()]
+
+
+def _in_progress_game() -> Game:
+    creator_id = uuid4()
+    game = Game(
+        creator_account_id=creator_id,
+        time_control=TimeControl(initial_seconds=180, increment_seconds=2),
+        white_clock_ms=180000,
+        black_clock_ms=180000,
+    )
+    game.white_account_id = creator_id
+    game.black_account_id = uuid4()
+    game.start_game()
+    return game
+
+
+def _play(engine: GameStateEngine, state, moves) -> None:
+    for from_square, to_square in moves:
+        engine.apply_move(
+            state, color=state.game.side_to_move, from_square=from_square, to_square=to_square
+        )
+
+
+class TestSnapshotCodec:
+    """Test the binary snapshot format."""
+
+    def test_round_trip_preserves_board_and_hashes(self):
+        """Decoding an encoded snapshot yields the same position and ply."""
+        board = chess.Board("r3k2r/pppq1ppp/8/3pP3/8/8/PPP2PPP/R3K2R w Kq d6 0 12")
+        snapshot = GameSnapshot(
+            ply=22,
+            board=board,
+            position_hashes=[1, 2**64 - 1, 12345678901234567],
+        )
+
+        data = encode_snapshot(snapshot)
+        decoded = decode_snapshot(data)
+
+        assert len(data) < 100
+        assert decoded.board.fen() == board.fen()
+        assert decoded.board.ep_square == chess.D6
+        assert decoded.ply == 22
+        assert decoded.position_hashes == snapshot.position_hashes
+
+    def test_rejects_foreign_or_truncated_data(self):
+        """Unknown or truncated data raises SnapshotCodecError."""
+        data = encode_snapshot(GameSnapshot(ply=0, board=chess.Board()))
+
+        with pytest.raises(SnapshotCodecError):
+            decode_snapshot(b"XX" + data[2:])
+        with pytest.raises(SnapshotCodecError):
+            decode_snapshot(data[:20])
+
+
+class TestSnapshotRecovery:
+    """Test restoring resident state from a snapshot plus the move tail."""
+
+    def test_restore_matches_full_replay(self):
+        """Snapshot + tail gives the same board and repetition state as a full replay."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        _play(engine, state, MOVES[:2])
+        snapshot = decode_snapshot(
+            encode_snapshot(
+                GameSnapshot(
+                    ply=state.ply, board=state.board, position_hashes=state.position_hashes
+                )
+            )
+        )
+        _play(engine, state, MOVES[2:4])
+        tail = state.game.moves[2:4]
+
+        restored = GameStateEngine.restore(
+            state.game.model_copy(deep=True),
+            snapshot.board,
+            snapshot.position_hashes,
+            snapshot.ply,
+            tail,
+        )
+
+        assert restored is not None
+        assert restored.ply == 4
+        assert not restored.has_full_history
+        assert restored.board.fen() == state.board.fen()
+        assert restored.position_hashes == state.position_hashes
+        # The start position has now occurred twice
+        assert restored.repetition_count() == 2
+
+    def test_restore_rejects_stale_snapshot(self):
+        """A snapshot that does not lead to the stored FEN is not used."""
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        _play(engine, state, MOVES[:2])
+
+        restored = GameStateEngine.restore(
+            state.game.model_copy(deep=True), chess.Board(), [], 0, []
+        )
+
+        assert restored is None
+
+    def test_should_snapshot_on_move_or_time_interval(self):
+        """Snapshots are due after N moves or N seconds since the last one."""
+        service = SnapshotService(db_session=None)
+        service.snapshot_interval_moves = 4
+        service.snapshot_interval_seconds = 60
+        engine = GameStateEngine()
+        state = engine.put(_in_progress_game())
+        state.snapshot_at = 1000.0
+
+        assert not service.should_snapshot(state, now=1001.0)  # No moves yet
+        _play(engine, state, MOVES[:3])
+        assert not service.should_snapshot(state, now=1001.0)
+        assert service.should_snapshot(state, now=1060.0)
+        _play(engine, state, MOVES[3:4])
+        assert service.should_snapshot(state, now=1001.0)
+
+    @pytest.mark.asyncio
+    async def test_recover_active_games_replays_only_the_tail(self, db_session):
+        """Recovery uses the stored snapshot and the moves after it."""
+        repository = GameRepository(db_session)
+        game = await repository.create(_in_progress_game())
+        engine = GameStateEngine()
+        state = engine.put(game.model_copy(deep=True))
+        service = SnapshotService(db_session)
+
+        for index, (from_square, to_square) in enumerate(MOVES):
+            applied = engine.apply_move(
+                state,
+                color=state.game.side_to_move,
+                from_square=from_square,
+                to_square=to_square,
+            )
+            await repository.append_move(game.id, applied.move, applied.game_columns)
+            if index in (1, 4):
+                await service.create_snapshot(state)  # The second replaces the first
+
+        states = await service.recover_active_games()
+
+        assert len(states) == 1
+        recovered = states[0]
+        assert recovered.ply == len(MOVES)
+        assert [move.ply for move in recovered.game.moves] == [6, 7, 8]
+        # Position hashes survive the signed BIGINT column
+        assert [move.position_hash for move in recovered.game.moves] == [
+            move.position_hash for move in state.game.moves[5:]
+        ]
+        assert recovered.board.fen() == state.board.fen()
+        assert recovered.board.ep_square == state.board.ep_square == chess.F6
+        assert recovered.position_hashes == state.position_hashes
+        # Clocks come from the game row, which every move updates
+        assert (recovered.game.white_clock_ms, recovered.game.black_clock_ms) == (
+            state.game.white_clock_ms,
+            state.game.black_clock_ms,
+        )
@@ -0,0 +1,144 @@
+"""Unit tests for the Redis pub/sub WebSocket fan-out."""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+import pytest_asyncio
+
+from app.infrastructure.websocket.fanout import GameChannelFanout
+from app.infrastructure.websocket.send_queue import ConnectionSendQueue
+
+
+class FakePubSub:
+    """In-memory stand-in for a redis-py PubSub connection."""
+
+    def __init__(self):
+        self.channels = set()
+        self.subscribe_calls: List[str] = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def subscribed(self) -> bool:
+        return bool(self.channels)
+
+    async def subscribe(self, channel: str) -> None:
+        self.subscribe_calls.append(channel)
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pubsub_conn = FakePubSub()
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakePubSub:
+        return self.pubsub_conn
+
+
+class FakeWebSocket:
+    def __init__(self, fail: bool = False):
+        self.sent: List[str] = []
+        self.fail = fail
+
+    async def send_text(self, data: str) -> None:
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(data)
+
+
+_queues: List[ConnectionSendQueue] = []
+
+
+def _queue(connection_id: str, websocket: FakeWebSocket) -> ConnectionSendQueue:
+    send_queue = ConnectionSendQueue(websocket, connection_id)
+    send_queue.start()
+    _queues.append(send_queue)
+    return send_queue
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest_asyncio.fixture
+async def fanout(fake_redis):
+    async def get_client():
+        return fake_redis
+
+    yield GameChannelFanout(get_client, poll_timeout_seconds=0.05)
+    for send_queue in _queues:
+        await send_queue.close()
+    _queues.clear()
+
+
+@pytest.mark.asyncio
+async def test_one_subscription_per_game(fanout, fake_redis):
+    """Many local sockets for a game share one channel subscription."""
+    for i in range(50):
+        await fanout.add("g1", f"c{i}", _queue(f"c{i}", FakeWebSocket()))
+
+    assert fake_redis.pubsub_conn.subscribe_calls == ["pubsub:game:g1"]
+    assert fanout.local_connection_count("g1") == 50
+    await fanout.close()
+
+
+@pytest.mark.asyncio
+async def test_message_reaches_all_local_sockets(fanout, fake_redis):
+    """A published message is forwarded verbatim to every socket of the game."""
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for i, websocket in enumerate(sockets):
+        await fanout.add("g1", f"c{i}", _queue(f"c{i}", websocket))
+    other = FakeWebSocket()
+    await fanout.add("g2", "other", _queue("other", other))
+
+    payload = '{"type":"move_played"}'
+    await fake_redis.pubsub_conn.messages.put(
+        {"type": "message", "channel": "pubsub:game:g1", "data": payload}
+    )
+    for _ in range(20):
+        if all(websocket.sent for websocket in sockets):
+            break
+        await asyncio.sleep(0.01)
+
+    assert all(websocket.sent == [payload] for websocket in sockets)
+    assert other.sent == []
+    await fanout.close()
+
+
+@pytest.mark.asyncio
+async def test_last_socket_leaving_unsubscribes(fanout, fake_redis):
+    await fanout.add("g1", "c1", _queue("c1", FakeWebSocket()))
+    await fanout.add("g1", "c2", _queue("c2", FakeWebSocket()))
+
+    await fanout.remove("g1", "c1")
+    assert "pubsub:game:g1" in fake_redis.pubsub_conn.channels
+
+    await fanout.remove("g1", "c2")
+    assert "pubsub:game:g1" not in fake_redis.pubsub_conn.channels
+    await fanout.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_socket_is_dropped(fanout):
+    await fanout.add("g1", "ok", _queue("ok", FakeWebSocket()))
+    await fanout.add("g1", "broken", _queue("broken", FakeWebSocket(fail=True)))
+
+    await fanout.deliver("g1", "{}")
+    await asyncio.sleep(0)
+    await fanout.deliver("g1", "{}")
+
+    assert fanout.local_connection_count("g1") == 1
+    await fanout.close()
@@ -0,0 +1,122 @@
+"""Unit tests for bounded per-connection WebSocket send queues."""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from app.infrastructure.websocket.send_queue import ConnectionSendQueue
+
+
+class BlockedWebSocket:
+    """Socket whose sends wait until released, like a stalled mobile client."""
+
+    def __init__(self):
+        self.sent: List[str] = []
+        self.release = asyncio.Event()
+        self.close_code: Optional[int] = None
+
+    async def send_text(self, data: str) -> None:
+        await self.release.wait()
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+async def _drain(websocket: BlockedWebSocket, send_queue: ConnectionSendQueue) -> None:
+    websocket.release.set()
+    for _ in range(20):
+        if send_queue.depth == 0:
+            break
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_frames_are_sent_in_order():
+    websocket = BlockedWebSocket()
+    send_queue = ConnectionSendQueue(websocket, "c1")
+    send_queue.start()
+
+    for i in range(3):
+        assert send_queue.offer(f"frame-{i}")
+    await _drain(websocket, send_queue)
+
+    assert websocket.sent == ["frame-0", "frame-1", "frame-2"]
+    await send_queue.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_coalesces_superseded_moves():
+    """When full, the latest move_played replaces the queued one."""
+    websocket = BlockedWebSocket()
+    send_queue = ConnectionSendQueue(websocket, "c1", max_size=3, high_water=3)
+
+    send_queue.offer("move-1", coalesce_key="g1:move_played")
+    send_queue.offer("ping")
+    send_queue.offer("chat")
+    assert send_queue.offer("move-2", coalesce_key="g1:move_played")
+    assert not send_queue.offer("ping")
+
+    send_queue.start()
+    await _drain(websocket, send_queue)
+
+    assert websocket.sent == ["ping", "chat", "move-2"]
+    await send_queue.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_evicted_after_grace_period():
+    websocket = BlockedWebSocket()
+    send_queue = ConnectionSendQueue(
+        websocket, "c1", max_size=4, high_water=2, slow_consumer_grace_seconds=0.0
+    )
+    send_queue.start()
+
+    for i in range(4):
+        send_queue.offer(f"frame-{i}")
+    await asyncio.sleep(0.01)
+    send_queue.offer("frame-4")
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert send_queue.closed
+    assert send_queue.depth == 0
+    assert websocket.close_code == 1013
+    assert not send_queue.offer("late")
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_evicted_once():
+    """Offers made before the close task runs do not schedule more closes."""
+    websocket = BlockedWebSocket()
+    closes = []
+    websocket.close = lambda code=1000: closes.append(code) or asyncio.sleep(0)
+    send_queue = ConnectionSendQueue(
+        websocket, "c1", max_size=4, high_water=2, slow_consumer_grace_seconds=0.0
+    )
+
+    for i in range(3):
+        send_queue.offer(f"frame-{i}")
+    await asyncio.sleep(0.01)
+    offered = [send_queue.offer(f"late-{i}") for i in range(3)]
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert offered == [False, False, False]
+    assert closes == [1013]
+
+
+@pytest.mark.asyncio
+async def test_offer_does_not_wait_for_the_socket():
+    """A stalled socket does not block producers."""
+    websocket = BlockedWebSocket()
+    send_queue = ConnectionSendQueue(websocket, "c1", max_size=8)
+    send_queue.start()
+
+    for i in range(8):
+        send_queue.offer(f"frame-{i}")
+
+    assert websocket.sent == []
+    await send_queue.close()
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_DECODE_RESPONSES: bool = True
+    REDIS_BULK_LOAD_CHUNK_SIZE: int = 500  # Tickets per pipelined HGETALL batch when loading a pool
 
     # JWT / Auth
     JWT_ALGORITHM: str = "HS256"
@@ -58,7 +59,18 @@ class Settings(BaseSettings):
     RATING_WINDOW_WIDENING_AMOUNT: int = 25  # Widen by 25 points
     WORKER_INTERVAL_SECONDS: float = 1.0  # Match every 1 second
     WORKER_BATCH_SIZE: int = 100  # Process matches in batches
+    WORKER_ENABLED: bool = True  # Run the matchmaking worker in the API process
+    WORKER_POOL_MIN_INTERVAL_SECONDS: float = 0.2  # Cadence of a pool that just produced proposals
+    WORKER_POOL_MAX_INTERVAL_SECONDS: float = 5.0  # Cadence an idle pool backs off to
+    WORKER_POOL_DISCOVERY_INTERVAL_SECONDS: float = 2.0  # Look for newly active pools
+    WORKER_POOL_LEASE_TTL_SECONDS: float = 15.0  # Pool lease lifetime without renewal
     MATCH_PAIRS_PER_BATCH: int = 50  # Number of pairs to attempt per batch
+    # "greedy" (oldest ticket first) or "batch" (min-cost pairing of the pool)
+    MATCHING_MODE: str = "greedy"
+    MATCHING_COST_WAIT_WEIGHT: float = 0.25  # Batch mode: cost removed per second waited
+    MATCHING_COST_LATENCY_WEIGHT: float = 0.1  # Batch mode: rating points of cost per ms of latency
+    MATCHING_BATCH_REACH: int = 4  # Batch mode: rating neighbours a ticket can be paired with
+    MATCHING_BATCH_ROUNDS: int = 6  # Batch mode: pairing passes over still-unmatched tickets
     HEARTBEAT_TIMEOUT_SECONDS: int = 30  # Heartbeat grace period
     HEARTBEAT_REAPER_INTERVAL_SECONDS: float = 5.0  # Sweep expired tickets
     PROPOSING_TIMEOUT_SECONDS: int = 10  # Time to accept/decline proposals
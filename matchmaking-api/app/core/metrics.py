@@ -46,6 +46,17 @@ matchmaking_queue_wait_time_seconds = Histogram(
     buckets=[1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0],
 )
 
+matchmaking_worker_leased_pools = Gauge(
+    "matchmaking_worker_leased_pools",
+    "Number of matchmaking pools leased by this worker",
+)
+
+matchmaking_worker_cycle_seconds = Histogram(
+    "matchmaking_worker_cycle_seconds",
+    "Duration of one matching cycle of a pool in seconds",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+
 # Database metrics
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
@@ -1,5 +1,6 @@
 """Queue store repository interface."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from app.domain.models import QueueEntryStatus, Ticket
@@ -45,6 +46,27 @@ class QueueStoreRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def transition_entries(
+        self,
+        entries: list[Ticket],
+        status: QueueEntryStatus,
+        match_id: Optional[str] = None,
+        from_status: Optional[QueueEntryStatus] = QueueEntryStatus.SEARCHING,
+    ) -> bool:
+        """Atomically move tickets from one status to another.
+
+        Args:
+            entries: Tickets, all moved or none
+            status: New status
+            match_id: Match ID if matched
+            from_status: Status every ticket must be in (None: the status it was loaded in)
+
+        Returns:
+            True if the tickets were moved
+        """
+        pass
+
     @abstractmethod
     async def get_active_entry_for_user(self, user_id: str, tenant_id: str) -> Optional[Ticket]:
         """Get active ticket for user.
@@ -73,6 +95,11 @@ class QueueStoreRepository(ABC):
         tenant_id: str,
         pool_key: str,
         status: QueueEntryStatus = QueueEntryStatus.SEARCHING,
+        *,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        enqueued_after: Optional[datetime] = None,
+        enqueued_before: Optional[datetime] = None,
     ) -> list[Ticket]:
         """Get all tickets in a pool by status.
 
@@ -80,6 +107,10 @@ class QueueStoreRepository(ABC):
             tenant_id: Tenant ID
             pool_key: Pool key (e.g., "5+0_rated_ASIA")
             status: Status filter
+            min_rating: Only tickets rated at least this
+            max_rating: Only tickets rated at most this
+            enqueued_after: Only tickets enqueued at or after this time
+            enqueued_before: Only tickets enqueued at or before this time
 
         Returns:
             List of tickets
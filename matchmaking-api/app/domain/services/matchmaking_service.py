@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from app.clients.rating_client import PlayerRating, RatingAPIClient
+from app.clients.rating_client import RatingAPIClient
 from app.core.config import get_settings
 from app.domain.models import (
     HardConstraints,
@@ -21,6 +21,8 @@ from app.domain.models import (
 )
 from app.domain.repositories.match_record import MatchRecordRepository
 from app.domain.repositories.queue_store import QueueStoreRepository
+from app.domain.utils.rating_index import RatingIndex
+from app.domain.utils.rating_pairing import pair_along_ratings
 from app.domain.utils.time_control import rating_pool_id_from_constraints
 from app.infrastructure.external.live_game_api import LiveGameAPIClient
 from app.infrastructure.resilience.circuit_breaker import CircuitBreakerOpenError
@@ -176,7 +178,9 @@ class MatchmakingService:
                 f"Cannot cancel entry in state {entry.status.value}"
             )
 
-        await self.queue_store.update_entry_status(queue_entry_id, QueueEntryStatus.CANCELLED)
+        # Only a still-searching ticket is cancelled, even if the worker matches it meanwhile
+        if not await self.queue_store.transition_entries([entry], QueueEntryStatus.CANCELLED):
+            raise CannotCancelException("Cannot cancel entry that is no longer searching")
 
         updated_entry = await self.queue_store.get_entry(queue_entry_id)
         if not updated_entry:
@@ -258,9 +262,22 @@ class MatchmakingService:
 
         Returns:
             True if game created successfully
+
+        Both tickets are claimed (moved to MATCHED) before the game is
+        created, so a concurrent cancel or timeout either wins before the game
+        exists or fails; they go back to SEARCHING if game creation fails.
         """
         start_time = time.time()
         match_id = f"m_{uuid.uuid4().hex[:12]}"
+        tickets = [entry1, entry2]
+        ticket_ids = [entry1.queue_entry_id, entry2.queue_entry_id]
+
+        if not await self.queue_store.transition_entries(tickets, QueueEntryStatus.MATCHED):
+            logger.info(
+                f"Ticket left the queue before match {match_id} was created",
+                extra={"tickets": ticket_ids},
+            )
+            return False
 
         # Randomly assign white/black
         import random
@@ -302,9 +319,22 @@ class MatchmakingService:
                     match_id=match_id,
                 )
                 await self.failed_matches_queue.enqueue(failed_match)
-            # Don't update queue entries as failed - they'll be retried
+            # Don't mark queue entries as failed - they'll be retried
+            await self._release_tickets(tickets, match_id)
             return False
         except Exception as e:
+            logger.error(
+                f"Failed to create match: {str(e)}",
+                extra={"match_id": match_id},
+            )
+            await self._release_tickets(tickets, match_id)
+            return False
+
+        try:
+            # Attach the game to the claimed tickets
+            await self.queue_store.transition_entries(
+                tickets, QueueEntryStatus.MATCHED, game_id, from_status=QueueEntryStatus.MATCHED
+            )
 
             # Create match record
             rating_snapshot = RatingSnapshot(white=white_rating, black=black_rating)
@@ -318,20 +348,12 @@ class MatchmakingService:
                 mode=entry1.hard_constraints.mode,
                 variant=entry1.hard_constraints.variant,
                 created_at=datetime.now(timezone.utc),
-                queue_entry_ids=[entry1.queue_entry_id, entry2.queue_entry_id],
+                queue_entry_ids=ticket_ids,
                 rating_snapshot=rating_snapshot,
             )
 
             await self.match_repo.create(match_record)
 
-            # Update queue entries with match_id
-            await self.queue_store.update_entry_status(
-                entry1.queue_entry_id, QueueEntryStatus.MATCHED, game_id
-            )
-            await self.queue_store.update_entry_status(
-                entry2.queue_entry_id, QueueEntryStatus.MATCHED, game_id
-            )
-
             # Publish MatchCreated event
             if self.event_publisher:
                 match_created_event = MatchCreatedEvent(
@@ -366,6 +388,18 @@ class MatchmakingService:
             )
             return False
 
+    async def _release_tickets(self, tickets: list[Ticket], match_id: str) -> None:
+        """Put tickets claimed for a match back into the search."""
+        try:
+            await self.queue_store.transition_entries(
+                tickets, QueueEntryStatus.SEARCHING, from_status=QueueEntryStatus.MATCHED
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to release tickets of match {match_id}: {str(e)}",
+                extra={"tickets": [ticket.queue_entry_id for ticket in tickets]},
+            )
+
     def _rating_in_window(
         self, player_rating: int, candidate_rating: int, window: int
     ) -> bool:
@@ -387,7 +421,8 @@ class MatchmakingService:
     ) -> list[tuple[Ticket, Ticket, str]]:
         """Find matches for a pool.
 
-        Per service-spec section 2.1.2 Matchmaking Logic
+        Per service-spec section 2.1.2 Matchmaking Logic. ``MATCHING_MODE``
+        selects greedy (oldest ticket first) or batch (min-cost) pairing.
 
         Args:
             tenant_id: Tenant ID
@@ -414,87 +449,191 @@ class MatchmakingService:
         pool_id = rating_pool_id_from_constraints(
             entries[0].hard_constraints.variant, entries[0].hard_constraints.time_control
         )
-        user_ids = [entry.players[0].user_id for entry in entries]
-        ratings = await self.rating_api.get_bulk_ratings(user_ids, pool_id)
+        player_ratings = await self._load_pool_ratings(entries, pool_id)
 
-        def _get_rating(ticket: Ticket) -> PlayerRating:
-            rating = ratings.get(ticket.players[0].user_id)
-            if rating:
-                ticket.players[0].rating = rating.rating
-                ticket.players[0].rating_deviation = rating.rating_deviation
-                return rating
-            return PlayerRating(
-                rating=self.settings.RATING_DEFAULT_MMR,
-                rating_deviation=self.settings.RATING_DEFAULT_RD,
+        if self.settings.MATCHING_MODE == "batch":
+            return self._find_batch_matches(entries, player_ratings, now)
+        return self._find_greedy_matches(entries, player_ratings, now)
+
+    def _find_greedy_matches(
+        self, entries: list[Ticket], player_ratings: list[float], now: datetime
+    ) -> list[tuple[Ticket, Ticket, str]]:
+        """Pair each ticket, oldest first, with its closest-rated candidate."""
+        # Greedy matching with rating window widening: oldest ticket first,
+        # closest-rated compatible younger ticket within its window. Candidates
+        # are indexed by rating per preferred region, so each ticket only looks
+        # at the tickets inside its window, nearest first.
+        indexes: dict[Optional[str], RatingIndex[Ticket]] = {}
+        for region, members in self._group_by_preferred_region(entries).items():
+            indexes[region] = RatingIndex(
+                (player_ratings[order], order, entries[order])
+                for order in members
+                if self._can_play_in_preferred_region(entries[order])
             )
 
-        # Simple greedy matching with rating window widening
         matches: list[tuple[Ticket, Ticket, str]] = []
-        used = set()
+        matched: set[int] = set()
 
-        for i, entry in enumerate(entries):
-            if entry.queue_entry_id in used:
+        for order, entry in enumerate(entries):
+            if order in matched:
                 continue
+            region = self._preferred_region(entry)
+            indexes[region].remove(order)  # Only younger tickets are candidates
 
-            wait_time = entry.time_in_queue_seconds(now)
+            current_window = self._widen_window(entry, now)
+            if not self._can_play_in_preferred_region(entry):
+                continue
+            player_rating = player_ratings[order]
+
+            # Compatible regions: the same preference or none (no preference: any).
+            # Matches with a ticket preferring a region are hosted there.
+            searched = [
+                index
+                for candidate_region, index in indexes.items()
+                if candidate_region is None
+                or (
+                    region in (None, candidate_region)
+                    and self._within_latency_budget(entry, candidate_region)
+                )
+            ]
+            best: Optional[tuple[float, int, Ticket, str]] = None
+            for index in searched:
+                for gap, candidate_order, candidate in index.nearest(player_rating, current_window):
+                    # Nearest first, older first on equal gaps: the first fit is the best
+                    if best is not None and (gap, candidate_order) >= best[:2]:
+                        break
+                    match_region = self._select_match_region(entry, candidate)
+                    if self._within_latency_budget(
+                        entry, match_region
+                    ) and self._within_latency_budget(candidate, match_region):
+                        best = (gap, candidate_order, candidate, match_region)
+                        break
+
+            if best:
+                _, candidate_order, candidate, match_region = best
+                matches.append((entry, candidate, match_region))
+                matched.add(order)
+                matched.add(candidate_order)
+                indexes[self._preferred_region(candidate)].remove(candidate_order)
 
-            # Calculate rating window based on wait time
-            initial_window = (
-                entry.soft_constraints.rating_window
-                if entry.soft_constraints and entry.soft_constraints.rating_window
-                else entry.widening_state.current_window
-                if entry.widening_state.current_window
-                else self.settings.INITIAL_RATING_WINDOW
-            )
-            widening_interval = self.settings.RATING_WINDOW_WIDENING_INTERVAL
-            widening_amount = self.settings.RATING_WINDOW_WIDENING_AMOUNT
+        return matches
 
-            windows_widened = int(wait_time / widening_interval)
-            new_stage = max(entry.widening_state.stage, windows_widened)
-            current_window = initial_window + (new_stage * widening_amount)
+    def _find_batch_matches(
+        self, entries: list[Ticket], player_ratings: list[float], now: datetime
+    ) -> list[tuple[Ticket, Ticket, str]]:
+        """Pair the whole pool at once, minimizing the total cost of its matches.
 
-            if new_stage > entry.widening_state.stage:
-                entry.widening_state.last_widened_at = now
+        Matching as many tickets as possible comes first. Among pairings with
+        the same number of matches, the cheapest wins: a pair costs its rating
+        gap plus the players' latency to the match region (weighted), minus
+        the time both have waited (weighted), so long waiters go first. As in
+        greedy mode, the older ticket's widened window bounds the gap.
+        """
+        windows = [self._widen_window(entry, now) for entry in entries]
+        waits = [entry.time_in_queue_seconds(now) for entry in entries]
+        wait_weight = self.settings.MATCHING_COST_WAIT_WEIGHT
+        latency_weight = self.settings.MATCHING_COST_LATENCY_WEIGHT
+
+        def pair_cost(a: int, b: int) -> Optional[float]:
+            older, younger = min(a, b), max(a, b)  # Entries are sorted oldest first
+            gap = abs(player_ratings[a] - player_ratings[b])
+            if gap > windows[older]:
+                return None
+            entry, candidate = entries[older], entries[younger]
+            if not self._regions_compatible(entry, candidate):
+                return None
+            match_region = self._select_match_region(entry, candidate)
+            if not (
+                self._within_latency_budget(entry, match_region)
+                and self._within_latency_budget(candidate, match_region)
+            ):
+                return None
+            latency = self._latency_ms(entry, match_region) + self._latency_ms(
+                candidate, match_region
+            )
+            return gap + latency_weight * latency - wait_weight * (waits[a] + waits[b])
 
-            entry.widening_state.stage = new_stage
-            entry.widening_state.current_window = current_window
-            entry.widening_state.widen_count = new_stage
+        # Tickets that cannot be matched would only stand between rating neighbours
+        playable = [
+            order for order, entry in enumerate(entries) if self._can_play_in_preferred_region(entry)
+        ]
+        pairs = pair_along_ratings(
+            [player_ratings[order] for order in playable],
+            lambda a, b: pair_cost(playable[a], playable[b]),
+            reach=self.settings.MATCHING_BATCH_REACH,
+            max_rounds=self.settings.MATCHING_BATCH_ROUNDS,
+        )
 
-            player_rating = _get_rating(entry).rating
+        # Oldest ticket first, as in greedy mode
+        matches: list[tuple[Ticket, Ticket, str]] = []
+        for a, b in pairs:
+            older, younger = sorted((playable[a], playable[b]))
+            entry, candidate = entries[older], entries[younger]
+            matches.append((entry, candidate, self._select_match_region(entry, candidate)))
+        matches.sort(key=lambda match: match[0].time_in_queue_seconds(now), reverse=True)
+        return matches
+
+    async def _load_pool_ratings(self, entries: list[Ticket], pool_id: str) -> list[float]:
+        """Fetch the rating of every ticket (default MMR when unknown), in entry order."""
+        user_ids = [entry.players[0].user_id for entry in entries]
+        ratings = await self.rating_api.get_bulk_ratings(user_ids, pool_id)
 
-            # Find best match candidate
-            best_match = None
-            best_diff = float("inf")
+        player_ratings = []
+        for entry in entries:
+            rating = ratings.get(entry.players[0].user_id)
+            if rating:
+                entry.players[0].rating = rating.rating
+                entry.players[0].rating_deviation = rating.rating_deviation
+                player_ratings.append(rating.rating)
+            else:
+                player_ratings.append(self.settings.RATING_DEFAULT_MMR)
+        return player_ratings
+
+    def _widen_window(self, entry: Ticket, now: datetime) -> int:
+        """Widen a ticket's rating window by its wait time and return it."""
+        wait_time = entry.time_in_queue_seconds(now)
+
+        # Calculate rating window based on wait time
+        initial_window = (
+            entry.soft_constraints.rating_window
+            if entry.soft_constraints and entry.soft_constraints.rating_window
+            else entry.widening_state.current_window
+            if entry.widening_state.current_window
+            else self.settings.INITIAL_RATING_WINDOW
+        )
+        widening_interval = self.settings.RATING_WINDOW_WIDENING_INTERVAL
+        widening_amount = self.settings.RATING_WINDOW_WIDENING_AMOUNT
 
-            for j, candidate in enumerate(entries):
-                if i >= j or candidate.queue_entry_id in used:
-                    continue
+        windows_widened = int(wait_time / widening_interval)
+        new_stage = max(entry.widening_state.stage, windows_widened)
+        current_window = initial_window + (new_stage * widening_amount)
 
-                candidate_rating = _get_rating(candidate).rating
+        if new_stage > entry.widening_state.stage:
+            entry.widening_state.last_widened_at = now
 
-                if not self._regions_compatible(entry, candidate):
-                    continue
+        entry.widening_state.stage = new_stage
+        entry.widening_state.current_window = current_window
+        entry.widening_state.widen_count = new_stage
+        return current_window
 
-                match_region = self._select_match_region(entry, candidate)
-                if not (
-                    self._within_latency_budget(entry, match_region)
-                    and self._within_latency_budget(candidate, match_region)
-                ):
-                    continue
+    @staticmethod
+    def _preferred_region(entry: Ticket) -> Optional[str]:
+        return (entry.soft_constraints.preferred_region if entry.soft_constraints else None) or None
 
-                if self._rating_in_window(player_rating, candidate_rating, current_window):
-                    diff = abs(player_rating - candidate_rating)
-                    if diff < best_diff:
-                        best_match = candidate
-                        best_diff = diff
+    def _can_play_in_preferred_region(self, entry: Ticket) -> bool:
+        """A ticket over its latency budget in its preferred region cannot be matched.
 
-            if best_match:
-                match_region = self._select_match_region(entry, best_match)
-                matches.append((entry, best_match, match_region))
-                used.add(entry.queue_entry_id)
-                used.add(best_match.queue_entry_id)
+        Its matches are always hosted in its preferred region.
+        """
+        region = self._preferred_region(entry)
+        return region is None or self._within_latency_budget(entry, region)
 
-        return matches
+    def _group_by_preferred_region(self, entries: list[Ticket]) -> dict[Optional[str], list[int]]:
+        """Entry positions per preferred region (None: no preference)."""
+        groups: dict[Optional[str], list[int]] = {}
+        for order, entry in enumerate(entries):
+            groups.setdefault(self._preferred_region(entry), []).append(order)
+        return groups
 
     async def process_timed_out_entries(self, tenant_id: str, pool_key: str) -> int:
         """Process timed out queue entries.
@@ -506,20 +645,23 @@ class MatchmakingService:
         Returns:
             Number of entries timed out
         """
-        entries = await self.queue_store.get_queue_by_pool(
-            tenant_id, pool_key, QueueEntryStatus.SEARCHING
-        )
-
         now = datetime.now(timezone.utc)
         max_wait = self.settings.MAX_QUEUE_TIME_SECONDS
+        entries = await self.queue_store.get_queue_by_pool(
+            tenant_id,
+            pool_key,
+            QueueEntryStatus.SEARCHING,
+            enqueued_before=now - timedelta(seconds=max_wait),
+        )
         timed_out_count = 0
 
         for entry in entries:
             wait_time = entry.time_in_queue_seconds(now)
             if wait_time > max_wait:
-                await self.queue_store.update_entry_status(
-                    entry.queue_entry_id, QueueEntryStatus.TIMED_OUT
-                )
+                if not await self.queue_store.transition_entries(
+                    [entry], QueueEntryStatus.TIMED_OUT
+                ):
+                    continue  # Matched or cancelled meanwhile
                 timed_out_count += 1
                 logger.info(
                     f"Timed out queue entry {entry.queue_entry_id}",
@@ -569,6 +711,12 @@ class MatchmakingService:
         latency = latency_map.get(region)
         return latency is None or latency <= max_latency
 
+    @staticmethod
+    def _latency_ms(entry: Ticket, region: str) -> float:
+        metadata = entry.players[0].metadata or {}
+        latency_map = metadata.get("latency_ms") or {}
+        return latency_map.get(region) or 0
+
     def _select_match_region(self, entry: Ticket, candidate: Ticket) -> str:
         preferred_entry = (
             entry.soft_constraints.preferred_region if entry.soft_constraints else None
@@ -0,0 +1,89 @@
+"""Rating-sorted index of matchmaking tickets."""
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from typing import Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def _find(parent: list[int], i: int) -> int:
+    """Follow removal links to the nearest remaining slot (with path halving)."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+class RatingIndex(Generic[T]):
+    """Items sorted by rating, searched nearest-rating first.
+
+    Removal only unlinks an item, so a search skips removed items in amortized
+    constant time and visiting the first ``k`` items of a window costs
+    ``O(k + log n)`` per distinct rating visited.
+    """
+
+    def __init__(self, items: Iterable[tuple[float, int, T]]) -> None:
+        """Build the index.
+
+        Args:
+            items: ``(rating, order, item)`` triples; ``order`` is a unique
+                integer id used to remove the item and to break ties.
+        """
+        entries = sorted(items, key=lambda entry: (entry[0], entry[1]))
+        self._ratings = [entry[0] for entry in entries]
+        self._orders = [entry[1] for entry in entries]
+        self._items = [entry[2] for entry in entries]
+        self._position = {order: pos for pos, order in enumerate(self._orders)}
+        size = len(entries)
+        # _next[i]: first remaining position >= i (size: none)
+        self._next = list(range(size + 1))
+        # _prev[i]: remaining position + 1 that is <= i (0: none), i.e. slot i is position i - 1
+        self._prev = list(range(size + 1))
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def remove(self, order: int) -> None:
+        """Remove an item by its order id (no-op if already removed)."""
+        pos = self._position.pop(order, None)
+        if pos is None:
+            return
+        self._next[pos] = pos + 1
+        self._prev[pos + 1] = pos
+        self._size -= 1
+
+    def nearest(self, rating: float, window: float) -> Iterator[tuple[float, int, T]]:
+        """Yield ``(rating gap, order, item)`` within ``window``, by gap then order.
+
+        Items must not be removed while the iterator is in use.
+        """
+        end = len(self._ratings)
+        start = bisect_left(self._ratings, rating)
+        right = _find(self._next, start)
+        left = _find(self._prev, start) - 1
+        while right < end or left >= 0:
+            right_gap = self._ratings[right] - rating if right < end else float("inf")
+            left_gap = rating - self._ratings[left] if left >= 0 else float("inf")
+            gap = min(right_gap, left_gap)
+            if gap > window:
+                return
+
+            # Items at this gap: a run above and/or a run below the rating
+            runs = []
+            if right_gap == gap:
+                run_end = bisect_right(self._ratings, self._ratings[right])
+                runs.append(self._walk(right, run_end))
+                right = _find(self._next, run_end)
+            if left_gap == gap:
+                run_start = bisect_left(self._ratings, self._ratings[left])
+                runs.append(self._walk(_find(self._next, run_start), left + 1))
+                left = _find(self._prev, run_start) - 1
+            for pos in merge(*runs, key=self._orders.__getitem__):
+                yield gap, self._orders[pos], self._items[pos]
+
+    def _walk(self, pos: int, end: int) -> Iterator[int]:
+        """Remaining positions from ``pos`` (remaining) up to ``end``, in order."""
+        while pos < end:
+            yield pos
+            pos = _find(self._next, pos + 1)
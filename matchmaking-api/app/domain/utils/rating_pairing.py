@@ -0,0 +1,74 @@
+"""Approximate min-cost pairing of tickets along the rating axis."""
+from typing import Callable, Optional, Sequence
+
+PairCost = Callable[[int, int], Optional[float]]
+
+
+def pair_along_ratings(
+    ratings: Sequence[float],
+    pair_cost: PairCost,
+    reach: int = 4,
+    max_rounds: int = 3,
+) -> list[tuple[int, int]]:
+    """Pair items so that as many as possible are matched, as cheaply as possible.
+
+    With rating gap as the only cost, an optimal matching never crosses: it
+    pairs neighbours on the sorted rating axis. Each round therefore runs a
+    dynamic program over the still-unpaired items in rating order, where an
+    item is either left alone or paired with one of the ``reach`` items below
+    it (the items in between stay alone), and keeps the pairing with the most
+    pairs at the lowest total cost. Items left alone get another chance
+    against their new neighbours in the next round. A round costs
+    ``O(n * reach)`` cost evaluations.
+
+    Args:
+        ratings: Rating of each item
+        pair_cost: Cost of pairing two items (by position in ``ratings``), or
+            None if they cannot be paired
+        reach: How many rating neighbours an item can be paired with
+        max_rounds: Maximum number of rounds
+
+    Returns:
+        Pairs of item positions, lower rating first
+    """
+    remaining = sorted(range(len(ratings)), key=lambda i: (ratings[i], i))
+    pairs: list[tuple[int, int]] = []
+
+    for _ in range(max_rounds):
+        round_pairs = _pair_neighbours(remaining, pair_cost, reach)
+        if not round_pairs:
+            break
+        pairs.extend(round_pairs)
+        paired = {i for pair in round_pairs for i in pair}
+        remaining = [i for i in remaining if i not in paired]
+
+    return pairs
+
+
+def _pair_neighbours(items: list[int], pair_cost: PairCost, reach: int) -> list[tuple[int, int]]:
+    # best[k]: (pairs, -cost) of the best pairing of items[:k]
+    # partner[k]: position in items that items[k - 1] is paired with, if any
+    best: list[tuple[int, float]] = [(0, 0.0)] * (len(items) + 1)
+    partner: list[Optional[int]] = [None] * (len(items) + 1)
+    for k in range(2, len(items) + 1):
+        best[k] = best[k - 1]
+        for j in range(max(0, k - 1 - reach), k - 1):
+            cost = pair_cost(items[j], items[k - 1])
+            if cost is None:
+                continue
+            candidate = (best[j][0] + 1, best[j][1] - cost)
+            if candidate > best[k]:
+                best[k] = candidate
+                partner[k] = j
+
+    pairs = []
+    k = len(items)
+    while k >= 2:
+        j = partner[k]
+        if j is None:
+            k -= 1
+        else:
+            pairs.append((items[j], items[k - 1]))
+            k = j
+    pairs.reverse()
+    return pairs
@@ -0,0 +1 @@
+"""Coordination between service replicas."""
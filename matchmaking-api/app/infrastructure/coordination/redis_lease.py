@@ -0,0 +1,71 @@
+"""Redis leases, so that one replica at a time owns a piece of work."""
+import uuid
+from typing import Optional
+
+import redis.asyncio as redis
+
+# Take the lease if it is free, or extend it if we already hold it.
+# KEYS[1]: lease key; ARGV: owner, TTL in ms. Returns 1 if held.
+_ACQUIRE_SCRIPT = """
+local owner = redis.call('GET', KEYS[1])
+if not owner then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return 1
+end
+if owner == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Drop the lease only if we hold it. KEYS[1]: lease key; ARGV[1]: owner.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLeases:
+    """Named, expiring leases held by this process.
+
+    A holder renews its lease by acquiring it again before ``ttl_seconds``
+    pass; if it stops (crash, stall, shutdown), another replica can take
+    the lease once it expires.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ttl_seconds: float,
+        owner: Optional[str] = None,
+        prefix: str = "lease",
+    ) -> None:
+        """Initialize leases.
+
+        Args:
+            redis_client: Redis async client
+            ttl_seconds: Lease lifetime without renewal
+            owner: Identity of this holder (random by default)
+            prefix: Key prefix of the leases
+        """
+        self.redis = redis_client
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self.owner = owner or uuid.uuid4().hex
+        self.prefix = prefix
+        self._acquire = redis_client.register_script(_ACQUIRE_SCRIPT)
+        self._release = redis_client.register_script(_RELEASE_SCRIPT)
+
+    def _get_lease_key(self, name: str) -> str:
+        return f"{self.prefix}:{name}"
+
+    async def acquire(self, name: str) -> bool:
+        """Take or renew a lease; returns True if this process holds it."""
+        held = await self._acquire(keys=[self._get_lease_key(name)], args=[self.owner, self.ttl_ms])
+        return bool(held)
+
+    async def release(self, name: str) -> None:
+        """Give up a lease if this process holds it."""
+        await self._release(keys=[self._get_lease_key(name)], args=[self.owner])
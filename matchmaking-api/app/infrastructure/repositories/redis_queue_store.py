@@ -2,20 +2,71 @@
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 
 import redis.asyncio as redis
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from app.core.config import get_settings
 from app.domain.models import QueueEntryStatus, Ticket
 from app.domain.repositories.queue_store import QueueStoreRepository
 
 logger = logging.getLogger(__name__)
 
+ENTRY_TTL_SECONDS = 3600  # 1 hour expiry
+
+# Ticket fields stored as JSON inside the ticket hash
+_JSON_FIELDS = ("players", "hard_constraints", "soft_constraints", "widening_state")
+
+# Moves tickets to another status in one call: all of them or none.
+# KEYS: per ticket, its hash, current pool and rating sets, new pool and rating sets
+# ARGV: new status, match_id ('' = keep), updated_at (ISO), pool score for tickets
+#       without enqueued_ts (timestamp), TTL in seconds, then the status each
+#       ticket is expected to be in
+# Returns the number of tickets moved (0 if any is missing or in another status).
+# Pool sets stay scored by enqueue time, so a ticket put back into the search
+# keeps its age. Every key is passed in KEYS (built from the caller's tickets,
+# whose tenant and pool never change), so the script only touches declared keys.
+_TRANSITION_SCRIPT = """
+local count = #KEYS / 5
+for i = 0, count - 1 do
+    local status = redis.call('HGET', KEYS[i * 5 + 1], 'status')
+    if not status or status ~= ARGV[6 + i] then
+        return 0
+    end
+end
+for i = 0, count - 1 do
+    local key = KEYS[i * 5 + 1]
+    local ticket = redis.call('HMGET', key, 'ticket_id', 'rating', 'enqueued_ts')
+    redis.call('ZREM', KEYS[i * 5 + 2], ticket[1])
+    redis.call('ZREM', KEYS[i * 5 + 3], ticket[1])
+    redis.call('ZADD', KEYS[i * 5 + 4], ticket[3] or ARGV[4], ticket[1])
+    redis.call('ZADD', KEYS[i * 5 + 5], ticket[2], ticket[1])
+    redis.call('HSET', key, 'status', ARGV[1], 'updated_at', ARGV[3])
+    if ARGV[2] ~= '' then
+        redis.call('HSET', key, 'match_id', ARGV[2])
+    end
+    redis.call('EXPIRE', key, ARGV[5])
+end
+return count
+"""
+
+# Attempts of a status update by ticket ID, which races other status changes
+_TRANSITION_ATTEMPTS = 3
+
 
 class RedisQueueStore(QueueStoreRepository):
     """Redis implementation of queue store.
 
     Stores active queue entries in Redis for fast access and matching.
+    Each ticket is a hash, so status changes patch single fields; they run
+    as a server-side script that also moves the ticket between pool sets.
     """
 
     def __init__(self, redis_client: redis.Redis) -> None:
@@ -25,10 +76,12 @@ class RedisQueueStore(QueueStoreRepository):
             redis_client: Redis async client
         """
         self.redis = redis_client
+        self.settings = get_settings()
+        self._transition = redis_client.register_script(_TRANSITION_SCRIPT)
 
     def _get_entry_key(self, queue_entry_id: str) -> str:
-        """Get Redis key for queue entry."""
-        return f"queue_entry:{queue_entry_id}"
+        """Get Redis key for queue entry (a hash)."""
+        return f"queue_ticket:{queue_entry_id}"
 
     def _get_user_queue_key(self, user_id: str, tenant_id: str) -> str:
         """Get Redis key for user's active queue entry."""
@@ -38,14 +91,39 @@ class RedisQueueStore(QueueStoreRepository):
         """Get Redis key for pool entries."""
         return f"pool:{tenant_id}:{pool_key}:{status.value}"
 
-    def _serialize_entry(self, entry: Ticket) -> str:
-        """Serialize ticket to JSON."""
-        return json.dumps(entry.to_dict())
-
-    def _deserialize_entry(self, data: str) -> Ticket:
-        """Deserialize ticket from JSON."""
-        obj = json.loads(data)
-        return Ticket.from_dict(obj)
+    def _get_pool_rating_key(self, tenant_id: str, pool_key: str, status: QueueEntryStatus) -> str:
+        """Get Redis key for pool entries scored by rating."""
+        return f"pool_rating:{tenant_id}:{pool_key}:{status.value}"
+
+    def _entry_rating(self, entry: Ticket) -> float:
+        """Rating a ticket is indexed by in its pool."""
+        rating = entry.players[0].rating
+        return rating if rating is not None else self.settings.RATING_DEFAULT_MMR
+
+    def _serialize_entry(self, entry: Ticket) -> dict[str, Union[str, float]]:
+        """Serialize ticket to hash fields (None values are left out)."""
+        fields: dict[str, Union[str, float]] = {}
+        for name, value in entry.to_dict().items():
+            if value is None:
+                continue
+            fields[name] = json.dumps(value) if name in _JSON_FIELDS else value
+        fields["pool_key"] = self._get_pool_key_from_entry(entry)
+        fields["rating"] = self._entry_rating(entry)
+        fields["enqueued_ts"] = entry.enqueued_at.timestamp()
+        return fields
+
+    def _deserialize_entry(self, fields: dict) -> Ticket:
+        """Deserialize ticket from hash fields."""
+        data = {
+            (name.decode() if isinstance(name, bytes) else name): (
+                value.decode() if isinstance(value, bytes) else value
+            )
+            for name, value in fields.items()
+        }
+        for name in _JSON_FIELDS:
+            if name in data:
+                data[name] = _json_loads(data[name])
+        return Ticket.from_dict(data)
 
     def _get_pool_key_from_entry(self, entry: Ticket) -> str:
         """Build pool key from entry attributes."""
@@ -58,13 +136,17 @@ class RedisQueueStore(QueueStoreRepository):
         pool_key = self._get_pool_key_from_entry(entry)
         pool_entries_key = self._get_pool_key(entry.tenant_id, pool_key, entry.status)
 
-        entry_data = self._serialize_entry(entry)
-
         # Use pipeline for atomic operations
         pipe = self.redis.pipeline()
-        pipe.set(entry_key, entry_data, ex=3600)  # 1 hour expiry
-        pipe.set(user_queue_key, entry.ticket_id, ex=3600)
+        pipe.delete(entry_key)
+        pipe.hset(entry_key, mapping=self._serialize_entry(entry))
+        pipe.expire(entry_key, ENTRY_TTL_SECONDS)
+        pipe.set(user_queue_key, entry.ticket_id, ex=ENTRY_TTL_SECONDS)
         pipe.zadd(pool_entries_key, {entry.ticket_id: entry.enqueued_at.timestamp()})
+        pipe.zadd(
+            self._get_pool_rating_key(entry.tenant_id, pool_key, entry.status),
+            {entry.ticket_id: self._entry_rating(entry)},
+        )
         await pipe.execute()
 
         logger.info(
@@ -75,10 +157,10 @@ class RedisQueueStore(QueueStoreRepository):
     async def get_entry(self, ticket_id: str) -> Optional[Ticket]:
         """Get ticket by ID."""
         entry_key = self._get_entry_key(ticket_id)
-        data = await self.redis.get(entry_key)
-        if not data:
+        fields = await self.redis.hgetall(entry_key)
+        if not fields:
             return None
-        return self._deserialize_entry(data)
+        return self._deserialize_entry(fields)
 
     async def update_entry_status(
         self,
@@ -87,36 +169,59 @@ class RedisQueueStore(QueueStoreRepository):
         match_id: Optional[str] = None,
     ) -> None:
         """Update entry status."""
-        entry = await self.get_entry(ticket_id)
-        if not entry:
-            logger.warning(f"Queue entry {ticket_id} not found for status update")
-            return
-
-        old_pool_key = self._get_pool_key_from_entry(entry)
-        old_pool_entries_key = self._get_pool_key(entry.tenant_id, old_pool_key, entry.status)
-
-        entry.status = status
-        entry.updated_at = datetime.now(timezone.utc)
-        if match_id:
-            entry.match_id = match_id
-
-        new_pool_key = self._get_pool_key_from_entry(entry)
-        new_pool_entries_key = self._get_pool_key(entry.tenant_id, new_pool_key, status)
-
-        entry_key = self._get_entry_key(ticket_id)
-        entry_data = self._serialize_entry(entry)
-
-        # Update and move to new pool
-        pipe = self.redis.pipeline()
-        pipe.set(entry_key, entry_data, ex=3600)
-        pipe.zrem(old_pool_entries_key, ticket_id)
-        pipe.zadd(new_pool_entries_key, {ticket_id: datetime.now(timezone.utc).timestamp()})
-        await pipe.execute()
+        for _ in range(_TRANSITION_ATTEMPTS):
+            entry = await self.get_entry(ticket_id)
+            if not entry:
+                logger.warning(f"Queue entry {ticket_id} not found for status update")
+                return
+            if await self.transition_entries([entry], status, match_id, from_status=None):
+                logger.info(f"Updated ticket {ticket_id} status to {status.value}")
+                return
+            # The ticket changed status since it was read; read it again
+        logger.warning(f"Queue entry {ticket_id} kept changing status; not updated")
+
+    async def transition_entries(
+        self,
+        entries: list[Ticket],
+        status: QueueEntryStatus,
+        match_id: Optional[str] = None,
+        from_status: Optional[QueueEntryStatus] = QueueEntryStatus.SEARCHING,
+    ) -> bool:
+        """Atomically move tickets to a status.
+
+        One script call (a single round-trip) moves the tickets between pool
+        sets and patches their status, update time and match ID in place. The
+        pool keys come from the tickets themselves; nothing changes unless
+        every ticket exists and is in ``from_status`` (the status it was
+        loaded in when None) when the script runs.
+        """
+        keys: list[str] = []
+        expected: list[str] = []
+        for entry in entries:
+            current = from_status or entry.status
+            pool_key = self._get_pool_key_from_entry(entry)
+            keys += [
+                self._get_entry_key(entry.ticket_id),
+                self._get_pool_key(entry.tenant_id, pool_key, current),
+                self._get_pool_rating_key(entry.tenant_id, pool_key, current),
+                self._get_pool_key(entry.tenant_id, pool_key, status),
+                self._get_pool_rating_key(entry.tenant_id, pool_key, status),
+            ]
+            expected.append(current.value)
 
-        logger.info(
-            f"Updated ticket {ticket_id} status to {status.value}",
-            extra={"tenant_id": entry.tenant_id},
+        now = datetime.now(timezone.utc)
+        moved = await self._transition(
+            keys=keys,
+            args=[
+                status.value,
+                match_id or "",
+                now.isoformat(),
+                now.timestamp(),
+                ENTRY_TTL_SECONDS,
+                *expected,
+            ],
         )
+        return bool(moved)
 
     async def get_active_entry_for_user(self, user_id: str, tenant_id: str) -> Optional[Ticket]:
         """Get active ticket for user."""
@@ -141,6 +246,7 @@ class RedisQueueStore(QueueStoreRepository):
         pipe.delete(entry_key)
         pipe.delete(user_queue_key)
         pipe.zrem(pool_entries_key, ticket_id)
+        pipe.zrem(self._get_pool_rating_key(entry.tenant_id, pool_key, entry.status), ticket_id)
         await pipe.execute()
 
         logger.info(f"Removed ticket {ticket_id}")
@@ -150,37 +256,70 @@ class RedisQueueStore(QueueStoreRepository):
         tenant_id: str,
         pool_key: str,
         status: QueueEntryStatus = QueueEntryStatus.SEARCHING,
+        *,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        enqueued_after: Optional[datetime] = None,
+        enqueued_before: Optional[datetime] = None,
     ) -> list[Ticket]:
-        """Get all entries in a pool by status."""
-        pool_entries_key = self._get_pool_key(tenant_id, pool_key, status)
-        entry_ids = await self.redis.zrange(pool_entries_key, 0, -1)
+        """Get entries in a pool by status, optionally within a rating band or age.
 
+        Only the matching ids are read from the pool sorted sets
+        (``ZRANGEBYSCORE``); the tickets are then loaded in bulk.
+        """
+        pool_entries_key = self._get_pool_key(tenant_id, pool_key, status)
+        age_window = enqueued_after is not None or enqueued_before is not None
+        rating_window = min_rating is not None or max_rating is not None
+
+        if age_window:
+            entry_ids = await self.redis.zrangebyscore(
+                pool_entries_key,
+                enqueued_after.timestamp() if enqueued_after else "-inf",
+                enqueued_before.timestamp() if enqueued_before else "+inf",
+            )
+        if rating_window:
+            rating_ids = await self.redis.zrangebyscore(
+                self._get_pool_rating_key(tenant_id, pool_key, status),
+                "-inf" if min_rating is None else min_rating,
+                "+inf" if max_rating is None else max_rating,
+            )
+            if age_window:
+                in_band = set(rating_ids)
+                entry_ids = [entry_id for entry_id in entry_ids if entry_id in in_band]
+            else:
+                entry_ids = rating_ids
+        if not age_window and not rating_window:
+            entry_ids = await self.redis.zrange(pool_entries_key, 0, -1)
+
+        return await self._get_entries(entry_ids)
+
+    async def _get_entries(self, ticket_ids: list[str]) -> list[Ticket]:
+        """Load tickets with pipelined HGETALLs, in bounded chunks.
+
+        Missing (expired) tickets are skipped; order follows ``ticket_ids``.
+        """
         entries: list[Ticket] = []
-        for entry_id in entry_ids:
-            entry = await self.get_entry(entry_id)
-            if entry:
-                entries.append(entry)
-
+        chunk_size = self.settings.REDIS_BULK_LOAD_CHUNK_SIZE
+        for start in range(0, len(ticket_ids), chunk_size):
+            pipe = self.redis.pipeline(transaction=False)
+            for ticket_id in ticket_ids[start : start + chunk_size]:
+                pipe.hgetall(self._get_entry_key(ticket_id))
+            for fields in await pipe.execute():
+                if fields:
+                    entries.append(self._deserialize_entry(fields))
         return entries
 
     async def get_queue_stats(self, tenant_id: str, pool_key: str) -> dict:
         """Get queue statistics."""
-        pool_entries_key = self._get_pool_key(tenant_id, pool_key, QueueEntryStatus.SEARCHING)
-        entry_ids = await self.redis.zrange(pool_entries_key, 0, -1)
+        entries = await self.get_queue_by_pool(tenant_id, pool_key, QueueEntryStatus.SEARCHING)
 
-        if not entry_ids:
+        if not entries:
             return {
                 "waiting_count": 0,
                 "avg_wait_seconds": 0.0,
                 "p95_wait_seconds": 0.0,
             }
 
-        entries: list[Ticket] = []
-        for entry_id in entry_ids:
-            entry = await self.get_entry(entry_id)
-            if entry:
-                entries.append(entry)
-
         now = datetime.now(timezone.utc)
         wait_times = [entry.time_in_queue_seconds(now) for entry in entries]
         wait_times.sort()
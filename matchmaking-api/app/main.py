@@ -1,7 +1,8 @@
 """FastAPI application factory."""
+import asyncio
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, AsyncIterator
 
 import httpx
 import redis.asyncio as redis
@@ -22,6 +23,7 @@ from app.core.tracing import (
     setup_tracing,
 )
 from app.api.middleware.metrics import MetricsMiddleware
+from app.infrastructure.coordination.redis_lease import RedisLeases
 from app.infrastructure.database.connection import database_manager
 from app.infrastructure.external.live_game_api import LiveGameAPIClient
 from app.infrastructure.repositories.postgres_challenge_repo import (
@@ -32,6 +34,7 @@ from app.infrastructure.repositories.postgres_match_record_repo import (
 )
 from app.infrastructure.repositories.redis_queue_store import RedisQueueStore
 from app.repositories.postgres_ticket_repository import PostgresTicketRepository
+from app.workers.matchmaking_worker import MatchmakingWorker
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,7 @@ logger = logging.getLogger(__name__)
 # Global state
 redis_client: redis.Redis | None = None
 http_client: httpx.AsyncClient | None = None
+matchmaking_worker: MatchmakingWorker | None = None
 
 
 @asynccontextmanager
@@ -47,7 +51,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown.
     """
-    global redis_client, http_client
+    global redis_client, http_client, matchmaking_worker
 
     # Startup
     settings = get_settings()
@@ -79,14 +83,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     http_client = httpx.AsyncClient(timeout=settings.LIVE_GAME_API_TIMEOUT_SECONDS)
     logger.info("HTTP client created")
 
-    # TODO: Start matchmaking worker in background
-    # await run_worker(matchmaking_service)
+    # Start matchmaking worker in background
+    worker_task: asyncio.Task | None = None
+    if settings.WORKER_ENABLED:
+
+        @asynccontextmanager
+        async def ticket_repo_session() -> AsyncIterator[PostgresTicketRepository]:
+            async with database_manager.session() as session:
+                yield PostgresTicketRepository(
+                    session,
+                    redis_client,
+                    enable_heartbeat_cache=settings.TICKET_HEARTBEATS_REDIS_ENABLED,
+                )
+
+        matchmaking_worker = MatchmakingWorker(
+            ticket_repo_factory=ticket_repo_session,
+            leases=RedisLeases(
+                redis_client,
+                ttl_seconds=settings.WORKER_POOL_LEASE_TTL_SECONDS,
+                prefix="matchmaking:lease",
+            ),
+        )
+        worker_task = asyncio.create_task(matchmaking_worker.start())
+        logger.info("Matchmaking worker scheduled")
 
     yield
 
     # Shutdown
     logger.info("Shutting down")
 
+    if worker_task:
+        await matchmaking_worker.stop()
+        worker_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker_task
+
     if http_client:
         await http_client.aclose()
         logger.info("HTTP client closed")
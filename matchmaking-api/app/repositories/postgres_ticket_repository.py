@@ -266,7 +266,7 @@ class PostgresTicketRepository(TicketRepository):
         models = result.scalars().unique().all()
         return [self._to_entity(model) for model in models]
 
-    async def list_active_tickets(self) -> list[Ticket]:
+    async def list_active_tickets(self, pool_key: str | None = None) -> list[Ticket]:
         now = datetime.now(timezone.utc)
         stmt = (
             select(MatchTicketModel)
@@ -279,10 +279,28 @@ class PostgresTicketRepository(TicketRepository):
                 ),
             )
         )
+        if pool_key is not None:
+            stmt = stmt.where(MatchTicketModel.pool_key == pool_key)
         result = await self.session.execute(stmt)
         models = result.scalars().unique().all()
         return [self._to_entity(model) for model in models]
 
+    async def list_active_pool_keys(self) -> set[str]:
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(MatchTicketModel.pool_key)
+            .where(
+                MatchTicketModel.status.in_(_PROPOSABLE_STATUSES),
+                (
+                    MatchTicketModel.heartbeat_timeout_at.is_(None)
+                    | (MatchTicketModel.heartbeat_timeout_at > now)
+                ),
+            )
+            .distinct()
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def create_proposal(
         self,
         ticket_ids: Sequence[str],
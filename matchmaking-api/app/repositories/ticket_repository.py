@@ -139,8 +139,13 @@ class TicketRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def list_active_tickets(self) -> list[Ticket]:
-        """Return tickets that are still eligible for matchmaking."""
+    async def list_active_tickets(self, pool_key: str | None = None) -> list[Ticket]:
+        """Return tickets that are still eligible for matchmaking (of one pool, if given)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_active_pool_keys(self) -> set[str]:
+        """Return the pools that have tickets waiting to be proposed."""
         raise NotImplementedError
 
     @abstractmethod
@@ -1,13 +1,19 @@
 """Matchmaking worker process."""
 import asyncio
 import logging
+import time
 import uuid
-from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional
 
 from app.core.config import get_settings
+from app.core.metrics import (
+    matchmaking_worker_cycle_seconds,
+    matchmaking_worker_leased_pools,
+)
 from app.domain.services.matchmaking_service import MatchmakingService
+from app.infrastructure.coordination.redis_lease import RedisLeases
 from app.infrastructure.database.match_ticket_model import MatchTicketStatus
 from app.repositories.postgres_ticket_repository import PostgresTicketRepository
 
@@ -16,6 +22,8 @@ logger = logging.getLogger(__name__)
 
 _MATCHMAKING_STATUSES = {MatchTicketStatus.QUEUED, MatchTicketStatus.SEARCHING}
 
+TicketRepoFactory = Callable[[], AsyncContextManager[PostgresTicketRepository]]
+
 
 class MatchmakingWorker:
     """Background worker for matchmaking.
@@ -26,120 +34,235 @@ class MatchmakingWorker:
     - Find matching players in queues
     - Create games via live-game-api
     - Handle queue timeouts
+
+    Every pool with waiting tickets gets its own loop. With ``leases``, a
+    pool is only processed by the replica holding its lease, so pools are
+    spread over replicas. Each loop adapts its cadence: a pool that just
+    produced proposals is processed again quickly, an idle pool backs off.
     """
 
     def __init__(
         self,
-        matchmaking_service: MatchmakingService,
+        matchmaking_service: Optional[MatchmakingService] = None,
         ticket_repo: Optional[PostgresTicketRepository] = None,
+        *,
+        ticket_repo_factory: Optional[TicketRepoFactory] = None,
+        leases: Optional[RedisLeases] = None,
     ) -> None:
         """Initialize worker.
 
         Args:
             matchmaking_service: Matchmaking service instance
+            ticket_repo: Ticket repository shared by all cycles
+            ticket_repo_factory: Opens a ticket repository per cycle
+                (preferred for long-running workers: one session per cycle)
+            leases: Pool leases shared by the replicas (None: own all pools)
         """
         self.matchmaking_service = matchmaking_service
         self.settings = get_settings()
         self.running = False
         self.ticket_repo = ticket_repo
+        self.ticket_repo_factory = ticket_repo_factory
+        self.leases = leases
         self.pool_keys: set[str] = set()
+        self._pool_tasks: dict[str, asyncio.Task] = {}
+        self._leased_pools: set[str] = set()
 
     async def start(self) -> None:
-        """Start worker loop."""
+        """Start worker loop: keep one loop running per active pool."""
+        if not self._has_ticket_repo():
+            logger.warning("Matchmaking worker has no ticket repository; not starting")
+            return
+
         self.running = True
         logger.info("Matchmaking worker started")
 
-        await self._refresh_active_pool_keys()
+        try:
+            while self.running:
+                try:
+                    await self._refresh_active_pool_keys()
+                except Exception as e:
+                    logger.error(f"Error refreshing matchmaking pools: {str(e)}", exc_info=True)
 
-        while self.running:
-            try:
-                await self._process_matching_cycle()
-            except Exception as e:
-                logger.error(f"Error in matching cycle: {str(e)}", exc_info=True)
+                for pool_key in self.pool_keys - self._pool_tasks.keys():
+                    self._pool_tasks[pool_key] = asyncio.create_task(self._run_pool(pool_key))
+                for pool_key, task in list(self._pool_tasks.items()):
+                    if task.done():
+                        del self._pool_tasks[pool_key]
 
-            await asyncio.sleep(self.settings.WORKER_INTERVAL_SECONDS)
+                await asyncio.sleep(self.settings.WORKER_POOL_DISCOVERY_INTERVAL_SECONDS)
+        finally:
+            await self._stop_pool_loops()
 
     async def stop(self) -> None:
         """Stop worker loop."""
         self.running = False
         logger.info("Matchmaking worker stopped")
 
-    async def _process_matching_cycle(self) -> None:
-        """Process one matching cycle.
+    async def _run_pool(self, pool_key: str) -> None:
+        """Process one pool until it has no waiting tickets or the worker stops."""
+        interval = self.settings.WORKER_INTERVAL_SECONDS
+        try:
+            while self.running and pool_key in self.pool_keys:
+                if not await self._hold_lease(pool_key):
+                    # Another replica owns the pool; check again before its lease could expire
+                    await asyncio.sleep(self.settings.WORKER_POOL_MAX_INTERVAL_SECONDS)
+                    continue
+
+                try:
+                    waiting, proposed = await self._process_pool_cycle(pool_key)
+                    interval = self._next_interval(interval, waiting, proposed)
+                except Exception as e:
+                    logger.error(
+                        f"Error in matching cycle for pool {pool_key}: {str(e)}", exc_info=True
+                    )
+                    interval = self.settings.WORKER_POOL_MAX_INTERVAL_SECONDS
+
+                await asyncio.sleep(interval)
+        finally:
+            await self._drop_lease(pool_key)
+
+    def _next_interval(self, interval: float, waiting: int, proposed: int) -> float:
+        """Cadence of a pool after a cycle."""
+        if proposed:
+            return self.settings.WORKER_POOL_MIN_INTERVAL_SECONDS
+        if waiting >= 2:
+            return self.settings.WORKER_INTERVAL_SECONDS
+        return min(interval * 2, self.settings.WORKER_POOL_MAX_INTERVAL_SECONDS)
+
+    async def _process_pool_cycle(self, pool_key: str) -> tuple[int, int]:
+        """Process one matching cycle of a pool.
 
-        Finds matches for all pools and creates games.
+        Loads the pool's tickets once and creates proposals for them. The
+        proposals are written from a fresh repository, as each of them runs
+        in its own transaction.
+
+        Returns:
+            (tickets waiting, proposals created)
         """
-        await self._refresh_active_pool_keys()
-        await self._process_proposals()
+        started = time.perf_counter()
+        async with self._open_ticket_repo() as ticket_repo:
+            tickets = await ticket_repo.list_active_tickets(pool_key)
+        waiting = [ticket for ticket in tickets if ticket.status in _MATCHMAKING_STATUSES]
 
-    async def _process_proposals(self) -> None:
-        """Create ready-check proposals for eligible tickets."""
+        proposed = 0
+        if len(waiting) >= 2:
+            async with self._open_ticket_repo() as ticket_repo:
+                proposed = await self._process_proposals(ticket_repo, pool_key, list(waiting))
+        matchmaking_worker_cycle_seconds.observe(time.perf_counter() - started)
+        return len(waiting), proposed
 
-        if not self.ticket_repo:
-            return
+    async def _process_proposals(
+        self, ticket_repo: PostgresTicketRepository, pool_key: str, tickets: list
+    ) -> int:
+        """Create ready-check proposals for eligible tickets of a pool."""
 
-        active_tickets = await self.ticket_repo.list_active_tickets()
-        tickets_by_pool: dict[str, list] = defaultdict(list)
+        tickets.sort(key=lambda t: t.created_at)
+        proposed = 0
 
-        for ticket in active_tickets:
-            if ticket.status in _MATCHMAKING_STATUSES:
-                tickets_by_pool[ticket.pool_key].append(ticket)
+        while len(tickets) >= 2:
+            ticket_batch = [tickets.pop(0), tickets.pop(0)]
+            proposal_id = f"prop_{uuid.uuid4().hex[:12]}"
+            proposal_timeout_at = datetime.now(timezone.utc) + timedelta(
+                seconds=self.settings.PROPOSING_TIMEOUT_SECONDS
+            )
 
-        for pool_key, tickets in tickets_by_pool.items():
-            tickets.sort(key=lambda t: t.created_at)
+            created = await ticket_repo.create_proposal(
+                [t.ticket_id for t in ticket_batch],
+                proposal_id=proposal_id,
+                proposal_timeout_at=proposal_timeout_at,
+            )
 
-            while len(tickets) >= 2:
-                ticket_batch = [tickets.pop(0), tickets.pop(0)]
-                proposal_id = f"prop_{uuid.uuid4().hex[:12]}"
-                proposal_timeout_at = datetime.now(timezone.utc) + timedelta(
-                    seconds=self.settings.PROPOSING_TIMEOUT_SECONDS
+            if created:
+                proposed += 1
+                logger.info(
+                    "Created proposal",
+                    extra={
+                        "proposal_id": proposal_id,
+                        "pool_key": pool_key,
+                        "tickets": [t.ticket_id for t in created],
+                    },
                 )
-
-                created = await self.ticket_repo.create_proposal(
-                    [t.ticket_id for t in ticket_batch],
-                    proposal_id=proposal_id,
-                    proposal_timeout_at=proposal_timeout_at,
+            else:
+                logger.debug(
+                    "Skipped proposal creation due to race",
+                    extra={
+                        "proposal_id": proposal_id,
+                        "pool_key": pool_key,
+                        "tickets": [t.ticket_id for t in ticket_batch],
+                    },
                 )
 
-                if created:
-                    logger.info(
-                        "Created proposal",
-                        extra={
-                            "proposal_id": proposal_id,
-                            "pool_key": pool_key,
-                            "tickets": [t.ticket_id for t in created],
-                        },
-                    )
-                else:
-                    logger.debug(
-                        "Skipped proposal creation due to race",
-                        extra={
-                            "proposal_id": proposal_id,
-                            "pool_key": pool_key,
-                            "tickets": [t.ticket_id for t in ticket_batch],
-                        },
-                    )
+        return proposed
 
     async def _refresh_active_pool_keys(self) -> None:
-        if not self.ticket_repo:
+        async with self._open_ticket_repo() as ticket_repo:
+            self.pool_keys = await ticket_repo.list_active_pool_keys()
+
+    async def _hold_lease(self, pool_key: str) -> bool:
+        if self.leases is None:
+            return True
+        held = await self.leases.acquire(pool_key)
+        if held != (pool_key in self._leased_pools):
+            if held:
+                self._leased_pools.add(pool_key)
+                logger.info(f"Acquired matchmaking lease for pool {pool_key}")
+            else:
+                self._leased_pools.discard(pool_key)
+                logger.info(f"Lost matchmaking lease for pool {pool_key}")
+            matchmaking_worker_leased_pools.set(len(self._leased_pools))
+        return held
+
+    async def _drop_lease(self, pool_key: str) -> None:
+        if self.leases is None or pool_key not in self._leased_pools:
             return
+        self._leased_pools.discard(pool_key)
+        matchmaking_worker_leased_pools.set(len(self._leased_pools))
+        try:
+            await self.leases.release(pool_key)
+        except Exception as e:
+            logger.warning(f"Failed to release lease for pool {pool_key}: {str(e)}")
+
+    async def _stop_pool_loops(self) -> None:
+        tasks = list(self._pool_tasks.values())
+        self._pool_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _has_ticket_repo(self) -> bool:
+        return self.ticket_repo is not None or self.ticket_repo_factory is not None
 
-        tickets = await self.ticket_repo.list_active_tickets()
-        self.pool_keys = {
-            ticket.pool_key for ticket in tickets if ticket.status in _MATCHMAKING_STATUSES
-        }
+    @asynccontextmanager
+    async def _open_ticket_repo(self) -> AsyncIterator[PostgresTicketRepository]:
+        if self.ticket_repo_factory is not None:
+            async with self.ticket_repo_factory() as ticket_repo:
+                yield ticket_repo
+        else:
+            yield self.ticket_repo
 
 
 async def run_worker(
-    matchmaking_service: MatchmakingService,
+    matchmaking_service: Optional[MatchmakingService] = None,
     ticket_repo: Optional[PostgresTicketRepository] = None,
+    *,
+    ticket_repo_factory: Optional[TicketRepoFactory] = None,
+    leases: Optional[RedisLeases] = None,
 ) -> None:
     """Run matchmaking worker.
 
     Args:
         matchmaking_service: Matchmaking service instance
+        ticket_repo: Ticket repository shared by all cycles
+        ticket_repo_factory: Opens a ticket repository per cycle
+        leases: Pool leases shared by the replicas
     """
-    worker = MatchmakingWorker(matchmaking_service, ticket_repo)
+    worker = MatchmakingWorker(
+        matchmaking_service,
+        ticket_repo,
+        ticket_repo_factory=ticket_repo_factory,
+        leases=leases,
+    )
 
     try:
         await worker.start()
@@ -0,0 +1,125 @@
+"""Benchmark greedy vs batch (min-cost) matching on synthetic pools.
+
+Usage (from the matchmaking-api directory):
+
+    python -m scripts.benchmark_matching --sizes 1000 10000 100000
+
+For each pool size and mode it reports the share of tickets matched, the mean
+rating gap of the matches, and the CPU time of one matching cycle.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.clients.rating_client import PlayerRating
+from app.core.config import get_settings
+from app.domain.models import (
+    HardConstraints,
+    Player,
+    QueueEntryStatus,
+    SoftConstraints,
+    Ticket,
+    TicketType,
+    WideningState,
+)
+from app.domain.services.matchmaking_service import MatchmakingService
+
+REGIONS = ["EU", "NA", "ASIA"]
+MODES = ["greedy", "batch"]
+
+
+class InMemoryQueueStore:
+    def __init__(self, tickets: list[Ticket]) -> None:
+        self.tickets = tickets
+
+    async def get_queue_by_pool(self, tenant_id, pool_key, status):
+        return list(self.tickets)
+
+
+class StaticRatingClient:
+    def __init__(self, ratings: dict[str, PlayerRating]) -> None:
+        self.ratings = ratings
+
+    async def get_bulk_ratings(self, user_ids, pool_id):
+        return self.ratings
+
+
+def synthetic_pool(
+    size: int, seed: int, rating_sd: float = 350.0, max_wait: float = 120.0
+) -> tuple[list[Ticket], dict[str, PlayerRating]]:
+    """Ratings ~ N(1500, rating_sd), uniform waits, a quarter without region preference."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    tickets = []
+    ratings = {}
+    for index in range(size):
+        user_id = f"user_{index}"
+        latency_ms = {region: rng.choice([15, 40, 90, 180]) for region in REGIONS}
+        preferred_region = rng.choice(REGIONS + [None])
+        max_latency_ms = 100 if rng.random() < 0.2 else None
+        tickets.append(
+            Ticket(
+                ticket_id=f"t_{index}",
+                tenant_id="t_bench",
+                ticket_type=TicketType.SOLO,
+                status=QueueEntryStatus.SEARCHING,
+                players=[Player(user_id=user_id, metadata={"latency_ms": latency_ms})],
+                hard_constraints=HardConstraints(time_control="5+0", mode="rated"),
+                soft_constraints=SoftConstraints(
+                    preferred_region=preferred_region, max_latency_ms=max_latency_ms
+                ),
+                widening_state=WideningState(current_window=get_settings().INITIAL_RATING_WINDOW),
+                enqueued_at=now - timedelta(seconds=rng.uniform(0, max_wait)),
+                updated_at=now,
+                last_heartbeat_at=now,
+            )
+        )
+        ratings[user_id] = PlayerRating(
+            rating=round(rng.gauss(1500, rating_sd)), rating_deviation=60.0
+        )
+    return tickets, ratings
+
+
+async def run_cycle(
+    size: int, mode: str, seed: int, rating_sd: float = 350.0, max_wait: float = 120.0
+) -> dict:
+    tickets, ratings = synthetic_pool(size, seed, rating_sd, max_wait)
+    service = MatchmakingService(
+        InMemoryQueueStore(tickets), None, None, StaticRatingClient(ratings)
+    )
+    service.settings = get_settings().model_copy(update={"MATCHING_MODE": mode})
+
+    started = time.process_time()
+    matches = await service.find_matches_for_pool("t_bench", "bench")
+    cpu_seconds = time.process_time() - started
+
+    gaps = [abs(a.players[0].rating - b.players[0].rating) for a, b, _ in matches]
+    return {
+        "match_rate": 2 * len(matches) / size,
+        "mean_gap": sum(gaps) / len(gaps) if gaps else 0.0,
+        "cpu_seconds": cpu_seconds,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--rating-sd", type=float, default=350.0, help="Rating spread of the pool")
+    parser.add_argument("--max-wait", type=float, default=120.0, help="Longest wait in seconds")
+    args = parser.parse_args()
+
+    print(f"{'tickets':>8} {'mode':>7} {'matched':>8} {'mean gap':>9} {'cpu (s)':>8}")
+    for size in args.sizes:
+        for mode in MODES:
+            result = await run_cycle(size, mode, args.seed, args.rating_sd, args.max_wait)
+            print(
+                f"{size:>8} {mode:>7} {result['match_rate']:>8.1%} "
+                f"{result['mean_gap']:>9.1f} {result['cpu_seconds']:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""Unit tests for claiming tickets when a match is created."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+
+from app.core.exceptions import CannotCancelException
+from app.domain.models import (
+    HardConstraints,
+    Player,
+    QueueEntryStatus,
+    Ticket,
+    TicketType,
+    WideningState,
+)
+from app.domain.services.matchmaking_service import MatchmakingService
+from app.infrastructure.repositories.redis_queue_store import RedisQueueStore
+
+
+def make_ticket(index: int) -> Ticket:
+    now = datetime.now(timezone.utc)
+    return Ticket(
+        ticket_id=f"t_{index}",
+        tenant_id="t_default",
+        ticket_type=TicketType.SOLO,
+        status=QueueEntryStatus.SEARCHING,
+        players=[Player(user_id=f"user_{index}", rating=1500)],
+        hard_constraints=HardConstraints(time_control="5+0", mode="rated"),
+        soft_constraints=None,
+        widening_state=WideningState(current_window=100),
+        enqueued_at=now - timedelta(seconds=10),
+        updated_at=now,
+    )
+
+
+@pytest_asyncio.fixture
+async def queue_store():
+    client = aioredis.FakeRedis(decode_responses=True)
+    yield RedisQueueStore(client)
+    await client.aclose()
+
+
+@pytest_asyncio.fixture
+async def tickets(queue_store):
+    entries = [make_ticket(0), make_ticket(1)]
+    for entry in entries:
+        await queue_store.add_entry(entry)
+    return entries
+
+
+@pytest.fixture
+def live_game_api():
+    client = AsyncMock()
+    client.create_game.return_value = "game_123"
+    return client
+
+
+@pytest.fixture
+def service(queue_store, live_game_api):
+    return MatchmakingService(queue_store, AsyncMock(), live_game_api, AsyncMock())
+
+
+@pytest.mark.asyncio
+class TestMatchPlayers:
+    """Test that tickets are claimed before the game is created."""
+
+    async def test_cancel_during_game_creation_loses(
+        self, service, queue_store, tickets, live_game_api
+    ):
+        async def create_game(**kwargs):
+            with pytest.raises(CannotCancelException):
+                await service.cancel_queue_entry("t_0", "user_0")
+            return "game_123"
+
+        live_game_api.create_game.side_effect = create_game
+
+        assert await service.match_players(*tickets, 1500, 1500, "DEFAULT")
+
+        for ticket_id in ("t_0", "t_1"):
+            entry = await queue_store.get_entry(ticket_id)
+            assert (entry.status, entry.match_id) == (QueueEntryStatus.MATCHED, "game_123")
+
+    async def test_cancelled_ticket_is_not_matched(
+        self, service, queue_store, tickets, live_game_api
+    ):
+        await service.cancel_queue_entry("t_1", "user_1")
+
+        assert not await service.match_players(*tickets, 1500, 1500, "DEFAULT")
+
+        live_game_api.create_game.assert_not_called()
+        assert (await queue_store.get_entry("t_0")).status == QueueEntryStatus.SEARCHING
+
+    async def test_failed_game_creation_releases_tickets(
+        self, service, queue_store, tickets, live_game_api
+    ):
+        live_game_api.create_game.side_effect = RuntimeError("live-game-api down")
+
+        assert not await service.match_players(*tickets, 1500, 1500, "DEFAULT")
+
+        pool_key = tickets[0].hard_constraints.pool_key()
+        searching = await queue_store.get_queue_by_pool("t_default", pool_key)
+        assert sorted(entry.ticket_id for entry in searching) == ["t_0", "t_1"]
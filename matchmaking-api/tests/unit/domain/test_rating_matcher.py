@@ -0,0 +1,262 @@
+"""Unit tests for rating-window matching."""
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.clients.rating_client import PlayerRating
+from app.domain.models import (
+    HardConstraints,
+    Player,
+    QueueEntryStatus,
+    SoftConstraints,
+    Ticket,
+    TicketType,
+    WideningState,
+)
+from app.domain.services.matchmaking_service import MatchmakingService
+from app.domain.utils.rating_index import RatingIndex
+from app.domain.utils.rating_pairing import pair_along_ratings
+
+REGIONS = [None, "EU", "NA", "ASIA"]
+
+
+def make_ticket(
+    index: int,
+    wait_seconds: float,
+    preferred_region=None,
+    max_latency_ms=None,
+    latency_ms=None,
+) -> Ticket:
+    now = datetime.now(timezone.utc)
+    soft = (
+        SoftConstraints(preferred_region=preferred_region, max_latency_ms=max_latency_ms)
+        if preferred_region or max_latency_ms
+        else None
+    )
+    return Ticket(
+        ticket_id=f"t_{index}",
+        tenant_id="t_default",
+        ticket_type=TicketType.SOLO,
+        status=QueueEntryStatus.SEARCHING,
+        players=[Player(user_id=f"user_{index}", metadata={"latency_ms": latency_ms or {}})],
+        hard_constraints=HardConstraints(time_control="5+0", mode="rated"),
+        soft_constraints=soft,
+        widening_state=WideningState(current_window=100),
+        enqueued_at=now - timedelta(seconds=wait_seconds),
+        updated_at=now,
+        last_heartbeat_at=now,
+    )
+
+
+def random_pool(seed: int, size: int) -> tuple[list[Ticket], dict[str, PlayerRating]]:
+    rng = random.Random(seed)
+    tickets = []
+    ratings = {}
+    for index in range(size):
+        latency_ms = {region: rng.choice([20, 80, 200]) for region in REGIONS[1:]}
+        tickets.append(
+            make_ticket(
+                index,
+                wait_seconds=rng.choice([0, 5, 12, 40, 95]),
+                preferred_region=rng.choice(REGIONS),
+                max_latency_ms=rng.choice([None, None, 100]),
+                latency_ms=latency_ms,
+            )
+        )
+        if rng.random() < 0.9:  # Some players are unrated (default MMR)
+            ratings[f"user_{index}"] = PlayerRating(
+                rating=rng.choice([rng.randint(800, 2400), 1500]), rating_deviation=50.0
+            )
+    return tickets, ratings
+
+
+def reference_matches(service: MatchmakingService, entries: list[Ticket], ratings: dict) -> list:
+    """The original all-pairs greedy matcher."""
+    now = datetime.now(timezone.utc)
+    entries = sorted(entries, key=lambda e: e.time_in_queue_seconds(now), reverse=True)
+
+    def rating_of(ticket):
+        rating = ratings.get(ticket.players[0].user_id)
+        return rating.rating if rating else service.settings.RATING_DEFAULT_MMR
+
+    matches = []
+    used = set()
+    for i, entry in enumerate(entries):
+        if entry.ticket_id in used:
+            continue
+        window = service._widen_window(entry, now)
+        best, best_diff = None, float("inf")
+        for j, candidate in enumerate(entries):
+            if i >= j or candidate.ticket_id in used:
+                continue
+            if not service._regions_compatible(entry, candidate):
+                continue
+            region = service._select_match_region(entry, candidate)
+            if not (
+                service._within_latency_budget(entry, region)
+                and service._within_latency_budget(candidate, region)
+            ):
+                continue
+            diff = abs(rating_of(entry) - rating_of(candidate))
+            if diff <= window and diff < best_diff:
+                best, best_diff = candidate, diff
+        if best:
+            matches.append(
+                (entry.ticket_id, best.ticket_id, service._select_match_region(entry, best))
+            )
+            used.update((entry.ticket_id, best.ticket_id))
+    return matches
+
+
+def make_service(entries: list[Ticket], ratings: dict, mode: str = "greedy") -> MatchmakingService:
+    queue_store = AsyncMock()
+    queue_store.get_queue_by_pool.return_value = entries
+    rating_api = AsyncMock()
+    rating_api.get_bulk_ratings.return_value = ratings
+    service = MatchmakingService(queue_store, AsyncMock(), AsyncMock(), rating_api)
+    service.settings = service.settings.model_copy(update={"MATCHING_MODE": mode})
+    return service
+
+
+def stranding_pool() -> tuple[list[Ticket], dict[str, PlayerRating]]:
+    """Greedy pairs the oldest ticket (1500) with 1560 and strands 1420 and 1640."""
+    tickets = [make_ticket(0, 5), make_ticket(1, 4), make_ticket(2, 3), make_ticket(3, 2)]
+    ratings = {
+        f"user_{index}": PlayerRating(rating=rating, rating_deviation=50.0)
+        for index, rating in enumerate([1500, 1560, 1420, 1640])
+    }
+    return tickets, ratings
+
+
+class TestRatingIndex:
+    """Test the rating-sorted ticket index."""
+
+    def test_nearest_yields_by_gap_within_window(self):
+        index = RatingIndex([(1500, 0, "a"), (1450, 1, "b"), (1580, 2, "c"), (1800, 3, "d")])
+
+        found = [item for _, _, item in index.nearest(1510, 100)]
+
+        assert found == ["a", "b", "c"]
+
+    def test_removed_items_are_skipped(self):
+        index = RatingIndex([(1500, 0, "a"), (1510, 1, "b"), (1530, 2, "c")])
+
+        index.remove(1)
+        index.remove(1)
+
+        assert [item for _, _, item in index.nearest(1510, 50)] == ["a", "c"]
+        assert len(index) == 2
+
+    def test_empty_and_unbounded(self):
+        assert list(RatingIndex([]).nearest(1500, float("inf"))) == []
+
+        index = RatingIndex([(900, 0, "a"), (2200, 1, "b")])
+        assert [item for _, _, item in index.nearest(1500, float("inf"))] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+class TestFindMatchesForPool:
+    """Test the indexed matcher against the all-pairs greedy matcher."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    async def test_same_matches_as_all_pairs_greedy(self, seed):
+        tickets, ratings = random_pool(seed, size=60)
+        expected_tickets, _ = random_pool(seed, size=60)
+        service = make_service(tickets, ratings)
+
+        matches = await service.find_matches_for_pool("t_default", "pool")
+
+        expected = reference_matches(service, expected_tickets, ratings)
+        assert [(a.ticket_id, b.ticket_id, region) for a, b, region in matches] == expected
+        assert matches
+
+    async def test_oldest_ticket_takes_closest_rating(self):
+        tickets = [make_ticket(0, 1), make_ticket(1, 30), make_ticket(2, 10)]
+        ratings = {
+            "user_0": PlayerRating(rating=1540, rating_deviation=50.0),
+            "user_1": PlayerRating(rating=1500, rating_deviation=50.0),
+            "user_2": PlayerRating(rating=1560, rating_deviation=50.0),
+        }
+        service = make_service(tickets, ratings)
+
+        matches = await service.find_matches_for_pool("t_default", "pool")
+
+        assert [(a.ticket_id, b.ticket_id) for a, b, _ in matches] == [("t_1", "t_0")]
+        assert tickets[1].players[0].rating == 1500
+
+
+class TestPairAlongRatings:
+    """Test min-cost pairing along the rating axis."""
+
+    def test_pairs_rating_neighbours(self):
+        ratings = [1500, 1900, 1510, 1890]
+
+        pairs = pair_along_ratings(ratings, lambda a, b: abs(ratings[a] - ratings[b]))
+
+        assert sorted(pairs) == [(0, 2), (3, 1)]
+
+    def test_prefers_more_pairs_over_smaller_gaps(self):
+        ratings = [1420, 1500, 1560, 1640]
+
+        def cost(a, b):
+            gap = abs(ratings[a] - ratings[b])
+            return gap if gap <= 100 else None
+
+        pairs = pair_along_ratings(ratings, cost)
+
+        assert sorted(pairs) == [(0, 1), (2, 3)]
+
+    def test_unpaired_items_meet_new_neighbours(self):
+        ratings = [1500, 1501, 1502, 1503]
+        allowed = {(0, 3), (1, 2)}
+
+        def cost(a, b):
+            return abs(ratings[a] - ratings[b]) if (a, b) in allowed else None
+
+        pairs = pair_along_ratings(ratings, cost, reach=1)
+
+        assert sorted(pairs) == [(0, 3), (1, 2)]
+
+
+@pytest.mark.asyncio
+class TestBatchMatching:
+    """Test the min-cost batch matching mode."""
+
+    async def test_matches_tickets_greedy_strands(self):
+        tickets, ratings = stranding_pool()
+        greedy = await make_service(tickets, ratings).find_matches_for_pool("t_default", "pool")
+
+        tickets, ratings = stranding_pool()
+        service = make_service(tickets, ratings, mode="batch")
+        matches = await service.find_matches_for_pool("t_default", "pool")
+
+        assert len(greedy) == 1
+        assert [(a.ticket_id, b.ticket_id) for a, b, _ in matches] == [
+            ("t_0", "t_2"),
+            ("t_1", "t_3"),
+        ]
+
+    @pytest.mark.parametrize("seed", range(10))
+    async def test_matches_respect_constraints(self, seed):
+        tickets, ratings = random_pool(seed, size=80)
+        service = make_service(tickets, ratings, mode="batch")
+
+        matches = await service.find_matches_for_pool("t_default", "pool")
+
+        now = datetime.now(timezone.utc)
+        seen = set()
+        for entry, candidate, region in matches:
+            assert entry.time_in_queue_seconds(now) >= candidate.time_in_queue_seconds(now)
+            assert service._regions_compatible(entry, candidate)
+            assert region == service._select_match_region(entry, candidate)
+            assert service._within_latency_budget(entry, region)
+            assert service._within_latency_budget(candidate, region)
+            rating_gap = abs(
+                (entry.players[0].rating or 1500) - (candidate.players[0].rating or 1500)
+            )
+            assert rating_gap <= entry.widening_state.current_window
+            assert entry.ticket_id not in seen and candidate.ticket_id not in seen
+            seen.update((entry.ticket_id, candidate.ticket_id))
+        assert matches
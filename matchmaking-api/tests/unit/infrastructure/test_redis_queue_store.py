@@ -0,0 +1,183 @@
+"""Unit tests for the Redis queue store."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+
+from app.domain.models import (
+    HardConstraints,
+    Player,
+    QueueEntryStatus,
+    Ticket,
+    TicketType,
+    WideningState,
+)
+from app.infrastructure.repositories.redis_queue_store import RedisQueueStore
+
+POOL_KEY = HardConstraints(time_control="5+0", mode="rated").pool_key()
+
+
+def make_ticket(index: int, rating: int, wait_seconds: float) -> Ticket:
+    now = datetime.now(timezone.utc)
+    return Ticket(
+        ticket_id=f"t_{index}",
+        tenant_id="t_default",
+        ticket_type=TicketType.SOLO,
+        status=QueueEntryStatus.SEARCHING,
+        players=[Player(user_id=f"user_{index}", rating=rating)],
+        hard_constraints=HardConstraints(time_control="5+0", mode="rated"),
+        soft_constraints=None,
+        widening_state=WideningState(current_window=100),
+        enqueued_at=now - timedelta(seconds=wait_seconds),
+        updated_at=now,
+    )
+
+
+@pytest_asyncio.fixture
+async def queue_store():
+    client = aioredis.FakeRedis(decode_responses=True)
+    store = RedisQueueStore(client)
+    store.settings = store.settings.model_copy(update={"REDIS_BULK_LOAD_CHUNK_SIZE": 3})
+    yield store
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+class TestRedisQueueStore:
+    """Test pool loading in the Redis queue store."""
+
+    async def test_get_queue_by_pool_loads_all_chunks(self, queue_store):
+        for index in range(8):
+            await queue_store.add_entry(make_ticket(index, 1400 + 25 * index, 80 - 10 * index))
+        await queue_store.redis.delete(queue_store._get_entry_key("t_3"))  # Expired ticket
+
+        entries = await queue_store.get_queue_by_pool("t_default", POOL_KEY)
+
+        assert [entry.ticket_id for entry in entries] == [f"t_{i}" for i in (0, 1, 2, 4, 5, 6, 7)]
+        assert entries[0].players[0].rating == 1400
+
+    async def test_get_queue_by_pool_rating_band_and_age(self, queue_store):
+        for index in range(8):
+            await queue_store.add_entry(make_ticket(index, 1400 + 25 * index, 80 - 10 * index))
+        now = datetime.now(timezone.utc)
+
+        in_band = await queue_store.get_queue_by_pool(
+            "t_default", POOL_KEY, min_rating=1450, max_rating=1525
+        )
+        old = await queue_store.get_queue_by_pool(
+            "t_default", POOL_KEY, enqueued_before=now - timedelta(seconds=45)
+        )
+        both = await queue_store.get_queue_by_pool(
+            "t_default",
+            POOL_KEY,
+            min_rating=1450,
+            enqueued_before=now - timedelta(seconds=45),
+        )
+
+        assert sorted(entry.ticket_id for entry in in_band) == ["t_2", "t_3", "t_4", "t_5"]
+        assert [entry.ticket_id for entry in old] == ["t_0", "t_1", "t_2", "t_3"]
+        assert [entry.ticket_id for entry in both] == ["t_2", "t_3"]
+
+    async def test_status_change_moves_rating_index(self, queue_store):
+        await queue_store.add_entry(make_ticket(0, 1500, 10))
+        await queue_store.add_entry(make_ticket(1, 1510, 5))
+
+        await queue_store.update_entry_status("t_0", QueueEntryStatus.MATCHED, match_id="m_1")
+        await queue_store.remove_entry("t_1")
+
+        searching = await queue_store.get_queue_by_pool("t_default", POOL_KEY, min_rating=0)
+        matched = await queue_store.get_queue_by_pool(
+            "t_default", POOL_KEY, QueueEntryStatus.MATCHED, min_rating=0
+        )
+        assert searching == []
+        assert [(entry.ticket_id, entry.match_id) for entry in matched] == [("t_0", "m_1")]
+
+    async def test_get_queue_stats(self, queue_store):
+        assert (await queue_store.get_queue_stats("t_default", POOL_KEY))["waiting_count"] == 0
+
+        for index in range(5):
+            await queue_store.add_entry(make_ticket(index, 1500, 10 * (index + 1)))
+
+        stats = await queue_store.get_queue_stats("t_default", POOL_KEY)
+
+        assert stats["waiting_count"] == 5
+        assert 29 < stats["avg_wait_seconds"] < 31
+
+    async def test_transition_entries_moves_both_tickets(self, queue_store):
+        tickets = [make_ticket(0, 1500, 10), make_ticket(1, 1510, 5)]
+        for ticket in tickets:
+            await queue_store.add_entry(ticket)
+
+        moved = await queue_store.transition_entries(
+            tickets, QueueEntryStatus.MATCHED, match_id="g_1"
+        )
+
+        assert moved
+        assert await queue_store.get_queue_by_pool("t_default", POOL_KEY) == []
+        matched = await queue_store.get_queue_by_pool(
+            "t_default", POOL_KEY, QueueEntryStatus.MATCHED, min_rating=1505
+        )
+        assert [(entry.ticket_id, entry.match_id) for entry in matched] == [("t_1", "g_1")]
+        entry = await queue_store.get_entry("t_0")
+        assert entry.status == QueueEntryStatus.MATCHED
+        assert entry.players[0].rating == 1500
+
+    async def test_transition_entries_is_all_or_nothing(self, queue_store):
+        tickets = [make_ticket(0, 1500, 10), make_ticket(1, 1510, 5)]
+        for ticket in tickets:
+            await queue_store.add_entry(ticket)
+        assert await queue_store.transition_entries(tickets[1:], QueueEntryStatus.CANCELLED)
+
+        moved = await queue_store.transition_entries(
+            tickets, QueueEntryStatus.MATCHED, match_id="g_1"
+        )
+        missing = await queue_store.transition_entries(
+            [tickets[0], make_ticket(9, 1500, 10)], QueueEntryStatus.MATCHED
+        )
+
+        assert not moved and not missing
+        entry = await queue_store.get_entry("t_0")
+        assert (entry.status, entry.match_id) == (QueueEntryStatus.SEARCHING, None)
+        assert (await queue_store.get_entry("t_1")).status == QueueEntryStatus.CANCELLED
+        searching = await queue_store.get_queue_by_pool("t_default", POOL_KEY)
+        assert [entry.ticket_id for entry in searching] == ["t_0"]
+
+    async def test_released_ticket_keeps_its_queue_age(self, queue_store):
+        tickets = [make_ticket(0, 1500, 120), make_ticket(1, 1510, 5)]
+        for ticket in tickets:
+            await queue_store.add_entry(ticket)
+
+        assert await queue_store.transition_entries(tickets, QueueEntryStatus.MATCHED)
+        assert await queue_store.transition_entries(
+            tickets, QueueEntryStatus.SEARCHING, from_status=QueueEntryStatus.MATCHED
+        )
+
+        minute_ago = datetime.now(timezone.utc) - timedelta(seconds=60)
+        old = await queue_store.get_queue_by_pool("t_default", POOL_KEY, enqueued_before=minute_ago)
+        assert [entry.ticket_id for entry in old] == ["t_0"]
+
+    async def test_transition_script_declares_every_key(self, queue_store):
+        ticket = make_ticket(0, 1500, 10)
+        await queue_store.add_entry(ticket)
+        calls = []
+        transition = queue_store._transition
+
+        async def record(keys, args):
+            calls.append(keys)
+            return await transition(keys=keys, args=args)
+
+        queue_store._transition = record
+        assert await queue_store.transition_entries([ticket], QueueEntryStatus.MATCHED)
+
+        assert calls == [
+            [
+                "queue_ticket:t_0",
+                f"pool:t_default:{POOL_KEY}:SEARCHING",
+                f"pool_rating:t_default:{POOL_KEY}:SEARCHING",
+                f"pool:t_default:{POOL_KEY}:MATCHED",
+                f"pool_rating:t_default:{POOL_KEY}:MATCHED",
+            ]
+        ]
+        keys = await queue_store.redis.keys()
+        assert {key for key in keys if not key.startswith("user_queue:")} <= set(calls[0])
@@ -0,0 +1,157 @@
+"""Unit tests for the matchmaking worker."""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+
+from app.infrastructure.coordination.redis_lease import RedisLeases
+from app.infrastructure.database.match_ticket_model import MatchTicketStatus
+from app.workers.matchmaking_worker import MatchmakingWorker
+
+
+class InMemoryTicketRepository:
+    """Just enough of the ticket repository for the worker."""
+
+    def __init__(self) -> None:
+        self.tickets: dict[str, SimpleNamespace] = {}
+        self.list_calls: list[str | None] = []
+
+    def add(self, ticket_id: str, pool_key: str, age_seconds: float = 0.0) -> None:
+        self.tickets[ticket_id] = SimpleNamespace(
+            ticket_id=ticket_id,
+            pool_key=pool_key,
+            status=MatchTicketStatus.SEARCHING,
+            proposal_id=None,
+            created_at=datetime.now(timezone.utc) - timedelta(seconds=age_seconds),
+        )
+
+    def proposals(self) -> dict[str, set[str]]:
+        grouped: dict[str, set[str]] = {}
+        for ticket in self.tickets.values():
+            if ticket.proposal_id:
+                grouped.setdefault(ticket.proposal_id, set()).add(ticket.ticket_id)
+        return grouped
+
+    def _waiting(self) -> list[SimpleNamespace]:
+        return [t for t in self.tickets.values() if t.status == MatchTicketStatus.SEARCHING]
+
+    async def list_active_tickets(self, pool_key=None):
+        self.list_calls.append(pool_key)
+        return [t for t in self._waiting() if pool_key is None or t.pool_key == pool_key]
+
+    async def list_active_pool_keys(self):
+        return {t.pool_key for t in self._waiting()}
+
+    async def create_proposal(self, ticket_ids, *, proposal_id, proposal_timeout_at):
+        tickets = [self.tickets[ticket_id] for ticket_id in ticket_ids]
+        if any(t.status != MatchTicketStatus.SEARCHING for t in tickets):
+            return []
+        for ticket in tickets:
+            ticket.status = MatchTicketStatus.PROPOSING
+            ticket.proposal_id = proposal_id
+        return tickets
+
+
+def make_worker(ticket_repo, leases=None) -> MatchmakingWorker:
+    @asynccontextmanager
+    async def ticket_repo_factory():
+        yield ticket_repo
+
+    worker = MatchmakingWorker(ticket_repo_factory=ticket_repo_factory, leases=leases)
+    worker.settings = worker.settings.model_copy(
+        update={
+            "WORKER_INTERVAL_SECONDS": 0.02,
+            "WORKER_POOL_MIN_INTERVAL_SECONDS": 0.01,
+            "WORKER_POOL_MAX_INTERVAL_SECONDS": 0.08,
+            "WORKER_POOL_DISCOVERY_INTERVAL_SECONDS": 0.01,
+        }
+    )
+    return worker
+
+
+@pytest_asyncio.fixture
+async def redis_client():
+    client = aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+class TestMatchmakingWorker:
+    """Test per-pool matching cycles, cadence and leases."""
+
+    async def test_pool_cycle_lists_tickets_once(self):
+        ticket_repo = InMemoryTicketRepository()
+        for index, age in enumerate([5, 30, 10, 20, 1]):
+            ticket_repo.add(f"t_{index}", "blitz", age_seconds=age)
+        ticket_repo.add("t_other", "rapid")
+        worker = make_worker(ticket_repo)
+
+        waiting, proposed = await worker._process_pool_cycle("blitz")
+
+        assert (waiting, proposed) == (5, 2)
+        assert ticket_repo.list_calls == ["blitz"]
+        # Oldest tickets are proposed first
+        assert sorted(ticket_repo.proposals().values(), key=sorted) == [
+            {"t_0", "t_2"},
+            {"t_1", "t_3"},
+        ]
+        assert ticket_repo.tickets["t_other"].proposal_id is None
+
+    async def test_cadence_adapts_to_pool_activity(self):
+        worker = make_worker(InMemoryTicketRepository())
+
+        assert worker._next_interval(0.08, waiting=4, proposed=2) == 0.01
+        assert worker._next_interval(0.01, waiting=3, proposed=0) == 0.02
+        assert worker._next_interval(0.02, waiting=1, proposed=0) == 0.04
+        assert worker._next_interval(0.04, waiting=0, proposed=0) == 0.08
+        assert worker._next_interval(0.08, waiting=0, proposed=0) == 0.08
+
+    async def test_leases_partition_pools_between_replicas(self, redis_client):
+        ticket_repo = InMemoryTicketRepository()
+        workers = [
+            make_worker(ticket_repo, RedisLeases(redis_client, ttl_seconds=5, owner=owner))
+            for owner in ("replica_a", "replica_b")
+        ]
+        pools = [f"pool_{index}" for index in range(6)]
+
+        owners = {}
+        for index, pool_key in enumerate(pools):
+            # Replicas race for the pools in alternating order
+            first, second = workers if index % 2 == 0 else workers[::-1]
+            assert await first._hold_lease(pool_key)
+            assert not await second._hold_lease(pool_key)
+            owners[pool_key] = first
+
+        for worker in workers:
+            assert worker._leased_pools == {p for p, owner in owners.items() if owner is worker}
+            # Renewal keeps the lease with its holder
+            assert all([await worker._hold_lease(p) for p in worker._leased_pools])
+
+        # Once a holder lets go, the other replica can take the pool over
+        await owners["pool_0"]._drop_lease("pool_0")
+        assert await owners["pool_1"]._hold_lease("pool_0")
+
+    async def test_worker_proposes_every_pool_and_releases_leases(self, redis_client):
+        ticket_repo = InMemoryTicketRepository()
+        for pool_key in ("blitz", "rapid"):
+            for index in range(4):
+                ticket_repo.add(f"{pool_key}_{index}", pool_key, age_seconds=index)
+        worker = make_worker(ticket_repo, RedisLeases(redis_client, ttl_seconds=5))
+
+        task = asyncio.create_task(worker.start())
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(ticket_repo.proposals()) == 4:
+                break
+        await worker.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert len(ticket_repo.proposals()) == 4
+        assert worker._pool_tasks == {}
+        assert worker._leased_pools == set()
+        assert await redis_client.keys("lease:*") == []